@@ -0,0 +1,14 @@
+"""Sample request arguments and response bodies generated from pydantic models.
+
+Used by the pipeline benchmark to drive every client method offline: request kwargs are
+built from the handler's ``req_model`` (required fields only) and mock responses from its
+``resp_model`` (all fields, by alias, JSON-compatible), so each route exercises its real
+validation and serialization path.
+
+The generators themselves live in ``integrify.testing`` (shared with the provider
+simulators); this module keeps the benchmark's import path stable.
+"""
+
+from integrify.testing import sample_body, sample_model, sample_value
+
+__all__ = ['sample_body', 'sample_model', 'sample_value']
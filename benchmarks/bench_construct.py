@@ -0,0 +1,271 @@
+"""Micro-benchmark: pydantic validation paths for the largest response schemas.
+
+Compares, per response, the integration handler (``handle_response``: JSON decoding plus
+``APIResponse`` validation) with the pydantic-native ways of building the body model:
+``model_validate`` on the decoded body, ``TypeAdapter.validate_python``,
+``TypeAdapter.validate_json`` on the raw bytes and ``model_construct`` (no validation; only
+the top level is built, so nested models stay dicts and aliases are not applied).
+Speedups are relative to ``model_validate``:
+
+- Clopos ``get_receipts`` (``ObjectListResponse[Receipt]``, receipts with products)
+- Kapitalbank ``get_detailed_order_info`` (``DetailedOrderInformationResponseSchema``)
+
+A trusted "no-validate" response mode was considered and declined. The validating paths
+stay within about 1.2x of each other (pydantic v2 already validates in Rust), and
+``model_construct`` is only fast because it leaves nested bodies as plain dicts. A deep
+builder on top of it measured about 1.2x for the receipts and 0.5x for the order. Re-run
+this benchmark to re-check that decision on a new pydantic version.
+
+Usage::
+
+    python benchmarks/bench_construct.py [--number N] [--receipts N]
+"""
+
+import argparse
+import timeit
+
+import httpx
+from integrify.clopos.handlers import GetReceiptsHandler
+from integrify.clopos.schemas.common.response import ObjectListResponse
+from integrify.clopos.schemas.receipts.object import Receipt
+from integrify.kapitalbank.handlers import DetailedOrderInformationPayloadHandler
+from integrify.kapitalbank.schemas.response import DetailedOrderInformationResponseSchema
+from integrify.schemas import json_loads
+from pydantic import BaseModel, TypeAdapter
+from pydantic.alias_generators import to_camel
+
+
+def _receipt_product(receipt_id: int, index: int) -> dict:
+    return {
+        'id': receipt_id * 100 + index,
+        'cid': f'rp-{receipt_id}-{index}',
+        'product_id': 400 + index,
+        'meta': {'product': {'name': f'Product {index}'}},
+        'count': 2,
+        'portion_size': '1.000',
+        'total': '12.50',
+        'price': '6.25',
+        'cost': '3.10',
+        'is_gift': False,
+        'created_at': '2025-05-01 12:00:00',
+        'updated_at': '2025-05-01 12:05:00',
+        'receipt_id': receipt_id,
+        'product_hash': None,
+        'preprint_count': 0,
+        'station_printed_count': 1,
+        'station_aborted_count': 0,
+        'seller_id': 7,
+        'loyalty_type': None,
+        'loyalty_value': None,
+        'discount_rate': '0',
+        'discount_value': '0',
+        'discount_type': 0,
+        'total_discount': '0',
+        'subtotal': '12.50',
+        'receipt_discount': '0',
+        'receipt_product_modificators': [],
+        'taxes': [],
+    }
+
+
+def _receipt(receipt_id: int, products: int) -> dict:
+    return {
+        'id': receipt_id,
+        'venue_id': 1,
+        'cid': f'receipt-{receipt_id}',
+        'user_id': 7,
+        'source': 'pos',
+        'table_id': 3,
+        'guests': 2,
+        'status': 2,
+        'lock': False,
+        'meta': {'preprint': {'count': 1}},
+        'printed': True,
+        'total': '62.50',
+        'subtotal': '62.50',
+        'totalCost': '31.00',
+        'payment_methods': [{'id': 1, 'name': 'Cash', 'amount': '62.50'}],
+        'by_cash': '62.50',
+        'by_card': '0',
+        'discount_type': 0,
+        'discount_value': '0',
+        'service_charge': '0',
+        'order_status': 'COMPLETED',
+        'receipt_products': [_receipt_product(receipt_id, i) for i in range(products)],
+        'closed_at': '2025-05-01 13:00:00',
+        'created_at': '2025-05-01 12:00:00',
+        'updated_at': '2025-05-01 13:00:00',
+    }
+
+
+def clopos_receipts_response(receipts: int, products: int = 5) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            'success': True,
+            'time': 12,
+            'timestamp': '2025-05-01T13:00:00Z',
+            'unix': 1746104400,
+            'total': receipts,
+            'data': [_receipt(i, products) for i in range(1, receipts + 1)],
+        },
+    )
+
+
+def _camelize(data):
+    if isinstance(data, dict):
+        return {to_camel(key): _camelize(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_camelize(item) for item in data]
+    return data
+
+
+def kapitalbank_detailed_order_response() -> httpx.Response:
+    browser = {
+        'user_agent': 'Mozilla/5.0',
+        'color_depth': 24,
+        'pixel_ratio': 2.0,
+        'language': 'az',
+        'tz_offset': -240,
+        'local_storage': True,
+        'language_replaced': False,
+        'resolution_replaced': False,
+        'os_replaced': False,
+        'browser_replaced': False,
+        'screen_w': 1920,
+        'screen_h': 1080,
+        'screen_avail_w': 1920,
+        'screen_avail_h': 1040,
+        'platform': 'MacIntel',
+        'accept_header': 'text/html',
+        'ip': '127.0.0.1',
+        'ref_url': 'https://example.com/checkout',
+        'java_enabled': False,
+        'js_enabled': True,
+    }
+    order_type = {
+        'allow_void': True,
+        'hpp_tran_phase': 'Single',
+        'secret_length': 8,
+        'title': 'Order_SMS',
+        'rid': 'Order_SMS',
+        'payment_methods': ['Card'],
+        'card_brands': ['VISA', 'MC'],
+        'allow_tds_attempt': True,
+        'allow_tds_cant': False,
+        'allow_tds_challenged': True,
+        'allow_surcharge': False,
+        'allow_tran_types': ['Purchase', 'Refund'],
+        'allow_tran_phases': ['Single'],
+        'allow_auth_kinds': ['Cof'],
+        'allow_cof_store_usages': ['Cof'],
+        'order_class': 'Standard',
+    }
+    order = {
+        'id': 12345,
+        'hpp_url': 'https://txpgtst.kapitalbank.az/flex',
+        'password': 'secret',
+        'status': 'FullyPaid',
+        'last_status_login': 'user',
+        'amount': 10.5,
+        'currency': 'AZN',
+        'terminal': {'id': 1},
+        'src_amount': 10.5,
+        'src_amount_full': 10.5,
+        'src_currency': 'AZN',
+        'stored_tokens': [{'id': i} for i in range(10)],
+        'create_time': '2025-05-01 12:00:00',
+        'finish_time': '2025-05-01 12:01:00',
+        'cvv2_auth_status': 'Verified',
+        'authorized_charge_amount': 10.5,
+        'cleared_charge_amount': 10.5,
+        'cleared_refund_amount': 0,
+        'description': 'Order description',
+        'language': 'az',
+        'src_token': {
+            'id': 77,
+            'payment_method': 'Card',
+            'role': 'Src',
+            'status': 'Active',
+            'reg_time': '2025-05-01 12:00:00',
+            'display_name': '416973******1234',
+            'card': {
+                'authentication': {'need_cvv2': True, 'need_tds': True, 'eci': '05'},
+                'expiration': '2030-12-31',
+                'brand': 'VISA',
+            },
+        },
+        'consumer_device': {'browser': browser},
+        'merchant': {
+            'id': 1,
+            'rid': 'merchant',
+            'title': 'Merchant',
+            'business_address': {'country': 'Azerbaijan', 'country_a2': 'AZ', 'country_n3': 31},
+            'trust_consumer_phone': False,
+        },
+        'initiation_env_kind': 'Browser',
+        'type': order_type,
+        'hpp_cof_capture_purposes': ['Cit'],
+        'cust_attrs': [],
+        'report_pubs': {},
+    }
+    order = _camelize(order)
+    order['type']['allowCVV2'] = True
+    return httpx.Response(200, json={'order': order})
+
+
+def _timeit(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def _paths(handler, response: httpx.Response, model: type[BaseModel], key: str | None) -> dict:
+    """Timed callables: the full handler and the pydantic ways to build the body model."""
+    adapter = TypeAdapter(model)
+    raw = response.content if key is None else json_loads(response.content)[key]
+    raw = raw if isinstance(raw, bytes) else adapter.dump_json(adapter.validate_python(raw))
+    data = json_loads(raw)
+
+    return {
+        'handler': lambda: handler.handle_response(response),
+        'model_validate': lambda: model.model_validate(data),
+        'validate_python': lambda: adapter.validate_python(data),
+        'validate_json': lambda: adapter.validate_json(raw),
+        'model_construct': lambda: model.model_construct(**data),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200)
+    parser.add_argument('--receipts', type=int, default=100)
+    args = parser.parse_args()
+
+    receipts = clopos_receipts_response(args.receipts)
+    order = kapitalbank_detailed_order_response()
+
+    cases = {
+        f'clopos receipts x{args.receipts}': (
+            _paths(GetReceiptsHandler(), receipts, ObjectListResponse[Receipt], None),
+            args.number,
+        ),
+        'kapitalbank detailed order': (
+            _paths(
+                DetailedOrderInformationPayloadHandler(),
+                order,
+                DetailedOrderInformationResponseSchema,
+                'order',
+            ),
+            args.number * 50,
+        ),
+    }
+
+    for title, (paths, number) in cases.items():
+        print(title)
+        timings = {name: _timeit(func, number) for name, func in paths.items()}
+        baseline = timings['model_validate']
+        for name, elapsed in timings.items():
+            print(f'  {name:<16} {elapsed:10.1f} us {baseline / elapsed:7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
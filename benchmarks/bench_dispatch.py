@@ -0,0 +1,60 @@
+"""Micro-benchmark: `APIClient` endpoint dispatch overhead.
+
+Compares calling a registered route (``client.pay(...)``) against calling the
+executor function directly, and against the previous per-call resolution
+(``urljoin`` + handler lookup + fresh lambda on every attribute access). The
+executor function is replaced with a no-op so only the dispatch path is timed.
+
+Usage::
+
+    python benchmarks/bench_dispatch.py [--number N]
+"""
+
+import argparse
+import timeit
+from urllib.parse import urljoin
+
+from integrify.api import APIClient
+from integrify.utils import UNSET
+
+
+def _noop(url, verb, handler, *args, **kwds):
+    return None
+
+
+def _legacy_dispatch(client: APIClient, name: str):
+    """Replica of the pre-cache `APIClient.__getattr__` resolution path."""
+    route = client.urls[name]
+    url = urljoin(route['base_url'], route['url'])
+    handler = client.handlers.get(name, client.default_handler)
+    func = client.request_executor.request_function
+    return client._build_request_lambda(func, url, route['verb'], handler)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200_000)
+    number = parser.parse_args().number
+
+    client = APIClient('bench', 'https://example.com')
+    client.request_executor.sync_req = _noop
+    client.add_url('pay', '/api/1/request', 'POST')
+
+    handler = client.default_handler
+    cases = {
+        'direct function call': lambda: _noop('url', 'POST', handler, amount=1, currency='AZN'),
+        'cached dispatch': lambda: client.pay(amount=1, currency='AZN', description=UNSET),
+        'legacy dispatch': lambda: _legacy_dispatch(client, 'pay')(
+            amount=1, currency='AZN', description=UNSET
+        ),
+    }
+
+    baseline = None
+    for title, stmt in cases.items():
+        per_call = min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+        baseline = baseline or per_call
+        print(f'{title:<22} {per_call:8.1f} ns/call  ({per_call / baseline:4.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
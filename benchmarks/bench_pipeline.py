@@ -0,0 +1,335 @@
+"""Benchmark suite: per-request overhead of every client method of every integration.
+
+Runs fully offline: each client gets an ``httpx.MockTransport`` that answers with a sample
+body generated from the route's response model (see ``_samples.py``), so every call goes
+through the real pipeline (``from_args``, payload handling and signing, serialization,
+transport, response validation). Three sections are measured:
+
+- ``route``: full ``client.<route>(...)`` call, per client method (µs/call)
+- ``stage``: the individual stages of each route (µs/call)
+- ``throughput``: sync vs async ``APIClient.batch`` under concurrency against a transport
+  with simulated network latency (µs/request, i.e. inverse throughput)
+
+Results can be stored as a baseline and compared against later runs; a comparison exits
+with status 1 when any metric is slower than the baseline by more than ``--tolerance``.
+
+Usage::
+
+    python benchmarks/bench_pipeline.py [--number N] [--only SUBSTRING]
+    python benchmarks/bench_pipeline.py --save benchmarks/.baselines/main.json
+    python benchmarks/bench_pipeline.py --compare benchmarks/.baselines/main.json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+import timeit
+import warnings
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import httpx
+import rsa
+from _samples import sample_body, sample_model
+from pydantic import BaseModel
+
+
+def _configure_env() -> None:
+    """Dummy credentials so that every integration can be imported and sign requests"""
+    _, private_key = rsa.newkeys(1024)
+    with tempfile.NamedTemporaryFile('wb', suffix='.pem', delete=False) as key_file:
+        key_file.write(private_key.save_pkcs1())
+
+    defaults = {
+        'EPOINT_PUBLIC_KEY': 'i000000001',
+        'EPOINT_PRIVATE_KEY': 'bench-private-key',
+        'KAPITAL_USERNAME': 'bench',
+        'KAPITAL_PASSWORD': 'bench',
+        'AZERICARD_KEY_FILE_PATH': key_file.name,
+        'AZERICARD_MERCHANT_ID': '00000001',
+        'AZERICARD_MERCHANT_NAME': 'Bench',
+        'AZERICARD_MERCHANT_URL': 'https://example.com',
+        'AZERICARD_MERCHANT_EMAIL': 'bench@example.com',
+        'AZERICARD_CALLBACK_URL': 'https://example.com/callback',
+        'CLOPOS_CLIENT_ID': 'bench',
+        'CLOPOS_CLIENT_SECRET': 'bench',
+        'CLOPOS_BRAND': 'bench',
+        'CLOPOS_INTEGRATOR_ID': 'bench',
+        'CLOPOS_VENUE_ID': '1',
+        'LSIM_LOGIN': 'bench',
+        'LSIM_PASSWORD': 'bench',
+        'LSIM_SENDER_NAME': 'bench',
+        'POSTA_GUVERCINI_USERNAME': 'bench',
+        'POSTA_GUVERCINI_PASSWORD': 'bench',
+    }
+    for key, value in defaults.items():
+        os.environ.setdefault(key, value)
+
+
+_configure_env()
+warnings.simplefilter('ignore')  # missing-env warnings of the integrations
+
+from integrify.api import APIClient, APIExecutor  # noqa: E402
+from integrify.azericard.client import AzeriCardClientClass  # noqa: E402
+from integrify.clopos.client import CloposClientClass  # noqa: E402
+from integrify.epoint.client import EPointClientClass  # noqa: E402
+from integrify.kapitalbank.client import KapitalClientClass  # noqa: E402
+from integrify.lsim.bulk.client import LSIMBulkSMSClientClass  # noqa: E402
+from integrify.lsim.single.client import LSIMSingleSMSClientClass  # noqa: E402
+from integrify.postaguvercini.client import PostaGuverciniClientClass  # noqa: E402
+
+# Response fields whose values are checked by custom validators
+FIELD_VALUES = {
+    'pmoResultCode': '1',  # Kapitalbank: key of PMO_RESULT_CODES
+    'Transaction date': '20250501120000',  # AzeriCard: '%Y%m%d%H%M%S'
+    'Timestamp': '20250501120000',
+}
+
+
+def _lsim_bulk(body: Any) -> dict:
+    return {'response': {'head': {'responsecode': 0}, 'body': body}}
+
+
+# Routes whose response models restructure the raw body in a `before` validator
+RAW_BODIES = {
+    ('LSIM-BulkSMS', 'bulk_send_one_message'): _lsim_bulk({'taskid': 1}),
+    ('LSIM-BulkSMS', 'bulk_send_different_messages'): _lsim_bulk({'taskid': 1}),
+    ('LSIM-BulkSMS', 'get_report'): _lsim_bulk({'delivered': 1, 'send': 1}),
+    ('LSIM-BulkSMS', 'get_detailed_report'): _lsim_bulk(
+        [{'msisdn': 994500000000, 'message': 'bench', 'status': 2}]
+    ),
+    ('LSIM-BulkSMS', 'get_detailed_report_with_dates'): _lsim_bulk(
+        [{'msisdn': 994500000000, 'message': 'bench', 'status': 2}]
+    ),
+    ('LSIM-BulkSMS', 'check_balance'): _lsim_bulk({'units': 100}),
+}
+
+CLIENTS: dict[str, type[APIClient]] = {
+    'epoint': EPointClientClass,
+    'kapitalbank': KapitalClientClass,
+    'azericard': AzeriCardClientClass,
+    'clopos': CloposClientClass,
+    'lsim-single': LSIMSingleSMSClientClass,
+    'lsim-bulk': LSIMBulkSMSClientClass,
+    'postaguvercini': PostaGuverciniClientClass,
+}
+
+CLOPOS_HEADERS = {'x-token': 'bench-token'}
+
+
+class Route:
+    """A client method with its sample arguments and mocked response"""
+
+    def __init__(self, integration: str, client: APIClient, name: str):
+        self.integration = integration
+        self.client = client
+        self.name = name
+        self.handler = client.handlers.get(name, client.default_handler)
+        self.verb = client.urls[name]['verb']
+
+        req_model = self.handler.req_model
+        self.kwds = sample_model(req_model, json=False, required_only=True) if req_model else {}
+        if isinstance(client, CloposClientClass) and name != 'auth':
+            self.kwds['headers'] = CLOPOS_HEADERS
+
+        body = RAW_BODIES.get((client.request_executor.client_name, name))
+        if body is None:
+            body = _override(sample_body(self.handler.resp_model), FIELD_VALUES)
+            if hasattr(self.handler.resp_model, 'SIGNATURE_FIELDS'):
+                body = _sign_azericard(self.handler.resp_model, body)
+            if getattr(self.handler, 'data_key', None):
+                body = {self.handler.data_key: body}
+        self.content = json.dumps(body).encode()
+
+    @property
+    def title(self) -> str:
+        return f'{self.integration}.{self.name}'
+
+    def call(self) -> Any:
+        return getattr(self.client, self.name)(**self.kwds)
+
+    def stages(self) -> dict[str, Callable[[], Any]]:
+        """Individual pipeline stages of the route"""
+        handler, kwds = self.handler, {k: v for k, v in self.kwds.items() if k != 'headers'}
+        stages: dict[str, Callable[[], Any]] = {}
+
+        req_model = handler.build_request_model(**kwds)
+        if handler.req_model is not None:
+            stages['from_args'] = lambda: handler.build_request_model(**kwds)
+        stages['handle_request'] = lambda: handler.handle_request(req_model, **kwds)
+
+        data = handler.handle_request(req_model, **kwds)
+        headers = {**handler.headers, **self.kwds.get('headers', {})}
+        stages['serialize'] = lambda: APIExecutor._build_request_kwds(
+            self.verb, handler, data, headers
+        )
+
+        if handler.resp_model is not None and not handler.dry:
+            response = httpx.Response(200, content=self.content)
+            stages['handle_response'] = lambda: handler.handle_response(response)
+
+        return stages
+
+
+def _override(data: Any, values: dict[str, Any]) -> Any:
+    if isinstance(data, dict):
+        return {k: values[k] if k in values else _override(v, values) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_override(item, values) for item in data]
+    return data
+
+
+def _sign_azericard(model: type[BaseModel], body: dict) -> dict:
+    """Sets the MD5 signature that AzeriCard transfer responses are validated against"""
+    unsigned = type(model.__name__, (model,), {'validate_signature': lambda self: self})
+    parsed = unsigned.model_validate(body)
+    with open(os.environ['AZERICARD_KEY_FILE_PATH'], encoding='utf-8') as key_file:
+        key = key_file.read().strip()
+
+    source = ''.join(str(getattr(parsed, f) or '') for f in model.SIGNATURE_FIELDS) + key  # type: ignore[attr-defined]
+    signature = hashlib.md5(source.encode(), usedforsecurity=False).hexdigest()
+    alias = model.model_fields['signature'].alias or 'signature'
+    return {**body, alias: signature}
+
+
+def build_routes() -> list[Route]:
+    routes = []
+    current: dict[str, bytes] = {}
+    transport = httpx.MockTransport(lambda _: httpx.Response(200, content=current['content']))
+
+    for integration, client_class in CLIENTS.items():
+        client = client_class(transport=transport)
+        for name in client.urls:
+            route = Route(integration, client, name)
+            routes.append(route)
+
+    # The transport answers with the body of the route being measured
+    for route in routes:
+        call = route.call
+
+        def routed_call(route=route, call=call):
+            current['content'] = route.content
+            return call()
+
+        route.call = routed_call  # type: ignore[method-assign]
+    return routes
+
+
+def _timeit(stmt: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number * 1e6
+
+
+def bench_routes(routes: list[Route], number: int) -> Iterator[tuple[str, float]]:
+    for route in routes:
+        route.call()  # warm-up (model builds, caches)
+        yield f'route:{route.title}', _timeit(route.call, number)
+
+
+def bench_stages(routes: list[Route], number: int) -> Iterator[tuple[str, float]]:
+    for route in routes:
+        for stage, stmt in route.stages().items():
+            stmt()
+            yield f'stage:{route.title}:{stage}', _timeit(stmt, number)
+
+
+def bench_throughput(
+    requests: int,
+    concurrency: int,
+    latency: float,
+) -> Iterator[tuple[str, float]]:
+    """`APIClient.batch` over EPoint `pay` against a transport that sleeps `latency` seconds"""
+    body = json.dumps(sample_body(EPointClientClass().handlers['pay'].resp_model)).encode()
+
+    def sync_handler(_: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        return httpx.Response(200, content=body)
+
+    async def async_handler(_: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        return httpx.Response(200, content=body)
+
+    items = [{'amount': 1, 'currency': 'AZN', 'order_id': str(i)} for i in range(requests)]
+
+    sync_client = EPointClientClass(transport=httpx.MockTransport(sync_handler))
+    start = time.perf_counter()
+    results = list(sync_client.batch('pay', items, concurrency=concurrency))
+    elapsed = time.perf_counter() - start
+    assert all(result.ok for result in results)
+    yield f'throughput:sync:c{concurrency}', elapsed / requests * 1e6
+
+    async def run_async() -> float:
+        client = EPointClientClass(sync=False, transport=httpx.MockTransport(async_handler))
+        start = time.perf_counter()
+        results = [r async for r in client.batch('pay', items, concurrency=concurrency)]
+        elapsed = time.perf_counter() - start
+        assert all(result.ok for result in results)
+        await client.aclose()
+        return elapsed
+
+    yield f'throughput:async:c{concurrency}', asyncio.run(run_async()) / requests * 1e6
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], tolerance: float) -> bool:
+    regressions = []
+    print(f'\n{"metric":<70} {"baseline":>12} {"current":>12} {"change":>8}')
+    for name, value in results.items():
+        if name not in baseline:
+            continue
+        change = value / baseline[name] - 1
+        flag = ' !' if change > tolerance else ''
+        print(f'{name:<70} {baseline[name]:9.1f} us {value:9.1f} us {change:+7.1%}{flag}')
+        if flag:
+            regressions.append(name)
+
+    if regressions:
+        print(f'\n{len(regressions)} metric(s) regressed by more than {tolerance:.0%}')
+    return not regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200, help='calls per measurement')
+    parser.add_argument('--only', default='', help='run only metrics containing this text')
+    parser.add_argument('--requests', type=int, default=400, help='requests per throughput run')
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.005, help='simulated latency (s)')
+    parser.add_argument('--save', metavar='PATH', help='store the results as a baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare against a stored baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown (0.25)')
+    args = parser.parse_args()
+
+    routes = [route for route in build_routes() if args.only in f'route:{route.title}']
+    sections = [
+        bench_routes(routes, args.number),
+        bench_stages(routes, args.number),
+        bench_throughput(args.requests, args.concurrency, args.latency),
+    ]
+
+    results: dict[str, float] = {}
+    for section in sections:
+        for name, value in section:
+            if args.only not in name:
+                continue
+            results[name] = value
+            print(f'{name:<70} {value:9.1f} us')
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or '.', exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+        print(f'\nBaseline saved to {args.save}')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
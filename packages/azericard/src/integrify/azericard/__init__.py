@@ -10,7 +10,22 @@ PAN: 4127211288596748, ExpDate: 10/27, CVV: 931 SMS OTP: 1111
 PAN: 5167513336327283, ExpDate: 10/27, CVV: 209 SMS OTP: 1111
 """
 
-from .client import AzeriCardAsyncClient, AzeriCardClient, AzeriCardClientClass
-from .env import VERSION
+from typing import TYPE_CHECKING
+
+from integrify.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import AzeriCardAsyncClient, AzeriCardClient, AzeriCardClientClass
+    from .env import VERSION
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'AzeriCardAsyncClient': '.client',
+        'AzeriCardClientClass': '.client',
+        'AzeriCardClient': '.client',
+        'VERSION': '.env',
+    },
+)
 
 __all__ = ['AzeriCardAsyncClient', 'AzeriCardClientClass', 'AzeriCardClient', 'VERSION']
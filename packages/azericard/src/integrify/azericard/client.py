@@ -36,8 +36,9 @@ class AzeriCardClientClass(APIClient, Generic[_Mode]):
         default_handler: APIPayloadHandler | None = None,
         sync: bool = True,
         dry: bool = False,
+        **kwds: Any,
     ):
-        super().__init__(name, base_url, default_handler, sync, dry)
+        super().__init__(name, base_url, default_handler, sync, dry, **kwds)
 
         self.add_url(
             'authorization',
@@ -76,10 +77,18 @@ class AzeriCardClientClass(APIClient, Generic[_Mode]):
             env.MpiAPI.AUTHORIZATION,
             verb='POST',
             base_url=env.MpiAPI.BASE_URL,
+            idempotent=True,
+            coalesce=True,
         )
         self.add_handler('get_transaction_status', GetTransactionStatusPayloadHandler)
 
-        self.add_url('transfer_start', env.MtAPI.TRANSFER, verb='GET', base_url=env.MtAPI.BASE_URL)
+        self.add_url(
+            'transfer_start',
+            env.MtAPI.TRANSFER,
+            verb='GET',
+            base_url=env.MtAPI.BASE_URL,
+            idempotent=False,
+        )
         self.add_handler('transfer_start', TransferStartPayloadHandler)
 
         self.add_url(
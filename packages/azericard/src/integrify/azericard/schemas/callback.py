@@ -5,7 +5,8 @@ from integrify.azericard import env
 from integrify.azericard.schemas.common import AzeriCardMinimalWithAmountDataSchema
 from integrify.azericard.schemas.enums import Action, CardStatus
 from integrify.azericard.utils import TimeStampIn
-from pydantic import AliasGenerator, BaseModel, ConfigDict, Field, model_validator
+from integrify.schemas import DeferredModel
+from pydantic import AliasGenerator, ConfigDict, Field, model_validator
 from pydantic.alias_generators import to_pascal
 from typing_extensions import Self
 
@@ -41,7 +42,7 @@ class AuthCallbackWithCardDataSchema(AuthCallbackSchema):
     """Saxlanılacaq kartın TOKEN parametri"""
 
 
-class TransferCallbackSchema(BaseModel):
+class TransferCallbackSchema(DeferredModel):
     model_config = ConfigDict(alias_generator=AliasGenerator(validation_alias=to_pascal))
 
     operation_id: str = Field(min_length=16, max_length=20, validation_alias='OperationID')
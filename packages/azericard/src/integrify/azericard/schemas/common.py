@@ -8,10 +8,11 @@ from integrify.azericard.schemas.enums import (
     AuthorizationType,
 )
 from integrify.azericard.utils import TimeStampOut
-from pydantic import BaseModel, Field
+from integrify.schemas import DeferredModel
+from pydantic import Field
 
 
-class AzeriCardMinimalDataSchema(BaseModel):
+class AzeriCardMinimalDataSchema(DeferredModel):
     order: str = Field(min_length=6, max_length=32)
     """Satıcı sifariş ID-si, rəqəmsal. Son 6 rəqəm sistem izi audit nömrəsi kimi istifadə olunur,
     terminal id üçün bir gün ərzində unikal olmalıdır"""
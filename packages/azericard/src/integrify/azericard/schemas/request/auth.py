@@ -1,5 +1,4 @@
 import base64
-import json
 from functools import cache
 from typing import ClassVar, Literal
 
@@ -14,7 +13,7 @@ from integrify.azericard.schemas.enums import (
     AuthorizationResponseType,
     AuthorizationType,
 )
-from integrify.schemas import PayloadBaseModel
+from integrify.schemas import PayloadBaseModel, json_dumps
 from pydantic import (
     AliasGenerator,
     ConfigDict,
@@ -111,7 +110,7 @@ class AuthRequestSchema(BaseRequestSchema, AzeriCardMinimalWithAmountDataSchema)
         if not m_info:
             return None
 
-        return base64.b64encode(json.dumps(m_info).encode()).decode()
+        return base64.b64encode(json_dumps(m_info)).decode()
 
     @classmethod
     def get_input_fields(cls):
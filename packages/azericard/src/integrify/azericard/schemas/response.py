@@ -11,12 +11,13 @@ from integrify.azericard.schemas.enums import (
     TransferStatusCode,
 )
 from integrify.azericard.utils import TimeStampIn
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from integrify.schemas import DeferredModel
+from pydantic import ConfigDict, Field, field_validator, model_validator
 from pydantic.alias_generators import to_pascal
 from typing_extensions import Self
 
 
-class GetTransactionStatusResponseSchema(BaseModel):
+class GetTransactionStatusResponseSchema(DeferredModel):
     action: Action = Field(validation_alias='ACTION')
     """Sorğu üçün orijinal əməliyyat"""
 
@@ -81,7 +82,7 @@ class GetTransactionStatusResponseSchema(BaseModel):
         return datetime.strptime(val, '%Y%m%d%H%M%S')
 
 
-class TransferDeclineResponseSchema(BaseModel):
+class TransferDeclineResponseSchema(DeferredModel):
     SIGNATURE_FIELDS: ClassVar[list[str]] = [
         'operation_id',
         'srn',
@@ -0,0 +1,321 @@
+import secrets
+from datetime import datetime
+from decimal import Decimal
+from hashlib import md5
+from typing import Any
+
+import httpx
+import rsa
+from integrify.azericard import env
+from integrify.azericard.schemas.response import (
+    TransferConfirmResponseSchema,
+    TransferDeclineResponseSchema,
+)
+from integrify.testing import Simulator, json_response, request_data, route
+from pydantic import BaseModel
+
+__all__ = ['AzeriCardSimulator']
+
+_AUTH_SIGNATURE_FIELDS = ['AMOUNT', 'CURRENCY', 'TERMINAL', 'TRTYPE', 'TIMESTAMP', 'NONCE']
+_FINALIZE_SIGNATURE_FIELDS = ['ORDER', 'AMOUNT', 'CURRENCY', 'TERMINAL', 'TRTYPE', 'RRN', 'INT_REF']
+_STATUS_SIGNATURE_FIELDS = ['ORDER', 'TERMINAL', 'TRTYPE', 'TIMESTAMP', 'NONCE']
+_CALLBACK_SIGNATURE_FIELDS = ['AMOUNT', 'CURRENCY', 'TERMINAL', 'TRTYPE', 'ORDER', 'RRN', 'INT_REF']
+
+
+def _timestamp() -> str:
+    return datetime.now().strftime('%Y%m%d%H%M%S')
+
+
+def _mac_source(data: dict[str, Any], fields: list[str]) -> str:
+    """P_SIGN-in MAC source-u: hər dəyər üçün `len(value) + value`, boş dəyər üçün `-`"""
+    values = (str(data.get(field) or '') for field in fields)
+    return ''.join(f'{len(value)}{value}' if value else '-' for value in values)
+
+
+class AzeriCardSimulator(Simulator):
+    """AzeriCard MPI və MT API-lərinin lokal simulyatoru (bax: `integrify.testing.Simulator`).
+
+    - `/cgi-bin/cgi_link`, `/token/cgi_link`: brauzerin göndərdiyi avtorizasiya formları
+      (`TRTYPE` 0/1), tamamlama/geri qaytarma (21/22/24) və status sorğusu (90). `P_SIGN`
+      merchant açarının public hissəsi ilə yoxlanılır. Avtorizasiyanın nəticəsi `complete()`
+      ilə (və ya `auto_complete=True` olduqda dərhal) `BACKREF` ünvanına callback kimi
+      göndərilir.
+    - `/payment/view`, `/api/confirm`, `/api/decline`: pul köçürmələri. MD5 imzalar
+      yoxlanılır, cavablar və callback-lər AzeriCard formatında imzalanır.
+
+    Klientdə avtorizasiya endpoint-ləri `dry` olduğundan, onların data-sı brauzerin etdiyi
+    kimi simulyatora form şəklində göndərilməlidir, məs.,
+    `httpx.Client(transport=sim.transport()).post(resp['url'], data=resp['data'])`.
+    """
+
+    name = 'azericard'
+    base_url = env.MpiAPI.BASE_URL.value
+
+    def __init__(
+        self,
+        key_file_path: str | None = None,
+        transfer_callback_url: str = 'http://testserver/azericard/transfer-callback',
+        auto_complete: bool = False,
+        **kwds: Any,
+    ):
+        """
+        Args:
+            key_file_path: Merchant-in RSA açarı. Verilməsə, `AZERICARD_KEY_FILE_PATH`
+                istifadə olunur.
+            transfer_callback_url: Köçürmənin nəticəsinin göndəriləcəyi URL
+            auto_complete: Avtorizasiyaları 3DS səhifəsini gözləmədən dərhal tamamlamaq
+            **kwds: `Simulator` argumentləri (`latency`, `error_rate` və s.)
+        """
+        super().__init__(**kwds)
+        with open(key_file_path or env.AZERICARD_KEY_FILE_PATH, encoding='utf-8') as key_file:
+            self.key = key_file.read()
+
+        private_key = rsa.PrivateKey.load_pkcs1(self.key.encode())
+        self.public_key = rsa.PublicKey(private_key.n, private_key.e)
+        self.private_key = private_key
+        self.transfer_callback_url = transfer_callback_url
+        self.auto_complete = auto_complete
+
+        self.transactions: dict[str, dict[str, Any]] = {}
+        """`ORDER` üzrə avtorizasiyalar"""
+
+        self.transfers: dict[str, dict[str, Any]] = {}
+        """`SRN` üzrə pul köçürmələri"""
+
+    # ------------------------------------------------------------------------------------- #
+    # İmzalar
+    # ------------------------------------------------------------------------------------- #
+    def _verify_p_sign(self, data: dict[str, Any], fields: list[str]) -> bool:
+        try:
+            signature = bytes.fromhex(data.get('P_SIGN', ''))
+            rsa.verify(_mac_source(data, fields).encode(), signature, self.public_key)
+        except (ValueError, rsa.VerificationError):
+            return False
+        return True
+
+    def _p_sign(self, data: dict[str, Any], fields: list[str]) -> str:
+        return rsa.sign(_mac_source(data, fields).encode(), self.private_key, 'SHA-256').hex()
+
+    def _md5(self, source: str) -> str:
+        return md5(source.encode(), usedforsecurity=False).hexdigest()
+
+    def _verify_transfer(self, data: dict[str, Any], fields: list[str]) -> bool:
+        source = ''.join(str(data.get(field, '')) for field in fields)
+        return data.get('Signature') == self._md5(source + self.key.replace('\n', ''))
+
+    def _sign_response(self, model: type[BaseModel], body: dict[str, Any]) -> dict[str, Any]:
+        # İmza validasiya olunmuş dəyərlərdən hesablanır (bax: `validate_signature`)
+        unsigned = type(model.__name__, (model,), {'validate_signature': lambda self: self})
+        parsed = unsigned.model_validate({**body, 'Signature': ''})
+        source = ''.join(str(getattr(parsed, f) or '') for f in model.SIGNATURE_FIELDS)  # type: ignore[attr-defined]
+        key = self.key.strip().replace('\r\n', '\n')
+        return {**body, 'Signature': self._md5(source + key)}
+
+    # ------------------------------------------------------------------------------------- #
+    # Avtorizasiya
+    # ------------------------------------------------------------------------------------- #
+    def complete(self, order: str, success: bool = True) -> None:
+        """3DS səhifəsində ödənişin bitməsini simulyasiya edir və `BACKREF`-ə callback göndərir.
+
+        Args:
+            order: Sifarişin `ORDER` dəyəri
+            success: Ödənişin uğurlu olub-olmaması
+        """
+        with self._lock:
+            transaction = self.transactions[order]
+            transaction.update(ACTION='0' if success else '2', RC='00' if success else '05')
+            self._send_auth_callback(transaction)
+
+    def _send_auth_callback(self, transaction: dict[str, Any]) -> None:
+        callback = {
+            key: transaction[key]
+            for key in ('TERMINAL', 'TRTYPE', 'ORDER', 'AMOUNT', 'CURRENCY', 'ACTION', 'RC')
+        }
+        callback.update(
+            APPROVAL=transaction['APPROVAL'],
+            RRN=transaction['RRN'],
+            INT_REF=transaction['INT_REF'],
+            TIMESTAMP=_timestamp(),
+            NONCE=secrets.token_hex(16),
+        )
+        if transaction.get('TOKEN'):
+            callback.update(CARD='123456******1234', TOKEN=transaction['TOKEN'])
+        callback['P_SIGN'] = self._p_sign(callback, _CALLBACK_SIGNATURE_FIELDS)
+
+        if transaction.get('BACKREF'):
+            self.send_callback('POST', transaction['BACKREF'], data=callback)
+
+    def _authorize(self, data: dict[str, Any], save_card: bool) -> httpx.Response:
+        if not self._verify_p_sign(data, [*_AUTH_SIGNATURE_FIELDS, 'MERCH_URL']):
+            return httpx.Response(200, text='Invalid P_SIGN')
+
+        token = data.get('TOKEN')
+        if save_card and data.get('TOKEN_ACTION') == 'REGISTER':
+            token = secrets.token_hex(14)
+
+        index = len(self.transactions) + 1
+        transaction = {
+            **{key: data.get(key) for key in ('TERMINAL', 'TRTYPE', 'ORDER', 'AMOUNT')},
+            'CURRENCY': data.get('CURRENCY'),
+            'BACKREF': data.get('BACKREF'),
+            'TOKEN': token,
+            'APPROVAL': f'{index:06d}',
+            'RRN': f'{index:012d}',
+            'INT_REF': secrets.token_hex(8).upper(),
+            'ACTION': None,
+            'RC': None,
+        }
+        self.transactions[data['ORDER']] = transaction
+        if self.auto_complete:
+            self.complete(data['ORDER'])
+
+        return httpx.Response(200, text=f'<html><body>3DS {data["ORDER"]}</body></html>')
+
+    def _finalize(self, data: dict[str, Any]) -> httpx.Response:
+        if not self._verify_p_sign(data, _FINALIZE_SIGNATURE_FIELDS):
+            return httpx.Response(200, text='Invalid P_SIGN')
+
+        transaction = self.transactions.get(data.get('ORDER', ''))
+        if transaction is None or data.get('RRN') != transaction['RRN']:
+            return httpx.Response(200, text='Transaction not found')
+
+        transaction.update(TRTYPE=data['TRTYPE'], ACTION='0', RC='00')
+        self._send_auth_callback(transaction)
+        return httpx.Response(200, text='OK')
+
+    def _status(self, data: dict[str, Any]) -> httpx.Response:
+        if not self._verify_p_sign(data, _STATUS_SIGNATURE_FIELDS):
+            return json_response({'error': 'Invalid P_SIGN'}, 400)
+
+        transaction = self.transactions.get(data.get('ORDER', ''))
+        if transaction is None:
+            return json_response({'error': 'Transaction not found'}, 404)
+
+        body = {
+            'ACTION': int(transaction['ACTION'] or 3),
+            'Response code': transaction['RC'] or '-1',
+            'Transaction Status message': 'Approved' if transaction['RC'] == '00' else 'Pending',
+            'TERMINAL': transaction['TERMINAL'],
+            'Card number': '123456******1234',
+            'Transaction amount': transaction['AMOUNT'],
+            'Transaction currency': transaction['CURRENCY'],
+            'Transaction date': _timestamp(),
+            'Transaction state': 'Completed' if transaction['ACTION'] == '0' else 'New',
+            'Merchant order id': transaction['ORDER'],
+            'Banks approval code': transaction['APPROVAL'],
+            'Transaction RRN': transaction['RRN'],
+            'INT_REF': transaction['INT_REF'],
+            'Original transaction TRTYPE': transaction['TRTYPE'],
+            'Timestamp': _timestamp(),
+            'Nonce': secrets.token_hex(16),
+        }
+        signed = {
+            'ORDER': transaction['ORDER'],
+            'TERMINAL': transaction['TERMINAL'],
+            'TRTYPE': data['TRTYPE'],
+            'TIMESTAMP': body['Timestamp'],
+            'NONCE': body['Nonce'],
+        }
+        body['P_SIGN'] = self._p_sign(signed, _STATUS_SIGNATURE_FIELDS)
+        return json_response(body)
+
+    def _cgi_link(self, request: httpx.Request, save_card: bool) -> httpx.Response:
+        data = {key.upper(): value for key, value in request_data(request).items()}
+        trtype = str(data.get('TRTYPE', ''))
+        if trtype in {'0', '1'}:
+            return self._authorize(data, save_card)
+        if trtype in {'21', '22', '24'}:
+            return self._finalize(data)
+        if trtype == '90':
+            return self._status(data)
+        return httpx.Response(200, text=f'Unknown TRTYPE {trtype!r}')
+
+    @route('POST', env.MpiAPI.AUTHORIZATION)
+    def cgi_link(self, request: httpx.Request) -> httpx.Response:
+        return self._cgi_link(request, save_card=False)
+
+    @route('POST', env.MpiAPI.SAVE_CARD)
+    def token_cgi_link(self, request: httpx.Request) -> httpx.Response:
+        return self._cgi_link(request, save_card=True)
+
+    # ------------------------------------------------------------------------------------- #
+    # Pul köçürmələri
+    # ------------------------------------------------------------------------------------- #
+    @route('GET', env.MtAPI.TRANSFER)
+    def transfer_start(self, request: httpx.Request) -> httpx.Response:
+        data = request_data(request)
+        fields = ['Merchant', 'SRN', 'Amount', 'Cur', 'ReceiverCredentials', 'RedirectLink']
+        if not self._verify_transfer(data, fields):
+            return httpx.Response(400, text='Signature mismatch')
+
+        transfer = {
+            'OperationId': secrets.token_hex(8).upper(),
+            'SRN': data['SRN'],
+            'Amount': data['Amount'],
+            'Cur': data['Cur'],
+            'Status': 'pending',
+        }
+        self.transfers[data['SRN']] = transfer
+
+        callback = {
+            'OperationID': transfer['OperationId'],
+            'SRN': transfer['SRN'],
+            'Amount': transfer['Amount'],
+            'Cur': transfer['Cur'],
+            'CardStatus': 'our_active',
+            'ReceiverPAN': '1234560000001234',
+            'Status': 'pending',
+            'Timestamp': _timestamp(),
+            'Response Code': '00',
+            'Message': 'Pending',
+        }
+        source = ''.join(
+            str(Decimal(str(value))) if key == 'Amount' else str(value)
+            for key, value in callback.items()
+        )
+        callback['Signature'] = self._md5(source + self.key.strip().replace('\r\n', '\n'))
+        self.send_callback('POST', self.transfer_callback_url, json=callback)
+
+        return httpx.Response(200, text=f'<html><body>Transfer {data["SRN"]}</body></html>')
+
+    def _finish_transfer(self, request: httpx.Request, confirm: bool) -> httpx.Response:
+        data = request_data(request)
+        transfer = self.transfers.get(str(data.get('SRN')))
+        body: dict[str, Any] = {
+            'OperationId': transfer['OperationId'] if transfer else '-',
+            'SRN': str(data.get('SRN', '')),
+            'Amount': data.get('Amount'),
+            'Cur': data.get('Cur'),
+            'Timestamp': _timestamp(),
+        }
+
+        if not self._verify_transfer(data, ['Merchant', 'SRN', 'Amount', 'Cur', 'Timestamp']):
+            body.update(ResponseCode=106, Message='Signature mismatch')
+        elif transfer is None:
+            body.update(ResponseCode=112, Message='Transaction not found')
+        elif transfer['Status'] != 'pending':
+            body.update(ResponseCode=105, Message='Transaction is not pending')
+        else:
+            transfer['Status'] = 'confirmed' if confirm else 'declined'
+            body.update(ResponseCode=0, Message='Success')
+        body['Status'] = transfer['Status'] if transfer else 'unknown'
+
+        model: type[BaseModel] = TransferDeclineResponseSchema
+        if confirm:
+            model = TransferConfirmResponseSchema
+            body.update(RRN=f'{len(self.transfers):012d}', ReceiverPan='1234560000001234')
+        return json_response(self._sign_response(model, body))
+
+    @route('POST', env.MtAPI.TRANSFER_CONFIRM)
+    def transfer_confirm(self, request: httpx.Request) -> httpx.Response:
+        return self._finish_transfer(request, confirm=True)
+
+    @route('POST', env.MtAPI.TRANSFER_DECLINE)
+    def transfer_decline(self, request: httpx.Request) -> httpx.Response:
+        return self._finish_transfer(request, confirm=False)
+
+    def reset(self) -> None:
+        with self._lock:
+            super().reset()
+            self.transactions.clear()
+            self.transfers.clear()
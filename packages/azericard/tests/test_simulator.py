@@ -0,0 +1,107 @@
+import json
+from urllib.parse import parse_qsl
+
+import pytest
+import rsa
+from integrify.azericard.client import AzeriCardClientClass
+from integrify.azericard.schemas.callback import (
+    AuthCallbackWithCardDataSchema,
+    TransferCallbackSchema,
+)
+from integrify.azericard.schemas.enums import Action, AuthorizationType
+from integrify.azericard.simulator import AzeriCardSimulator
+from integrify.testing import simulator
+from pytest_mock import MockerFixture
+
+MERCHANT = {
+    'terminal': '17204655',
+    'desc': 'test',
+    'merch_name': 'Shop',
+    'merch_url': 'https://shop.az',
+    'backref': 'https://shop.az/azericard/callback',
+}
+
+
+@pytest.fixture(scope='module')
+def azericard_key_file(tmp_path_factory: pytest.TempPathFactory):
+    _, private_key = rsa.newkeys(1024)
+    key_file = tmp_path_factory.mktemp('azericard') / 'key.pem'
+    key_file.write_bytes(private_key.save_pkcs1())
+    yield str(key_file)
+
+
+@pytest.fixture
+def azericard_simulator(azericard_key_file: str, mocker: MockerFixture):
+    mocker.patch('integrify.azericard.env.AZERICARD_KEY_FILE_PATH', azericard_key_file)
+    yield simulator('azericard')
+
+
+def test_auth_flow(azericard_simulator: AzeriCardSimulator):
+    transport = azericard_simulator.transport()
+    client = AzeriCardClientClass(transport=transport)
+
+    form = client.auth_and_save_card(
+        amount=1,
+        currency='AZN',
+        order='12345678',
+        trtype=AuthorizationType.DIRECT,
+        **MERCHANT,
+    )
+    # Brauzerin form post-u
+    assert client.request_executor.client.post(form['url'], data=form['data']).status_code == 200
+
+    azericard_simulator.complete('12345678')
+    callback = dict(parse_qsl(azericard_simulator.callbacks[0].read().decode()))
+    auth = AuthCallbackWithCardDataSchema.model_validate(callback)
+    assert auth.action == Action.TRANSACTION_SUCCESS
+    assert auth.token
+
+    status = client.get_transaction_status(
+        tran_trtype=AuthorizationType.DIRECT,
+        order='12345678',
+        terminal=MERCHANT['terminal'],
+    )
+    assert status.ok
+    assert status.body.action == Action.TRANSACTION_SUCCESS
+    assert status.body.rrn == auth.rrn
+
+
+def test_invalid_p_sign(azericard_simulator: AzeriCardSimulator):
+    client = AzeriCardClientClass(transport=azericard_simulator.transport())
+
+    form = client.authorization(
+        amount=1,
+        currency='AZN',
+        order='12345678',
+        trtype=AuthorizationType.DIRECT,
+        **MERCHANT,
+    )
+    data = {**form['data'], 'AMOUNT': '100'}
+    resp = client.request_executor.client.post(form['url'], data=data)
+    assert resp.text == 'Invalid P_SIGN'
+    assert not azericard_simulator.transactions
+
+
+def test_transfer_flow(azericard_simulator: AzeriCardSimulator):
+    client = AzeriCardClientClass(transport=azericard_simulator.transport())
+
+    start = client.transfer_start(
+        merchant='Shop',
+        srn='SRN1',
+        amount=10,
+        cur='AZN',
+        receiver_credentials='John Doe',
+        redirect_link='https://x.az',
+    )
+    resp = client.request_executor.client.get(start['url'], params=start['data'])
+    assert resp.status_code == 200
+
+    callback = TransferCallbackSchema.model_validate(
+        json.loads(azericard_simulator.callbacks[0].read())
+    )
+    assert callback.srn == 'SRN1'
+
+    confirm = client.transfer_confirm(merchant='Shop', srn='SRN1', amount=10, cur='AZN')
+    assert confirm.ok
+    assert confirm.body.status == 'confirmed'
+    assert confirm.body.operation_id == callback.operation_id
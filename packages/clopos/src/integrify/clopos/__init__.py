@@ -7,7 +7,22 @@ EN: https://developer.clopos.com
 __path__ = __import__('pkgutil').extend_path(__path__, __name__)
 
 
-from .client import CloposAsyncRequest, CloposClientClass, CloposRequest
-from .env import VERSION
+from typing import TYPE_CHECKING
+
+from integrify.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import CloposAsyncRequest, CloposClientClass, CloposRequest
+    from .env import VERSION
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'CloposClientClass': '.client',
+        'CloposRequest': '.client',
+        'CloposAsyncRequest': '.client',
+        'VERSION': '.env',
+    },
+)
 
 __all__ = ['CloposClientClass', 'CloposRequest', 'CloposAsyncRequest', 'VERSION']
@@ -51,6 +51,8 @@ from integrify.clopos.schemas.sales.object import PaymentMethod, SaleType
 from integrify.clopos.schemas.stations.object import Station
 from integrify.clopos.schemas.users.object import User
 from integrify.clopos.schemas.venues.object import Venue
+from integrify.ratelimit import RateLimiter
+from integrify.retry import DEFAULT_RETRY_POLICY
 from integrify.schemas import APIResponse
 from integrify.utils import UNSET, Unset
 
@@ -67,10 +69,13 @@ class CloposClientClass(APIClient, Generic[_Mode]):
         default_handler=None,
         sync: bool = True,
         dry: bool = False,
+        **kwds: Any,
     ):
-        super().__init__(name, base_url, default_handler, sync, dry)
+        kwds.setdefault('rate_limiter', RateLimiter.shared('clopos', env.CLOPOS_RATE_LIMIT))
+        kwds.setdefault('retry', DEFAULT_RETRY_POLICY)
+        super().__init__(name, base_url, default_handler, sync, dry, **kwds)
 
-        self.add_url('auth', env.API.AUTH, verb='POST')
+        self.add_url('auth', env.API.AUTH, verb='POST', idempotent=True)
         self.add_handler('auth', AuthHandler)
 
         self.add_url('get_venues', env.API.VENUES, verb='GET')
@@ -90,26 +95,43 @@ class CloposClientClass(APIClient, Generic[_Mode]):
         self.add_url('get_customer_groups', env.API.CUSTOMER_GROUPS, verb='GET')
         self.add_handler('get_customer_groups', GetPaginatedDataHandler(Group))
 
-        self.add_url('get_categories', env.API.CATEGORIES, verb='GET')
+        self.add_url(
+            'get_categories', env.API.CATEGORIES, verb='GET', cache_ttl=env.CLOPOS_CATALOG_CACHE_TTL
+        )
         self.add_handler('get_categories', GetCategoriesHandler)
         self.add_url('get_category_by_id', env.API.CATEGORY_BY_ID, verb='GET')
         self.add_handler('get_category_by_id', GetCategoryByIDHandler)
 
-        self.add_url('get_stations', env.API.STATIONS, verb='GET')
+        self.add_url(
+            'get_stations', env.API.STATIONS, verb='GET', cache_ttl=env.CLOPOS_CATALOG_CACHE_TTL
+        )
         self.add_handler('get_stations', GetStationsHandler)
         self.add_url('get_station_by_id', env.API.STATION_BY_ID, verb='GET')
         self.add_handler('get_station_by_id', GetByIDHandler(Station))
 
-        self.add_url('get_products', env.API.PRODUCTS, verb='GET')
+        self.add_url(
+            'get_products',
+            env.API.PRODUCTS,
+            verb='GET',
+            cache_ttl=env.CLOPOS_CATALOG_CACHE_TTL,
+            coalesce=True,
+        )
         self.add_handler('get_products', GetProductsHandler)
-        self.add_url('get_product_by_id', env.API.PRODUCT_BY_ID, verb='GET')
+        self.add_url('get_product_by_id', env.API.PRODUCT_BY_ID, verb='GET', coalesce=True)
         self.add_handler('get_product_by_id', GetProductByIDHandler)
         self.add_url('get_stop_list', env.API.STOP_LIST, verb='GET')
         self.add_handler('get_stop_list', GetStopListHandler)
 
-        self.add_url('get_sale_types', env.API.SALE_TYPES, verb='GET')
+        self.add_url(
+            'get_sale_types', env.API.SALE_TYPES, verb='GET', cache_ttl=env.CLOPOS_CATALOG_CACHE_TTL
+        )
         self.add_handler('get_sale_types', GetPaginatedDataHandler(SaleType))
-        self.add_url('get_payment_methods', env.API.PAYMENT_METHODS, verb='GET')
+        self.add_url(
+            'get_payment_methods',
+            env.API.PAYMENT_METHODS,
+            verb='GET',
+            cache_ttl=env.CLOPOS_CATALOG_CACHE_TTL,
+        )
         self.add_handler('get_payment_methods', GetPaginatedDataHandler(PaymentMethod))
 
         self.add_url('get_orders', env.API.ORDERS, verb='GET')
@@ -118,21 +140,26 @@ class CloposClientClass(APIClient, Generic[_Mode]):
         self.add_handler('get_order_by_id', GetOrderByIDHandler)
         self.add_url('create_order', env.API.ORDERS, verb='POST')
         self.add_handler('create_order', CreateOrderHandler)
-        self.add_url('update_order', env.API.ORDER_BY_ID, verb='PUT')
+        self.add_url('update_order', env.API.ORDER_BY_ID, verb='PUT', idempotent=False)
         self.add_handler('update_order', UpdateOrderHandler)
 
         self.add_url('get_receipts', env.API.RECEIPTS, verb='GET')
         self.add_handler('get_receipts', GetReceiptsHandler)
         self.add_url('get_receipt_by_id', env.API.RECEIPT_BY_ID, verb='GET')
         self.add_handler('get_receipt_by_id', GetByIDHandler(Receipt))
-        self.add_url('update_closed_receipt', env.API.RECEIPT_BY_ID, verb='PATCH')
+        self.add_url('update_closed_receipt', env.API.RECEIPT_BY_ID, verb='PATCH', idempotent=False)
         self.add_handler('update_closed_receipt', UpdateClosedReceiptHandler)
         self.add_url('close_receipt', env.API.RECEIPT_CLOSE, verb='POST')
         self.add_handler('close_receipt', CloseReceiptHandler)
         self.add_url('get_receipt_stock_operations', env.API.RECEIPT_STOCK_OPERATIONS, verb='GET')
         self.add_handler('get_receipt_stock_operations', GetReceiptStockOperationsHandler)
 
-        self.add_url('get_price_lists', env.API.PRICE_LISTS, verb='GET')
+        self.add_url(
+            'get_price_lists',
+            env.API.PRICE_LISTS,
+            verb='GET',
+            cache_ttl=env.CLOPOS_CATALOG_CACHE_TTL,
+        )
         self.add_handler('get_price_lists', GetPaginatedDataHandler(PriceList))
         self.add_url('get_price_list_prices', env.API.PRICE_LIST_PRICES, verb='GET')
         self.add_handler('get_price_list_prices', GetPaginatedDataHandler(PriceListPrice))
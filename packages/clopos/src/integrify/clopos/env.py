@@ -1,6 +1,8 @@
 import os
 from enum import Enum
+from warnings import warn
 
+from integrify.ratelimit import RateLimiter
 from integrify.utils import Environment
 
 VERSION = '2.0.0'  # Clopos Open API version targeted by this client
@@ -15,6 +17,47 @@ CLOPOS_INTEGRATOR_ID: str = os.getenv('CLOPOS_INTEGRATOR_ID', '')
 CLOPOS_VENUE_ID: str = os.getenv('CLOPOS_VENUE_ID', '')
 CLOPOS_ENV: str = os.getenv('CLOPOS_ENV', Environment.TEST.value)
 
+DEFAULT_CATALOG_CACHE_TTL = 300.0
+
+
+def _parse_ttl(value: str | None, default: float = DEFAULT_CATALOG_CACHE_TTL) -> float:
+    """Env-dən oxunan TTL-i parse edir. Boş, yanlış formatlı və ya mənfi dəyərlərdə
+    paketin importu xəta ilə dayanmasın deyə, default dəyər qaytarılır."""
+    try:
+        ttl = float(value) if value and value.strip() else default
+    except ValueError:
+        return default
+
+    return ttl if ttl >= 0 else default
+
+
+def _parse_rate_limit(name: str, value: str | None) -> str | None:
+    """Env-dən oxunan sorğu limitini yoxlayır. Yanlış formatlı dəyərdə paketin importu xəta
+    ilə dayanmasın deyə, xəbərdarlıq edilir və limit tətbiq olunmur (`None`)."""
+    try:
+        RateLimiter.from_spec(value)
+    except ValueError:
+        warn(
+            f"{name}='{value}' yanlış formatdadır (məs., '10/s', '600/m'); "
+            'limit tətbiq olunmayacaq.'
+        )
+        return None
+
+    return value
+
+
+# Client-side sorğu limiti (məs., '10/s', '600/m'). Təyin olunmasa və ya yanlış formatdadırsa,
+# limit tətbiq olunmur.
+CLOPOS_RATE_LIMIT: str | None = _parse_rate_limit(
+    'CLOPOS_RATE_LIMIT', os.getenv('CLOPOS_RATE_LIMIT')
+)
+
+
+# Kataloq cavablarının (məhsullar, kateqoriyalar, stansiyalar, qiymət siyahıları, ödəniş
+# üsulları, satış tipləri) cache-də saxlanma müddəti (saniyə ilə). Yalnız klientə
+# `response_cache` verildikdə tətbiq olunur. Yanlış formatlı dəyərlərdə default istifadə olunur.
+CLOPOS_CATALOG_CACHE_TTL: float = _parse_ttl(os.getenv('CLOPOS_CATALOG_CACHE_TTL'))
+
 
 class API(str, Enum):
     """Endpoint constant-ları (Clopos Open API v2)"""
@@ -62,5 +105,7 @@ __all__ = [
     'CLOPOS_CLIENT_ID',
     'CLOPOS_CLIENT_SECRET',
     'CLOPOS_ENV',
+    'CLOPOS_RATE_LIMIT',
+    'CLOPOS_CATALOG_CACHE_TTL',
     'API',
 ]
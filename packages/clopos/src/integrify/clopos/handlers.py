@@ -1,6 +1,5 @@
 # pylint: disable=wrong-import-order,ungrouped-imports
-import json
-from functools import cached_property
+from functools import cache, cached_property
 from typing import Annotated
 
 from integrify.api import APIPayloadHandler
@@ -38,14 +37,25 @@ from integrify.clopos.schemas.receipts.request import (
 )
 from integrify.clopos.schemas.stations.object import Station
 from integrify.clopos.schemas.stations.request import GetStationsRequest
+from integrify.schemas import json_dumps
 from pydantic import Field
 
 
+@cache
+def with_error_response(resp_model):
+    """`resp_model | ErrorResponse` discriminated union-ını yaradır.
+
+    Nəticə cache-lənir: eyni `resp_model` üçün həmişə eyni tip obyekti qaytarılır, beləliklə
+    `APIResponse[...]` modeli hər handler instansiyası üçün yenidən qurulmur.
+    """
+    return Annotated[resp_model | ErrorResponse, Field(discriminator='success')]
+
+
 class AuthHandler(APIPayloadHandler):
     def __init__(
         self,
         req_model=AuthRequest,
-        resp_model=Annotated[AuthResponse | ErrorResponse, Field(discriminator='success')],
+        resp_model=with_error_response(AuthResponse),
         dry=False,
     ):
         super().__init__(req_model, resp_model, dry)
@@ -53,11 +63,7 @@ class AuthHandler(APIPayloadHandler):
 
 class AuthedAPIPayloadHandler(APIPayloadHandler):
     def __init__(self, req_model=None, resp_model=None, dry=False):
-        super().__init__(
-            req_model,
-            Annotated[resp_model | ErrorResponse, Field(discriminator='success')],
-            dry,
-        )
+        super().__init__(req_model, with_error_response(resp_model), dry)
 
     @cached_property
     def headers(self):
@@ -162,7 +168,7 @@ class GetProductsHandler(AuthedAPIPayloadHandler):
         super().__init__(req_model, resp_model, dry)
 
     def post_handle_payload(self, data):
-        return json.dumps(data)  # for urlencoding
+        return json_dumps(data).decode()  # for urlencoding
 
 
 class GetProductByIDHandler(AuthedAPIPayloadHandler):
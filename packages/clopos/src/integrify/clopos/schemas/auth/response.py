@@ -1,9 +1,9 @@
 from typing import Literal
 
-from pydantic import BaseModel
+from integrify.schemas import DeferredModel
 
 
-class AuthResponse(BaseModel):
+class AuthResponse(DeferredModel):
     success: Literal[True]
     token: str
     token_type: str
@@ -2,11 +2,12 @@ from decimal import Decimal
 from typing import Literal
 
 from integrify.clopos.schemas.enums import ProductType
+from integrify.schemas import DeferredModel
 from integrify.utils import UnsetOrNoneField
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 
-class Timestamp(BaseModel):
+class Timestamp(DeferredModel):
     created_at: str
     """The timestamp when the object was created"""
 
@@ -43,7 +44,7 @@ class Balance(Timestamp):
     """The position of the balance"""
 
 
-class CashbackBalance(BaseModel):
+class CashbackBalance(DeferredModel):
     name: UnsetOrNoneField[str]
     """The name of the balance"""
 
@@ -54,7 +55,7 @@ class CashbackBalance(BaseModel):
     """The balance amount"""
 
 
-class Image(BaseModel):
+class Image(DeferredModel):
     original: UnsetOrNoneField[str]
     """The original image URL"""
 
@@ -71,7 +72,7 @@ class Image(BaseModel):
     """The blur hash of the image"""
 
 
-class Media(BaseModel):
+class Media(DeferredModel):
     uuid: UnsetOrNoneField[str]
     """The UUID of the media"""
 
@@ -91,7 +92,7 @@ class Media(BaseModel):
     """The dimensions of the media"""
 
 
-class Variant(BaseModel):
+class Variant(DeferredModel):
     """List of product variants (for GOODS)"""
 
     id: int
@@ -122,7 +123,7 @@ class Variant(BaseModel):
     """The status of the variant (1: Active, 0: Inactive)"""
 
 
-class Modifier(BaseModel):
+class Modifier(DeferredModel):
     id: int
     """The modifier's identifier"""
 
@@ -170,7 +171,7 @@ class ModifierGroup(Timestamp):
     """The pivot information of the group"""
 
 
-class Package(BaseModel):
+class Package(DeferredModel):
     """List of purchasing packages (for INGREDIENT)"""
 
     id: int
@@ -183,7 +184,7 @@ class Package(BaseModel):
     """The number of base units contained in the package"""
 
 
-class Tax(BaseModel):
+class Tax(DeferredModel):
     id: int
     """Tax ID"""
 
@@ -194,7 +195,7 @@ class Tax(BaseModel):
     """Tax rate"""
 
 
-class Price(BaseModel):
+class Price(DeferredModel):
     price: Decimal
     """Price"""
 
@@ -205,7 +206,7 @@ class Price(BaseModel):
     """The venue ID"""
 
 
-class TimerSetting(BaseModel):
+class TimerSetting(DeferredModel):
     interval: int
     """The pricing interval in minutes"""
 
@@ -213,7 +214,7 @@ class TimerSetting(BaseModel):
     """List of prices by intervals"""
 
 
-class Service(BaseModel):
+class Service(DeferredModel):
     sale_type_id: UnsetOrNoneField[int]
     """The sale type ID"""
 
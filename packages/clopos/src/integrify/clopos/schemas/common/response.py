@@ -1,12 +1,13 @@
 from typing import Generic, Literal, TypeVar
 
+from integrify.schemas import DeferredModel
 from integrify.utils import UnsetField
 from pydantic import BaseModel
 
 _ObjectTypeT = TypeVar('_ObjectTypeT', bound=BaseModel)
 
 
-class BaseResponse(BaseModel):
+class BaseResponse(DeferredModel):
     success: Literal[True]
     """Success status of the request"""
 
@@ -40,7 +41,7 @@ class ObjectListResponse(PaginatedResponse, Generic[_ObjectTypeT]):
     data: list[_ObjectTypeT]
 
 
-class Errors(BaseModel):
+class Errors(DeferredModel):
     message: str | None = None
     type: str | None = None
     exception: str | None = None
@@ -48,7 +49,7 @@ class Errors(BaseModel):
     http_code: int | None = None
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(DeferredModel):
     success: Literal[False]
     error: list[Errors] = []
     message: str | None = None
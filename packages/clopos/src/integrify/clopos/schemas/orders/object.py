@@ -5,18 +5,18 @@ from integrify.clopos.schemas.common.object import Service, Timestamp
 from integrify.clopos.schemas.enums import DiscountType, OrderStatus
 from integrify.clopos.schemas.products.object import Product
 from integrify.clopos.schemas.sales.object import PaymentMethod, SaleType
+from integrify.schemas import DeferredModel
 from integrify.utils import UnsetField, UnsetOrNoneField
-from pydantic import BaseModel
 
 
-class ServiceIn(BaseModel):
+class ServiceIn(DeferredModel):
     sale_type_id: int
     sale_type_name: str
     venue_id: int
     venue_name: str
 
 
-class CustomerIn(BaseModel):
+class CustomerIn(DeferredModel):
     id: int
     name: str
     customer_discount_type: UnsetField[int] = None
@@ -24,21 +24,21 @@ class CustomerIn(BaseModel):
     address: UnsetOrNoneField[str]
 
 
-class ProductIn(BaseModel):
+class ProductIn(DeferredModel):
     product_id: int
     count: int
     product_modificators: UnsetOrNoneField[list[dict]]
     meta: UnsetOrNoneField[dict]
 
 
-class OrderPayloadIn(BaseModel):
+class OrderPayloadIn(DeferredModel):
     service: ServiceIn
     customer: CustomerIn
     products: list[ProductIn]
     meta: UnsetOrNoneField[dict]
 
 
-class OrderProductProduct(BaseModel):
+class OrderProductProduct(DeferredModel):
     product: UnsetOrNoneField[Union['Product', list]]
     """The product information"""
 
@@ -55,7 +55,7 @@ class OrderProductProduct(BaseModel):
     """The hash of the product"""
 
 
-class OrderProductMeta(BaseModel):
+class OrderProductMeta(DeferredModel):
     price: UnsetOrNoneField[Decimal]
     """The sales price of the product"""
 
@@ -63,7 +63,7 @@ class OrderProductMeta(BaseModel):
     """The product information"""
 
 
-class OrderProduct(BaseModel):
+class OrderProduct(DeferredModel):
     product_id: UnsetOrNoneField[int]
     """The product ID"""
 
@@ -77,7 +77,7 @@ class OrderProduct(BaseModel):
     """The product information"""
 
 
-class OrderCustomer(BaseModel):
+class OrderCustomer(DeferredModel):
     id: UnsetOrNoneField[int]
     """The customer ID"""
 
@@ -94,7 +94,7 @@ class OrderCustomer(BaseModel):
     """The discount type of the customer"""
 
 
-class OrderPayload(BaseModel):
+class OrderPayload(DeferredModel):
     service: UnsetOrNoneField[Service]
     """The sale type of the order"""
 
@@ -117,7 +117,7 @@ class OrderPayload(BaseModel):
     """The timestamp of the last update to the payload"""
 
 
-class OrderItem(BaseModel):
+class OrderItem(DeferredModel):
     id: int
     """The order item's identifier"""
 
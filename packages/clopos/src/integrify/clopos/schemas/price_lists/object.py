@@ -1,10 +1,10 @@
 from decimal import Decimal
 
+from integrify.schemas import DeferredModel
 from integrify.utils import UnsetOrNoneField
-from pydantic import BaseModel
 
 
-class PriceListPrice(BaseModel):
+class PriceListPrice(DeferredModel):
     id: int
     """Unique identifier of the price entry"""
 
@@ -24,7 +24,7 @@ class PriceListPrice(BaseModel):
     """The related price list object (included with `with[]=list`)"""
 
 
-class PriceList(BaseModel):
+class PriceList(DeferredModel):
     id: int
     """Unique identifier of the price list"""
 
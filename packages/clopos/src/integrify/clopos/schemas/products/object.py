@@ -13,8 +13,8 @@ from integrify.clopos.schemas.common.object import (
 )
 from integrify.clopos.schemas.enums import ProductType
 from integrify.clopos.schemas.venues.object import Venue
+from integrify.schemas import DeferredModel
 from integrify.utils import UnsetOrNoneField
-from pydantic import BaseModel
 
 
 class Product(Timestamp):
@@ -199,7 +199,7 @@ class Product(Timestamp):
     """The timestamp when the object was last updated"""
 
 
-class StopList(BaseModel):
+class StopList(DeferredModel):
     id: int
     """The ID of the stop list"""
 
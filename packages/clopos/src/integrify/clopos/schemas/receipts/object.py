@@ -3,11 +3,12 @@ from decimal import Decimal
 from integrify.clopos.helpers import IsoDateTime
 from integrify.clopos.schemas.common.object import Timestamp
 from integrify.clopos.schemas.enums import DiscountType, OrderStatus
+from integrify.schemas import DeferredModel
 from integrify.utils import UnsetField, UnsetOrNoneField
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 
-class ReceiptProductIn(BaseModel):
+class ReceiptProductIn(DeferredModel):
     model_config = {'extra': 'allow'}
 
     id: UnsetField[int]
@@ -53,7 +54,7 @@ class ReceiptProductIn(BaseModel):
     """The deleted at of the receipt product"""
 
 
-class ReceiptPaymentMethod(BaseModel):
+class ReceiptPaymentMethod(DeferredModel):
     id: int
     """The payment method ID"""
 
@@ -302,7 +303,7 @@ class Receipt(Timestamp):
     """Receipt properties"""
 
 
-class ReceiptStockOperation(BaseModel):
+class ReceiptStockOperation(DeferredModel):
     id: int
     """Unique identifier of the stock operation"""
 
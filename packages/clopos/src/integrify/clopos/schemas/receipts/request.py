@@ -3,11 +3,11 @@ from decimal import Decimal
 from integrify.clopos.helpers import IsoDateTime
 from integrify.clopos.schemas.common.request import ByIDRequest, PaginatedDataRequest
 from integrify.clopos.schemas.enums import OrderStatus
+from integrify.schemas import DeferredModel
 from integrify.utils import UnsetField
-from pydantic import BaseModel
 
 
-class PaymentMethodIn(BaseModel):
+class PaymentMethodIn(DeferredModel):
     id: int
     """The unique identifier for the payment method"""
 
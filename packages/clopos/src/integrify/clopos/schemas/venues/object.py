@@ -1,8 +1,8 @@
+from integrify.schemas import DeferredModel
 from integrify.utils import UnsetOrNoneField
-from pydantic import BaseModel
 
 
-class Venue(BaseModel):
+class Venue(DeferredModel):
     id: int
     """Branch ID"""
 
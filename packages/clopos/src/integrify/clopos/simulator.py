@@ -0,0 +1,305 @@
+import secrets
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+from integrify.clopos import env
+from integrify.clopos.schemas.categories.object import Category
+from integrify.clopos.schemas.customers.object import Customer, Group
+from integrify.clopos.schemas.orders.object import Order
+from integrify.clopos.schemas.price_lists.object import PriceList, PriceListPrice
+from integrify.clopos.schemas.products.object import Product, StopList
+from integrify.clopos.schemas.receipts.object import Receipt, ReceiptStockOperation
+from integrify.clopos.schemas.sales.object import PaymentMethod, SaleType
+from integrify.clopos.schemas.stations.object import Station
+from integrify.clopos.schemas.users.object import User
+from integrify.clopos.schemas.venues.object import Venue
+from integrify.testing import Simulator, json_response, request_data, route, sample_model
+from pydantic import BaseModel
+
+__all__ = ['CloposSimulator']
+
+_CATALOG: dict[str, type[BaseModel]] = {
+    'venues': Venue,
+    'users': User,
+    'customers': Customer,
+    'customer-groups': Group,
+    'categories': Category,
+    'stations': Station,
+    'products': Product,
+    'stop-list': StopList,
+    'sale-types': SaleType,
+    'payment-methods': PaymentMethod,
+    'orders': Order,
+    'receipts': Receipt,
+    'stock-operations': ReceiptStockOperation,
+    'price-lists': PriceList,
+    'prices': PriceListPrice,
+}
+
+
+class CloposSimulator(Simulator):
+    """Clopos Open API v2-nin lokal simulyatoru (bax: `integrify.testing.Simulator`).
+
+    `auth` endpoint-i credential-ları yoxlayıb token qaytarır; digər endpoint-lər yalnız
+    verilmiş `x-token` ilə işləyir. Hər resurs üçün `catalog_size` sayda nümunə obyekt
+    (schema-lardan generasiya olunur) yaddaşda saxlanılır: siyahılar `page`/`limit` ilə
+    səhifələnir, müştəri və sifarişlər yaradılır, sifariş və çeklər yenilənir.
+    """
+
+    name = 'clopos'
+    base_url = env.API.BASE_URL.value
+
+    def __init__(self, catalog_size: int = 20, token_ttl: int = 3600, **kwds: Any):
+        """
+        Args:
+            catalog_size: Hər resurs üçün generasiya olunan obyektlərin sayı
+            token_ttl: Tokenin etibarlılıq müddəti (saniyə ilə)
+            **kwds: `Simulator` argumentləri (`latency`, `error_rate` və s.)
+        """
+        super().__init__(**kwds)
+        self.catalog_size = catalog_size
+        self.token_ttl = token_ttl
+
+        self.tokens: dict[str, float] = {}
+        """Verilmiş tokenlər və onların bitmə vaxtı"""
+
+        self.objects: dict[str, dict[int, dict[str, Any]]] = {}
+        """Resurs adı üzrə obyektlər (`id` -> JSON)"""
+
+        self._generate()
+
+    def _generate(self) -> None:
+        for resource, model in _CATALOG.items():
+            sample = sample_model(model)
+            self.objects[resource] = {
+                i: {**sample, 'id': i} if 'id' in sample else dict(sample)
+                for i in range(1, self.catalog_size + 1)
+            }
+
+    # ------------------------------------------------------------------------------------- #
+    # Cavablar
+    # ------------------------------------------------------------------------------------- #
+    @staticmethod
+    def _envelope(**body: Any) -> dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        return {
+            'success': True,
+            'time': 1,
+            'timestamp': now.isoformat(),
+            'unix': int(now.timestamp()),
+            **body,
+        }
+
+    @staticmethod
+    def error(status_code: int, message: str) -> httpx.Response:
+        """Clopos formatında xəta cavabı"""
+        error = {'message': message, 'code': status_code, 'http_code': status_code}
+        return json_response(
+            {'success': False, 'error': [error], 'message': message},
+            status_code,
+        )
+
+    def _list(self, request: httpx.Request, resource: str) -> httpx.Response:
+        if not self._authorized(request):
+            return self.error(401, 'Unauthenticated')
+
+        params = request.url.params
+        items = list(self.objects[resource].values())
+        limit = int(params.get('limit', 0)) or len(items)
+        page = max(int(params.get('page', 1)), 1)
+        data = items[(page - 1) * limit : page * limit]
+        return json_response(self._envelope(data=data, total=len(items)))
+
+    def _get(self, request: httpx.Request, resource: str, id: str) -> httpx.Response:  # noqa: A002
+        if not self._authorized(request):
+            return self.error(401, 'Unauthenticated')
+
+        obj = self.objects[resource].get(int(id))
+        if obj is None:
+            return self.error(404, f'{resource} {id} not found')
+        return json_response(self._envelope(data=obj))
+
+    def _update(self, obj: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
+        # Yalnız tipi uyğun gələn sahələr yenilənir (request və obyekt schema-ları fərqlidir)
+        obj.update(
+            {
+                key: value
+                for key, value in data.items()
+                if key in obj and key != 'id' and type(value) is type(obj[key])
+            }
+        )
+        return obj
+
+    def _create(self, request: httpx.Request, resource: str) -> httpx.Response:
+        if not self._authorized(request):
+            return self.error(401, 'Unauthenticated')
+
+        objects = self.objects[resource]
+        obj_id = max(objects, default=0) + 1
+        sample = sample_model(_CATALOG[resource])
+        objects[obj_id] = self._update({**sample, 'id': obj_id}, request_data(request))
+        return json_response(self._envelope(data=objects[obj_id]), 201)
+
+    def _modify(self, request: httpx.Request, resource: str, id: str) -> httpx.Response:  # noqa: A002
+        if not self._authorized(request):
+            return self.error(401, 'Unauthenticated')
+
+        obj = self.objects[resource].get(int(id))
+        if obj is None:
+            return self.error(404, f'{resource} {id} not found')
+        return json_response(self._envelope(data=self._update(obj, request_data(request))))
+
+    # ------------------------------------------------------------------------------------- #
+    # Auth
+    # ------------------------------------------------------------------------------------- #
+    def _authorized(self, request: httpx.Request) -> bool:
+        expires_at = self.tokens.get(request.headers.get('x-token', ''))
+        return expires_at is not None and expires_at > time.time()
+
+    @route('POST', env.API.AUTH)
+    def auth(self, request: httpx.Request) -> httpx.Response:
+        data = request_data(request)
+        expected = {
+            'client_id': env.CLOPOS_CLIENT_ID,
+            'client_secret': env.CLOPOS_CLIENT_SECRET,
+            'brand': env.CLOPOS_BRAND,
+            'integrator_id': env.CLOPOS_INTEGRATOR_ID,
+        }
+        if any(
+            not data.get(key) or value and data[key] != value for key, value in expected.items()
+        ):
+            return self.error(401, 'Invalid credentials')
+
+        token = secrets.token_urlsafe(32)
+        expires_at = int(time.time()) + self.token_ttl
+        self.tokens[token] = expires_at
+        return json_response(
+            {
+                'success': True,
+                'token': token,
+                'token_type': 'Bearer',
+                'expires_in': self.token_ttl,
+                'expires_at': expires_at,
+            }
+        )
+
+    # ------------------------------------------------------------------------------------- #
+    # Resurslar
+    # ------------------------------------------------------------------------------------- #
+    @route('GET', env.API.VENUES)
+    def get_venues(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'venues')
+
+    @route('GET', env.API.USERS)
+    def get_users(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'users')
+
+    @route('GET', env.API.USER_BY_ID)
+    def get_user_by_id(self, request: httpx.Request, id: str) -> httpx.Response:  # noqa: A002
+        return self._get(request, 'users', id)
+
+    @route('GET', env.API.CUSTOMERS)
+    def get_customers(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'customers')
+
+    @route('GET', env.API.CUSTOMER_BY_ID)
+    def get_customer_by_id(self, request: httpx.Request, id: str) -> httpx.Response:  # noqa: A002
+        return self._get(request, 'customers', id)
+
+    @route('POST', env.API.CUSTOMERS)
+    def create_customer(self, request: httpx.Request) -> httpx.Response:
+        return self._create(request, 'customers')
+
+    @route('GET', env.API.CUSTOMER_GROUPS)
+    def get_customer_groups(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'customer-groups')
+
+    @route('GET', env.API.CATEGORIES)
+    def get_categories(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'categories')
+
+    @route('GET', env.API.CATEGORY_BY_ID)
+    def get_category_by_id(self, request: httpx.Request, id: str) -> httpx.Response:  # noqa: A002
+        return self._get(request, 'categories', id)
+
+    @route('GET', env.API.STATIONS)
+    def get_stations(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'stations')
+
+    @route('GET', env.API.STATION_BY_ID)
+    def get_station_by_id(self, request: httpx.Request, id: str) -> httpx.Response:  # noqa: A002
+        return self._get(request, 'stations', id)
+
+    @route('GET', env.API.PRODUCTS)
+    def get_products(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'products')
+
+    @route('GET', env.API.PRODUCT_BY_ID)
+    def get_product_by_id(self, request: httpx.Request, id: str) -> httpx.Response:  # noqa: A002
+        return self._get(request, 'products', id)
+
+    @route('GET', env.API.STOP_LIST)
+    def get_stop_list(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'stop-list')
+
+    @route('GET', env.API.SALE_TYPES)
+    def get_sale_types(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'sale-types')
+
+    @route('GET', env.API.PAYMENT_METHODS)
+    def get_payment_methods(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'payment-methods')
+
+    @route('GET', env.API.ORDERS)
+    def get_orders(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'orders')
+
+    @route('GET', env.API.ORDER_BY_ID)
+    def get_order_by_id(self, request: httpx.Request, id: str) -> httpx.Response:  # noqa: A002
+        return self._get(request, 'orders', id)
+
+    @route('POST', env.API.ORDERS)
+    def create_order(self, request: httpx.Request) -> httpx.Response:
+        return self._create(request, 'orders')
+
+    @route('PUT', env.API.ORDER_BY_ID)
+    def update_order(self, request: httpx.Request, id: str) -> httpx.Response:  # noqa: A002
+        return self._modify(request, 'orders', id)
+
+    @route('GET', env.API.RECEIPTS)
+    def get_receipts(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'receipts')
+
+    @route('GET', env.API.RECEIPT_BY_ID)
+    def get_receipt_by_id(self, request: httpx.Request, id: str) -> httpx.Response:  # noqa: A002
+        return self._get(request, 'receipts', id)
+
+    @route('PATCH', env.API.RECEIPT_BY_ID)
+    def update_closed_receipt(self, request: httpx.Request, id: str) -> httpx.Response:  # noqa: A002
+        return self._modify(request, 'receipts', id)
+
+    @route('POST', env.API.RECEIPT_CLOSE)
+    def close_receipt(self, request: httpx.Request, id: str) -> httpx.Response:  # noqa: A002
+        return self._modify(request, 'receipts', id)
+
+    @route('GET', env.API.RECEIPT_STOCK_OPERATIONS)
+    def get_receipt_stock_operations(self, request: httpx.Request, id: str) -> httpx.Response:  # noqa: A002
+        if self._authorized(request) and int(id) not in self.objects['receipts']:
+            return self.error(404, f'receipts {id} not found')
+        return self._list(request, 'stock-operations')
+
+    @route('GET', env.API.PRICE_LISTS)
+    def get_price_lists(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'price-lists')
+
+    @route('GET', env.API.PRICE_LIST_PRICES)
+    def get_price_list_prices(self, request: httpx.Request) -> httpx.Response:
+        return self._list(request, 'prices')
+
+    def reset(self) -> None:
+        with self._lock:
+            super().reset()
+            self.tokens.clear()
+            self._generate()
@@ -2,6 +2,7 @@
 
 from typing import TYPE_CHECKING
 
+import pytest
 from integrify.clopos.schemas.categories.object import Category
 from integrify.clopos.schemas.common.response import ErrorResponse
 from integrify.clopos.schemas.customers.object import Customer, Group
@@ -241,3 +242,58 @@ def test_get_payment_methods(authed_client: 'CloposTestClientClass'):
     assert resp.body.success
     assert isinstance(resp.body.data, list)
     assert isinstance(resp.body.data[0], PaymentMethod)
+
+
+def test_catalog_cache_ttl_env():
+    from integrify.clopos.env import DEFAULT_CATALOG_CACHE_TTL, _parse_ttl
+
+    assert _parse_ttl('60') == 60
+    assert _parse_ttl('0') == 0
+    assert _parse_ttl(None) == DEFAULT_CATALOG_CACHE_TTL
+    assert _parse_ttl(' ') == DEFAULT_CATALOG_CACHE_TTL
+    assert _parse_ttl('5m') == DEFAULT_CATALOG_CACHE_TTL
+    assert _parse_ttl('-1') == DEFAULT_CATALOG_CACHE_TTL
+
+
+def test_rate_limit_env():
+    from integrify.clopos.env import _parse_rate_limit
+
+    assert _parse_rate_limit('CLOPOS_RATE_LIMIT', '10/s') == '10/s'
+    assert _parse_rate_limit('CLOPOS_RATE_LIMIT', None) is None
+
+    # Yanlış formatlı limit paketin importunu dayandırmır, limit sadəcə tətbiq olunmur
+    with pytest.warns(UserWarning, match='CLOPOS_RATE_LIMIT'):
+        assert _parse_rate_limit('CLOPOS_RATE_LIMIT', 'abc') is None
+
+
+def test_rate_limit_shared(monkeypatch):
+    from integrify.clopos import env
+    from integrify.clopos.client import CloposClientClass
+
+    monkeypatch.setattr(env, 'CLOPOS_RATE_LIMIT', '600/m')
+    sync_client = CloposClientClass()
+    async_client = CloposClientClass(sync=False)
+
+    # Sync və async klientlər limiti birlikdə gözləyir, yəni limit iki dəfə artmır
+    limiter = sync_client.request_executor.rate_limiter
+    assert limiter is not None
+    assert async_client.request_executor.rate_limiter is limiter
+
+
+def test_retry_only_reads():
+    from integrify.clopos.client import CloposClientClass
+    from integrify.retry import DEFAULT_RETRY_POLICY
+
+    executor = CloposClientClass().request_executor
+
+    assert executor.get_retry_policy('get_products', 'GET') is DEFAULT_RETRY_POLICY
+    assert executor.get_retry_policy('auth', 'POST') is DEFAULT_RETRY_POLICY
+    # PUT/PATCH metodlarına baxmayaraq, sifariş və çek yeniləmələri təkrar göndərilmir
+    assert executor.get_retry_policy('update_order', 'PUT') is None
+    assert executor.get_retry_policy('update_closed_receipt', 'PATCH') is None
+    assert executor.get_retry_policy('create_order', 'POST') is None
+
+    assert (
+        CloposClientClass(retry=None).request_executor.get_retry_policy('get_products', 'GET')
+        is None
+    )
@@ -0,0 +1,48 @@
+import pytest
+from integrify.clopos.client import CloposClientClass
+from integrify.clopos.simulator import CloposSimulator
+from integrify.testing import simulator
+
+CREDENTIALS = {'client_id': 'id', 'client_secret': 'secret', 'brand': 'brand', 'integrator_id': '1'}
+
+
+@pytest.fixture
+def clopos_simulator():
+    yield simulator('clopos', catalog_size=5)
+
+
+@pytest.fixture
+def clopos_sim_client(clopos_simulator: CloposSimulator):
+    yield CloposClientClass(transport=clopos_simulator.transport())
+
+
+def test_auth_required(clopos_sim_client: CloposClientClass):
+    resp = clopos_sim_client.get_products(headers={'x-token': 'invalid'})
+    assert resp.status_code == 401
+    assert resp.body.success is False
+
+
+def test_catalog(clopos_simulator: CloposSimulator, clopos_sim_client: CloposClientClass):
+    token = clopos_sim_client.auth(**CREDENTIALS).body.token
+    headers = {'x-token': token}
+
+    products = clopos_sim_client.get_products(headers=headers)
+    assert products.body.success
+    assert len(products.body.data) == 5
+
+    page = clopos_sim_client.get_venues(page=2, limit=2, headers=headers)
+    assert [venue.id for venue in page.body.data] == [3, 4]
+
+    assert clopos_sim_client.get_product_by_id(id=3, headers=headers).body.data.id == 3
+    assert clopos_sim_client.get_product_by_id(id=99, headers=headers).status_code == 404
+    assert clopos_sim_client.get_stop_list(headers=headers).body.success
+    assert clopos_simulator.calls['get_stop_list'] == 1
+
+
+def test_customers(clopos_sim_client: CloposClientClass):
+    headers = {'x-token': clopos_sim_client.auth(**CREDENTIALS).body.token}
+
+    created = clopos_sim_client.create_customer(name='John Doe', headers=headers)
+    assert created.body.data.id == 6
+    assert created.body.data.name == 'John Doe'
+    assert clopos_sim_client.get_customer_by_id(id=6, headers=headers).body.data.name == 'John Doe'
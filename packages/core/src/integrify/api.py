@@ -1,17 +1,59 @@
+import asyncio
+import contextvars
+import copy
+import inspect
 import string
-from collections.abc import Callable, Coroutine
-from functools import cached_property
-from typing import Any, ClassVar, Optional, TypeVar
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import cached_property, partial
+from typing import Any, ClassVar, NamedTuple, Optional, TypeVar
 from urllib.parse import urljoin
 
 import httpx
+from integrify.breaker import CircuitBreaker
+from integrify.cache import ResponseCache, request_key
+from integrify.deadline import (
+    DeadlineExceededError,
+    DeadlineLike,
+    bounded_timeout,
+    current_deadline,
+)
+from integrify.deadline import deadline as deadline_scope
+from integrify.hedging import HedgePolicy
+from integrify.hooks import RequestHook, RequestRecord, request_body_size
 from integrify.logger import LOGGER_FUNCTION
-from integrify.schemas import APIResponse, DryResponse, PayloadBaseModel
-from integrify.utils import UNSET, _ResponseT
+from integrify.ratelimit import RateLimiter, RateLimitTimeoutError
+from integrify.retry import IDEMPOTENT_METHODS, RetryPolicy
+from integrify.schemas import (
+    APIResponse,
+    DryResponse,
+    LazyAPIResponse,
+    PayloadBaseModel,
+    build_model,
+    get_response_model,
+    json_dumps,
+)
+from integrify.singleflight import AsyncSingleFlight, FlightTimeoutError, SingleFlight
+from integrify.tracing import RequestTracer
+from integrify.utils import UNSET, Unset, _ResponseT
+
+try:
+    import h2
+except ModuleNotFoundError:
+    h2 = None
 
 DEFAULT_TIMEOUT = 10
 """Default sorğu timeout-u (saniyə ilə)"""
 
+HTTPTransport = httpx.BaseTransport | httpx.AsyncBaseTransport
+"""httpx sync/async transport tipi"""
+
+HTTPClient = httpx.Client | httpx.AsyncClient
+"""httpx sync/async klient tipi"""
+
 
 # ------------------------------------------------------------------------------------------------ #
 # Sync/async üçün tip markerləri                                                                   #
@@ -35,6 +77,34 @@ class _Async:  # pylint: disable=too-few-public-methods
 _Mode = TypeVar('_Mode')
 """İnteqrasiya klientlərinin sync/async rejimini bildirən TypeVar (`_Sync` və ya `_Async`)."""
 
+DEFAULT_BATCH_CONCURRENCY = 10
+"""`APIClient.batch` üçün default paralel sorğu sayı"""
+
+
+class BatchResult(NamedTuple):
+    """`APIClient.batch` ilə göndərilən hər bir sorğunun nəticəsi.
+
+    Sorğu xəta ilə bitdikdə, exception bütün batch-i dayandırmır: `error` field-inə
+    yazılır və `result` `None` olur.
+    """
+
+    index: int
+    """Sorğunun input iterable-dakı sırası"""
+
+    kwds: Mapping[str, Any]
+    """Sorğunun göndərildiyi argumentlər"""
+
+    result: Any = None
+    """Sorğunun cavabı (`APIResponse`, `DryResponse` və s.)"""
+
+    error: BaseException | None = None
+    """Sorğu zamanı baş vermiş xəta (əgər olubsa)"""
+
+    @property
+    def ok(self) -> bool:
+        """Sorğunun xətasız icra olunub-olunmadığı"""
+        return self.error is None
+
 
 class APIClient:
     """
@@ -48,7 +118,21 @@ class APIClient:
         default_handler: Optional['APIPayloadHandler'] = None,
         sync: bool = True,
         dry: bool = False,
-        timeout: float | None = DEFAULT_TIMEOUT,
+        timeout: float | httpx.Timeout | None = DEFAULT_TIMEOUT,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: HTTPTransport | None = None,
+        http_client: HTTPClient | None = None,
+        shared_pool: bool = True,
+        response_cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        lazy_responses: bool = False,
+        hooks: Iterable[RequestHook] = (),
+        tracer: RequestTracer | None = None,
+        hedge: HedgePolicy | None = None,
     ):
         """
         Args:
@@ -60,12 +144,64 @@ class APIClient:
                 handler register olunmadıqda istifadə olunur.
             sync: Sync (True) və ya Async (False) klient seçimi. Default olaraq sync seçilir.
             dry: Sorğu göndərmək əvəzinə göndəriləcək datanı qaytarmaq üçün istifadə olunur.
-            timeout: httpx sorğu timeout-u (saniyə ilə).
+            timeout: httpx sorğu timeout-u (saniyə ilə). Connect/read/write/pool
+                timeout-larını ayrıca vermək üçün `httpx.Timeout` istifadə edin.
+            retry: İdempotent endpoint-lər üçün default təkrar siyasəti (bax: `RetryPolicy`).
+                Verilməsə, sorğular təkrarlanmır; təkrarı yalnız müəyyən endpoint-lər üçün
+                `add_url(..., retry=...)` və ya `set_retry_policy(..., route_name)` ilə
+                aktivləşdirmək olar.
+            circuit_breaker: Bütün endpoint-lər üçün circuit breaker (bax: `CircuitBreaker`).
+                Eyni obyekt bir neçə klientə verilə bilər. Verilməsə, istifadə olunmur.
+            rate_limiter: Klientin bütün sorğularına tətbiq olunan rate limiter
+                (bax: `RateLimiter`). Verilməsə, limit yoxdur.
+            limits: httpx connection pool limitləri (`max_connections`,
+                `max_keepalive_connections`, `keepalive_expiry`)
+            http2: HTTP/2 istifadəsi. `h2` paketini tələb edir (`pip install httpx[http2]`).
+            transport: httpx-ə ötürüləcək xüsusi transport (məs., test üçün `MockTransport`)
+            http_client: Hazır `httpx.Client`/`httpx.AsyncClient`. Verildikdə, klient özü
+                yaradılmır və bir neçə inteqrasiya eyni connection pool-u paylaşa bilər.
+                Belə klient `close`/`aclose` ilə bağlanmır; onu yaradan tərəf bağlamalıdır.
+            shared_pool: Host üzrə paylaşılan connection pool-ların istifadəsi
+                (bax: `TransportRegistry`). `transport` və ya `http_client` verildikdə
+                nəzərə alınmır.
+            response_cache: `GET` endpoint-lərinin cavabları üçün cache (bax: `ResponseCache`).
+                Verilməsə, cavablar cache olunmur.
+            coalesce: `add_url(..., coalesce=True)` ilə işarələnmiş endpoint-lərə eyni anda
+                göndərilən eyni sorğuların (route, url, parametrlər və header-lər eyni
+                olduqda) bir HTTP sorğusu ilə birləşdirilməsi. `False` bütün endpoint-lər
+                üçün söndürür. Hər çağırış cavabın öz nüsxəsini alır.
+            lazy_responses: Cavabların `LazyAPIResponse` kimi qaytarılması: body yalnız
+                `body`-yə ilk müraciətdə decode və validate olunur.
+            hooks: Hər sorğudan sonra `RequestRecord` ilə çağırılan funksiyalar
+                (bax: `add_hook`)
+            tracer: Sorğular üçün OpenTelemetry span-ları açan tracer (bax: `RequestTracer`).
+                Verilməsə, span açılmır.
+            hedge: Async klientin idempotent endpoint-ləri üçün hedging siyasəti
+                (bax: `HedgePolicy`). Verilməsə, sorğular hedge olunmur.
         """
         self.base_url = base_url
         self.default_handler = default_handler or APIPayloadHandler(None, None)
 
-        self.request_executor = APIExecutor(name=name, sync=sync, dry=dry, timeout=timeout)
+        self.request_executor = APIExecutor(
+            name=name,
+            sync=sync,
+            dry=dry,
+            timeout=timeout,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+            http_client=http_client,
+            shared_pool=shared_pool,
+            response_cache=response_cache,
+            coalesce=coalesce,
+            lazy_responses=lazy_responses,
+            hooks=hooks,
+            tracer=tracer,
+            hedge=hedge,
+        )
         """API sorğularını icra edən obyekt"""
 
         self.urls: dict[str, dict[str, str]] = {}
@@ -74,7 +210,25 @@ class APIClient:
         self.handlers: dict[str, APIPayloadHandler] = {}
         """API sorğularının payload (request və response) handler-lərının mapping-i"""
 
-    def add_url(self, route_name: str, url: str, verb: str, base_url: str | None = None) -> None:
+        self._endpoints: dict[str, Callable] = {}
+        """Kompilyasiya olunmuş endpoint funksiyalarının dispatch cədvəli (route adı -> funksiya)"""
+
+    def add_url(
+        self,
+        route_name: str,
+        url: str,
+        verb: str,
+        base_url: str | None = None,
+        *,
+        idempotent: bool | None = None,
+        retry: Unset[RetryPolicy | None] = UNSET,
+        circuit_breaker: Unset[CircuitBreaker | None] = UNSET,
+        rate_limiter: RateLimiter | None = None,
+        cache_ttl: float | None = None,
+        coalesce: bool | None = None,
+        timeout: Unset[float | httpx.Timeout | None] = UNSET,
+        hedge: Unset[HedgePolicy | None] = UNSET,
+    ) -> None:
         """Yeni endpoint əlavə etmə funksiyası
 
         Args:
@@ -83,6 +237,31 @@ class APIClient:
             verb: Endpoint metodu (`POST`, `GET`, və s.)
             base_url: Endpoint-lərin baza (kök) url-i. Endpoint-lər fərqli hostlar
                     üzərində qurulduqda lazım olur.
+            idempotent: Sorğunun təkrar göndərilməsinin təhlükəsiz olub-olmadığı. Verilməsə,
+                    metoddan təyin olunur (`GET`, `PUT`, `DELETE` və s. idempotentdir).
+                    Yalnız idempotent endpoint-lər təkrarlanır; ödəniş kimi sorğuları
+                    yalnız provayder təkrar sorğunu tanıyırsa (məs., eyni `order_id`),
+                    `idempotent=True` ilə işarələyin.
+            retry: Bu endpoint üçün təkrar siyasəti. Verilməsə, klientin default siyasəti
+                    istifadə olunur; `None` təkrarı söndürür.
+            circuit_breaker: Bu endpoint üçün circuit breaker. Verilməsə, klientin
+                    default circuit breaker-i istifadə olunur; `None` söndürür.
+            rate_limiter: Bu endpoint üçün əlavə rate limiter. Klientin rate limiter-inə
+                    əlavə olaraq tətbiq olunur (hər ikisindən token gözlənilir).
+            cache_ttl: `GET` endpoint-inin uğurlu cavablarının cache-də saxlanma müddəti
+                    (saniyə ilə). Yalnız klientə `response_cache` verildikdə tətbiq olunur.
+            coalesce: Eyni anda göndərilən eyni sorğuların birləşdirilməsi. Default olaraq
+                    söndürülüb; yalnız nəticəsi bütün çağırışlar üçün eyni olan oxuma
+                    sorğularını (məs., ödəniş statusu) `coalesce=True` ilə işarələyin;
+                    qeyri-idempotent endpoint-lər birləşdirilmir (bax: `set_coalesce`).
+                    Gözləyən çağırış öz deadline-ı bitdikdə `DeadlineExceededError` alır.
+            timeout: Bu endpoint üçün httpx timeout-u (saniyə ilə və ya `httpx.Timeout`).
+                    Verilməsə, klientin timeout-u istifadə olunur; `None` limitsiz deməkdir.
+                    Deadline verildikdə (bax: `integrify.deadline`), qalan müddətlə
+                    məhdudlaşdırılır.
+            hedge: Bu endpoint üçün hedging siyasəti (yalnız async klientlərdə və idempotent
+                    endpoint-lərdə tətbiq olunur). Verilməsə, klientin default siyasəti
+                    istifadə olunur; `None` söndürür.
         """
         self.urls[route_name] = {'url': url, 'verb': verb}
 
@@ -90,6 +269,28 @@ class APIClient:
         # endpointləri, `base_url` ilə əlavə etmək lazımdır.
         self.urls[route_name]['base_url'] = base_url or self.base_url or ''
 
+        # Əvvəlcədən (məs., `set_retry_policy` ilə) təyin olunmuş parametrlər saxlanılır
+        options = self.request_executor.routes.setdefault(route_name, {})
+        options['idempotent'] = (
+            verb.upper() in IDEMPOTENT_METHODS if idempotent is None else idempotent
+        )
+        if retry is not UNSET:
+            options['retry'] = retry
+        if circuit_breaker is not UNSET:
+            options['circuit_breaker'] = circuit_breaker
+        if rate_limiter is not None:
+            options['rate_limiter'] = rate_limiter
+        if cache_ttl is not None:
+            options['cache_ttl'] = cache_ttl
+        if coalesce is not None:
+            options['coalesce'] = coalesce
+        if timeout is not UNSET:
+            options['timeout'] = timeout
+        if hedge is not UNSET:
+            options['hedge'] = hedge
+
+        self._invalidate_endpoint(route_name)
+
     def set_default_handler(self, handler_class: type['APIPayloadHandler']) -> None:
         """Sorğulara default handler setter-i
 
@@ -97,6 +298,80 @@ class APIClient:
             handler_class: Default handler class-ı
         """
         self.default_handler = handler_class()  # pragma: no cover
+        self._invalidate_endpoint()  # pragma: no cover
+
+    def set_retry_policy(self, retry: RetryPolicy | None, route_name: str | None = None) -> None:
+        """Təkrar siyasətini dəyişmək method-u
+
+        Args:
+            retry: Yeni təkrar siyasəti. `None` təkrarı söndürür.
+            route_name: Funksionallığın adı. Verilməsə, klientin default siyasəti dəyişir.
+        """
+        if route_name is None:
+            self.request_executor.retry = retry
+        else:
+            self.request_executor.routes.setdefault(route_name, {})['retry'] = retry
+
+    def set_hedge_policy(self, hedge: HedgePolicy | None, route_name: str | None = None) -> None:
+        """Hedging siyasətini dəyişmək method-u. Hazır inteqrasiya klientlərinin oxuma
+        endpoint-lərində hedging-i aktivləşdirmək üçün istifadə olunur::
+
+            EPointAsyncRequest.set_hedge_policy(HedgePolicy(), 'get_transaction_status')
+
+        Args:
+            hedge: Yeni hedging siyasəti. `None` hedging-i söndürür.
+            route_name: Funksionallığın adı. Verilməsə, klientin default siyasəti dəyişir.
+        """
+        if route_name is None:
+            self.request_executor.hedge = hedge
+        else:
+            self.request_executor.routes.setdefault(route_name, {})['hedge'] = hedge
+
+    def set_coalesce(self, route_name: str, enabled: bool = True) -> None:
+        """Endpoint-in eyni anda göndərilən eyni sorğularının birləşdirilməsini (bax:
+        `add_url(..., coalesce=...)`) açıb-söndürmək method-u. Hazır inteqrasiya klientlərinin
+        oxuma endpoint-ləri üçün istifadə olunur::
+
+            KapitalRequest.set_coalesce('get_detailed_order_info')
+
+        Qeyri-idempotent endpoint-lər açıq olsa belə birləşdirilmir.
+
+        Args:
+            route_name: Funksionallığın adı
+            enabled: Birləşdirmənin aktiv olub-olmadığı
+        """
+        self.request_executor.routes.setdefault(route_name, {})['coalesce'] = enabled
+
+    def invalidate_cache(self, route_name: str | None = None) -> None:
+        """Cache-dəki cavabları silmək method-u
+
+        Args:
+            route_name: Funksionallığın adı. Verilməsə, bütün cavablar silinir.
+        """
+        if self.request_executor.response_cache is not None:
+            self.request_executor.response_cache.invalidate(route_name)
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """Sorğu hook-u əlavə etmək method-u.
+
+        Hook hər sorğu bitdikdən (və ya xəta ilə dayandıqdan) sonra klient adı, route,
+        metod, status kodu, göndərilən/alınan byte sayı və mərhələlərin müddəti olan
+        `RequestRecord` ilə çağırılır. Async klientlərdə hook async funksiya da ola bilər.
+        Hook-da baş verən xəta log olunur, sorğuya təsir etmir. Hook olmadıqda qeyd
+        yaradılmır.
+
+        Args:
+            hook: `RequestRecord` qəbul edən funksiya
+        """
+        self.request_executor.add_hook(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """Əlavə olunmuş sorğu hook-unu silmək method-u
+
+        Args:
+            hook: `add_hook` ilə əlavə olunmuş funksiya
+        """
+        self.request_executor.remove_hook(hook)
 
     def add_handler(self, route_name: str, handler_class: type['APIPayloadHandler']) -> None:
         """Endpoint-ə handler əlavə etmək method-u
@@ -106,6 +381,178 @@ class APIClient:
             handler_class: Həmin sorğunun (və response-unun) payload handler class-ı
         """
         self.handlers[route_name] = handler_class()
+        self._invalidate_endpoint(route_name)
+
+    def warmup(self, routes: Iterable[str] | None = None) -> None:
+        """Handler-lərin sorğu və cavab modellərinin validator-larını əvvəlcədən qurmaq üçün
+        funksiya. Servisin start-up mərhələsində çağırıla bilər ki, ilk sorğular gecikməsin
+        (bax: `warmup`).
+
+        Args:
+            routes: Yalnız bu endpoint-lərin modelləri qurulur. Verilməsə, bütün
+                endpoint-lərin (və default handler-in) modelləri qurulur.
+        """
+        if routes is None:
+            handlers = [self.default_handler, *self.handlers.values()]
+        else:
+            handlers = [self.handlers.get(route, self.default_handler) for route in routes]
+
+        for handler in handlers:
+            handler.warmup()
+
+    def batch(
+        self,
+        route_name: str,
+        items: Iterable[Mapping[str, Any]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = True,
+    ) -> Iterator[BatchResult] | AsyncIterator[BatchResult]:
+        """Eyni endpoint-ə çoxlu sorğunu məhdud paralelliklə göndərən funksiya.
+
+        Sync klientdə sorğular thread pool-da, paylaşılan `httpx.Client` üzərindən icra olunur
+        və nəticə adi iterator kimi qaytarılır. Async klientdə isə sorğular paylaşılan
+        `httpx.AsyncClient` üzərindən task-lar kimi icra olunur və nəticə async iterator-dur::
+
+            for item in KapitalRequest.batch('get_order_info', [{'order_id': 1}, ...]):
+                ...
+
+            async for item in EPointAsyncRequest.batch('get_transaction_status', ...):
+                ...
+
+        Eyni anda `concurrency`-dən çox sorğu göndərilmir; input iterable lazy oxunur.
+
+        Args:
+            route_name: Funksionallığın adı (məs., `pay`, `refund` və s.)
+            items: Hər sorğu üçün keyword argumentləri
+            concurrency: Eyni anda icra olunan maksimum sorğu sayı
+            ordered: `True` olduqda nəticələr input sırası ilə, əks halda tamamlanma
+                sırası ilə qaytarılır
+
+        Returns:
+            Hər sorğu üçün `BatchResult` qaytaran (async) iterator
+        """
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+
+        endpoint = getattr(self, route_name)
+
+        if self.request_executor.sync:
+            if not self.request_executor.dry:
+                # Klienti thread-lərdən əvvəl yaradırıq ki, hər thread öz klientini açmasın
+                _ = self.request_executor.client
+
+            return self._batch_sync(endpoint, items, concurrency, ordered)
+
+        return self._batch_async(endpoint, items, concurrency, ordered)
+
+    @staticmethod
+    def _batch_sync(
+        endpoint: Callable,
+        items: Iterable[Mapping[str, Any]],
+        concurrency: int,
+        ordered: bool,
+    ) -> Iterator[BatchResult]:
+        def call(index: int, kwds: Mapping[str, Any]) -> BatchResult:
+            try:
+                return BatchResult(index, kwds, endpoint(**kwds))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return BatchResult(index, kwds, error=e)
+
+        pending: deque[Future] = deque()
+        pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='integrify-batch')
+
+        def next_done() -> list[BatchResult]:
+            if ordered:
+                return [pending.popleft().result()]
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+            return sorted((future.result() for future in done), key=lambda r: r.index)
+
+        try:
+            for index, kwds in enumerate(items):
+                if len(pending) >= concurrency:
+                    yield from next_done()
+
+                # Deadline (context var) və digər context var-lar thread-lərə ötürülür
+                context = contextvars.copy_context()
+                pending.append(pool.submit(context.run, call, index, kwds))
+
+            while pending:
+                yield from next_done()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    async def _batch_async(
+        endpoint: Callable,
+        items: Iterable[Mapping[str, Any]],
+        concurrency: int,
+        ordered: bool,
+    ) -> AsyncIterator[BatchResult]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(index: int, kwds: Mapping[str, Any]) -> BatchResult:
+            try:
+                return BatchResult(index, kwds, await endpoint(**kwds))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return BatchResult(index, kwds, error=e)
+            finally:
+                semaphore.release()
+
+        pending: deque[asyncio.Task] = deque()
+
+        async def next_done() -> list[BatchResult]:
+            if ordered:
+                return [await pending.popleft()]
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.remove(task)
+            return sorted((task.result() for task in done), key=lambda r: r.index)
+
+        try:
+            for index, kwds in enumerate(items):
+                # Semaphore həm paralelliyi, həm də yaradılan task sayını məhdudlaşdırır
+                while semaphore.locked() and pending:
+                    for result in await next_done():
+                        yield result
+
+                await semaphore.acquire()
+                pending.append(asyncio.ensure_future(call(index, kwds)))
+
+            while pending:
+                for result in await next_done():
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def configure_http(
+        self,
+        *,
+        timeout: Unset[float | httpx.Timeout | None] = UNSET,
+        limits: Unset[httpx.Limits | None] = UNSET,
+        http2: Unset[bool] = UNSET,
+        transport: Unset[HTTPTransport | None] = UNSET,
+        http_client: Unset[HTTPClient | None] = UNSET,
+    ) -> None:
+        """httpx parametrlərini sonradan dəyişmək üçün funksiya. Əsasən modul səviyyəsində
+        yaradılmış klientlər (`EPointRequest`, `CloposAsyncRequest` və s.) üçün nəzərdə
+        tutulub və servisin start-up mərhələsində çağırılmalıdır::
+
+            EPointRequest.configure_http(limits=httpx.Limits(max_connections=200), http2=True)
+
+        Verilməyən parametrlər dəyişmir. Parametrlərin izahı üçün bax: `APIClient.__init__`.
+        """
+        self.request_executor.configure_http(
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+            http_client=http_client,
+        )
 
     def close(self) -> None:
         """Sync klientin bağlanması (httpx connection pool-un boşaldılması)"""
@@ -134,13 +581,44 @@ class APIClient:
         verb: str,
         handler: 'APIPayloadHandler',
     ) -> Callable:
-        return lambda *args, **kwds: func(
-            url,
-            verb,
-            handler,
-            *(arg for arg in args if arg is not UNSET),
-            **{k: v for k, v in kwds.items() if v is not UNSET},
-        )
+        def endpoint(*args, **kwds):
+            # `UNSET` dəyərləri ötürülmür; boş args/kwds üçün filtrləmə tamamilə ötürülür
+            if args:
+                args = [arg for arg in args if arg is not UNSET]
+            if kwds:
+                kwds = {k: v for k, v in kwds.items() if v is not UNSET}
+
+            return func(url, verb, handler, *args, **kwds)
+
+        return endpoint
+
+    def _compile_endpoint(self, route_name: str) -> Callable:
+        """Route üçün sorğu funksiyasını bir dəfəlik "kompilyasiya" edir: url-i birləşdirir,
+        metodu və handler-i tapır və onları executor funksiyası ilə birlikdə bağlayır.
+
+        Args:
+            route_name: Funksionallığın adı (məs., `pay`, `refund` və s.)
+        """
+        route = self.urls[route_name]
+        url = urljoin(route['base_url'], route['url'])
+        handler = self.handlers.get(route_name, self.default_handler)
+
+        func = partial(self.request_executor.request_function, route_name=route_name)
+        return self._build_request_lambda(func, url, route['verb'], handler)
+
+    def _invalidate_endpoint(self, route_name: str | None = None) -> None:
+        """Kompilyasiya olunmuş endpoint-i (və ya `route_name` verilməsə, hamısını) cache-dən
+        silir. Route yenidən register olunduqda çağırılır ki, növbəti müraciətdə yenidən
+        kompilyasiya olunsun.
+
+        Args:
+            route_name: Funksionallığın adı (məs., `pay`, `refund` və s.)
+        """
+        names = [route_name] if route_name is not None else list(self._endpoints)
+
+        for name in names:
+            if self._endpoints.pop(name, None) is not None:
+                self.__dict__.pop(name, None)
 
     def __getattr__(self, name: str) -> Any:
         """Möcüzənin baş verdiyi yer:
@@ -149,7 +627,9 @@ class APIClient:
         bu dunder metodundan istifadə edərək, hansı endpointə nə sorğu atılacağını anlaya bilirik.
 
         `__getattr__` yalnız adi atribut axtarışı uğursuz olduqda çağırılır, ona görə də
-        real atributlara (`urls`, `handlers` və s.) heç bir əlavə yük gətirmir.
+        real atributlara (`urls`, `handlers` və s.) heç bir əlavə yük gətirmir. Endpoint ilk
+        müraciətdə kompilyasiya olunub instansiyanın `__dict__`-inə yazılır, beləliklə sonrakı
+        çağırışlar `__getattr__`-a ümumiyyətlə düşmür (route yenidən register olunana qədər).
         """
         # `self.urls`-ə birbaşa müraciət rekursiyaya səbəb ola bilər (əgər hələ init
         # olunmayıbsa), ona görə `__dict__`-dən oxuyuruq.
@@ -160,14 +640,61 @@ class APIClient:
             raise AttributeError(name)
 
         # "Axtarılan" funksiyanın adından istifadə edərək, lazımi endpoint, metod və handler-i
-        # taparaq, sorğunu icra edirik.
-        base_url = urls[name]['base_url']
-        url = urljoin(base_url, urls[name]['url'])
-        verb = urls[name]['verb']
-        handler = self.handlers.get(name, self.default_handler)
+        # taparaq, sorğu funksiyasını kompilyasiya edib cache-ləyirik.
+        endpoint = self._compile_endpoint(name)
+        self._endpoints[name] = endpoint
+        self.__dict__[name] = endpoint
+
+        return endpoint
+
+
+def warmup(
+    clients: Iterable[APIClient],
+    routes: Iterable[str] | None = None,
+    models: Iterable[Any] = (),
+    background: bool = True,
+) -> threading.Thread | None:
+    """Klientlərin istifadə etdiyi validator-ları əvvəlcədən quran funksiya.
+
+    Sorğu və cavab schema-larının validator-ları import zamanı deyil, ilk istifadədə qurulur
+    (bax: `integrify.schemas.DeferredModel`). Qısaömürlü proseslər (CLI, serverless) bundan
+    qazanır; uzunömürlü servislər isə start-up-da bu funksiyanı çağıraraq ilk sorğuların
+    gecikməsinin qarşısını alır::
+
+        from integrify.api import warmup
+        from integrify.epoint import EPointAsyncRequest
+
+        warmup([EPointAsyncRequest], routes=['pay', 'get_transaction_status'])
+
+    Args:
+        clients: Validator-ları qurulacaq klientlər
+        routes: Yalnız bu endpoint-lərin modelləri qurulur (klientdə olmayan endpoint-lər
+            üçün default handler istifadə olunur). Verilməsə, bütün endpoint-lər.
+        models: Klientlərdən əlavə qurulacaq modellər (məs., callback schema-ları)
+        background: `True` olduqda, modellər daemon thread-də qurulur və funksiya dərhal
+            qayıdır. Thread ilk sorğuları bloklamır: hələ qurulmamış model ilk istifadədə
+            qurulur.
+
+    Returns:
+        `background=True` olduqda, işə salınmış thread (məs., `join` üçün), əks halda `None`
+    """
+    clients = list(clients)
+    routes = list(routes) if routes is not None else None
+    models = list(models)
+
+    def run() -> None:
+        for client in clients:
+            client.warmup(routes)
+        for model in models:
+            build_model(model)
+
+    if not background:
+        run()
+        return None
 
-        func = self.request_executor.request_function
-        return self._build_request_lambda(func, url, verb, handler)
+    thread = threading.Thread(target=run, name='integrify-warmup', daemon=True)
+    thread.start()
+    return thread
 
 
 class APIPayloadHandler:
@@ -196,17 +723,26 @@ class APIPayloadHandler:
     dry: ClassVar[bool] = False
     """Simulasiya bool-u: True olarsa, sorğu göndərilmir, göndərilən data qaytarılır"""
 
+    lazy: ClassVar[bool] = False
+    """True olarsa, cavab `LazyAPIResponse` kimi qaytarılır (body ilk müraciətdə parse olunur)"""
+
+    lazy_supported: ClassVar[bool] = True
+    """Cavabın lazy qaytarıla bilməsi. `handle_response` `ok`/`status_code`-u body-yə
+    əsasən dəyişirsə (bax: EPoint), bu atribut `False` olmalıdır."""
+
     def __init__(
         self,
         req_model: Any = UNSET,
         resp_model: Any = UNSET,
         dry: Any = UNSET,
+        lazy: Any = UNSET,
     ):
         """
         Args:
             req_model: Sorğunun payload model-i. Verilməsə, class atributu istifadə olunur.
             resp_model: Sorğunun cavabının payload model-i. Verilməsə, class atributu istifadə olunur.
             dry: Simulasiya bool-u. Verilməsə, class atributu istifadə olunur.
+            lazy: Lazy cavab bool-u. Verilməsə, class atributu istifadə olunur.
         """  # noqa: E501
         # Geriyə uyğunluq: dəyər `__init__`-ə ötürülübsə, instansiya səviyyəsində
         # class atributunu override edirik; əks halda ClassVar dəyəri qalır.
@@ -216,6 +752,8 @@ class APIPayloadHandler:
             self.resp_model = resp_model
         if dry is not UNSET:
             self.dry = dry
+        if lazy is not UNSET:
+            self.lazy = lazy
 
     def build_request_model(self, *args, **kwds) -> PayloadBaseModel | None:
         """Verilən argumentlərdən `self.req_model` instansiyasını yaradan funksiya.
@@ -323,7 +861,227 @@ class APIPayloadHandler:
         if not self.resp_model:
             return resp
 
-        return APIResponse[self.resp_model].model_validate(resp, from_attributes=True)
+        return self.response_model.model_validate(resp, from_attributes=True)
+
+    @cached_property
+    def response_model(self) -> type[APIResponse]:
+        """`APIResponse[self.resp_model]` modeli. İlk müraciətdə qurulur və eyni `resp_model`-ə
+        malik bütün handler-lər arasında paylaşılır (bax: `get_response_model`)."""
+        return get_response_model(self.resp_model)
+
+    def warmup(self) -> None:
+        """Sorğu və cavab modellərinin validator-larını ilk sorğudan əvvəl qurmaq üçün
+        funksiya. Çağırılmasa belə, validator-lar ilk istifadədə avtomatik qurulur
+        (bax: `DeferredModel`); bu funksiya sadəcə ilk sorğunun gecikməsini aradan qaldırır."""
+        if self.req_model:
+            build_model(self.req_model)
+        if self.resp_model:
+            build_model(self.response_model)
+
+
+# ------------------------------------------------------------------------------------------------ #
+# Paylaşılan connection pool-lar                                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Hər executor öz httpx klientini saxlayır, lakin klientin transport-u sorğunu host üzrə paylaşılan
+# connection pool-a yönləndirir. Beləliklə, eyni host-a gedən bütün klientlər (məs., bir neçə
+# inteqrasiya instance-ı) TCP/TLS bağlantılarını paylaşır, bir klient isə (məs., AzeriCard-ın
+# MpiAPI və MtAPI host-ları) hər host üçün ayrıca pool istifadə edir. Async pool-lar event loop-a
+# bağlı olduğu üçün açara event loop da daxildir.
+
+
+class _PoolEntry:
+    """Registry-dəki bir transport və onun istifadəçi sayı"""
+
+    __slots__ = ('closed', 'key', 'refs', 'transport')
+
+    def __init__(self, key: tuple, transport: HTTPTransport):
+        self.key = key
+        self.transport = transport
+        self.refs = 0
+        self.closed = False
+
+
+class TransportRegistry:
+    """Host üzrə paylaşılan httpx transport-larının (connection pool-larının) registry-si.
+
+    Transport-lar `(scheme, host, sync/async, event loop, pool parametrləri)` açarı ilə
+    saxlanılır və istifadəçi sayı (reference count) ilə idarə olunur: son istifadəçi
+    transport-u buraxdıqda (`close`/`aclose`) transport bağlanır.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple, _PoolEntry] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def acquire(
+        self,
+        url: httpx.URL,
+        sync: bool,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+    ) -> _PoolEntry:
+        """URL-in host-u üçün transport-u qaytarır (lazım olduqda yaradır) və istifadəçi
+        sayını artırır. Async transport-lar hazırkı event loop üçün qaytarılır."""
+        loop = None if sync else asyncio.get_running_loop()
+        key = (url.scheme, url.netloc, sync, loop, repr(limits), http2)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._forget_closed_loops()
+
+                kwds: dict[str, Any] = {'http2': http2}
+                if limits is not None:
+                    kwds['limits'] = limits
+
+                transport_class = httpx.HTTPTransport if sync else httpx.AsyncHTTPTransport
+                entry = self._entries[key] = _PoolEntry(key, transport_class(**kwds))
+
+            entry.refs += 1
+            return entry
+
+    def release(self, entry: _PoolEntry) -> HTTPTransport | None:
+        """İstifadəçi sayını azaldır. Transport-un artıq istifadəçisi qalmadıqda, onu
+        registry-dən silib qaytarır (bağlamaq çağıranın işidir)."""
+        with self._lock:
+            if entry.closed:
+                return None
+
+            entry.refs -= 1
+            if entry.refs > 0:
+                return None
+
+            entry.closed = True
+            self._entries.pop(entry.key, None)
+            return entry.transport
+
+    def clear(self) -> list[_PoolEntry]:
+        """Bütün transport-ları registry-dən silib qaytarır (bağlamaq çağıranın işidir)"""
+        with self._lock:
+            entries, self._entries = list(self._entries.values()), {}
+            for entry in entries:
+                entry.closed = True
+            return entries
+
+    def _forget_closed_loops(self) -> None:
+        # Bağlanmış event loop-ların transport-ları artıq istifadə oluna bilməz
+        for key in [key for key in self._entries if key[3] is not None and key[3].is_closed()]:
+            self._entries.pop(key).closed = True
+
+
+TRANSPORT_REGISTRY = TransportRegistry()
+"""Bütün klientlərin paylaşdığı default transport registry-si"""
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Sync sorğuları host üzrə paylaşılan transport-a yönləndirən transport"""
+
+    def __init__(
+        self,
+        registry: TransportRegistry,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+    ):
+        self.registry = registry
+        self.limits = limits
+        self.http2 = http2
+        self._held: dict[tuple[str, str], _PoolEntry] = {}
+
+    def _entry(self, url: httpx.URL) -> _PoolEntry:
+        key = (url.scheme, url.netloc)
+        entry = self._held.get(key)
+        if entry is None or entry.closed:
+            entry = self._held[key] = self.registry.acquire(url, True, self.limits, self.http2)
+        return entry
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._entry(request.url).transport.handle_request(request)
+
+    def close(self) -> None:
+        entries, self._held = list(self._held.values()), {}
+        for entry in entries:
+            transport = self.registry.release(entry)
+            if transport is not None:
+                transport.close()
+
+
+class _AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """Async sorğuları host (və event loop) üzrə paylaşılan transport-a yönləndirən transport"""
+
+    def __init__(
+        self,
+        registry: TransportRegistry,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+    ):
+        self.registry = registry
+        self.limits = limits
+        self.http2 = http2
+        self._held: dict[tuple[str, str, asyncio.AbstractEventLoop], _PoolEntry] = {}
+
+    def _entry(self, url: httpx.URL) -> _PoolEntry:
+        key = (url.scheme, url.netloc, asyncio.get_running_loop())
+        entry = self._held.get(key)
+        if entry is None or entry.closed:
+            entry = self._held[key] = self.registry.acquire(url, False, self.limits, self.http2)
+        return entry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._entry(request.url).transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        entries, self._held = list(self._held.values()), {}
+        for entry in entries:
+            transport = self.registry.release(entry)
+            if transport is not None and not entry.key[3].is_closed():
+                await transport.aclose()
+
+
+def shutdown(registry: TransportRegistry = TRANSPORT_REGISTRY) -> None:
+    """Paylaşılan bütün connection pool-ları bağlayır (məs., prosesin sonunda).
+
+    Sync pool-lar dərhal bağlanır. Async pool-lar isə registry-dən silinir; onları
+    bağlamaq üçün event loop daxilində `ashutdown` çağırın. Klientlər bundan sonra da
+    istifadə oluna bilər: növbəti sorğuda yeni pool yaradılır.
+    """
+    for entry in registry.clear():
+        if isinstance(entry.transport, httpx.BaseTransport):
+            entry.transport.close()
+
+
+async def ashutdown(registry: TransportRegistry = TRANSPORT_REGISTRY) -> None:
+    """`shutdown`-un async versiyası: hazırkı event loop-a aid async pool-ları da bağlayır"""
+    loop = asyncio.get_running_loop()
+
+    for entry in registry.clear():
+        if isinstance(entry.transport, httpx.BaseTransport):
+            entry.transport.close()
+        elif entry.key[3] is loop:
+            await entry.transport.aclose()
+
+
+def _copy_result(result: Any) -> Any:
+    """Birləşdirilmiş çağırışın nəticəsinin gözləyən çağırış üçün ayrıca nüsxəsi, ki bir
+    çağırışın cavabda etdiyi dəyişiklik digərlərinə keçməsin"""
+    if isinstance(result, APIResponse):
+        return result.model_copy(deep=True)
+    if isinstance(result, LazyAPIResponse):
+        return result.copy()
+    if isinstance(result, httpx.Response):
+        # Body (bytes) dəyişməzdir, yalnız header-lər ayrıca kopyalanır
+        response = copy.copy(result)
+        response.headers = result.headers.copy()
+        return response
+    return result
+
+
+def _consume_result(task: asyncio.Future) -> None:
+    """Ləğv olunmuş (hedge) task-ın nəticəsini oxuyur ki, asyncio xəbərdarlıq yazmasın"""
+    if not task.cancelled():
+        task.exception()
 
 
 class APIExecutor:
@@ -334,7 +1092,21 @@ class APIExecutor:
         name: str,
         sync: bool = True,
         dry: bool = False,
-        timeout: float | None = DEFAULT_TIMEOUT,
+        timeout: float | httpx.Timeout | None = DEFAULT_TIMEOUT,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: HTTPTransport | None = None,
+        http_client: HTTPClient | None = None,
+        shared_pool: bool = True,
+        response_cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        lazy_responses: bool = False,
+        hooks: Iterable[RequestHook] = (),
+        tracer: RequestTracer | None = None,
+        hedge: HedgePolicy | None = None,
     ):
         """
         Args:
@@ -342,14 +1114,63 @@ class APIExecutor:
             sync: Sync (True) və ya Async (False) klient seçimi. Default olaraq sync seçilir.
             dry: Sorğu göndərmək əvəzinə göndəriləcək datanı qaytarmaq üçün istifadə olunur.
                     Debug üçün nəzərdə tutulub.
-            timeout: httpx sorğu timeout-u (saniyə ilə).
+            timeout: httpx sorğu timeout-u (saniyə ilə və ya `httpx.Timeout`).
+            retry: İdempotent endpoint-lər üçün default təkrar siyasəti. Verilməsə, sorğular
+                təkrarlanmır.
+            circuit_breaker: Bütün endpoint-lər üçün default circuit breaker.
+                Verilməsə, circuit breaker istifadə olunmur.
+            rate_limiter: Bütün sorğulara tətbiq olunan rate limiter. Verilməsə, limit yoxdur.
+            limits: httpx connection pool limitləri
+            http2: HTTP/2 istifadəsi (`h2` paketini tələb edir)
+            transport: httpx-ə ötürüləcək xüsusi transport
+            http_client: Hazır httpx klienti. Verildikdə, executor onu bağlamır.
+            shared_pool: Host üzrə paylaşılan connection pool-ların (`TRANSPORT_REGISTRY`)
+                istifadəsi. `transport` verildikdə nəzərə alınmır.
+            response_cache: `GET` endpoint-lərinin cavabları üçün cache. Verilməsə, cache yoxdur.
+            coalesce: `coalesce=True` ilə işarələnmiş endpoint-lərin eyni anda göndərilən
+                eyni sorğularının birləşdirilməsi. `False` bütün endpoint-lər üçün söndürür.
+            lazy_responses: Cavabların `LazyAPIResponse` kimi qaytarılması
+            hooks: Hər sorğudan sonra `RequestRecord` ilə çağırılan funksiyalar
+            tracer: Sorğular üçün OpenTelemetry span-ları açan tracer
+            hedge: Async klientdə idempotent endpoint-lər üçün default hedging siyasəti
         """
         self.sync = sync
         self.dry = dry
         self.timeout = timeout
+        self.limits = limits
+        self.http2 = http2
+        self.transport = transport
+        self.shared_pool = shared_pool
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.coalesce = coalesce
+        self.lazy_responses = lazy_responses
+        self.tracer = tracer
+        self.hedge = hedge
         self.client_name = name
         self.logger = LOGGER_FUNCTION(name)
 
+        self.routes: dict[str, dict[str, Any]] = {}
+        """Endpoint-lərin icra parametrləri (route adı -> `idempotent`, `retry` və s.)"""
+
+        self.flights = SingleFlight() if sync else AsyncSingleFlight()
+        """Davam edən (birləşdirilmiş) sorğular"""
+
+        self.hooks: list[RequestHook] = []
+        """Sorğu hook-ları (bax: `add_hook`)"""
+        for hook in hooks:
+            self.add_hook(hook)
+
+        self.owns_client = True
+        """httpx klientinin executor tərəfindən yaradılıb-yaradılmadığı (və bağlanacağı)"""
+
+        self._validate_http(http2, transport, http_client)
+        if http_client is not None:
+            self.__dict__['client'] = http_client
+            self.owns_client = False
+
     @cached_property
     def client(self) -> httpx.Client | httpx.AsyncClient:
         """httpx sorğu client-i.
@@ -357,26 +1178,675 @@ class APIExecutor:
         Lazy yaradılır: import zamanı deyil, ilk sorğuda açılır. Beləliklə, `AsyncClient`
         event loop-dan kənarda import zamanı yaradılmır və heç istifadə olunmayan
         klient üçün socket açılmır.
+
+        `transport` verilmədikdə, sorğular host üzrə paylaşılan connection pool-lara
+        (`TRANSPORT_REGISTRY`) yönləndirilir.
         """
+        kwds: dict[str, Any] = {'timeout': self.timeout, 'http2': self.http2}
+        if self.limits is not None:
+            kwds['limits'] = self.limits
+        if self.transport is not None:
+            kwds['transport'] = self.transport
+        elif self.shared_pool:
+            transport_class = _SharedTransport if self.sync else _AsyncSharedTransport
+            kwds['transport'] = transport_class(TRANSPORT_REGISTRY, self.limits, self.http2)
+
         if self.sync:
-            return httpx.Client(timeout=self.timeout)
+            return httpx.Client(**kwds)
 
-        return httpx.AsyncClient(timeout=self.timeout)
+        return httpx.AsyncClient(**kwds)
+
+    def _validate_http(
+        self,
+        http2: bool,
+        transport: HTTPTransport | None,
+        http_client: HTTPClient | None,
+    ) -> None:
+        """httpx parametrlərinin klientin sync/async rejiminə uyğunluğunu yoxlayır"""
+        if http2 and h2 is None and transport is None and http_client is None:
+            raise ImportError(
+                'Using http2=True requires the `h2` package. '
+                'Install it with `pip install httpx[http2]`.'
+            )
+
+        client_type, transport_type = (
+            (httpx.Client, httpx.BaseTransport)
+            if self.sync
+            else (httpx.AsyncClient, httpx.AsyncBaseTransport)
+        )
+        if http_client is not None and not isinstance(http_client, client_type):
+            raise TypeError(f'http_client must be an instance of {client_type.__name__}')
+        if transport is not None and not isinstance(transport, transport_type):
+            raise TypeError(f'transport must be an instance of {transport_type.__name__}')
+
+    def configure_http(
+        self,
+        *,
+        timeout: Unset[float | httpx.Timeout | None] = UNSET,
+        limits: Unset[httpx.Limits | None] = UNSET,
+        http2: Unset[bool] = UNSET,
+        transport: Unset[HTTPTransport | None] = UNSET,
+        http_client: Unset[HTTPClient | None] = UNSET,
+    ) -> None:
+        """httpx parametrlərini dəyişir. Verilməyən parametrlər dəyişmir.
+
+        Executor-un özünün yaratdığı klient artıq açılıbsa, sync klient bağlanır, async klient
+        isə sadəcə buraxılır (onu əvvəlcədən `aclose` ilə bağlamaq tövsiyə olunur) və
+        növbəti sorğuda yeni parametrlərlə yenidən yaradılır.
+        """
+        self._validate_http(
+            self.http2 if http2 is UNSET else http2,
+            self.transport if transport is UNSET else transport,
+            None if http_client is UNSET else http_client,
+        )
+
+        if timeout is not UNSET:
+            self.timeout = timeout
+        if limits is not UNSET:
+            self.limits = limits
+        if http2 is not UNSET:
+            self.http2 = http2
+        if transport is not UNSET:
+            self.transport = transport
+
+        if http_client is UNSET and not self.owns_client:
+            # Kənardan verilmiş klient öz parametrləri ilə qalır
+            return
+
+        client = self.__dict__.pop('client', None)
+        if client is not None and self.owns_client and isinstance(client, httpx.Client):
+            client.close()
+
+        self.owns_client = True
+        if http_client is not UNSET and http_client is not None:
+            self.__dict__['client'] = http_client
+            self.owns_client = False
 
     def close(self) -> None:
-        """Sync httpx client-in bağlanması (əgər yaradılıbsa)"""
+        """Sync httpx client-in bağlanması (əgər executor tərəfindən yaradılıbsa)"""
         client = self.__dict__.get('client')
-        if client is not None and isinstance(client, httpx.Client):
+        if client is not None and self.owns_client and isinstance(client, httpx.Client):
             client.close()
             del self.__dict__['client']
 
     async def aclose(self) -> None:
-        """Async httpx client-in bağlanması (əgər yaradılıbsa)"""
+        """Async httpx client-in bağlanması (əgər executor tərəfindən yaradılıbsa)"""
         client = self.__dict__.get('client')
-        if client is not None and isinstance(client, httpx.AsyncClient):
+        if client is not None and self.owns_client and isinstance(client, httpx.AsyncClient):
             await client.aclose()
             del self.__dict__['client']
 
+    def add_hook(self, hook: RequestHook) -> None:
+        """Sorğu hook-u əlavə edir (bax: `APIClient.add_hook`)"""
+        if self.sync and inspect.iscoroutinefunction(hook):
+            raise TypeError('Async hooks can only be used with async clients')
+
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """Sorğu hook-unu silir"""
+        self.hooks.remove(hook)
+
+    def _emit(self, record: RequestRecord) -> None:
+        for hook in self.hooks:
+            try:
+                hook(record)
+            except Exception:
+                self.logger.exception('%s request hook %r failed', self.client_name, hook)
+
+    async def _aemit(self, record: RequestRecord) -> None:
+        for hook in self.hooks:
+            try:
+                result = hook(record)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                self.logger.exception('%s request hook %r failed', self.client_name, hook)
+
+    @staticmethod
+    def _build_request_kwds(
+        verb: str,
+        handler: APIPayloadHandler,
+        data: Any,
+        headers: dict,
+    ) -> dict[str, Any]:
+        """httpx `request` funksiyasına ötürüləcək argumentləri hazırlayır.
+
+        GET sorğularında data query parametrləri kimi göndərilir. Digər sorğularda isə
+        body aktiv JSON codec ilə (bax: `integrify.schemas.set_json_codec`) byte-lara
+        çevrilib `content` kimi göndərilir; artıq `str`/`bytes` olan data olduğu kimi qalır.
+        """
+        request_kwds: dict[str, Any] = {'headers': headers, **handler.req_args}
+
+        if verb == 'GET':
+            # Boş `params` verildikdə httpx URL-in öz query-sini silir
+            # (məs., Kapitalbank-ın `?tranDetailLevel=2...` parametrləri)
+            if data:
+                request_kwds['params'] = data
+        elif data is not None:
+            if not isinstance(data, (bytes, str)):
+                data = json_dumps(data)
+                if 'Content-Type' not in headers:
+                    request_kwds['headers'] = {'Content-Type': 'application/json', **headers}
+
+            request_kwds['content'] = data
+
+        return request_kwds
+
+    def get_retry_policy(self, route_name: str | None, verb: str) -> RetryPolicy | None:
+        """Endpoint üçün qüvvədə olan təkrar siyasəti.
+        Qeyri-idempotent endpoint-lər üçün həmişə `None` qaytarılır.
+
+        Args:
+            route_name: Endpoint-in adı
+            verb: Sorğunun metodu (`POST`, `GET`, və s.)
+        """
+        options = self.routes.get(route_name, {}) if route_name else {}
+        idempotent = options.get('idempotent')
+
+        if not (verb.upper() in IDEMPOTENT_METHODS if idempotent is None else idempotent):
+            return None
+
+        return options.get('retry', self.retry)
+
+    def get_circuit_breaker(self, route_name: str | None) -> CircuitBreaker | None:
+        """Endpoint üçün qüvvədə olan circuit breaker
+
+        Args:
+            route_name: Endpoint-in adı
+        """
+        options = self.routes.get(route_name, {}) if route_name else {}
+        return options.get('circuit_breaker', self.circuit_breaker)
+
+    def get_rate_limiters(self, route_name: str | None) -> tuple[RateLimiter, ...]:
+        """Endpoint-ə tətbiq olunan rate limiter-lər (klientin və route-un)
+
+        Args:
+            route_name: Endpoint-in adı
+        """
+        options = self.routes.get(route_name, {}) if route_name else {}
+        limiters = (self.rate_limiter, options.get('rate_limiter'))
+        return tuple(limiter for limiter in limiters if limiter is not None)
+
+    def get_hedge_policy(self, route_name: str | None, verb: str) -> HedgePolicy | None:
+        """Endpoint üçün qüvvədə olan hedging siyasəti. Sync klientlərdə və qeyri-idempotent
+        endpoint-lər üçün həmişə `None` qaytarılır.
+
+        Args:
+            route_name: Endpoint-in adı
+            verb: Sorğunun metodu (`POST`, `GET`, və s.)
+        """
+        if self.sync or not route_name:
+            return None
+
+        options = self.routes.get(route_name, {})
+        idempotent = options.get('idempotent')
+        if not (verb.upper() in IDEMPOTENT_METHODS if idempotent is None else idempotent):
+            return None
+
+        return options.get('hedge', self.hedge)
+
+    def get_timeout(self, route_name: str | None) -> float | httpx.Timeout | None:
+        """Endpoint üçün qüvvədə olan httpx timeout-u (deadline nəzərə alınmadan)
+
+        Args:
+            route_name: Endpoint-in adı
+        """
+        options = self.routes.get(route_name, {}) if route_name else {}
+        if 'timeout' in options:
+            return options['timeout']
+
+        return self.client.timeout
+
+    def _attempt_timeout(self, route_name: str | None, url: str) -> Any:
+        """Növbəti cəhd üçün httpx timeout-u. Deadline varsa, timeout qalan müddətlə
+        məhdudlaşdırılır; deadline bitibsə, `DeadlineExceededError` qaldırılır."""
+        deadline = current_deadline()
+        if deadline is None:
+            options = self.routes.get(route_name, {}) if route_name else {}
+            return options.get('timeout', httpx.USE_CLIENT_DEFAULT)
+
+        return bounded_timeout(self.get_timeout(route_name), deadline.check(url))
+
+    def get_cache_ttl(self, route_name: str | None, verb: str) -> float | None:
+        """Endpoint-in cavablarının cache-də saxlanma müddəti.
+        Cache olmadıqda və ya `GET` olmayan endpoint-lər üçün `None` qaytarılır.
+
+        Args:
+            route_name: Endpoint-in adı
+            verb: Sorğunun metodu (`POST`, `GET`, və s.)
+        """
+        if self.response_cache is None or not route_name or verb.upper() != 'GET':
+            return None
+
+        options = self.routes.get(route_name, {})
+        if options.get('idempotent') is False:
+            return None
+
+        return options.get('cache_ttl', self.response_cache.default_ttl)
+
+    def should_coalesce(self, route_name: str | None, verb: str) -> bool:
+        """Endpoint-in eyni anda göndərilən eyni sorğularının birləşdirilib-birləşdirilmədiyi.
+        Yalnız `coalesce=True` ilə işarələnmiş idempotent endpoint-lər birləşdirilir;
+        qeyri-idempotent sorğular (məs., ödəniş) heç vaxt birləşdirilmir.
+
+        Args:
+            route_name: Endpoint-in adı
+            verb: Sorğunun metodu (`POST`, `GET`, və s.)
+        """
+        if not self.coalesce or not route_name:
+            return False
+
+        options = self.routes.get(route_name, {})
+        idempotent = options.get('idempotent')
+        if not (verb.upper() in IDEMPOTENT_METHODS if idempotent is None else idempotent):
+            return False
+
+        return options.get('coalesce', False)
+
+    @staticmethod
+    def _flight_timeout() -> float | None:
+        """Başqa çağırışın cavabını gözləmə müddəti: deadline-a qalan müddət"""
+        deadline = current_deadline()
+        return max(0.0, deadline.remaining()) if deadline is not None else None
+
+    def _flight_key(self, route_name: str, verb: str, url: str, request_kwds: dict) -> str:
+        return request_key(
+            route_name,
+            verb,
+            url,
+            request_kwds.get('params'),
+            request_kwds.get('headers'),
+            request_kwds.get('content'),
+        )
+
+    def _cached_response(
+        self,
+        route_name: str | None,
+        verb: str,
+        url: str,
+        request_kwds: dict[str, Any],
+    ) -> tuple[str | None, float | None, httpx.Response | None]:
+        """Sorğunun cache açarı, TTL-i və (əgər varsa) cache-dəki cavabı"""
+        ttl = self.get_cache_ttl(route_name, verb)
+        if ttl is None or self.response_cache is None or route_name is None:
+            return None, None, None
+
+        key = self.response_cache.make_key(
+            route_name, verb, url, request_kwds.get('params'), request_kwds.get('headers')
+        )
+        cached = self.response_cache.get(key)
+        if cached is None:
+            return key, ttl, None
+
+        return key, ttl, cached.to_response(httpx.Request(verb, url))
+
+    def _retry_delay(
+        self,
+        retry: RetryPolicy | None,
+        attempt: int,
+        url: str,
+        response: httpx.Response | None = None,
+        exc: Exception | None = None,
+    ) -> float | None:
+        """Cəhd uğursuz olduqda, növbəti cəhddən əvvəl gözləmə müddəti.
+        Sorğu təkrarlanmamalıdırsa, `None` qaytarılır."""
+        if retry is None:
+            return None
+
+        if exc is not None:
+            if not retry.retry_on_exception(exc, attempt):
+                return None
+        elif response is None or not retry.retry_on_response(response, attempt):
+            return None
+
+        delay = retry.get_delay(attempt, response)
+
+        deadline = current_deadline()
+        if delay is not None and deadline is not None and delay >= deadline.remaining():
+            # Gözləmədən sonra növbəti cəhd üçün vaxt qalmır
+            return None
+
+        if delay is not None:
+            self.logger.warning(
+                '%s request to %s failed (%s). Retrying in %.2fs (attempt %d of %d)',
+                self.client_name,
+                url,
+                repr(exc) if exc is not None else response.status_code,
+                delay,
+                attempt + 1,
+                retry.max_attempts,
+            )
+
+        return delay
+
+    def _send(
+        self,
+        verb: str,
+        url: str,
+        request_kwds: dict[str, Any],
+        route_name: str | None = None,
+    ) -> httpx.Response:
+        """Sync sorğunu route-un rate limit-i, təkrar siyasəti və circuit breaker-i ilə göndərir"""
+        retry = self.get_retry_policy(route_name, verb)
+        breaker = self.get_circuit_breaker(route_name)
+        key = breaker.key_for(url, route_name) if breaker is not None else ''
+        limiters = self.get_rate_limiters(route_name)
+
+        attempt = 1
+        while True:
+            deadline = current_deadline()
+            if deadline is not None:
+                deadline.check(url)
+
+            if breaker is not None:
+                breaker.before_call(key)
+
+            recorded = False
+            try:
+                self._acquire(limiters, url)
+
+                try:
+                    timeout = self._attempt_timeout(route_name, url)
+                    response = self.client.request(verb, url, **request_kwds, timeout=timeout)
+                except Exception as e:
+                    recorded = self._record_outcome(breaker, key, exc=e)
+                    delay = self._retry_delay(retry, attempt, url, exc=e)
+                    if delay is None:
+                        raise
+                else:
+                    recorded = self._record_outcome(breaker, key, response=response)
+                    delay = self._retry_delay(retry, attempt, url, response=response)
+                    if delay is None:
+                        return response
+            finally:
+                if breaker is not None and not recorded:
+                    # Yarımçıq və ya deadline-ı bitmiş cəhd sınaq yerini tutmamalıdır
+                    breaker.release(key)
+
+            time.sleep(delay)
+            attempt += 1
+
+    async def _asend(
+        self,
+        verb: str,
+        url: str,
+        request_kwds: dict[str, Any],
+        route_name: str | None = None,
+        record: RequestRecord | None = None,
+    ) -> httpx.Response:
+        """Async sorğunu route-un rate limit-i, təkrar siyasəti, circuit breaker-i və hedging
+        siyasəti ilə göndərir"""
+        retry = self.get_retry_policy(route_name, verb)
+        hedge = self.get_hedge_policy(route_name, verb)
+        breaker = self.get_circuit_breaker(route_name)
+        key = breaker.key_for(url, route_name) if breaker is not None else ''
+        limiters = self.get_rate_limiters(route_name)
+
+        attempt = 1
+        while True:
+            deadline = current_deadline()
+            if deadline is not None:
+                deadline.check(url)
+
+            if breaker is not None:
+                breaker.before_call(key)
+
+            recorded = False
+            try:
+                await self._aacquire(limiters, url)
+
+                try:
+                    timeout = self._attempt_timeout(route_name, url)
+                    send = partial(self.client.request, verb, url, **request_kwds, timeout=timeout)
+                    if hedge is None:
+                        response = await send()
+                    else:
+                        response = await self._ahedge(hedge, send, route_name, limiters, record)
+                except Exception as e:
+                    recorded = self._record_outcome(breaker, key, exc=e)
+                    delay = self._retry_delay(retry, attempt, url, exc=e)
+                    if delay is None:
+                        raise
+                else:
+                    recorded = self._record_outcome(breaker, key, response=response)
+                    delay = self._retry_delay(retry, attempt, url, response=response)
+                    if delay is None:
+                        return response
+            finally:
+                if breaker is not None and not recorded:
+                    # Ləğv olunmuş və ya deadline-ı bitmiş cəhd sınaq yerini tutmamalıdır
+                    breaker.release(key)
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _acquire(limiters: tuple[RateLimiter, ...], url: str) -> None:
+        """Rate limiter-lərdən token alır. Deadline varsa, gözləmə qalan müddətlə
+        məhdudlaşdırılır: token deadline-dan əvvəl hazır olmayacaqsa, gözləmədən
+        `DeadlineExceededError` qaldırılır."""
+        for limiter in limiters:
+            deadline = current_deadline()
+            remaining = deadline.remaining() if deadline is not None else None
+            try:
+                limiter.acquire(timeout=remaining)
+            except RateLimitTimeoutError as e:
+                raise DeadlineExceededError(url, e.wait - e.timeout) from e
+
+    @staticmethod
+    async def _aacquire(limiters: tuple[RateLimiter, ...], url: str) -> None:
+        """`_acquire`-in async versiyası"""
+        for limiter in limiters:
+            deadline = current_deadline()
+            remaining = deadline.remaining() if deadline is not None else None
+            try:
+                await limiter.aacquire(timeout=remaining)
+            except RateLimitTimeoutError as e:
+                raise DeadlineExceededError(url, e.wait - e.timeout) from e
+
+    @staticmethod
+    def _record_outcome(
+        breaker: CircuitBreaker | None,
+        key: str,
+        response: httpx.Response | None = None,
+        exc: Exception | None = None,
+    ) -> bool:
+        """Cəhdin nəticəsini circuit breaker-də qeyd edir və qeyd olunub-olunmadığını
+        qaytarır. Deadline-ın bitməsi (o cümlədən rate limiter-in gözləməsinin deadline-a
+        sığmaması) provayderin nəticəsi deyil, ona görə qeyd olunmur."""
+        if breaker is None or isinstance(exc, DeadlineExceededError):
+            return False
+
+        breaker.record(key, breaker.is_failure(response=response, exc=exc))
+        return True
+
+    async def _ahedge(
+        self,
+        hedge: HedgePolicy,
+        send: Callable[[], Coroutine[Any, Any, httpx.Response]],
+        route_name: str | None,
+        limiters: tuple[RateLimiter, ...],
+        record: RequestRecord | None,
+    ) -> httpx.Response:
+        """Sorğunu göndərir; gecikmə müddətində uğurlu cavab gəlmədikdə, büdcə və rate
+        limit imkan verdikcə eyni sorğunu paralel təkrarlayır. İlk uğurlu cavab qaytarılır,
+        digər sorğular ləğv olunur. Uğurlu cavab gəlmədikdə, sonuncu nəticə qaytarılır."""
+        key = f'{self.client_name}:{route_name}'
+        hedge.begin()
+        delay = hedge.get_delay(key)
+        start = time.perf_counter()
+
+        primary = asyncio.ensure_future(send())
+        primary_done: list[float] = []
+        primary.add_done_callback(lambda _: primary_done.append(time.perf_counter()))
+        pending = {primary}
+        hedges = 0
+        can_hedge = True
+        try:
+            while True:
+                timeout = None
+                if can_hedge and hedges < hedge.max_hedges:
+                    timeout = max(0.0, start + delay * (hedges + 1) - time.perf_counter())
+
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Gecikmə bitdi: büdcə və rate limit imkan verirsə, hedge göndəririk
+                    can_hedge = self._admit_hedge(hedge, limiters)
+                    if can_hedge:
+                        hedges += 1
+                        pending.add(asyncio.ensure_future(send()))
+                    continue
+
+                winner = None
+                for task in done:
+                    # `exception()` həm də uğursuz task-ın xətasını "oxunmuş" edir
+                    if task.exception() is None and hedge.is_success(task.result()):
+                        winner = task
+
+                if winner is None and pending:
+                    continue  # Digər sorğuların cavabını gözləyirik
+
+                won = winner is not None and winner is not primary
+                if record is not None:
+                    record.hedge_won = record.hedge_won or won
+
+                response = (winner or done.pop()).result()
+                self._observe_primary(hedge, key, primary, start, primary_done, won)
+                return response
+        finally:
+            if record is not None:
+                record.hedges += hedges
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(_consume_result)
+
+    @staticmethod
+    def _observe_primary(
+        hedge: HedgePolicy,
+        key: str,
+        primary: asyncio.Future,
+        start: float,
+        primary_done: list[float],
+        won: bool,
+    ) -> None:
+        """Gecikmənin hesablanması üçün ilk (primary) sorğunun öz latency-sini qeyd edir.
+        Qalib sorğunun (minimumun) müddəti yazılsaydı, persentil getdikcə azalardı.
+        Hələ bitməmiş (ləğv olunacaq) primary üçün keçən müddət aşağı sərhəd kimi yazılır;
+        xəta ilə bitmiş primary ölçü sayılmır."""
+        if not primary.done():
+            latency: float | None = time.perf_counter() - start
+        elif primary.exception() is None:
+            latency = primary_done[0] - start
+        else:
+            latency = None
+
+        hedge.observe(key, latency, won)
+
+    @staticmethod
+    def _admit_hedge(hedge: HedgePolicy, limiters: tuple[RateLimiter, ...]) -> bool:
+        """Hedge-in büdcədən və rate limiter-lərdən (gözləmədən) token alıb-almadığı"""
+        if not hedge.try_hedge():
+            return False
+
+        if not all(limiter.try_acquire() for limiter in limiters):
+            hedge.throttle()
+            return False
+
+        return True
+
+    def _parse_response(
+        self,
+        handler: APIPayloadHandler,
+        response: httpx.Response,
+    ) -> httpx.Response | APIResponse[_ResponseT] | LazyAPIResponse[_ResponseT]:
+        """Cavabı handler ilə (və ya lazy rejimdə, ilk müraciətdə) parse edir"""
+        if handler.resp_model and handler.lazy_supported and (self.lazy_responses or handler.lazy):
+            return LazyAPIResponse(response, handler.handle_response)
+
+        return handler.handle_response(response)
+
+    def _handle_response(
+        self,
+        url: str,
+        handler: APIPayloadHandler,
+        response: httpx.Response,
+    ) -> httpx.Response | APIResponse[_ResponseT] | LazyAPIResponse[_ResponseT]:
+        if not response.is_success:
+            self.logger.error(
+                '%s request to %s failed. Status code was %d. Content => %s',
+                self.client_name,
+                url,
+                response.status_code,
+                response.content.decode(errors='replace'),
+            )
+
+        return self._parse_response(handler, response)
+
+    def _respond(
+        self,
+        verb: str,
+        url: str,
+        handler: APIPayloadHandler,
+        request_kwds: dict[str, Any],
+        route_name: str | None = None,
+        record: RequestRecord | None = None,
+    ) -> httpx.Response | APIResponse[_ResponseT] | LazyAPIResponse[_ResponseT]:
+        """Sync sorğunun cavabını (cache-dən və ya göndərərək) alıb handler ilə emal edir"""
+        cache_key, cache_ttl, response = self._cached_response(route_name, verb, url, request_kwds)
+        if response is not None:
+            if record is not None:
+                record.cache_hit = True
+                self._record_response(record, response)
+            return self._finish_response(record, self._parse_response(handler, response))
+
+        response = self._send(verb, url, request_kwds, route_name)
+        if record is not None:
+            self._record_response(record, response)
+        if cache_key is not None and self.response_cache is not None:
+            self.response_cache.set(cache_key, response, cache_ttl)
+
+        return self._finish_response(record, self._handle_response(url, handler, response))
+
+    async def _arespond(
+        self,
+        verb: str,
+        url: str,
+        handler: APIPayloadHandler,
+        request_kwds: dict[str, Any],
+        route_name: str | None = None,
+        record: RequestRecord | None = None,
+    ) -> httpx.Response | APIResponse[_ResponseT] | LazyAPIResponse[_ResponseT]:
+        """Async sorğunun cavabını (cache-dən və ya göndərərək) alıb handler ilə emal edir"""
+        cache_key, cache_ttl, response = self._cached_response(route_name, verb, url, request_kwds)
+        if response is not None:
+            if record is not None:
+                record.cache_hit = True
+                self._record_response(record, response)
+            return self._finish_response(record, self._parse_response(handler, response))
+
+        response = await self._asend(verb, url, request_kwds, route_name, record)
+        if record is not None:
+            self._record_response(record, response)
+        if cache_key is not None and self.response_cache is not None:
+            self.response_cache.set(cache_key, response, cache_ttl)
+
+        return self._finish_response(record, self._handle_response(url, handler, response))
+
+    @staticmethod
+    def _record_response(record: RequestRecord, response: httpx.Response) -> None:
+        record.mark('network')
+        record.status_code = response.status_code
+        record.bytes_in = len(response.content)
+
+    @staticmethod
+    def _finish_response(record: RequestRecord | None, result: Any) -> Any:
+        if record is not None:
+            record.mark('handle_response')
+        return result
+
     @property
     def request_function(
         self,
@@ -400,21 +1870,74 @@ class APIExecutor:
         handler: APIPayloadHandler,
         *args,
         headers: dict | None = None,
+        route_name: str | None = None,
+        deadline: DeadlineLike | None = None,
         **kwds,
-    ) -> httpx.Response | APIResponse[_ResponseT] | DryResponse:
+    ) -> httpx.Response | APIResponse[_ResponseT] | LazyAPIResponse[_ResponseT] | DryResponse:
         """Sync sorğu atan funksiya
 
         Args:
             url: Sorğunun full url-i
             verb: Sorğunun metodun (`POST`, `GET`, və s.)
             handler: Sorğu və cavabın payload handler-i
+            route_name: Endpoint-in adı. Route-a aid parametrlər (təkrar siyasəti və s.)
+                üçün istifadə olunur.
+            deadline: Çağırışın (təkrar cəhdlər daxil) deadline-ı: `Deadline` obyekti və ya
+                saniyə ilə büdcə. Kontekstdəki deadline-dan (bax: `integrify.deadline`)
+                daha tez bitdikdə tətbiq olunur.
         """
         assert isinstance(self.client, httpx.Client)
 
+        if deadline is not None:
+            with deadline_scope(deadline):
+                return self.sync_req(
+                    url, verb, handler, *args, headers=headers, route_name=route_name, **kwds
+                )
+
+        if not self.hooks and self.tracer is None:
+            return self._sync_call(None, url, verb, handler, args, kwds, headers, route_name)
+
+        record = RequestRecord(self.client_name, route_name, verb, url)
+        span = self.tracer.start(record) if self.tracer is not None else None
+        try:
+            result = self._sync_call(record, url, verb, handler, args, kwds, headers, route_name)
+        except BaseException as e:
+            record.finish(error=e)
+            raise
+        else:
+            record.finish(result)
+        finally:
+            if self.tracer is not None:
+                self.tracer.end(span, record)
+            self._emit(record)
+
+        return result
+
+    def _sync_call(
+        self,
+        record: RequestRecord | None,
+        url: str,
+        verb: str,
+        handler: APIPayloadHandler,
+        args: tuple,
+        kwds: dict,
+        headers: dict | None,
+        route_name: str | None,
+    ) -> httpx.Response | APIResponse[_ResponseT] | LazyAPIResponse[_ResponseT] | DryResponse:
+        """Sorğunu icra edir; `record` verildikdə mərhələlərin müddətini qeyd edir"""
         req_model = handler.build_request_model(*args, **kwds)
+        if record is not None:
+            record.mark('build_request_model')
+
         data = handler.handle_request(req_model, *args, **kwds)
+        if record is not None:
+            record.mark('handle_request')
+
         full_headers = {**handler.headers, **(headers or {})}
         full_url = handler.set_urlparams(url, req_model)
+        if record is not None:
+            record.mark('set_urlparams')
+            record.url = full_url
 
         if self.dry or handler.dry:
             return DryResponse(
@@ -425,25 +1948,24 @@ class APIExecutor:
                 data=data,
             )
 
-        request_kwds = {'headers': full_headers, **handler.req_args}
-
-        if verb == 'GET':
-            request_kwds['params'] = data
-        else:
-            request_kwds['json'] = data
-
-        response = self.client.request(verb, full_url, **request_kwds)
-
-        if not response.is_success:
-            self.logger.error(
-                '%s request to %s failed. Status code was %d. Content => %s',
-                self.client_name,
-                full_url,
-                response.status_code,
-                response.content.decode(errors='replace'),
-            )
-
-        return handler.handle_response(response)
+        request_kwds = self._build_request_kwds(verb, handler, data, full_headers)
+        if record is not None:
+            record.bytes_out = request_body_size(request_kwds)
+        respond = partial(self._respond, verb, full_url, handler, request_kwds, route_name, record)
+
+        if route_name is not None and self.should_coalesce(route_name, verb):
+            assert isinstance(self.flights, SingleFlight)
+            key = self._flight_key(route_name, verb, full_url, request_kwds)
+            try:
+                result = self.flights.do(key, respond, self._flight_timeout(), _copy_result)
+            except FlightTimeoutError as e:
+                raise DeadlineExceededError(full_url, 0.0) from e
+            if record is not None and 'network' not in record.timings:
+                record.coalesced = True  # Cavab başqa çağırışın sorğusundan alınıb
+                record.mark('network')
+            return result
+
+        return respond()
 
     async def async_req(  # pragma: no cover
         self,
@@ -452,21 +1974,76 @@ class APIExecutor:
         handler: APIPayloadHandler,
         *args,
         headers: dict | None = None,
+        route_name: str | None = None,
+        deadline: DeadlineLike | None = None,
         **kwds,
-    ) -> httpx.Response | APIResponse[_ResponseT] | DryResponse:
+    ) -> httpx.Response | APIResponse[_ResponseT] | LazyAPIResponse[_ResponseT] | DryResponse:
         """Async sorğu atan funksiya
 
         Args:
             url: Sorğunun full url-i
             verb: Sorğunun metodun (`POST`, `GET`, və s.)
             handler: Sorğu və cavabın payload handler-i
+            route_name: Endpoint-in adı. Route-a aid parametrlər (təkrar siyasəti və s.)
+                üçün istifadə olunur.
+            deadline: Çağırışın (təkrar cəhdlər daxil) deadline-ı: `Deadline` obyekti və ya
+                saniyə ilə büdcə. Kontekstdəki deadline-dan (bax: `integrify.deadline`)
+                daha tez bitdikdə tətbiq olunur.
         """
         assert isinstance(self.client, httpx.AsyncClient)
 
+        if deadline is not None:
+            with deadline_scope(deadline):
+                return await self.async_req(
+                    url, verb, handler, *args, headers=headers, route_name=route_name, **kwds
+                )
+
+        if not self.hooks and self.tracer is None:
+            return await self._async_call(None, url, verb, handler, args, kwds, headers, route_name)
+
+        record = RequestRecord(self.client_name, route_name, verb, url)
+        span = self.tracer.start(record) if self.tracer is not None else None
+        try:
+            result = await self._async_call(
+                record, url, verb, handler, args, kwds, headers, route_name
+            )
+        except BaseException as e:
+            record.finish(error=e)
+            raise
+        else:
+            record.finish(result)
+        finally:
+            if self.tracer is not None:
+                self.tracer.end(span, record)
+            await self._aemit(record)
+
+        return result
+
+    async def _async_call(
+        self,
+        record: RequestRecord | None,
+        url: str,
+        verb: str,
+        handler: APIPayloadHandler,
+        args: tuple,
+        kwds: dict,
+        headers: dict | None,
+        route_name: str | None,
+    ) -> httpx.Response | APIResponse[_ResponseT] | LazyAPIResponse[_ResponseT] | DryResponse:
+        """Sorğunu icra edir; `record` verildikdə mərhələlərin müddətini qeyd edir"""
         req_model = handler.build_request_model(*args, **kwds)
+        if record is not None:
+            record.mark('build_request_model')
+
         data = handler.handle_request(req_model, *args, **kwds)
+        if record is not None:
+            record.mark('handle_request')
+
         full_headers = {**handler.headers, **(headers or {})}
         full_url = handler.set_urlparams(url, req_model)
+        if record is not None:
+            record.mark('set_urlparams')
+            record.url = full_url
 
         if self.dry or handler.dry:
             # Sorğu göndərmək əvəzinə göndəriləcək datanı qaytarmaq
@@ -478,22 +2055,21 @@ class APIExecutor:
                 data=data,
             )
 
-        request_kwds = {'headers': full_headers, **handler.req_args}
-
-        if verb == 'GET':
-            request_kwds['params'] = data
-        else:
-            request_kwds['json'] = data
-
-        response = await self.client.request(verb, full_url, **request_kwds)
-
-        if not response.is_success:
-            self.logger.error(
-                '%s request to %s failed. Status code was %d. Content => %s',
-                self.client_name,
-                full_url,
-                response.status_code,
-                response.content.decode(errors='replace'),
-            )
-
-        return handler.handle_response(response)
+        request_kwds = self._build_request_kwds(verb, handler, data, full_headers)
+        if record is not None:
+            record.bytes_out = request_body_size(request_kwds)
+        respond = partial(self._arespond, verb, full_url, handler, request_kwds, route_name, record)
+
+        if route_name is not None and self.should_coalesce(route_name, verb):
+            assert isinstance(self.flights, AsyncSingleFlight)
+            key = self._flight_key(route_name, verb, full_url, request_kwds)
+            try:
+                result = await self.flights.do(key, respond, self._flight_timeout(), _copy_result)
+            except FlightTimeoutError as e:
+                raise DeadlineExceededError(full_url, 0.0) from e
+            if record is not None and 'network' not in record.timings:
+                record.coalesced = True  # Cavab başqa çağırışın sorğusundan alınıb
+                record.mark('network')
+            return result
+
+        return await respond()
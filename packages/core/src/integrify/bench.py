@@ -0,0 +1,442 @@
+import argparse
+import asyncio
+import importlib
+import itertools
+import json
+import logging
+import math
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any
+
+import httpx
+from integrify.api import APIClient
+from integrify.cassette import ReplayTransport
+from integrify.hooks import PHASES, RequestRecord
+from integrify.testing import simulator
+
+CLIENTS = {
+    'epoint': ('integrify.epoint.client:EPointClientClass', 'epoint'),
+    'kapitalbank': ('integrify.kapitalbank.client:KapitalClientClass', 'kapitalbank'),
+    'azericard': ('integrify.azericard.client:AzeriCardClientClass', 'azericard'),
+    'clopos': ('integrify.clopos.client:CloposClientClass', 'clopos'),
+    'lsim': ('integrify.lsim.single.client:LSIMSingleSMSClientClass', 'lsim'),
+    'lsim.bulk': ('integrify.lsim.bulk.client:LSIMBulkSMSClientClass', 'lsim'),
+    'postaguvercini': (
+        'integrify.postaguvercini.client:PostaGuverciniClientClass',
+        'postaguvercini',
+    ),
+}
+"""İnteqrasiyaların klient class-ları və onlara uyğun simulyatorlar (bax: `SIMULATORS`)"""
+
+PERCENTILES = (50, 90, 99)
+"""Hesabatda göstərilən gecikmə persentilləri"""
+
+_status_code: ContextVar[int | None] = ContextVar('integrify_bench_status_code', default=None)
+"""Cari worker-in son sorğusunun status kodu (hook tərəfindən yazılır)"""
+
+
+class LoadReport:
+    """Yük testinin nəticəsi: sorğu sayı, gecikmələr, xətalar və mərhələlərin müddəti.
+
+    Qeydlər bir neçə thread-dən eyni anda əlavə oluna bilər.
+    """
+
+    def __init__(self, title: str = ''):
+        self.title = title
+        """Testin adı (məs., `epoint.pay`)"""
+
+        self.latencies: list[float] = []
+        """Hər sorğunun gecikməsi (saniyə ilə)"""
+
+        self.errors: Counter[str] = Counter()
+        """Xəta növü üzrə sorğu sayı (`HTTP 503`, `ReadTimeout` və s.)"""
+
+        self.phases: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        """Mərhələlərin ümumi müddəti (bax: `integrify.hooks.PHASES`)"""
+
+        self.records = 0
+        """Mərhələ müddətləri yazılmış sorğu sayı"""
+
+        self.elapsed = 0.0
+        """Testin ümumi müddəti (saniyə ilə)"""
+
+        self.cpu_time = 0.0
+        """Test zamanı prosesin sərf etdiyi CPU vaxtı (saniyə ilə)"""
+
+        self._lock = threading.Lock()
+
+    def add(self, latency: float, error: str | None = None) -> None:
+        """Bir sorğunun nəticəsini əlavə edir"""
+        with self._lock:
+            self.latencies.append(latency)
+            if error is not None:
+                self.errors[error] += 1
+
+    def observe(self, record: RequestRecord) -> None:
+        """Klientin hook-u: sorğunun mərhələ müddətlərini toplayır"""
+        _status_code.set(record.status_code)
+        with self._lock:
+            self.records += 1
+            for phase, duration in record.timings.items():
+                self.phases[phase] = self.phases.get(phase, 0.0) + duration
+
+    @property
+    def requests(self) -> int:
+        """Tamamlanmış sorğu sayı"""
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """Saniyədə tamamlanmış sorğu sayı"""
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Gecikmənin `q`-cü persentili (nearest-rank)"""
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        return latencies[max(math.ceil(q / 100 * len(latencies)) - 1, 0)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Nəticənin dict formasında (məs., JSON çıxışı üçün) təsviri"""
+        records = self.records or 1
+        return {
+            'title': self.title,
+            'requests': self.requests,
+            'elapsed': self.elapsed,
+            'throughput': self.throughput,
+            'errors': dict(self.errors),
+            'latency': {
+                **{f'p{q}': self.percentile(q) for q in PERCENTILES},
+                'max': max(self.latencies, default=0.0),
+            },
+            'cpu_per_request': self.cpu_time / (self.requests or 1),
+            'phases': {
+                phase: duration / records for phase, duration in self.phases.items() if duration
+            },
+        }
+
+    def render(self) -> str:
+        """Nəticənin mətn formasında hesabatı"""
+        data = self.as_dict()
+        error_count = sum(self.errors.values())
+        lines = [
+            self.title,
+            f'  requests    {self.requests} in {self.elapsed:.2f}s '
+            f'({data["throughput"]:.1f} req/s)',
+            f'  errors      {error_count} ({error_count / (self.requests or 1):.1%})',
+        ]
+        lines.extend(f'    {name:<28} {count}' for name, count in self.errors.most_common())
+        lines.append(
+            '  latency     '
+            + '  '.join(f'{name} {value * 1e3:.2f} ms' for name, value in data['latency'].items())
+        )
+        lines.append(f'  cpu         {data["cpu_per_request"] * 1e6:.1f} us/request')
+        lines.append('  phases (mean per request)')
+        lines.extend(
+            f'    {phase:<28} {duration * 1e6:.1f} us' for phase, duration in data['phases'].items()
+        )
+        return '\n'.join(lines)
+
+
+def classify(result: Any = None, error: BaseException | None = None) -> str | None:
+    """Sorğunun xəta növü: uğurlu sorğu üçün `None`.
+
+    Exception-lar növü ilə qruplaşdırılır; cavab alınıbsa (məs., xəta cavabı validate
+    olunmadıqda), status kodu da əlavə olunur (klientə `LoadReport.observe` hook-u əlavə
+    olunduqda).
+    """
+    if error is not None:
+        status_code = _status_code.get()
+        name = type(error).__name__
+        return f'{name} (HTTP {status_code})' if status_code is not None else name
+
+    status_code = getattr(result, 'status_code', None)
+    if status_code is not None and status_code >= httpx.codes.BAD_REQUEST:
+        return f'HTTP {status_code}'
+    if getattr(result, 'ok', True) is False:
+        return f'not ok (HTTP {status_code})'
+    return None
+
+
+class _Schedule:
+    """Sorğuların ardıcıllıq nömrəsini və (RPS rejimində) planlaşdırılmış anını paylayır"""
+
+    def __init__(self, rps: float | None, duration: float | None, requests: int | None):
+        self.rps = rps
+        self.requests = requests
+        self.start = time.perf_counter()
+        self.deadline = self.start + duration if duration is not None else math.inf
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def next(self) -> tuple[int, float] | None:
+        """Növbəti sorğunun nömrəsi və planlaşdırılmış anı. Test bitibsə, `None`."""
+        with self._lock:
+            index = next(self._counter)
+        if self.requests is not None and index >= self.requests:
+            return None
+
+        at = self.start + index / self.rps if self.rps else time.perf_counter()
+        if at >= self.deadline:
+            return None
+        return index, at
+
+
+def _validate(
+    concurrency: int,
+    rps: float | None,
+    duration: float | None,
+    requests: int | None,
+) -> None:
+    if concurrency < 1:
+        raise ValueError('concurrency must be at least 1')
+    if rps is not None and rps <= 0:
+        raise ValueError('rps must be positive')
+    if duration is None and requests is None:
+        raise ValueError('duration or requests must be given')
+
+
+def run_load(
+    call: Callable[[int], Any],
+    concurrency: int = 10,
+    rps: float | None = None,
+    duration: float | None = None,
+    requests: int | None = None,
+    report: LoadReport | None = None,
+) -> LoadReport:
+    """Sync funksiyanı thread-lərdə paralel çağıraraq yük testi aparır.
+
+    `rps` verilmədikdə, test qapalı dövrədir: `concurrency` worker fasiləsiz sorğu göndərir.
+    `rps` verildikdə isə `i`-ci sorğu `start + i / rps` anında göndərilir (açıq dövrə) və
+    gecikmə planlaşdırılmış andan ölçülür, yəni worker çatışmadıqda növbədə gözləmə də
+    gecikməyə daxildir (coordinated omission baş vermir).
+
+    Args:
+        call: Sorğunun nömrəsini qəbul edən və sorğunu icra edən funksiya
+        concurrency: Worker (thread) sayı
+        rps: Hədəf RPS. Verilməsə, sorğular fasiləsiz göndərilir.
+        duration: Testin maksimum müddəti (saniyə ilə)
+        requests: Maksimum sorğu sayı
+        report: Nəticələrin yazılacağı obyekt (məs., əvvəlcədən hook kimi əlavə olunmuş)
+
+    Returns:
+        Testin nəticəsi
+    """
+    _validate(concurrency, rps, duration, requests)
+    report = report if report is not None else LoadReport()
+    schedule = _Schedule(rps, duration, requests)
+
+    def worker() -> None:
+        while (item := schedule.next()) is not None:
+            index, at = item
+            if (wait := at - time.perf_counter()) > 0:
+                time.sleep(wait)
+            _status_code.set(None)
+            try:
+                error = classify(call(index))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                error = classify(error=e)
+            report.add(time.perf_counter() - at, error)
+
+    cpu = time.process_time()
+    with ThreadPoolExecutor(concurrency, thread_name_prefix='integrify-bench') as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+
+    report.elapsed = time.perf_counter() - schedule.start
+    report.cpu_time = time.process_time() - cpu
+    return report
+
+
+async def arun_load(
+    call: Callable[[int], Awaitable[Any]],
+    concurrency: int = 10,
+    rps: float | None = None,
+    duration: float | None = None,
+    requests: int | None = None,
+    report: LoadReport | None = None,
+) -> LoadReport:
+    """`run_load`-un async versiyası: worker-lər eyni event loop-da task-lardır"""
+    _validate(concurrency, rps, duration, requests)
+    report = report if report is not None else LoadReport()
+    schedule = _Schedule(rps, duration, requests)
+
+    async def worker() -> None:
+        while (item := schedule.next()) is not None:
+            index, at = item
+            if (wait := at - time.perf_counter()) > 0:
+                await asyncio.sleep(wait)
+            _status_code.set(None)
+            try:
+                error = classify(await call(index))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                error = classify(error=e)
+            report.add(time.perf_counter() - at, error)
+
+    cpu = time.process_time()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    report.elapsed = time.perf_counter() - schedule.start
+    report.cpu_time = time.process_time() - cpu
+    return report
+
+
+def render_template(template: Any, index: int) -> Any:
+    """Argument şablonundakı `{i}` (sorğunun nömrəsi) və `{uuid}` (təsadüfi UUID)
+    placeholder-lərini əvəz edir (məs., unikal `order_id` üçün)."""
+    if isinstance(template, dict):
+        return {key: render_template(value, index) for key, value in template.items()}
+    if isinstance(template, list):
+        return [render_template(value, index) for value in template]
+    if isinstance(template, str):
+        return template.replace('{i}', str(index)).replace('{uuid}', uuid.uuid4().hex)
+    return template
+
+
+def load_client_class(integration: str) -> tuple[type[APIClient], str | None]:
+    """İnteqrasiyanın klient class-ı və simulyatorunun adı.
+
+    Args:
+        integration: `CLIENTS`-dəki ad və ya `module:Class` formatında klient class-ı
+            (bu halda simulyator yoxdur)
+    """
+    path, simulator_name = CLIENTS.get(integration, (integration, None))
+    if ':' not in path:
+        raise ValueError(
+            f'Unknown integration {integration!r}. Available: {", ".join(CLIENTS)} or module:Class'
+        )
+
+    module_name, class_name = path.split(':')
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            f'Integration {integration!r} is not installed ({e.name} not found)'
+        ) from e
+    return getattr(module, class_name), simulator_name
+
+
+def parse_args_json(value: str) -> dict[str, Any]:
+    """`--args` dəyərini JSON obyekti kimi parse edir. Yanlış JSON-da argparse səliqəli
+    xəta mesajı ilə çıxsın deyə `ArgumentTypeError` qaldırılır."""
+    try:
+        data = json.loads(value)
+    except json.JSONDecodeError as e:
+        raise argparse.ArgumentTypeError(f'invalid JSON: {e}') from None
+
+    if not isinstance(data, dict):
+        raise argparse.ArgumentTypeError('expected a JSON object of keyword arguments')
+
+    return data
+
+
+def build_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """`integrify bench` əmrinin argumentləri"""
+    parser.add_argument('integration', help=f'{", ".join(CLIENTS)} or module:Class')
+    parser.add_argument('route', help='client method, e.g. pay')
+    parser.add_argument(
+        '--args',
+        type=parse_args_json,
+        default='{}',
+        help='JSON keyword arguments; "{i}" and "{uuid}" are replaced per request',
+    )
+    parser.add_argument('--mode', choices=('sync', 'async'), default='async')
+    parser.add_argument('-c', '--concurrency', type=int, default=10, help='workers')
+    parser.add_argument('--rps', type=float, help='target requests per second (open loop)')
+    parser.add_argument('-d', '--duration', type=float, help='seconds (default: 10)')
+    parser.add_argument('-n', '--requests', type=int, help='maximum number of requests')
+    parser.add_argument(
+        '--base-url',
+        help='send real HTTP requests to this URL (e.g. a simulator served with uvicorn) '
+        'instead of the in-process simulator',
+    )
+    parser.add_argument('--max-connections', type=int, help='httpx pool limit (--base-url)')
+    parser.add_argument(
+        '--cassette',
+        help='replay responses recorded with integrify.cassette.RecordingTransport',
+    )
+    parser.add_argument(
+        '--cassette-latency',
+        type=float,
+        default=0.0,
+        help='factor of the recorded latency to emulate on replay (0: none, 1: real)',
+    )
+    parser.add_argument('--latency', type=float, default=0.0, help='simulated latency (s)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='simulated jitter (s)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='simulated error rate')
+    parser.add_argument('--timeout-rate', type=float, default=0.0, help='simulated timeouts')
+    parser.add_argument('--seed', type=int, help='simulator random seed')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    parser.add_argument('-v', '--verbose', action='store_true', help='keep client error logs')
+    return parser
+
+
+def bench(args: argparse.Namespace) -> LoadReport:
+    """`integrify bench` əmrini icra edir"""
+    client_class, simulator_name = load_client_class(args.integration)
+    template = args.args if isinstance(args.args, dict) else parse_args_json(args.args)
+    duration = args.duration if args.duration is not None or args.requests else 10.0
+
+    kwds: dict[str, Any] = {'sync': args.mode == 'sync'}
+    if args.base_url:
+        kwds['base_url'] = args.base_url
+        if args.max_connections:
+            kwds['limits'] = httpx.Limits(max_connections=args.max_connections)
+    elif args.cassette:
+        kwds['transport'] = ReplayTransport(args.cassette, latency=args.cassette_latency)
+    elif simulator_name is not None:
+        sim = simulator(
+            simulator_name,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            timeout_rate=args.timeout_rate,
+            seed=args.seed,
+        )
+        kwds['transport'] = sim.transport()
+    else:
+        raise ValueError(f'No simulator for {args.integration!r}; pass --base-url or --cassette')
+
+    report = LoadReport(f'{args.integration}.{args.route} ({args.mode})')
+    client = client_class(**kwds, hooks=[report.observe])
+    endpoint = getattr(client, args.route)
+    options = {
+        'concurrency': args.concurrency,
+        'rps': args.rps,
+        'duration': duration,
+        'requests': args.requests,
+        'report': report,
+    }
+
+    if client.request_executor.sync:
+        with client:
+            return run_load(lambda i: endpoint(**render_template(template, i)), **options)
+
+    async def main() -> LoadReport:
+        async with client:
+            return await arun_load(lambda i: endpoint(**render_template(template, i)), **options)
+
+    return asyncio.run(main())
+
+
+def command(args: argparse.Namespace) -> int:
+    """CLI əmri: hesabatı stdout-a yazır"""
+    if not args.verbose:
+        # Hər uğursuz sorğunun logu hesabatı örtməsin
+        logging.disable(logging.ERROR)
+    try:
+        report = bench(args)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    output = json.dumps(report.as_dict(), indent=2) if args.json else report.render()
+    sys.stdout.write(output + '\n')
+    return 0
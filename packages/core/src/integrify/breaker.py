@@ -0,0 +1,259 @@
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from enum import Enum
+from time import monotonic
+from urllib.parse import urlsplit
+
+import httpx
+from integrify.logger import LOGGER_FUNCTION
+
+DEFAULT_FAILURE_STATUSES = frozenset(range(500, 600))
+"""Default olaraq provayder xətası sayılan status kodları"""
+
+DEFAULT_FAILURE_EXCEPTIONS: tuple[type[BaseException], ...] = (httpx.TransportError,)
+"""Default olaraq provayder xətası sayılan exception-lar (timeout, şəbəkə xətaları və s.)"""
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker-in vəziyyəti"""
+
+    CLOSED = 'closed'
+    """Sorğular normal göndərilir, nəticələr izlənilir"""
+
+    OPEN = 'open'
+    """Sorğular göndərilmir, dərhal `CircuitOpenError` qaldırılır"""
+
+    HALF_OPEN = 'half_open'
+    """Provayderin bərpa olunub-olunmadığını yoxlamaq üçün məhdud sayda sınaq sorğusu buraxılır"""
+
+
+class CircuitOpenError(Exception):
+    """Circuit açıq olduqda, sorğu göndərilmədən qaldırılan xəta"""
+
+    def __init__(self, key: str, retry_in: float):
+        """
+        Args:
+            key: Açıq olan circuit-in açarı (host və ya route adı)
+            retry_in: Circuit-in sınaq üçün yarıaçıq vəziyyətə keçməsinə qalan müddət (saniyə ilə)
+        """
+        super().__init__(f'Circuit for {key!r} is open, retry in {retry_in:.1f}s')
+        self.key = key
+        self.retry_in = retry_in
+
+
+class _Circuit:
+    """Bir açar (host/route) üçün circuit vəziyyəti"""
+
+    __slots__ = ('opened_at', 'outcomes', 'state', 'trials')
+
+    def __init__(self):
+        self.state = CircuitState.CLOSED
+        self.outcomes: deque[tuple[float, bool]] = deque()
+        self.opened_at = 0.0
+        self.trials = 0
+
+
+class CircuitBreaker:
+    """Provayder host-u (və ya route) üzrə circuit breaker.
+
+    Son `window` saniyədəki sorğuların ən azı `minimum_calls` qədəri olduqda və
+    uğursuzluq nisbəti `failure_rate`-ə çatdıqda circuit açılır: `recovery_timeout`
+    müddətində həmin host-a sorğular göndərilmir və dərhal `CircuitOpenError` qaldırılır.
+    Bu müddətdən sonra circuit yarıaçıq vəziyyətə keçir və `half_open_max_calls` sınaq
+    sorğusu buraxılır: uğurlu olduqda circuit bağlanır, əks halda yenidən açılır.
+
+    Beləliklə, zəifləmiş bir provayderə gedən sorğular hər dəfə tam timeout gözləmir və
+    digər inteqrasiyaların trafiki üçün nəzərdə tutulmuş resursları tutmur.
+
+    Obyekt thread-safe-dir və eyni anda bir neçə klient tərəfindən istifadə oluna bilər.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        minimum_calls: int = 10,
+        window: float = 60.0,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        per_route: bool = False,
+        failure_statuses: Iterable[int] = DEFAULT_FAILURE_STATUSES,
+        failure_exceptions: tuple[type[BaseException], ...] = DEFAULT_FAILURE_EXCEPTIONS,
+        on_state_change: Callable[[str, CircuitState, CircuitState], None] | None = None,
+    ):
+        """
+        Args:
+            failure_rate: Circuit-i açan uğursuzluq nisbəti (`0` - `1` aralığında)
+            minimum_calls: Nisbət hesablanmadan əvvəl pəncərədə olmalı minimum sorğu sayı
+            window: Nəticələrin izləndiyi sürüşən pəncərə (saniyə ilə)
+            recovery_timeout: Açıq circuit-in yarıaçıq vəziyyətə keçmə müddəti (saniyə ilə)
+            half_open_max_calls: Yarıaçıq vəziyyətdə eyni anda buraxılan sınaq sorğu sayı
+            per_route: `True` olduqda circuit hər route üçün, əks halda hər host üçün ayrıdır
+            failure_statuses: Uğursuzluq sayılan status kodları
+            failure_exceptions: Uğursuzluq sayılan exception tipləri
+            on_state_change: Vəziyyət dəyişdikdə `(açar, köhnə, yeni)` ilə çağırılan
+                funksiya. Metrika və alert-lər üçün istifadə oluna bilər. Lock-dan kənarda
+                çağırılır; xətaları log-a yazılır və sorğunu dayandırmır.
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError('failure_rate must be in (0, 1]')
+
+        self.failure_rate = failure_rate
+        self.minimum_calls = max(1, minimum_calls)
+        self.window = window
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.per_route = per_route
+        self.failure_statuses = frozenset(failure_statuses)
+        self.failure_exceptions = failure_exceptions
+        self.on_state_change = on_state_change
+
+        self.logger = LOGGER_FUNCTION(__name__)
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.RLock()
+        # Lock altında baş vermiş, lakin hələ bildirilməmiş vəziyyət dəyişiklikləri
+        self._changes: list[tuple[str, CircuitState, CircuitState]] = []
+
+    def key_for(self, url: str, route_name: str | None = None) -> str:
+        """Sorğunun aid olduğu circuit-in açarı (host və ya route adı)"""
+        if self.per_route and route_name:
+            return route_name
+
+        return urlsplit(url).netloc or url
+
+    def state(self, key: str) -> CircuitState:
+        """Circuit-in hazırkı vəziyyəti"""
+        try:
+            with self._lock:
+                circuit = self._circuits.get(key)
+                if circuit is None:
+                    return CircuitState.CLOSED
+
+                self._maybe_half_open(key, circuit, monotonic())
+                return circuit.state
+        finally:
+            self._notify_changes()
+
+    def reset(self, key: str | None = None) -> None:
+        """Circuit-i (və ya `key` verilməsə, hamısını) bağlı vəziyyətə qaytarır"""
+        with self._lock:
+            keys = [key] if key is not None else list(self._circuits)
+            for k in keys:
+                circuit = self._circuits.pop(k, None)
+                if circuit is not None and circuit.state is not CircuitState.CLOSED:
+                    self._changes.append((k, circuit.state, CircuitState.CLOSED))
+
+        self._notify_changes()
+
+    def before_call(self, key: str) -> None:
+        """Sorğudan əvvəl çağırılır. Circuit açıqdırsa, `CircuitOpenError` qaldırır."""
+        try:
+            with self._lock:
+                circuit = self._circuits.get(key)
+                if circuit is None:
+                    return
+
+                now = monotonic()
+                self._maybe_half_open(key, circuit, now)
+
+                if circuit.state is CircuitState.OPEN:
+                    raise CircuitOpenError(key, circuit.opened_at + self.recovery_timeout - now)
+
+                if circuit.state is CircuitState.HALF_OPEN:
+                    if circuit.trials >= self.half_open_max_calls:
+                        raise CircuitOpenError(key, 0.0)
+                    circuit.trials += 1
+        finally:
+            self._notify_changes()
+
+    def is_failure(
+        self,
+        response: httpx.Response | None = None,
+        exc: BaseException | None = None,
+    ) -> bool:
+        """Sorğunun nəticəsinin provayder xətası sayılıb-sayılmadığı"""
+        if exc is not None:
+            return isinstance(exc, self.failure_exceptions)
+
+        return response is not None and response.status_code in self.failure_statuses
+
+    def record(self, key: str, failure: bool) -> None:
+        """Sorğunun nəticəsini qeyd edir və lazım olduqda vəziyyəti dəyişir"""
+        with self._lock:
+            self._record(key, failure)
+
+        self._notify_changes()
+
+    def release(self, key: str) -> None:
+        """Nəticəsi qeyd olunmadan bitən sorğunun (ləğv olunmuş, deadline-ı bitmiş və s.)
+        yarıaçıq vəziyyətdə tutduğu sınaq yerini boşaldır. Belə sorğu provayderin
+        vəziyyəti haqqında məlumat vermir, ona görə circuit-in vəziyyəti dəyişmir."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit.state is CircuitState.HALF_OPEN:
+                circuit.trials = max(0, circuit.trials - 1)
+
+    def _record(self, key: str, failure: bool) -> None:
+        circuit = self._circuits.setdefault(key, _Circuit())
+        now = monotonic()
+
+        if circuit.state is CircuitState.HALF_OPEN:
+            circuit.trials = max(0, circuit.trials - 1)
+            if failure:
+                self._open(key, circuit, now)
+            else:
+                circuit.outcomes.clear()
+                self._transition(key, circuit, CircuitState.CLOSED)
+            return
+
+        if circuit.state is CircuitState.OPEN:
+            # Circuit açılmamışdan əvvəl başlamış sorğunun nəticəsi
+            return
+
+        outcomes = circuit.outcomes
+        outcomes.append((now, failure))
+        while outcomes and outcomes[0][0] < now - self.window:
+            outcomes.popleft()
+
+        if len(outcomes) >= self.minimum_calls:
+            failures = sum(1 for _, failed in outcomes if failed)
+            if failures / len(outcomes) >= self.failure_rate:
+                self._open(key, circuit, now)
+
+    def _maybe_half_open(self, key: str, circuit: _Circuit, now: float) -> None:
+        if circuit.state is CircuitState.OPEN and now >= circuit.opened_at + self.recovery_timeout:
+            circuit.trials = 0
+            self._transition(key, circuit, CircuitState.HALF_OPEN)
+
+    def _open(self, key: str, circuit: _Circuit, now: float) -> None:
+        circuit.opened_at = now
+        circuit.outcomes.clear()
+        self._transition(key, circuit, CircuitState.OPEN)
+
+    def _transition(self, key: str, circuit: _Circuit, new_state: CircuitState) -> None:
+        old_state, circuit.state = circuit.state, new_state
+        if old_state is not new_state:
+            self._changes.append((key, old_state, new_state))
+
+    def _notify_changes(self) -> None:
+        """Yığılmış vəziyyət dəyişikliklərini lock-dan kənarda log-a yazır və
+        `on_state_change`-ə ötürür. Callback-in xətası sorğunu dayandırmır."""
+        if not self._changes:
+            return
+
+        with self._lock:
+            changes, self._changes = self._changes, []
+
+        for key, old_state, new_state in changes:
+            self.logger.warning(
+                'Circuit for %s changed: %s -> %s', key, old_state.value, new_state.value
+            )
+            if self.on_state_change is None:
+                continue
+
+            try:
+                self.on_state_change(key, old_state, new_state)
+            except Exception:  # pylint: disable=broad-exception-caught
+                self.logger.exception(
+                    'Circuit state change callback %r failed', self.on_state_change
+                )
@@ -0,0 +1,194 @@
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, NamedTuple
+
+import httpx
+
+DEFAULT_CACHE_SIZE = 1024
+"""In-memory cache-in default maksimum element sayı"""
+
+
+def request_key(
+    route_name: str,
+    verb: str,
+    url: str,
+    params: Any = None,
+    headers: dict | None = None,
+    content: bytes | str | None = None,
+) -> str:
+    """Sorğunu müəyyən edən açar: route adı, metod, query parametrləri ilə full url, header-lər
+    və body-dən hesablanır. Açar route adı ilə başlayır ki, route üzrə silinə bilsin."""
+    request_url = httpx.URL(url, params=params) if params else httpx.URL(url)
+    header_items = sorted((str(k).lower(), str(v)) for k, v in (headers or {}).items())
+    digest = hashlib.sha256(f'{verb} {request_url}\n{header_items}\n'.encode())
+    if content:
+        digest.update(content.encode() if isinstance(content, str) else content)
+    return f'{route_name}:{digest.hexdigest()}'
+
+
+class CachedResponse(NamedTuple):
+    """Cache-də saxlanılan cavab. Yalnız sadə tiplərdən ibarətdir ki, xarici backend-lərdə
+    (məs., Redis) də serialize oluna bilsin."""
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> 'CachedResponse':
+        return cls(response.status_code, list(response.headers.multi_items()), response.content)
+
+    def to_response(self, request: httpx.Request | None = None) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+
+class CacheBackend(ABC):
+    """Cavab cache-i üçün saxlama interfeysi.
+
+    Default olaraq `MemoryCacheBackend` istifadə olunur. Paylaşılan cache üçün (məs., Redis)
+    bu class-ı extend edib, `ResponseCache(backend=...)` ilə verə bilərsiniz.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """Açara aid, vaxtı keçməmiş dəyəri qaytarır"""
+
+    @abstractmethod
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        """Dəyəri `ttl` saniyəlik saxlayır"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Açarı silir"""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None:
+        """`prefix` ilə başlayan bütün açarları silir"""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Proses daxilində TTL və LRU ilə məhdudlaşdırılmış thread-safe cache"""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            maxsize: Maksimum element sayı. Dolduqda ən köhnə istifadə olunmuş element silinir.
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float, CachedResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at <= monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._data if key.startswith(prefix)]:
+                del self._data[key]
+
+
+class ResponseCache:
+    """İdempotent `GET` endpoint-lərinin cavabları üçün opt-in cache.
+
+    Cache yalnız `add_url(..., cache_ttl=...)` ilə TTL verilmiş (və ya `default_ttl` olduqda,
+    bütün) `GET` endpoint-lərinə tətbiq olunur. Açar route adı, full url, query parametrləri
+    və sorğu header-lərindən (məs., token, venue) hesablanır, yəni fərqli istifadəçilərin
+    cavabları qarışmır. Yalnız uğurlu (2xx) cavablar saxlanılır.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        default_ttl: float | None = None,
+    ):
+        """
+        Args:
+            backend: Saxlama backend-i. Verilməsə, `MemoryCacheBackend(maxsize)` istifadə olunur.
+            maxsize: Default in-memory backend-in maksimum element sayı
+            default_ttl: Öz TTL-i olmayan `GET` endpoint-ləri üçün TTL (saniyə ilə).
+                Verilməsə, yalnız `cache_ttl` təyin olunmuş endpoint-lər cache olunur.
+        """
+        self.backend = backend or MemoryCacheBackend(maxsize)
+        self.default_ttl = default_ttl
+        self.hits = 0
+        """Cache-dən qaytarılmış cavab sayı"""
+        self.misses = 0
+        """Cache-də tapılmayan (göndərilmiş) sorğu sayı"""
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        route_name: str,
+        verb: str,
+        url: str,
+        params: Any = None,
+        headers: dict | None = None,
+    ) -> str:
+        """Sorğu üçün cache açarı (bax: `request_key`)"""
+        return request_key(route_name, verb, url, params, headers)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Cache-dəki cavabı qaytarır və hit/miss sayğaclarını yeniləyir"""
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, response: httpx.Response, ttl: float) -> None:
+        """Uğurlu cavabı cache-ə yazır"""
+        if response.is_success and ttl > 0:
+            self.backend.set(key, CachedResponse.from_response(response), ttl)
+
+    def invalidate(self, route_name: str | None = None, key: str | None = None) -> None:
+        """Cache-i təmizləyir.
+
+        Args:
+            route_name: Verildikdə, yalnız həmin route-un cavabları silinir.
+            key: Verildikdə, yalnız həmin açar silinir (bax: `make_key`).
+        """
+        if key is not None:
+            self.backend.delete(key)
+        else:
+            self.backend.delete_prefix(f'{route_name}:' if route_name else '')
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss sayğacları"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
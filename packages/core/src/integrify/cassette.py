@@ -0,0 +1,441 @@
+import asyncio
+import base64
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+from integrify.schemas import json_dumps, json_loads
+
+REDACTED = '[REDACTED]'
+"""Gizli dəyərlərin kasetdə əvəzləndiyi dəyər"""
+
+DEFAULT_REDACTED_HEADERS = frozenset(
+    {'authorization', 'proxy-authorization', 'cookie', 'set-cookie', 'x-token', 'x-api-key'}
+)
+"""Default olaraq gizlədilən header-lər"""
+
+DEFAULT_REDACTED_FIELDS = frozenset(
+    {
+        'password',
+        'secret',
+        'client_secret',
+        'private_key',
+        'key',
+        'token',
+        'access_token',
+        'refresh_token',
+        'api_key',
+    }
+)
+"""Default olaraq gizlədilən JSON/form/query field-ləri (böyük-kiçik hərf nəzərə alınmır)"""
+
+MATCH_FIELDS = frozenset({'method', 'url', 'body'})
+"""Sorğunu kasetdəki qeydlə uyğunlaşdırmaq üçün istifadə oluna bilən hissələr"""
+
+_SKIPPED_RESPONSE_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding'})
+
+
+class UnmatchedRequestError(LookupError):
+    """Replay zamanı sorğuya uyğun qeyd kasetdə tapılmadıqda qaldırılan xəta"""
+
+    def __init__(self, request: httpx.Request):
+        super().__init__(f'No recorded response for {request.method} {request.url}')
+        self.request = request
+
+
+class Redactor:
+    """Sorğu və cavablardakı gizli dəyərləri (şifrə, token və s.) `REDACTED` ilə əvəz edir.
+
+    Header-lər adına, JSON, form və query field-ləri isə açarına görə (istənilən
+    dərinlikdə) gizlədilir.
+    """
+
+    def __init__(
+        self,
+        headers: Iterable[str] = DEFAULT_REDACTED_HEADERS,
+        fields: Iterable[str] = DEFAULT_REDACTED_FIELDS,
+    ):
+        """
+        Args:
+            headers: Gizlədilən header-lər
+            fields: Gizlədilən JSON/form/query field-ləri
+        """
+        self.headers = frozenset(header.lower() for header in headers)
+        self.fields = frozenset(field.lower() for field in fields)
+
+    def redact_headers(self, headers: httpx.Headers) -> list[tuple[str, str]]:
+        """Header-lərin gizlədilmiş siyahısı"""
+        return [
+            (name, REDACTED if name.lower() in self.headers else value)
+            for name, value in headers.multi_items()
+        ]
+
+    def redact_data(self, data: Any) -> Any:
+        """JSON obyektində gizli field-lərin dəyərlərini əvəz edir"""
+        if isinstance(data, dict):
+            return {
+                key: REDACTED if key.lower() in self.fields else self.redact_data(value)
+                for key, value in data.items()
+            }
+        if isinstance(data, list):
+            return [self.redact_data(value) for value in data]
+        return data
+
+    def redact_pairs(self, pairs: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        """Form/query parametrlərində gizli field-lərin dəyərlərini əvəz edir"""
+        return [(key, REDACTED if key.lower() in self.fields else value) for key, value in pairs]
+
+    def redact_url(self, url: httpx.URL) -> str:
+        """Query parametrləri gizlədilmiş və sıralanmış url"""
+        if not url.query:
+            return str(url)
+        query = urlencode(sorted(self.redact_pairs(list(url.params.multi_items()))))
+        return str(url.copy_with(query=query.encode()))
+
+    def redact_body(self, content: bytes, content_type: str) -> bytes:
+        """JSON və form body-lərində gizli field-ləri əvəz edir. JSON body açarları
+        sıralanmış şəkildə qaytarılır ki, eyni sorğu eyni açar versin."""
+        if not content:
+            return content
+
+        if content_type.startswith('application/x-www-form-urlencoded'):
+            pairs = parse_qsl(content.decode(errors='replace'), keep_blank_values=True)
+            return urlencode(sorted(self.redact_pairs(pairs))).encode()
+
+        try:
+            data = json_loads(content)
+        except ValueError:
+            return content
+        return json.dumps(
+            self.redact_data(data),
+            sort_keys=True,
+            separators=(',', ':'),
+            ensure_ascii=False,
+        ).encode()
+
+
+def _encode_body(content: bytes) -> dict[str, str]:
+    try:
+        return {'body': content.decode()}
+    except UnicodeDecodeError:
+        return {'body': base64.b64encode(content).decode(), 'encoding': 'base64'}
+
+
+def _decode_body(data: dict[str, Any]) -> bytes:
+    if data.get('encoding') == 'base64':
+        return base64.b64decode(data['body'])
+    return data['body'].encode()
+
+
+class _Matcher:
+    """Sorğudan kasetdəki qeydin açarını hesablayır"""
+
+    def __init__(self, redactor: Redactor, match_on: Iterable[str]):
+        self.redactor = redactor
+        self.match_on = frozenset(match_on)
+        if not self.match_on or not self.match_on <= MATCH_FIELDS:
+            raise ValueError(f'match_on must be a non-empty subset of {sorted(MATCH_FIELDS)}')
+
+    def request_parts(self, request: httpx.Request) -> tuple[str, bytes]:
+        """Sorğunun gizlədilmiş url-i və body-si"""
+        url = self.redactor.redact_url(request.url)
+        body = self.redactor.redact_body(
+            request.content,
+            request.headers.get('Content-Type', ''),
+        )
+        return url, body
+
+    def key(self, method: str, url: str, body: bytes) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        if 'method' in self.match_on:
+            digest.update(method.upper().encode())
+        digest.update(b'\0')
+        if 'url' in self.match_on:
+            digest.update(url.encode())
+        digest.update(b'\0')
+        if 'body' in self.match_on:
+            digest.update(body)
+        return digest.hexdigest()
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Real sorğu/cavab cütlərini kasetə yazan httpx transport-u (bax: `ReplayTransport`).
+
+    Sorğular `transport`-a (default olaraq, adi httpx transport-u) ötürülür, cavab tam oxunur
+    və gizli dəyərlər (`Redactor`) əvəz olunduqdan sonra kasetə əlavə olunur::
+
+        client = KapitalClientClass(transport=RecordingTransport('kapital.cassette'))
+
+    Kaset sətir-sətir yazılan fayldır: hər sətir uyğunlaşdırma açarı və JSON qeyddən
+    ibarətdir. Fayl əlavə (append) rejimində açılır, yəni bir neçə sessiyanın qeydləri eyni
+    kasetə yığıla bilər. Sync və async klientlərdə istifadə oluna bilər.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+        redactor: Redactor | None = None,
+        match_on: Iterable[str] = MATCH_FIELDS,
+    ):
+        """
+        Args:
+            path: Kasetin faylı
+            transport: Sorğuları real göndərən transport. Verilməsə, sync sorğular üçün
+                `httpx.HTTPTransport`, async sorğular üçün `httpx.AsyncHTTPTransport` yaradılır.
+            redactor: Gizli dəyərləri əvəz edən obyekt. Verilməsə, default header və
+                field-lər gizlədilir.
+            match_on: Qeydin açarına daxil olan hissələr (`method`, `url`, `body`).
+                Replay zamanı eyni dəyər istifadə olunmalıdır.
+        """
+        self.path = os.fspath(path)
+        self.transport = transport
+        self.redactor = redactor or Redactor()
+        self._matcher = _Matcher(self.redactor, match_on)
+        self._file = open(self.path, 'ab')  # noqa: SIM115  # pylint: disable=consider-using-with
+        self._lock = threading.Lock()
+        self._sync_transport: httpx.BaseTransport | None = None
+        self._async_transport: httpx.AsyncBaseTransport | None = None
+
+        self.count = 0
+        """Bu transport ilə yazılmış qeyd sayı"""
+
+    def _get_sync_transport(self) -> httpx.BaseTransport:
+        if self._sync_transport is None:
+            transport = self.transport
+            self._sync_transport = (
+                transport if isinstance(transport, httpx.BaseTransport) else httpx.HTTPTransport()
+            )
+        return self._sync_transport
+
+    def _get_async_transport(self) -> httpx.AsyncBaseTransport:
+        if self._async_transport is None:
+            transport = self.transport
+            self._async_transport = (
+                transport
+                if isinstance(transport, httpx.AsyncBaseTransport)
+                else httpx.AsyncHTTPTransport()
+            )
+        return self._async_transport
+
+    def _record(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        content: bytes,
+        elapsed: float,
+    ) -> httpx.Response:
+        url, body = self._matcher.request_parts(request)
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _SKIPPED_RESPONSE_HEADERS
+        ]
+        response_body = self.redactor.redact_body(content, response.headers.get('Content-Type', ''))
+        entry = {
+            'request': {
+                'method': request.method,
+                'url': url,
+                'headers': self.redactor.redact_headers(request.headers),
+                **_encode_body(body),
+            },
+            'response': {
+                'status_code': response.status_code,
+                'headers': self.redactor.redact_headers(httpx.Headers(headers)),
+                **_encode_body(response_body),
+            },
+            'elapsed': elapsed,
+        }
+        line = self._matcher.key(request.method, url, body).encode() + b' ' + json_dumps(entry)
+        with self._lock:
+            self._file.write(line + b'\n')
+            self._file.flush()
+            self.count += 1
+
+        # Cavab artıq decode olunub, ona görə encoding header-ləri ötürülmür
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+            extensions={
+                name: value
+                for name, value in response.extensions.items()
+                if name in {'http_version', 'reason_phrase'}
+            },
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        start = time.perf_counter()
+        response = self._get_sync_transport().handle_request(request)
+        try:
+            content = response.read()
+        finally:
+            response.close()
+        return self._record(request, response, content, time.perf_counter() - start)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        start = time.perf_counter()
+        response = await self._get_async_transport().handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        return self._record(request, response, content, time.perf_counter() - start)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+        if self._sync_transport is not None:
+            self._sync_transport.close()
+
+    async def aclose(self) -> None:
+        with self._lock:
+            self._file.close()
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
+
+
+def iter_cassette(path: str | os.PathLike) -> Iterator[dict[str, Any]]:
+    """Kasetin qeydlərini faylı tam yaddaşa yükləmədən, bir-bir qaytarır.
+
+    Hər qeyd `request`, `response` və `elapsed` açarları olan dict-dir.
+    """
+    with open(path, 'rb') as file:
+        for line in file:
+            _, _, entry = line.partition(b' ')
+            if entry.strip():
+                yield json_loads(entry)
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """`RecordingTransport` ilə yazılmış kasetdən cavab qaytaran httpx transport-u.
+
+    Kaset faylı memory-map olunur və yaddaşda yalnız açar -> fayldakı mövqe indeksi
+    saxlanılır; qeydin özü yalnız uyğun sorğu gəldikdə oxunur və parse olunur. Ona görə
+    yüz minlərlə qeydi olan kasetlər də az yaddaşla replay oluna bilər::
+
+        client = KapitalClientClass(transport=ReplayTransport('kapital.cassette'))
+
+    Eyni açarlı bir neçə qeyd yazılma sırası ilə qaytarılır; qeydlər bitdikdə, `repeat=True`
+    olduqda, yenidən birincidən başlanır. Sorğuya uyğun qeyd olmadıqda
+    `UnmatchedRequestError` qaldırılır.
+
+    Gecikmə emulyasiyası üçün `latency` verilə bilər: cavab qeyd olunmuş müddətin
+    `latency` misli qədər gecikdirilir (sync transport `time.sleep`, async transport
+    `asyncio.sleep` istifadə edir).
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        latency: float = 0.0,
+        repeat: bool = True,
+        redactor: Redactor | None = None,
+        match_on: Iterable[str] = MATCH_FIELDS,
+    ):
+        """
+        Args:
+            path: Kasetin faylı
+            latency: Qeyd olunmuş gecikmənin əmsalı (`0` - gecikmə yoxdur, `1` - real gecikmə)
+            repeat: Eyni açarlı qeydlər bitdikdə, onların yenidən qaytarılması
+            redactor: Yazılma zamanı istifadə olunmuş `Redactor`
+            match_on: Yazılma zamanı istifadə olunmuş açar hissələri
+        """
+        if latency < 0:
+            raise ValueError('latency must not be negative')
+
+        self.path = os.fspath(path)
+        self.latency = latency
+        self.repeat = repeat
+        self._matcher = _Matcher(redactor or Redactor(), match_on)
+        self._lock = threading.Lock()
+
+        self._file = open(self.path, 'rb')  # noqa: SIM115  # pylint: disable=consider-using-with
+        self._mmap: mmap.mmap | None = None
+        self._index: dict[str, list[int]] = {}
+        self._cursors: dict[str, int] = {}
+        if os.fstat(self._file.fileno()).st_size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._build_index()
+
+    def _build_index(self) -> None:
+        assert self._mmap is not None
+        data = self._mmap
+        position, size = 0, len(data)
+        while position < size:
+            end = data.find(b'\n', position)
+            if end == -1:
+                end = size
+            separator = data.find(b' ', position, end)
+            if separator != -1:
+                key = data[position:separator].decode()
+                self._index.setdefault(key, []).append(separator + 1)
+            position = end + 1
+
+    def __len__(self) -> int:
+        """Kasetdəki qeyd sayı"""
+        return sum(len(offsets) for offsets in self._index.values())
+
+    def _find(self, request: httpx.Request) -> dict[str, Any]:
+        url, body = self._matcher.request_parts(request)
+        key = self._matcher.key(request.method, url, body)
+
+        with self._lock:
+            offsets = self._index.get(key)
+            cursor = self._cursors.get(key, 0)
+            if not offsets or (cursor >= len(offsets) and not self.repeat):
+                raise UnmatchedRequestError(request)
+            self._cursors[key] = cursor + 1
+
+        assert self._mmap is not None
+        offset = offsets[cursor % len(offsets)]
+        end = self._mmap.find(b'\n', offset)
+        return json_loads(self._mmap[offset : end if end != -1 else len(self._mmap)])
+
+    @staticmethod
+    def _response(request: httpx.Request, entry: dict[str, Any]) -> httpx.Response:
+        response = entry['response']
+        return httpx.Response(
+            response['status_code'],
+            headers=response['headers'],
+            content=_decode_body(response),
+            request=request,
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        entry = self._find(request)
+        if self.latency:
+            time.sleep(entry['elapsed'] * self.latency)
+        return self._response(request, entry)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        entry = self._find(request)
+        if self.latency:
+            await asyncio.sleep(entry['elapsed'] * self.latency)
+        return self._response(request, entry)
+
+    def rewind(self) -> None:
+        """Bütün qeydləri yenidən birincidən qaytarmağa başlayır"""
+        with self._lock:
+            self._cursors.clear()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    async def aclose(self) -> None:
+        self.close()
@@ -0,0 +1,30 @@
+import argparse
+from collections.abc import Sequence
+
+from integrify import bench
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """`integrify` əmrinin argumentləri"""
+    parser = argparse.ArgumentParser(prog='integrify')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    bench_parser = commands.add_parser(
+        'bench',
+        help='load-test an integration client and report latency percentiles',
+        description='Drive a client method at a target RPS or concurrency against the '
+        'provider simulator (or --base-url, --cassette) and report throughput, latency '
+        'percentiles, errors and per-phase time.',
+    )
+    bench.build_parser(bench_parser).set_defaults(handler=bench.command)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """`integrify` CLI-ının giriş nöqtəsi"""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
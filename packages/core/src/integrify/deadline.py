@@ -0,0 +1,143 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+
+import httpx
+
+
+class DeadlineExceededError(TimeoutError):
+    """Sorğunun deadline-ı bitdikdə, sorğu göndərilmədən qaldırılan xəta"""
+
+    def __init__(self, url: str, overrun: float):
+        """
+        Args:
+            url: Göndərilməyən sorğunun url-i
+            overrun: Deadline-dan keçən (rate limiter-in gözləməsi üçün isə keçəcək) müddət
+                (saniyə ilə)
+        """
+        super().__init__(f'Deadline exceeded {overrun:.3f}s before request to {url}')
+        self.url = url
+        self.overrun = overrun
+
+
+class Deadline:
+    """Bir və ya bir neçə sorğu üçün ümumi vaxt büdcəsi.
+
+    Deadline `time.monotonic` üzrə mütləq an kimi saxlanılır, yəni eyni obyekt ardıcıl
+    çağırışlara ötürüldükdə hər çağırış yalnız qalan vaxtı istifadə edir::
+
+        deadline = Deadline(2.5)
+        order = KapitalRequest.create_order(..., deadline=deadline)
+        info = KapitalRequest.get_order_information(..., deadline=deadline)
+    """
+
+    __slots__ = ('expires_at',)
+
+    def __init__(self, timeout: float):
+        """
+        Args:
+            timeout: İndidən etibarən büdcə (saniyə ilə)
+        """
+        self.expires_at = monotonic() + timeout
+        """Deadline-ın bitdiyi an (`time.monotonic` üzrə)"""
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(remaining={self.remaining():.3f}s)'
+
+    def remaining(self) -> float:
+        """Qalan müddət (saniyə ilə). Deadline keçibsə, mənfi ola bilər."""
+        return self.expires_at - monotonic()
+
+    @property
+    def expired(self) -> bool:
+        """Deadline-ın bitib-bitmədiyi"""
+        return self.remaining() <= 0
+
+    def check(self, url: str) -> float:
+        """Qalan müddəti qaytarır; deadline bitibsə, `DeadlineExceededError` qaldırır
+
+        Args:
+            url: Göndəriləcək sorğunun url-i (xəta mesajı üçün)
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError(url, -remaining)
+        return remaining
+
+
+DeadlineLike = Deadline | float
+"""`Deadline` obyekti və ya indidən etibarən büdcə (saniyə ilə)"""
+
+_DEADLINE: ContextVar[Deadline | None] = ContextVar('integrify_deadline', default=None)
+
+
+def earliest(*deadlines: DeadlineLike | None) -> Deadline | None:
+    """Verilmiş deadline-lardan ən tez biteni. Ədədlər indidən etibarən büdcə kimi qəbul
+    olunur; `None` dəyərlər nəzərə alınmır."""
+    result = None
+    for value in deadlines:
+        if value is None:
+            continue
+
+        candidate = value if isinstance(value, Deadline) else Deadline(value)
+        if result is None or candidate.expires_at < result.expires_at:
+            result = candidate
+
+    return result
+
+
+@contextmanager
+def deadline(value: DeadlineLike) -> Iterator[Deadline]:
+    """Blok daxilində göndərilən bütün sorğulara ümumi deadline tətbiq edən context manager.
+    Sync və async kodda işləyir::
+
+        with deadline(3.0):
+            order = KapitalRequest.create_order(...)
+            info = KapitalRequest.get_order_information(...)
+
+    İç-içə bloklarda deadline yalnız qısala bilər: xarici blokun deadline-ı daha tez
+    bitirsə, o qüvvədə qalır.
+
+    Args:
+        value: `Deadline` obyekti və ya indidən etibarən büdcə (saniyə ilə)
+    """
+    effective = earliest(_DEADLINE.get(), value)
+    assert effective is not None
+
+    token = _DEADLINE.set(effective)
+    try:
+        yield effective
+    finally:
+        _DEADLINE.reset(token)
+
+
+def current_deadline() -> Deadline | None:
+    """Hazırkı kontekstdə qüvvədə olan deadline (bax: `deadline`)"""
+    return _DEADLINE.get()
+
+
+def bounded_timeout(
+    timeout: float | httpx.Timeout | None,
+    remaining: float,
+) -> httpx.Timeout:
+    """httpx timeout-unun hər hissəsini (connect/read/write/pool) qalan müddətlə məhdudlaşdırır.
+
+    httpx timeout-ları sorğunun ümumi müddətinə deyil, ayrı-ayrı əməliyyatlara tətbiq
+    olunur, ona görə deadline hər cəhddən əvvəl yenidən yoxlanılır (bax: `Deadline.check`).
+
+    Args:
+        timeout: Endpoint-in (və ya klientin) timeout-u. `None` limitsiz deməkdir.
+        remaining: Deadline-a qalan müddət (saniyə ilə)
+    """
+    timeout = timeout if isinstance(timeout, httpx.Timeout) else httpx.Timeout(timeout)
+
+    def bound(value: float | None) -> float:
+        return remaining if value is None else min(value, remaining)
+
+    return httpx.Timeout(
+        connect=bound(timeout.connect),
+        read=bound(timeout.read),
+        write=bound(timeout.write),
+        pool=bound(timeout.pool),
+    )
@@ -0,0 +1,183 @@
+import bisect
+import math
+import threading
+from collections import deque
+from collections.abc import Iterable
+
+import httpx
+from integrify.retry import DEFAULT_RETRY_STATUSES
+
+_MAX_PERCENTILE = 100
+
+
+class HedgePolicy:
+    """Async klientlərdə idempotent (oxuma) sorğuları üçün hedging siyasəti.
+
+    Sorğuya `delay` müddətində cavab gəlmədikdə, eyni sorğu təkrar (paralel) göndərilir;
+    ilk uğurlu cavab qaytarılır, qalan sorğular isə ləğv olunur. Gecikmə endpoint-in son
+    `window` sorğusunun latency-sinin `percentile`-i ilə təyin olunur, yəni yalnız ən yavaş
+    sorğular (məs., p95-dən yavaş olanlar) təkrarlanır.
+
+    Əlavə yük büdcə ilə məhdudlaşdırılır: hər sorğu büdcəyə `max_extra_load` token əlavə
+    edir, hər hedge isə bir token sərf edir (başlanğıcda büdcədə bir token var). Beləliklə,
+    hedge-lərin sayı sorğuların `max_extra_load` hissəsini keçmir, provayder yavaşladıqda isə
+    yük partlayışı yaranmır. Hedge-lər endpoint-in rate limiter-lərindən də gözləmədən
+    token alır; token yoxdursa, hedge göndərilmir.
+
+    Obyekt thread-safe-dir və bir neçə endpoint (və klient) arasında paylaşıla bilər;
+    latency statistikası endpoint üzrə ayrıca saxlanılır.
+    """
+
+    def __init__(
+        self,
+        percentile: float | None = 95.0,
+        delay: float = 0.1,
+        max_hedges: int = 1,
+        max_extra_load: float = 0.1,
+        window: int = 1000,
+        min_samples: int = 50,
+        failure_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+    ):
+        """
+        Args:
+            percentile: Hedge gecikməsi kimi istifadə olunan latency persentili (0-100).
+                `None` olduqda, həmişə sabit `delay` istifadə olunur.
+            delay: Endpoint üçün kifayət qədər ölçü (`min_samples`) yığılana qədər və ya
+                `percentile=None` olduqda istifadə olunan gecikmə (saniyə ilə)
+            max_hedges: Bir çağırış üçün göndərilə bilən maksimum əlavə sorğu sayı
+            max_extra_load: Hedge-lərin sorğu sayına maksimum nisbəti (məs., `0.1` - ən çox
+                10% əlavə sorğu)
+            window: Persentilin hesablandığı son sorğuların sayı
+            min_samples: Persentildən istifadə üçün minimum ölçü sayı
+            failure_statuses: Uğursuz sayılan status kodları. Belə cavab gəldikdə, digər
+                sorğuların cavabı gözlənilir.
+        """
+        if percentile is not None and not 0 < percentile <= _MAX_PERCENTILE:
+            raise ValueError('percentile must be in (0, 100]')
+        if max_hedges < 1:
+            raise ValueError('max_hedges must be at least 1')
+        if window < 1:
+            raise ValueError('window must be at least 1')
+        if not 0 < max_extra_load <= 1:
+            raise ValueError('max_extra_load must be in (0, 1]')
+
+        self.percentile = percentile
+        self.delay = delay
+        self.max_hedges = max_hedges
+        self.max_extra_load = max_extra_load
+        self.window = window
+        self.min_samples = min_samples
+        self.failure_statuses = frozenset(failure_statuses)
+
+        self.requests = 0
+        """Siyasət tətbiq olunan çağırışların sayı"""
+
+        self.hedges = 0
+        """Göndərilmiş hedge (əlavə) sorğuların sayı"""
+
+        self.wins = 0
+        """Cavabı hedge sorğusundan alınmış çağırışların sayı"""
+
+        self.throttled = 0
+        """Büdcə və ya rate limit səbəbindən göndərilməmiş hedge-lərin sayı"""
+
+        self._max_tokens = max(1.0, max_extra_load * window)
+        self._tokens = 1.0
+        # Endpoint üzrə son ölçülər: gəliş sırası ilə (köhnəni çıxarmaq üçün) və sıralanmış
+        # (persentili `get_delay`-də sıralamadan, indekslə oxumaq üçün)
+        self._latencies: dict[str, deque[float]] = {}
+        self._sorted: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}(percentile={self.percentile}, delay={self.delay}, '
+            f'max_hedges={self.max_hedges}, max_extra_load={self.max_extra_load})'
+        )
+
+    def get_delay(self, key: str) -> float:
+        """Endpoint üçün hedge gecikməsi (saniyə ilə)
+
+        Args:
+            key: Endpoint-in açarı (klient və route adı)
+        """
+        if self.percentile is None:
+            return self.delay
+
+        with self._lock:
+            ordered = self._sorted.get(key)
+            if ordered is None or len(ordered) < self.min_samples:
+                return self.delay
+            return ordered[math.ceil(self.percentile / _MAX_PERCENTILE * len(ordered)) - 1]
+
+    def begin(self) -> None:
+        """Çağırışı qeyd edir və büdcəyə token əlavə edir"""
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self._tokens + self.max_extra_load, self._max_tokens)
+
+    def try_hedge(self) -> bool:
+        """Büdcədə token varsa, hedge üçün götürür (`True`), yoxdursa `False` qaytarır"""
+        with self._lock:
+            if self._tokens < 1:
+                self.throttled += 1
+                return False
+
+            self._tokens -= 1
+            self.hedges += 1
+            return True
+
+    def throttle(self) -> None:
+        """Büdcədən götürülmüş, lakin (məs., rate limit səbəbindən) göndərilməmiş hedge-i
+        qaytarır"""
+        with self._lock:
+            self._tokens += 1
+            self.hedges -= 1
+            self.throttled += 1
+
+    def observe(self, key: str, latency: float | None, hedge_won: bool) -> None:
+        """Çağırışın nəticəsini qeyd edir
+
+        Args:
+            key: Endpoint-in açarı
+            latency: İlk (primary) sorğunun öz latency-si (saniyə ilə). Primary hedge-ə
+                uduzub ləğv olunubsa, ləğvə qədər keçən müddət (aşağı sərhəd); qalib hedge-in
+                müddəti deyil. `None` olduqda (məs., primary xəta ilə bitib), ölçü yazılmır.
+            hedge_won: Cavabın hedge sorğusundan alınıb-alınmadığı
+        """
+        with self._lock:
+            if latency is not None:
+                samples = self._latencies.get(key)
+                if samples is None:
+                    samples = self._latencies[key] = deque()
+                    self._sorted[key] = []
+
+                ordered = self._sorted[key]
+                if len(samples) >= self.window:
+                    del ordered[bisect.bisect_left(ordered, samples.popleft())]
+                samples.append(latency)
+                bisect.insort(ordered, latency)
+
+            if hedge_won:
+                self.wins += 1
+
+    def is_success(self, response: httpx.Response) -> bool:
+        """Cavabın qəbul olunub-olunmadığı (digər sorğuların ləğvi üçün)"""
+        return response.status_code not in self.failure_statuses
+
+    def stats(self) -> dict[str, int]:
+        """Çağırış, hedge, qələbə və göndərilməmiş hedge sayğacları"""
+        return {
+            'requests': self.requests,
+            'hedges': self.hedges,
+            'wins': self.wins,
+            'throttled': self.throttled,
+        }
+
+    def reset(self) -> None:
+        """Sayğacları, büdcəni və latency statistikasını sıfırlayır"""
+        with self._lock:
+            self.requests = self.hedges = self.wins = self.throttled = 0
+            self._tokens = 1.0
+            self._latencies.clear()
+            self._sorted.clear()
@@ -0,0 +1,133 @@
+from collections.abc import Awaitable, Callable
+from time import perf_counter
+from typing import Any
+
+PHASES = ('build_request_model', 'handle_request', 'set_urlparams', 'network', 'handle_response')
+"""Sorğunun mərhələləri (icra ardıcıllığı ilə). `network` mərhələsi rate limit gözləməsini,
+təkrarları (retry) və cache axtarışını da əhatə edir."""
+
+
+class RequestRecord:
+    """Bir sorğunun instrumentasiya qeydi. Sorğu bitdikdən (və ya xəta ilə dayandıqdan)
+    sonra klientin hook-larına ötürülür (bax: `APIClient.add_hook`).
+
+    Vaxtlar `time.perf_counter` (monotonic) ilə, saniyə ilə ölçülür. Mərhələ icra
+    olunmayıbsa (məs., dry rejimdə `network`, xəta halında sonrakı mərhələlər),
+    `timings`-də olmur.
+    """
+
+    __slots__ = (
+        '_last',
+        'bytes_in',
+        'bytes_out',
+        'cache_hit',
+        'client_name',
+        'coalesced',
+        'duration',
+        'error',
+        'hedge_won',
+        'hedges',
+        'route_name',
+        'started_at',
+        'status_code',
+        'timings',
+        'url',
+        'verb',
+    )
+
+    def __init__(self, client_name: str, route_name: str | None, verb: str, url: str):
+        self.client_name = client_name
+        """Klientin adı"""
+
+        self.route_name = route_name
+        """Endpoint-in adı"""
+
+        self.verb = verb
+        """Sorğu metodu"""
+
+        self.url = url
+        """Sorğunun url-i (url parametrləri əlavə olunduqdan sonra full url)"""
+
+        self.status_code: int | None = None
+        """Cavabın status kodu. Cavab alınmadıqda `None`."""
+
+        self.bytes_out = 0
+        """Göndərilən body-nin ölçüsü (byte ilə)"""
+
+        self.bytes_in = 0
+        """Alınan body-nin ölçüsü (byte ilə)"""
+
+        self.cache_hit = False
+        """Cavabın cache-dən qaytarılıb-qaytarılmadığı"""
+
+        self.coalesced = False
+        """Sorğunun eyni anda göndərilən digər sorğu ilə birləşdirilib-birləşdirilmədiyi.
+        Bu halda `network` mərhələsi həmin sorğunun gözlənilməsidir."""
+
+        self.hedges = 0
+        """Göndərilmiş hedge (əlavə paralel) sorğuların sayı (bax: `HedgePolicy`)"""
+
+        self.hedge_won = False
+        """Cavabın hedge sorğusundan alınıb-alınmadığı"""
+
+        self.error: BaseException | None = None
+        """Sorğunu dayandıran exception"""
+
+        self.timings: dict[str, float] = {}
+        """Mərhələlərin müddəti (bax: `PHASES`)"""
+
+        self.started_at = self._last = perf_counter()
+        """Sorğunun başlama anı (`time.perf_counter`)"""
+
+        self.duration = 0.0
+        """Sorğunun ümumi müddəti"""
+
+    def mark(self, phase: str) -> None:
+        """Əvvəlki mərhələdən bəri keçən vaxtı `phase` mərhələsinə yazır"""
+        now = perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def finish(self, result: Any = None, error: BaseException | None = None) -> None:
+        """Sorğunun nəticəsini və ümumi müddətini qeyd edir"""
+        self.duration = perf_counter() - self.started_at
+        self.error = error
+        if self.status_code is None:
+            self.status_code = getattr(result, 'status_code', None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Qeydin dict formasında (məs., structured logging üçün) təsviri"""
+        return {
+            'client_name': self.client_name,
+            'route_name': self.route_name,
+            'verb': self.verb,
+            'url': self.url,
+            'status_code': self.status_code,
+            'bytes_out': self.bytes_out,
+            'bytes_in': self.bytes_in,
+            'cache_hit': self.cache_hit,
+            'coalesced': self.coalesced,
+            'hedges': self.hedges,
+            'hedge_won': self.hedge_won,
+            'error': repr(self.error) if self.error is not None else None,
+            'duration': self.duration,
+            'timings': dict(self.timings),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f'RequestRecord({self.client_name}.{self.route_name} {self.verb} '
+            f'status={self.status_code} duration={self.duration:.6f})'
+        )
+
+
+RequestHook = Callable[[RequestRecord], None] | Callable[[RequestRecord], Awaitable[None]]
+"""Sorğu hook-u: sync funksiya və ya (yalnız async klientlərdə) async funksiya"""
+
+
+def request_body_size(request_kwds: dict[str, Any]) -> int:
+    """httpx-ə ötürülən sorğu body-sinin ölçüsü (byte ilə)"""
+    content = request_kwds.get('content')
+    if content is None:
+        return 0
+    return len(content.encode() if isinstance(content, str) else content)
@@ -0,0 +1,47 @@
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    module_name: str,
+    exports: Mapping[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Paketin `__init__.py`-ı üçün PEP 562 `__getattr__` və `__dir__` funksiyalarını yaradır.
+
+    Export olunan adlar yalnız ilk müraciətdə import olunur, yəni `import integrify.epoint`
+    (və ya `integrify.epoint.schemas...` kimi alt modulun importu) klienti, handler-ləri və
+    schema-ları yükləmir::
+
+        __getattr__, __dir__ = lazy_exports(
+            __name__,
+            {'EPointRequest': '.client', 'VERSION': '.env'},
+        )
+
+    Import olunmuş dəyər modulun namespace-inə yazılır, sonrakı müraciətlər `__getattr__`-dən
+    keçmir. Bu modul yalnız standart kitabxanadan istifadə edir ki, paketin importu ucuz
+    qalsın.
+
+    Args:
+        module_name: Paketin adı (`__name__`)
+        exports: Ad -> modul mapping-i. Modul nisbi (`.client`) və ya tam ola bilər; ad
+            moduldakı addan fərqlidirsə, `modul:ad` formatında verilir
+            (məs., `'BULKSMS_VERSION': '.bulk.env:VERSION'`).
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            target = exports[name]
+        except KeyError:
+            raise AttributeError(f'module {module_name!r} has no attribute {name!r}') from None
+
+        path, _, attribute = target.partition(':')
+        value = getattr(importlib.import_module(path, module_name), attribute or name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[module_name]), *exports})
+
+    return __getattr__, __dir__
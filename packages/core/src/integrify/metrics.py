@@ -0,0 +1,193 @@
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable
+from typing import Any
+
+from integrify.hooks import PHASES, RequestRecord
+
+DEFAULT_BUCKETS = tuple(0.001 * 2**i for i in range(16))
+"""Default latency bucket-ləri (saniyə ilə): 1ms-dən ~33s-ə qədər log-scale (2-nin qüvvətləri)"""
+
+
+def status_class(record: RequestRecord) -> str:
+    """Sorğunun status sinfi: `2xx`, `4xx`, `5xx` və s., cavab alınmadıqda isə `error`"""
+    if record.status_code is None:
+        return 'error'
+    return f'{record.status_code // 100}xx'
+
+
+class _Series:
+    """Bir (klient, route, status sinfi) üçün sayğaclar və latency histogram-ı"""
+
+    __slots__ = (
+        'bucket_counts',
+        'bytes_in',
+        'bytes_out',
+        'count',
+        'hedge_wins',
+        'hedges',
+        'lock',
+        'phases',
+        'total',
+    )
+
+    def __init__(self, buckets: int):
+        self.lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.bucket_counts = [0] * (buckets + 1)  # sonuncu: +Inf
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+
+
+class MetricsRegistry:
+    """Proses daxilində sorğu metriklərini toplayan registry.
+
+    Obyekt sorğu hook-u kimi klientə əlavə olunur (`client.add_hook(METRICS)` və ya
+    `APIClient(hooks=[METRICS])`) və hər (klient, route, status sinfi) üçün sorğu sayını,
+    göndərilən/alınan byte-ları, mərhələlərin ümumi müddətini və sabit log-scale bucket-li
+    latency histogram-ını saxlayır. Hər seriyanın öz lock-u var, yəni fərqli endpoint-lərin
+    sorğuları bir-birini gözləmir. `render_prometheus` metrikləri əlavə asılılıq olmadan
+    Prometheus text formatında qaytarır.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS, namespace: str = 'integrify'):
+        """
+        Args:
+            buckets: Latency histogram-ının yuxarı sərhədləri (saniyə ilə, artan sıra ilə)
+            namespace: Prometheus metrik adlarının prefiksi
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+        self._series: dict[tuple[str, str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record: RequestRecord) -> None:
+        self.observe(record)
+
+    def _get_series(self, key: tuple[str, str, str]) -> _Series:
+        series = self._series.get(key)
+        if series is None:
+            with self._lock:
+                series = self._series.setdefault(key, _Series(len(self.buckets)))
+        return series
+
+    def observe(self, record: RequestRecord) -> None:
+        """Sorğu qeydini metriklərə əlavə edir"""
+        key = (record.client_name, record.route_name or '', status_class(record))
+        series = self._get_series(key)
+        bucket = bisect_left(self.buckets, record.duration)
+
+        with series.lock:
+            series.count += 1
+            series.total += record.duration
+            series.bucket_counts[bucket] += 1
+            series.bytes_in += record.bytes_in
+            series.bytes_out += record.bytes_out
+            series.hedges += record.hedges
+            series.hedge_wins += record.hedge_won
+            for phase, seconds in record.timings.items():
+                series.phases[phase] = series.phases.get(phase, 0.0) + seconds
+
+    def reset(self) -> None:
+        """Bütün metrikləri sıfırlayır"""
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self) -> dict[tuple[str, str, str], dict[str, Any]]:
+        """Metriklərin (klient, route, status sinfi) üzrə surəti"""
+        result = {}
+        for key, series in list(self._series.items()):
+            with series.lock:
+                result[key] = {
+                    'count': series.count,
+                    'sum': series.total,
+                    'buckets': dict(zip((*self.buckets, float('inf')), series.bucket_counts)),
+                    'bytes_in': series.bytes_in,
+                    'bytes_out': series.bytes_out,
+                    'hedges': series.hedges,
+                    'hedge_wins': series.hedge_wins,
+                    'phases': dict(series.phases),
+                }
+        return result
+
+    def render_prometheus(self) -> str:
+        """Metrikləri Prometheus text exposition formatında qaytarır"""
+        ns = self.namespace
+        requests = [
+            f'# HELP {ns}_requests_total Total number of API requests.',
+            f'# TYPE {ns}_requests_total counter',
+        ]
+        duration = [
+            f'# HELP {ns}_request_duration_seconds API request latency.',
+            f'# TYPE {ns}_request_duration_seconds histogram',
+        ]
+        sent = [
+            f'# HELP {ns}_request_bytes_total Request body bytes sent.',
+            f'# TYPE {ns}_request_bytes_total counter',
+        ]
+        received = [
+            f'# HELP {ns}_response_bytes_total Response body bytes received.',
+            f'# TYPE {ns}_response_bytes_total counter',
+        ]
+        phases = [
+            f'# HELP {ns}_request_phase_seconds_total Time spent in each request phase.',
+            f'# TYPE {ns}_request_phase_seconds_total counter',
+        ]
+        hedges = [
+            f'# HELP {ns}_hedged_requests_total Extra requests sent by request hedging.',
+            f'# TYPE {ns}_hedged_requests_total counter',
+        ]
+        hedge_wins = [
+            f'# HELP {ns}_hedge_wins_total Calls answered by a hedged request.',
+            f'# TYPE {ns}_hedge_wins_total counter',
+        ]
+
+        for (client, route, status), data in sorted(self.snapshot().items()):
+            labels = f'client="{_escape(client)}",route="{_escape(route)}",status="{status}"'
+            requests.append(f'{ns}_requests_total{{{labels}}} {data["count"]}')
+            sent.append(f'{ns}_request_bytes_total{{{labels}}} {data["bytes_out"]}')
+            received.append(f'{ns}_response_bytes_total{{{labels}}} {data["bytes_in"]}')
+            hedges.append(f'{ns}_hedged_requests_total{{{labels}}} {data["hedges"]}')
+            hedge_wins.append(f'{ns}_hedge_wins_total{{{labels}}} {data["hedge_wins"]}')
+
+            cumulative = 0
+            for bound, count in data['buckets'].items():
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else _format(bound)
+                duration.append(
+                    f'{ns}_request_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}'
+                )
+            duration.append(f'{ns}_request_duration_seconds_sum{{{labels}}} {_format(data["sum"])}')
+            duration.append(f'{ns}_request_duration_seconds_count{{{labels}}} {data["count"]}')
+
+            for phase, seconds in data['phases'].items():
+                phases.append(
+                    f'{ns}_request_phase_seconds_total{{{labels},phase="{phase}"}} '
+                    f'{_format(seconds)}'
+                )
+
+        return (
+            '\n'.join((*requests, *duration, *sent, *received, *phases, *hedges, *hedge_wins))
+            + '\n'
+        )
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format(value: float) -> str:
+    return repr(float(value))
+
+
+METRICS = MetricsRegistry()
+"""Default (proses üzrə ortaq) metrik registry-si"""
+
+
+def render_prometheus(registry: MetricsRegistry = METRICS) -> str:
+    """Registry-nin metriklərini Prometheus text formatında qaytarır (bax: `MetricsRegistry`)"""
+    return registry.render_prometheus()
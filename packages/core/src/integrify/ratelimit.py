@@ -0,0 +1,167 @@
+import asyncio
+import math
+import threading
+import time
+from time import monotonic
+
+_PERIODS = {'s': 1.0, 'sec': 1.0, 'm': 60.0, 'min': 60.0, 'h': 3600.0, 'hour': 3600.0}
+
+_SHARED: dict[tuple[str, str], 'RateLimiter'] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+class RateLimitTimeoutError(TimeoutError):
+    """Token `timeout` müddətində hazır olmayacaqsa, gözləmədən qaldırılan xəta.
+    Bu halda token rezerv edilmir."""
+
+    def __init__(self, wait: float, timeout: float):
+        """
+        Args:
+            wait: Tokenin hazır olmasına qalan müddət (saniyə ilə)
+            timeout: İcazə verilən gözləmə müddəti (saniyə ilə)
+        """
+        super().__init__(f'Rate limit wait of {wait:.3f}s exceeds timeout of {timeout:.3f}s')
+        self.wait = wait
+        self.timeout = timeout
+
+
+class RateLimiter:
+    """Token bucket alqoritmi ilə client-side rate limiter.
+
+    Bucket saniyədə `rate` token ilə dolur və ən çox `burst` token saxlayır; hər sorğu bir
+    token sərf edir. Token olmadıqda sorğu növbəti tokenin yaranmasını gözləyir: sync
+    klientlərdə thread bloklanır (`time.sleep`), async klientlərdə isə event loop
+    bloklanmadan `await` olunur. Tokenlər rezerv edildiyi üçün gözləyən sorğular
+    növbə ilə (FIFO) buraxılır.
+
+    Obyekt thread-safe-dir; eyni obyekt sync və async klient arasında paylaşıla bilər ki,
+    ümumi provayder limiti birlikdə gözlənilsin.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0, burst: int | None = None):
+        """
+        Args:
+            rate: `per` saniyə ərzində icazə verilən sorğu sayı
+            per: Limitin müddəti (saniyə ilə). Məs., `RateLimiter(600, per=60)`
+                dəqiqədə 600 sorğu deməkdir.
+            burst: Bucket-in tutumu, yəni ardıcıl gözləmədən göndərilə bilən maksimum
+                sorğu sayı. Verilməsə, saniyəlik limitə (ən az 1) bərabər götürülür.
+        """
+        if rate <= 0 or per <= 0:
+            raise ValueError('rate and per must be positive')
+
+        self.rate = rate / per
+        """Saniyədə əlavə olunan token sayı"""
+
+        self.burst = burst or max(1, math.ceil(self.rate))
+        """Bucket-in tutumu"""
+
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(rate={self.rate:g}/s, burst={self.burst})'
+
+    @classmethod
+    def from_spec(cls, spec: str | None) -> 'RateLimiter | None':
+        """`'10/s'`, `'600/m'`, `'1000/h'` və ya `'5'` (saniyədə) formatlı limitdən obyekt yaradır.
+        Env dəyişənlərindən oxunan provayder limitləri üçün nəzərdə tutulub.
+
+        Args:
+            spec: Limit. Boş və ya `None` olduqda `None` qaytarılır (limit yoxdur).
+        """
+        if not spec or not spec.strip():
+            return None
+
+        count, _, period = spec.strip().partition('/')
+        try:
+            return cls(float(count), per=_PERIODS[period.strip().lower() or 's'])
+        except (KeyError, ValueError) as e:
+            raise ValueError(f'Invalid rate limit: {spec!r}') from e
+
+    @classmethod
+    def shared(cls, name: str, spec: str | None) -> 'RateLimiter | None':
+        """`from_spec` kimi, lakin eyni `name` və `spec` üçün həmişə eyni obyekti qaytarır.
+
+        İnteqrasiyaların modul səviyyəli sync və async klientləri (və eyni provayderin
+        digər klientləri) env-dən oxunan limiti birlikdə gözləsin deyə istifadə olunur;
+        hər klient öz limiter-ini yaratsaydı, faktiki limit klient sayı qədər artardı.
+
+        Args:
+            name: Provayderin adı. Fərqli provayderlər eyni limitlə belə ayrı limiter alır.
+            spec: Limit (bax: `from_spec`)
+        """
+        if not spec or not spec.strip():
+            return None
+
+        key = (name, spec.strip())
+        with _SHARED_LOCK:
+            limiter = _SHARED.get(key)
+            if limiter is None:
+                limiter = _SHARED[key] = cls.from_spec(spec)
+            return limiter
+
+    def _reserve(
+        self,
+        tokens: int,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> float | None:
+        """Tokenləri rezerv edir və onların hazır olmasına qalan müddəti qaytarır.
+        `block=False` olduqda və token çatmadıqda heç nə rezerv edilmir, `None` qaytarılır.
+        Gözləmə `timeout`-u keçəcəksə, heç nə rezerv edilmir, `RateLimitTimeoutError`
+        qaldırılır."""
+        if tokens > self.burst:
+            raise ValueError(f'Cannot acquire {tokens} tokens with burst of {self.burst}')
+
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            if self._tokens < tokens and not block:
+                return None
+
+            wait = max(0.0, (tokens - self._tokens) / self.rate)
+            if timeout is not None and wait > timeout:
+                raise RateLimitTimeoutError(wait, timeout)
+
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """Token varsa dərhal götürür (`True`), yoxdursa gözləmədən `False` qaytarır"""
+        return self._reserve(tokens, block=False) is not None
+
+    def acquire(self, tokens: int = 1, timeout: float | None = None) -> float:
+        """Token hazır olana qədər thread-i bloklayır.
+
+        Args:
+            tokens: Token sayı
+            timeout: Maksimum gözləmə müddəti (saniyə ilə). Token bu müddətdə hazır
+                olmayacaqsa, gözləmədən `RateLimitTimeoutError` qaldırılır.
+
+        Returns:
+            Gözlənilmiş müddət (saniyə ilə)
+        """
+        delay = self._reserve(tokens, timeout=timeout)
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def aacquire(self, tokens: int = 1, timeout: float | None = None) -> float:
+        """Token hazır olana qədər event loop-u bloklamadan gözləyir.
+
+        Args:
+            tokens: Token sayı
+            timeout: Maksimum gözləmə müddəti (saniyə ilə). Token bu müddətdə hazır
+                olmayacaqsa, gözləmədən `RateLimitTimeoutError` qaldırılır.
+
+        Returns:
+            Gözlənilmiş müddət (saniyə ilə)
+        """
+        delay = self._reserve(tokens, timeout=timeout)
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
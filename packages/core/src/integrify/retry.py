@@ -0,0 +1,142 @@
+import random
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+"""HTTP semantikasına görə idempotent sayılan metodlar. `add_url`-də `idempotent` verilmədikdə,
+endpoint-in təkrar göndərilə bilməsi bu siyahıya əsasən təyin olunur."""
+
+DEFAULT_RETRY_STATUSES = frozenset({408, 429, 502, 503, 504})
+"""Default olaraq təkrar yoxlanılan (müvəqqəti xəta sayılan) status kodları"""
+
+DEFAULT_RETRY_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+"""Default olaraq təkrar yoxlanılan (müvəqqəti xəta sayılan) httpx exception-ları"""
+
+
+class RetryPolicy:
+    """Uğursuz sorğuların təkrar göndərilmə siyasəti.
+
+    Siyasət yalnız idempotent endpoint-lərə tətbiq olunur: `GET` kimi oxuma sorğuları
+    (və ya `add_url`-də `idempotent=True` ilə işarələnmiş endpoint-lər) təkrarlanır,
+    ödəniş kimi sorğular isə heç vaxt təkrar göndərilmir.
+
+    Təkrarlar arasındakı gözləmə müddəti eksponensial artır
+    (`backoff_factor * 2 ** (attempt - 1)`, `backoff_max` ilə məhdud) və "full jitter"
+    ilə təsadüfiləşdirilir. Cavabda `Retry-After` header-i olduqda ona əməl olunur.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 10.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_exceptions: tuple[type[BaseException], ...] = DEFAULT_RETRY_EXCEPTIONS,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 30.0,
+    ):
+        """
+        Args:
+            max_attempts: İlk sorğu da daxil olmaqla maksimum cəhd sayı. `1` təkrarı söndürür.
+            backoff_factor: İlk təkrardan əvvəlki baza gözləmə müddəti (saniyə ilə)
+            backoff_max: Gözləmə müddətinin yuxarı həddi (saniyə ilə)
+            jitter: Gözləmə müddətinin `[0, delay]` aralığında təsadüfiləşdirilməsi
+            retry_statuses: Təkrar yoxlanılan status kodları
+            retry_exceptions: Təkrar yoxlanılan exception tipləri
+            respect_retry_after: Cavabdakı `Retry-After` header-inə əməl edilməsi
+            max_retry_after: `Retry-After` bundan uzun olduqda sorğu təkrarlanmır
+        """
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = retry_exceptions
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}(max_attempts={self.max_attempts}, '
+            f'backoff_factor={self.backoff_factor}, backoff_max={self.backoff_max})'
+        )
+
+    def retry_on_response(self, response: httpx.Response, attempt: int) -> bool:
+        """Cavabın təkrar yoxlanılmalı olub-olmadığı
+
+        Args:
+            response: Alınmış cavab
+            attempt: Bu cavabın neçənci cəhdə aid olduğu (1-dən başlayaraq)
+        """
+        return attempt < self.max_attempts and response.status_code in self.retry_statuses
+
+    def retry_on_exception(self, exc: BaseException, attempt: int) -> bool:
+        """Exception-un təkrar yoxlanılmalı olub-olmadığı
+
+        Args:
+            exc: Sorğu zamanı baş verən exception
+            attempt: Bu exception-un neçənci cəhdə aid olduğu (1-dən başlayaraq)
+        """
+        return attempt < self.max_attempts and isinstance(exc, self.retry_exceptions)
+
+    def get_delay(self, attempt: int, response: httpx.Response | None = None) -> float | None:
+        """Növbəti cəhdən əvvəl gözləmə müddəti (saniyə ilə).
+
+        Args:
+            attempt: Uğursuz olmuş cəhdin sırası (1-dən başlayaraq)
+            response: Uğursuz cəhdin cavabı (əgər alınıbsa)
+
+        Returns:
+            Gözləmə müddəti və ya `Retry-After` `max_retry_after`-dən uzun olduqda `None`
+            (bu halda sorğu təkrarlanmır).
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+
+        delay = min(self.backoff_max, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+"""Tövsiyə olunan təkrar siyasəti (3 cəhd). `APIClient` default olaraq sorğuları təkrarlamır;
+siyasət `APIClient(retry=DEFAULT_RETRY_POLICY)` və ya endpoint üzrə verilməlidir. Hazır
+inteqrasiya klientləri (EPoint, Kapital Bank, Clopos, PostaGuvercini) isə oxuma endpoint-lərini
+bu siyasətlə təkrarlayır."""
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """`Retry-After` header-ini saniyəyə çevirir.
+
+    Header həm saniyə sayı (`120`), həm də HTTP tarixi (`Wed, 21 Oct 2015 07:28:00 GMT`)
+    formatında ola bilər. Yararsız dəyər üçün `None` qaytarılır.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:  # pragma: no cover
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
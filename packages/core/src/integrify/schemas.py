@@ -1,12 +1,115 @@
 import json
+from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any, ClassVar, Generic
 
+import httpx
 from integrify.utils import _ResponseT
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing_extensions import TypedDict
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
 
-class APIResponse(BaseModel, Generic[_ResponseT]):
+
+class JSONCodec(ABC):
+    """Sorğu body-lərinin encode və cavab body-lərinin decode edilməsi üçün JSON codec interfeysi.
+
+    Öz codec-inizi (məs., `msgspec` əsaslı) istifadə etmək üçün bu class-ı extend edib,
+    `set_json_codec` funksiyası ilə qeyd edə bilərsiniz.
+    """
+
+    name: ClassVar[str] = 'custom'
+    """Codec-in adı (logging/debug üçün)"""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Obyekti kompakt, UTF-8 JSON byte-larına çevirir"""
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any:
+        """JSON mətnini (və ya byte-larını) python obyektinə çevirir.
+        Yararsız JSON üçün `ValueError` (və ya onun alt class-ı) qaldırmalıdır."""
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Standart kitabxananın `json` modulu əsasında codec (default fallback)"""
+
+    name = 'json'
+
+    def dumps(self, obj: Any) -> bytes:
+        # orjson ilə eyni çıxış: boşluqsuz ayırıcılar və ASCII-yə escape olunmayan UTF-8
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonJSONCodec(JSONCodec):
+    """[orjson](https://github.com/ijl/orjson) əsaslı sürətli codec (quraşdırılıbsa, default)"""
+
+    name = 'orjson'
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+
+def _default_json_codec() -> JSONCodec:
+    return OrjsonJSONCodec() if orjson is not None else StdlibJSONCodec()
+
+
+_json_codec: JSONCodec = _default_json_codec()
+
+
+def get_json_codec() -> JSONCodec:
+    """Hazırda istifadə olunan JSON codec-i qaytarır"""
+    return _json_codec
+
+
+def set_json_codec(codec: JSONCodec | None = None) -> None:
+    """Bütün kitabxana üçün JSON codec-i dəyişir.
+
+    Args:
+        codec: Yeni codec. `None` verilərsə, avtomatik seçimə qayıdılır
+            (orjson quraşdırılıbsa, orjson, əks halda standart `json`).
+    """
+    global _json_codec  # noqa: PLW0603 # pylint: disable=global-statement
+    _json_codec = codec or _default_json_codec()
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Obyekti aktiv JSON codec ilə byte-lara çevirir"""
+    return _json_codec.dumps(obj)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """JSON-u aktiv JSON codec ilə python obyektinə çevirir"""
+    return _json_codec.loads(data)
+
+
+class DeferredModel(BaseModel):
+    """Validator-u (pydantic-core schema-sı) import zamanı deyil, ilk istifadədə qurulan
+    model. İnteqrasiyaların bütün sorğu və cavab schema-ları bu class-dan törəyir ki, paketin
+    importu ucuz olsun; uzunömürlü servislər validator-ları `integrify.api.warmup` ilə
+    əvvəlcədən qura bilər.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+def build_model(model: Any) -> None:
+    """Deferred modelin validator-unu (hələ qurulmayıbsa) qurur. Model olmayan tiplər
+    (`dict` və s.) nəzərə alınmır."""
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        model.model_rebuild()
+
+
+class APIResponse(DeferredModel, Generic[_ResponseT]):
     """Cavab sorğu base payload tipi. Generic tip-i qeyd etmıəklə
     sorğu cavabını validate edə bilərsiniz.
     """
@@ -29,21 +132,120 @@ class APIResponse(BaseModel, Generic[_ResponseT]):
         """Binary content-i dict-ə çevirərək, validation-a hazır vəziyyətə gətirir.
 
         Cavab JSON deyilsə (məs., gateway xətası zamanı HTML səhifə və ya boş body),
-        `json.loads` xətası atmaq əvəzinə boş dict qaytarılır ki, sorğu axını crash olmasın.
+        decode xətası atmaq əvəzinə boş dict qaytarılır ki, sorğu axını crash olmasın.
         Bu halda, status kodu və `ok` field-ləri vasitəsilə xətanı öyrənmək olar.
+        Decode aktiv JSON codec ilə edilir (bax: `set_json_codec`).
         """
         if isinstance(v, (bytes, bytearray, str)):
             if not v:
                 return {}
 
             try:
-                return json.loads(v)
-            except (json.JSONDecodeError, ValueError, UnicodeDecodeError):
+                return _json_codec.loads(v)
+            except (ValueError, UnicodeDecodeError):
                 return {}
 
         return v
 
 
+class LazyAPIResponse(Generic[_ResponseT]):
+    """Body-si ilk müraciətdə decode və validate olunan cavab.
+
+    `ok`, `status_code` və `headers` dərhal əlçatandır, body isə `body` field-inə ilk
+    müraciətdə (`APIResponse` ilə eyni qaydada) parse olunur. Beləliklə, yalnız statusu
+    yoxlanılan böyük list cavabları üçün JSON decode və pydantic validasiyası edilmir.
+    Xam data `raw_bytes()` və `raw_json()` ilə validasiyasız əldə oluna bilər.
+    """
+
+    __slots__ = ('_parse', '_parsed', '_response', 'headers', 'ok', 'status_code')
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        parse: Callable[[httpx.Response], 'APIResponse[_ResponseT]'],
+    ):
+        """
+        Args:
+            response: Xam httpx cavabı
+            parse: Cavabı `APIResponse`-a çevirən funksiya (adətən handler-in
+                `handle_response` method-u)
+        """
+        self.ok: bool = response.is_success
+        """Cavab sorğusunun statusu 400dən kiçikdirsə"""
+
+        self.status_code: int = response.status_code
+        """Cavab sorğusunun status kodu"""
+
+        self.headers: dict = dict(response.headers)
+        """Cavab sorğusunun header-i"""
+
+        self._response = response
+        self._parse = parse
+        self._parsed: APIResponse[_ResponseT] | None = None
+
+    def __repr__(self) -> str:
+        state = 'parsed' if self._parsed is not None else 'unparsed'
+        return f'{type(self).__name__}(status_code={self.status_code}, {state})'
+
+    @property
+    def body(self) -> _ResponseT:
+        """Cavab sorğusunun validate olunmuş body-si"""
+        return self.parse().body
+
+    @property
+    def is_parsed(self) -> bool:
+        """Body-nin artıq parse olunub-olunmadığı"""
+        return self._parsed is not None
+
+    def copy(self) -> 'LazyAPIResponse[_ResponseT]':
+        """Eyni xam cavab üzərində, body-si ayrıca parse olunan yeni obyekt"""
+        return type(self)(self._response, self._parse)
+
+    def parse(self) -> 'APIResponse[_ResponseT]':
+        """Cavabı (bir dəfə) parse edib tam `APIResponse` obyektini qaytarır"""
+        if self._parsed is None:
+            self._parsed = self._parse(self._response)
+
+        return self._parsed
+
+    def raw_bytes(self) -> bytes:
+        """Cavabın xam body-si"""
+        return self._response.content
+
+    def raw_json(self) -> Any:
+        """Cavab body-sinin validasiyasız JSON-u (aktiv JSON codec ilə decode olunur).
+        Body JSON deyilsə, `ValueError` qaldırılır."""
+        return _json_codec.loads(self._response.content)
+
+    def model_dump(self, **kwds: Any) -> dict[str, Any]:
+        """Cavabı parse edib, `APIResponse.model_dump` nəticəsini qaytarır"""
+        return self.parse().model_dump(**kwds)
+
+
+_RESPONSE_MODELS: dict[Any, type[APIResponse]] = {}
+"""`get_response_model` üçün cache (resp_model -> `APIResponse[resp_model]`)"""
+
+
+def get_response_model(resp_model: Any) -> type[APIResponse]:
+    """`APIResponse[resp_model]` modelini bir dəfə qurub cache-ləyən funksiya.
+
+    Pydantic generic subscription-u (`APIResponse[...]`) hər çağırışda cache axtarışı (ilk
+    dəfə isə schema build) edir. Bu funksiya nəticəni `resp_model`-ə görə yadda saxlayır ki,
+    cavabların validasiyası tək bir hazır modelin çağırışına çevrilsin.
+
+    Args:
+        resp_model: Cavab body-sinin modeli (və ya tipi)
+    """
+    try:
+        return _RESPONSE_MODELS[resp_model]
+    except KeyError:
+        model = _RESPONSE_MODELS[resp_model] = APIResponse[resp_model]
+        return model
+    except TypeError:  # pragma: no cover
+        # Hash olunmayan tiplər cache-lənmir
+        return APIResponse[resp_model]
+
+
 class DryResponse(TypedDict):
     """Dry-run sorğularının `return` tipi"""
 
@@ -63,12 +265,53 @@ class DryResponse(TypedDict):
     """httpx.request funksiyasına ötürülən parametrlər"""
 
 
-class PayloadBaseModel(BaseModel):
+_ArgBinder = Callable[[tuple, dict], dict]
+
+_ARG_BINDERS: dict[type[BaseModel], _ArgBinder] = {}
+"""Model class-ı üzrə bir dəfə qurulmuş arqument binder-ləri (bax: `PayloadBaseModel.from_args`)"""
+
+
+def _compile_arg_binder(model: type['PayloadBaseModel']) -> _ArgBinder:
+    """`from_args` üçün binder qurur: input field-lərinin ardıcıllığı bir dəfə hesablanır,
+    çağırış zamanı isə arqumentlər birbaşa validasiya üçün dict-ə yığılır."""
+    fields = tuple(model.get_input_fields())
+    max_args = len(fields)
+    name = model.__name__
+
+    def bind(args: tuple, kwds: dict) -> dict:
+        if not args:
+            return kwds  # Yalnız keyword arqumentlər: təkrar yoxlamasına ehtiyac yoxdur
+
+        if len(args) > max_args:
+            raise TypeError(
+                f'{name}.from_args() got {len(args)} positional arguments '
+                f'but only {max_args} are expected'
+            )
+
+        data = dict(zip(fields, args))
+        if kwds:
+            # Eyni field həm positional, həm keyword kimi verilibsə, xəta qaldırırıq
+            if not data.keys().isdisjoint(kwds):
+                duplicates = data.keys() & kwds.keys()
+                raise TypeError(
+                    f'{name}.from_args() got multiple values for '
+                    f'argument(s): {", ".join(sorted(duplicates))}'
+                )
+            data.update(kwds)
+
+        return data
+
+    _ARG_BINDERS[model] = bind
+    return bind
+
+
+class PayloadBaseModel(DeferredModel):
     URL_PARAM_FIELDS: ClassVar[set[str]] = set()
 
     @classmethod
     def get_input_fields(cls) -> list[str]:
-        """Modelin field-lərinin listini almaq"""
+        """Modelin field-lərinin listini almaq. Nəticə class üzrə bir dəfə oxunur
+        (bax: `from_args`), ona görə sabit olmalıdır."""
         return list(cls.model_fields.keys())
 
     @classmethod
@@ -78,22 +321,5 @@ class PayloadBaseModel(BaseModel):
         modelindəki field-lərin ardıcıllığı və çağırılan funksiyada parametrlərinin ardıcıllığı
         EYNİ OLMALIDIR, əks halda, bu method yararsızdır.
         """
-        fields = cls.get_input_fields()
-
-        if len(args) > len(fields):
-            raise TypeError(
-                f'{cls.__name__}.from_args() got {len(args)} positional arguments '
-                f'but only {len(fields)} are expected'
-            )
-
-        positional = dict(zip(fields, args))
-
-        # Eyni field həm positional, həm keyword kimi verilibsə, xəta qaldırırıq
-        duplicates = positional.keys() & kwds.keys()
-        if duplicates:
-            raise TypeError(
-                f'{cls.__name__}.from_args() got multiple values for '
-                f'argument(s): {", ".join(sorted(duplicates))}'
-            )
-
-        return cls.model_validate({**positional, **kwds})
+        bind = _ARG_BINDERS.get(cls) or _compile_arg_binder(cls)
+        return cls.model_validate(bind(args, kwds))
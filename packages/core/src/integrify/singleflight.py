@@ -0,0 +1,158 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any, TypeVar
+
+_T = TypeVar('_T')
+
+
+class FlightTimeoutError(TimeoutError):
+    """Gözləyən çağırışın `timeout`-u davam edən çağırış bitmədən keçdikdə qaldırılan xəta.
+    Davam edən çağırış ləğv olunmur."""
+
+    def __init__(self, key: str, timeout: float):
+        """
+        Args:
+            key: Çağırışın açarı
+            timeout: Gözləmə müddəti (saniyə ilə)
+        """
+        super().__init__(f'Timed out after {timeout:.3f}s waiting for in-flight call {key!r}')
+        self.key = key
+        self.timeout = timeout
+
+
+class _Call:
+    """Davam edən sync sorğu və onun nəticəsi"""
+
+    __slots__ = ('done', 'error', 'result')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Eyni açarlı paralel sync çağırışları birləşdirən class.
+
+    Açar üçün ilk çağırış funksiyanı icra edir, eyni anda gələn digər çağırışlar isə onun
+    bitməsini gözləyib eyni nəticəni (və ya exception-u) alır. Çağırış bitdikdən sonra açar
+    unudulur, yəni nəticə cache olunmur (bax: `integrify.cache.ResponseCache`).
+    """
+
+    def __init__(self):
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def do(
+        self,
+        key: str,
+        func: Callable[[], _T],
+        timeout: float | None = None,
+        copy: Callable[[_T], _T] | None = None,
+    ) -> _T:
+        """`func`-u açar üzrə yalnız bir dəfə icra edir və nəticəni bütün gözləyənlərə qaytarır
+
+        Args:
+            key: Çağırışın açarı
+            func: İcra olunan funksiya
+            timeout: Başqa çağırışın nəticəsini gözləmə müddəti (saniyə ilə). Keçdikdə,
+                `FlightTimeoutError` qaldırılır.
+            copy: Gözləyən çağırışlara nəticənin öz nüsxəsini vermək üçün funksiya. Verilməsə,
+                bütün çağırışlar eyni obyekti alır.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise FlightTimeoutError(key, timeout or 0.0)
+            if call.error is not None:
+                raise call.error
+            return call.result if copy is None else copy(call.result)
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Eyni açarlı paralel async çağırışları ortaq `Future` üzərindən birləşdirən class.
+
+    Gözləyən çağırışlardan birinin ləğv olunması (cancel) digərlərinə təsir etmir. İlk
+    çağırış ləğv olunduqda isə gözləyənlərdən biri funksiyanı özü icra edir.
+    """
+
+    def __init__(self):
+        self._futures: dict[tuple[int, str], asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    async def do(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[_T]],
+        timeout: float | None = None,
+        copy: Callable[[_T], _T] | None = None,
+    ) -> _T:
+        """`func`-u açar üzrə yalnız bir dəfə icra edir və nəticəni bütün gözləyənlərə qaytarır
+
+        Args:
+            key: Çağırışın açarı
+            func: İcra olunan funksiya
+            timeout: Başqa çağırışın nəticəsini gözləmə müddəti (saniyə ilə). Keçdikdə,
+                `FlightTimeoutError` qaldırılır; davam edən çağırış ləğv olunmur.
+            copy: Gözləyən çağırışlara nəticənin öz nüsxəsini vermək üçün funksiya. Verilməsə,
+                bütün çağırışlar eyni obyekti alır.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        expires_at = monotonic() + timeout if timeout is not None else None
+
+        while (future := self._futures.get(flight_key)) is not None:
+            remaining = expires_at - monotonic() if expires_at is not None else None
+            try:
+                result = await asyncio.wait_for(asyncio.shield(future), remaining)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # Gözləyən çağırışın özü ləğv olunub
+            except asyncio.TimeoutError as e:
+                if future.done():
+                    raise  # Davam edən çağırışın öz xətası
+                raise FlightTimeoutError(key, timeout or 0.0) from e
+            else:
+                return result if copy is None else copy(result)
+
+        future = self._futures[flight_key] = loop.create_future()
+        # Gözləyən olmadıqda "exception was never retrieved" xəbərdarlığının qarşısını alır
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._futures[flight_key]
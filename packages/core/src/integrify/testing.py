@@ -0,0 +1,422 @@
+import asyncio
+import datetime
+import enum
+import importlib
+import random
+import re
+import threading
+import time
+import types
+from collections import Counter
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Annotated, Any, ClassVar, Literal, Union, get_args, get_origin, get_type_hints
+from urllib.parse import parse_qsl
+
+import httpx
+from integrify.schemas import json_loads
+from integrify.utils import UNSET
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+from typing_extensions import is_typeddict
+
+SIMULATORS = {
+    'epoint': 'integrify.epoint.simulator:EPointSimulator',
+    'kapitalbank': 'integrify.kapitalbank.simulator:KapitalSimulator',
+    'azericard': 'integrify.azericard.simulator:AzeriCardSimulator',
+    'clopos': 'integrify.clopos.simulator:CloposSimulator',
+    'lsim': 'integrify.lsim.simulator:LSIMSimulator',
+    'postaguvercini': 'integrify.postaguvercini.simulator:PostaGuverciniSimulator',
+}
+"""Provayder simulyatorlarının yerləri. Simulyatorlar inteqrasiya paketlərindədir və yalnız
+`simulator()` çağırıldıqda import olunur."""
+
+
+def route(method: str, path: str) -> Callable[[Callable], Callable]:
+    """Simulyator metodunu endpoint kimi qeydiyyatdan keçirən dekorator.
+
+    `path`-da `{name}` formatında parametrlər ola bilər; onlar metoda keyword argument kimi
+    ötürülür::
+
+        @route('GET', '/api/order/{order_id}')
+        def get_order(self, request: httpx.Request, order_id: str) -> httpx.Response: ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func.__simulator_route__ = (method.upper(), path)  # type: ignore[attr-defined]
+        return func
+
+    return decorator
+
+
+def json_response(body: Any, status_code: int = 200) -> httpx.Response:
+    """JSON body-li cavab"""
+    return httpx.Response(status_code, json=body)
+
+
+def request_data(request: httpx.Request) -> dict[str, Any]:
+    """Sorğunun data-sı: JSON body, form body və ya (body yoxdursa) query parametrləri"""
+    content = request.content
+    if not content:
+        return dict(request.url.params)
+
+    if request.headers.get('Content-Type', '').startswith('application/x-www-form-urlencoded'):
+        return dict(parse_qsl(content.decode()))
+
+    try:
+        data = json_loads(content)
+    except ValueError:
+        return dict(parse_qsl(content.decode()))
+    return data if isinstance(data, dict) else {'data': data}
+
+
+class Simulator:
+    """Provayder API-sinin lokal (şəbəkəsiz) simulyatoru üçün baza class.
+
+    Alt class-lar endpoint-ləri `@route` ilə təyin edir. Simulyator həm httpx transport-u
+    (`transport()`), həm də ASGI tətbiqi kimi işləyə bilər::
+
+        sim = simulator('epoint', latency=0.05, jitter=0.02, error_rate=0.01)
+        client = EPointClientClass(transport=sim.transport())
+
+        # və ya ayrıca prosesdə: uvicorn 'module:sim' və klientin base_url-i serverə
+
+    Hər sorğuya `latency ± jitter` saniyə gecikmə əlavə olunur; `error_rate` ehtimalı ilə
+    cavab `error_status` statusu ilə, `timeout_rate` ehtimalı ilə isə timeout ilə bitir.
+    Sync transport `time.sleep`, async transport və ASGI tətbiqi `asyncio.sleep` istifadə
+    edir, yəni yük testində simulyator event loop-u bloklamır.
+
+    Provayderin serverdən göndərdiyi callback-lər `send_callback` ilə yaradılır, `callbacks`
+    siyahısında saxlanılır və (verilibsə) `on_callback` funksiyasına ötürülür. Real
+    göndəriş üçün, məs., `on_callback=httpx.Client().send` istifadə oluna bilər.
+
+    Endpoint funksiyaları lock altında icra olunur, yəni alt class-lar vəziyyəti (sifarişlər,
+    tokenlər və s.) əlavə sinxronizasiya olmadan saxlaya bilər.
+    """
+
+    name: ClassVar[str] = 'simulator'
+    """Simulyatorun adı"""
+
+    base_url: ClassVar[str] = 'http://testserver'
+    """Provayderin default ünvanı (yalnız məlumat üçün; transport host-a baxmır)"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        timeout_rate: float = 0.0,
+        seed: int | None = None,
+        on_callback: Callable[[httpx.Request], Any] | None = None,
+    ):
+        """
+        Args:
+            latency: Hər sorğunun orta gecikməsi (saniyə ilə)
+            jitter: Gecikməyə əlavə olunan `[-jitter, jitter]` aralığında təsadüfi dəyər
+            error_rate: Sorğunun `error_status` ilə bitmə ehtimalı (0-1)
+            error_status: Simulyasiya olunan xətanın status kodu
+            timeout_rate: Sorğunun timeout ilə bitmə ehtimalı (0-1)
+            seed: Təsadüfi generatorun seed-i (təkrarlana bilən yük testləri üçün)
+            on_callback: Hər callback sorğusu (`httpx.Request`) ilə çağırılan funksiya
+        """
+        if not 0 <= error_rate <= 1 or not 0 <= timeout_rate <= 1:
+            raise ValueError('error_rate and timeout_rate must be between 0 and 1')
+        if latency < 0 or jitter < 0:
+            raise ValueError('latency and jitter must not be negative')
+
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.timeout_rate = timeout_rate
+        self.on_callback = on_callback
+
+        self.calls: Counter[str] = Counter()
+        """Endpoint (metod adı) üzrə qəbul olunmuş sorğuların sayı"""
+
+        self.callbacks: list[httpx.Request] = []
+        """Göndərilmiş callback sorğuları"""
+
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._routes = self._compile_routes()
+
+    @classmethod
+    def _compile_routes(cls) -> list[tuple[str, re.Pattern, str]]:
+        routes = []
+        for attr in dir(cls):
+            spec = getattr(getattr(cls, attr), '__simulator_route__', None)
+            if spec is None:
+                continue
+
+            method, path = spec
+            path = path.strip('/')
+            pattern = re.sub(r'\\{(\w+)\\}', r'(?P<\1>[^/]+)', re.escape(path))
+            # Path-ın əvvəlində base URL-in path-ı (məs., `/open-api/v2/`) ola bilər
+            compiled = re.compile(f'(?:.*/)?{pattern}')
+            literal = len(re.sub(r'\{\w+\}', '', path))
+            routes.append((literal, method, compiled, attr))
+
+        # Daha konkret path-lar əvvəl yoxlanılır: `products/stop-list` > `products/{id}`
+        routes.sort(key=lambda r: (-r[0], r[3]))
+        return [(method, compiled, attr) for _, method, compiled, attr in routes]
+
+    def delay(self) -> float:
+        """Növbəti sorğunun gecikməsi (saniyə ilə)"""
+        if not self.jitter:
+            return self.latency
+        return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+
+    def _fault(self, request: httpx.Request) -> httpx.Response | None:
+        if self.timeout_rate and self._random.random() < self.timeout_rate:
+            raise httpx.ReadTimeout('Simulated timeout', request=request)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return json_response({'error': 'Simulated failure'}, self.error_status)
+        return None
+
+    def dispatch(self, request: httpx.Request) -> httpx.Response:
+        """Sorğunu uyğun endpoint-ə ötürür (gecikmə və xəta inyeksiyası olmadan)"""
+        path = request.url.path.rstrip('/')
+        allowed = False
+        for method, pattern, attr in self._routes:
+            match = pattern.fullmatch(path)
+            if match is None:
+                continue
+            if method != request.method:
+                allowed = True
+                continue
+
+            with self._lock:
+                self.calls[attr] += 1
+                response = getattr(self, attr)(request, **match.groupdict())
+            response.request = request
+            return response
+
+        if allowed:
+            return json_response({'error': 'Method not allowed'}, 405)
+        return json_response({'error': 'Not found'}, 404)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Sync sorğunu emal edir; `httpx.MockTransport` handler-i kimi də istifadə oluna bilər"""
+        delay = self.delay()
+        if delay:
+            time.sleep(delay)
+        return self._fault(request) or self.dispatch(request)
+
+    async def ahandle(self, request: httpx.Request) -> httpx.Response:
+        """Async sorğunu emal edir (gecikmə event loop-u bloklamır)"""
+        delay = self.delay()
+        if delay:
+            await asyncio.sleep(delay)
+        return self._fault(request) or self.dispatch(request)
+
+    def transport(self) -> 'SimulatorTransport':
+        """Klientə `transport=` kimi ötürülə bilən (sync və async) httpx transport-u"""
+        return SimulatorTransport(self)
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        """ASGI tətbiqi: simulyatoru, məs., `uvicorn` ilə ayrıca server kimi işlətmək üçün"""
+        if scope['type'] == 'lifespan':
+            while (await receive())['type'] != 'lifespan.shutdown':
+                await send({'type': 'lifespan.startup.complete'})
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+        body = b''
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+
+        host, port = scope.get('server') or ('testserver', 80)
+        url = httpx.URL(
+            scheme=scope.get('scheme', 'http'),
+            host=host,
+            port=port,
+            path=scope['path'],
+            query=scope.get('query_string', b''),
+        )
+        request = httpx.Request(scope['method'], url, headers=scope['headers'], content=body)
+
+        try:
+            response = await self.ahandle(request)
+        except httpx.TimeoutException:
+            response = json_response({'error': 'Simulated timeout'}, 504)
+
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': response.status_code,
+                'headers': response.headers.raw,
+            }
+        )
+        await send({'type': 'http.response.body', 'body': response.content})
+
+    def send_callback(self, method: str, url: str, **kwds: Any) -> httpx.Request:
+        """Provayderin merchant-a göndərdiyi callback sorğusunu yaradır.
+
+        Args:
+            method: HTTP metodu
+            url: Callback URL-i
+            **kwds: `httpx.Request`-ə ötürülən argumentlər (`data`, `json`, `params` və s.)
+        """
+        request = httpx.Request(method, url, **kwds)
+        self.callbacks.append(request)
+        if self.on_callback is not None:
+            self.on_callback(request)
+        return request
+
+    def reset(self) -> None:
+        """Sayğacları və callback-ləri sıfırlayır"""
+        with self._lock:
+            self.calls.clear()
+            self.callbacks.clear()
+
+
+class SimulatorTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Sorğuları şəbəkəyə deyil, simulyatora ötürən httpx transport-u"""
+
+    def __init__(self, simulator: Simulator):
+        self.simulator = simulator
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        return self.simulator.handle(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        return await self.simulator.ahandle(request)
+
+
+def simulator(name: str, **kwds: Any) -> Simulator:
+    """Provayderin simulyatorunu yaradır (bax: `SIMULATORS`).
+
+    Args:
+        name: Provayderin adı (`epoint`, `kapitalbank`, `azericard`, `clopos`, `lsim`,
+            `postaguvercini`)
+        **kwds: Simulyatorun `__init__` argumentləri (`latency`, `error_rate` və s.)
+    """
+    if name not in SIMULATORS:
+        raise ValueError(f'Unknown simulator {name!r}; available: {", ".join(SIMULATORS)}')
+
+    module_name, class_name = SIMULATORS[name].split(':')
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        package = f'integrify-{module_name.split(".")[1]}'
+        raise ModuleNotFoundError(f'{name} simulator requires {package} to be installed') from e
+    return getattr(module, class_name)(**kwds)
+
+
+# =============================================================================================== #
+# Model-dən nümunə data                                                                           #
+# =============================================================================================== #
+_MAX_DEPTH = 4
+
+
+def _constraint(metadata: list, name: str) -> Any:
+    return next((getattr(m, name) for m in metadata if getattr(m, name, None) is not None), None)
+
+
+def _string(metadata: list) -> str:
+    min_length = _constraint(metadata, 'min_length') or 1
+    max_length = _constraint(metadata, 'max_length') or 12
+    return ('1' * max(min_length, min(8, max_length)))[:max_length]
+
+
+def _number(metadata: list, cast: type) -> Any:
+    low = _constraint(metadata, 'gt') or _constraint(metadata, 'ge') or 0
+    return cast(max(1, low + 1))
+
+
+def sample_value(annotation: Any, metadata: list, json: bool, depth: int = 0) -> Any:  # noqa: C901, PLR0911, PLR0912
+    """Tipə (`annotation`) uyğun, validasiyadan keçən nümunə dəyər"""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Annotated:
+        return sample_value(args[0], [*metadata, *args[1:]], json, depth)
+    if origin in (Union, types.UnionType):
+        options = [a for a in args if a is not type(None) and get_origin(a) is not Literal]
+        literals = [a for a in args if get_origin(a) is Literal and UNSET not in get_args(a)]
+        return sample_value((options or literals or [type(None)])[0], metadata, json, depth)
+    if origin is Literal:
+        return args[0].value if json and isinstance(args[0], enum.Enum) else args[0]
+    if origin in (list, set, tuple, frozenset):
+        item = sample_value(args[0], [], json, depth + 1) if args else '1'
+        return [item] if json or origin is list else origin([item])
+    if origin is dict or annotation is dict:
+        return {}
+    if annotation is list:
+        return []
+    if annotation is type(None):
+        return None
+    if is_typeddict(annotation):
+        hints = get_type_hints(annotation)
+        return {key: sample_value(hint, [], json, depth + 1) for key, hint in hints.items()}
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return sample_model(annotation, json=json, depth=depth + 1)
+        if issubclass(annotation, enum.Enum):
+            member = next(iter(annotation))
+            return member.value if json else member
+        if issubclass(annotation, bool):
+            return True
+        if issubclass(annotation, int):
+            return _number(metadata, int)
+        if issubclass(annotation, float):
+            return _number(metadata, float)
+        if issubclass(annotation, Decimal):
+            value = _number(metadata, Decimal)
+            return str(value) if json else value
+        if issubclass(annotation, datetime.datetime):
+            value = datetime.datetime(2025, 5, 1, 12, 0)
+            return value.isoformat() if json else value
+        if issubclass(annotation, datetime.date):
+            value = datetime.date(2025, 5, 1)
+            return value.isoformat() if json else value
+        if issubclass(annotation, str):
+            return _string(metadata)
+    return '1'
+
+
+def sample_model(
+    model: type[BaseModel],
+    json: bool = True,
+    required_only: bool = False,
+    depth: int = 0,
+) -> dict[str, Any]:
+    """Model-in validasiyasından keçən nümunə input data.
+
+    Args:
+        model: Pydantic model-i
+        json: `True` olduqda (cavab body-si) data JSON-uyğundur və alias-larla yazılır,
+            əks halda (sorğu argumentləri) Python obyektləri və field adları istifadə olunur
+        required_only: Yalnız məcburi field-lər
+        depth: Nested model-lərin dərinliyi (dərin model-lərdə yalnız məcburi field-lər)
+    """
+    by_name = model.model_config.get('populate_by_name') or model.model_config.get(
+        'validate_by_name'
+    )
+    data = {}
+    for name, field in model.model_fields.items():
+        required = field.is_required()
+        if (required_only or depth >= _MAX_DEPTH) and not required:
+            continue
+        alias = field.validation_alias if isinstance(field.validation_alias, str) else field.alias
+        key = alias if alias and (json or not by_name) else name
+        if not required and field.default not in (None, UNSET, PydanticUndefined):
+            continue  # Default-lar (çox vaxt env-dən gəlir) olduğu kimi saxlanılır
+        data[key] = sample_value(field.annotation, list(field.metadata), json, depth)
+    return data
+
+
+def sample_body(resp_model: Any) -> Any:
+    """Handler-in `resp_model`-inə uyğun JSON cavab body-si"""
+    if resp_model is None:
+        return {}
+    if isinstance(resp_model, type) and issubclass(resp_model, BaseModel):
+        return sample_model(resp_model)
+    return sample_value(resp_model, [], json=True)
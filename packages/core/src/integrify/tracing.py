@@ -0,0 +1,106 @@
+import time
+from typing import Any, NamedTuple
+
+import httpx
+from integrify.hooks import RequestRecord
+
+try:
+    from opentelemetry import context as otel_context
+    from opentelemetry import trace
+except ModuleNotFoundError:
+    otel_context = None
+    trace = None
+
+INSTRUMENTATION_NAME = 'integrify'
+"""OpenTelemetry tracer-inin (instrumentation scope) adı"""
+
+
+class _ActiveSpan(NamedTuple):
+    span: Any
+    token: Any
+    start_time: int  # time.time_ns()
+
+
+class RequestTracer:
+    """Hər API sorğusu üçün OpenTelemetry span-ı açan class.
+
+    Sorğunun ümumi span-ı (`CLIENT` növü) sorğu boyu aktiv (current) olur, yəni sorğu
+    zamanı yazılan log-lar və digər span-lar (məs., httpx instrumentasiyası) ona bağlanır.
+    Sorğu bitdikdən sonra mərhələlər (bax: `integrify.hooks.PHASES`; `handle_request`
+    imzalamanı, `handle_response` isə validasiyanı əhatə edir) dəqiq başlama və bitmə
+    vaxtları ilə child span kimi əlavə olunur.
+
+    `opentelemetry-api` quraşdırılmayıbsa, tracer heç nə etmir.
+    """
+
+    def __init__(self, tracer_provider: Any = None, name: str = INSTRUMENTATION_NAME):
+        """
+        Args:
+            tracer_provider: OpenTelemetry `TracerProvider`. Verilməsə, qlobal provider
+                istifadə olunur.
+            name: Instrumentation scope-un adı
+        """
+        self.tracer = (
+            trace.get_tracer(name, tracer_provider=tracer_provider) if trace is not None else None
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """OpenTelemetry API-nin mövcud olub-olmadığı"""
+        return self.tracer is not None
+
+    def start(self, record: RequestRecord) -> _ActiveSpan | None:
+        """Sorğunun span-ını açır və onu aktiv (current) edir"""
+        if self.tracer is None:
+            return None
+
+        start_time = time.time_ns()
+        span = self.tracer.start_span(
+            f'{record.client_name} {record.route_name or record.verb}',
+            kind=trace.SpanKind.CLIENT,
+            start_time=start_time,
+            attributes={
+                'integrify.client': record.client_name,
+                'integrify.route': record.route_name or '',
+                'http.request.method': record.verb,
+            },
+        )
+        token = otel_context.attach(trace.set_span_in_context(span))
+        return _ActiveSpan(span, token, start_time)
+
+    def end(self, active: _ActiveSpan | None, record: RequestRecord) -> None:
+        """Mərhələlərin child span-larını əlavə edir, atributları yazır və span-ı bağlayır"""
+        if active is None:
+            return
+
+        otel_context.detach(active.token)
+        span = active.span
+        span.set_attributes(
+            {
+                'url.full': record.url,
+                'server.address': httpx.URL(record.url).host,
+                'http.request.body.size': record.bytes_out,
+                'http.response.body.size': record.bytes_in,
+                'integrify.cache_hit': record.cache_hit,
+                'integrify.coalesced': record.coalesced,
+                'integrify.hedges': record.hedges,
+                'integrify.hedge_won': record.hedge_won,
+            }
+        )
+        if record.status_code is not None:
+            span.set_attribute('http.response.status_code', record.status_code)
+
+        parent = trace.set_span_in_context(span)
+        cursor = active.start_time
+        for phase, seconds in record.timings.items():
+            end = cursor + int(seconds * 1e9)
+            self.tracer.start_span(phase, context=parent, start_time=cursor).end(end_time=end)
+            cursor = end
+
+        if record.error is not None:
+            span.record_exception(record.error)
+            span.set_status(trace.Status(trace.StatusCode.ERROR, repr(record.error)))
+        elif record.status_code is not None and record.status_code >= 400:  # noqa: PLR2004
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+
+        span.end(end_time=active.start_time + int(record.duration * 1e9))
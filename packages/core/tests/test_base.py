@@ -4,7 +4,7 @@ import httpx
 import pytest
 from httpx import Response
 from integrify.api import APIClient, APIPayloadHandler
-from integrify.schemas import PayloadBaseModel
+from integrify.schemas import LazyAPIResponse, PayloadBaseModel
 from integrify.utils import UNSET, UnsetField
 from pydantic import BaseModel
 from pytest_mock import MockerFixture
@@ -239,3 +239,324 @@ def test_unset_response(api_client: APIClient, test_ok_response2, mocker: Mocker
         assert isinstance(resp.body, ResponseSchemaWithUnset)
         assert resp.body.data1 == 'output1'
         assert resp.body.data2 is UNSET
+
+
+def test_endpoint_is_cached(dry_api_client: APIClient):
+    dry_api_client.add_url('cached', 'url', 'GET')
+    endpoint = dry_api_client.cached
+
+    assert dry_api_client.cached is endpoint
+    assert 'cached' in dry_api_client.__dict__
+
+
+def test_endpoint_invalidated_on_reregister(dry_api_client: APIClient):
+    dry_api_client.add_url('rerouted', 'url', 'GET')
+    endpoint = dry_api_client.rerouted
+    assert endpoint()['url'] == 'url'
+
+    dry_api_client.add_url('rerouted', 'other', 'POST')
+    assert dry_api_client.rerouted is not endpoint
+
+    resp = dry_api_client.rerouted()
+    assert resp['url'] == 'other'
+    assert resp['verb'] == 'POST'
+
+    class Handler(APIPayloadHandler):
+        def __init__(self):
+            super().__init__(RequestSchema, ResponseSchema)
+
+    dry_api_client.add_handler('rerouted', Handler)
+    assert dry_api_client.rerouted(data1='input1')['data'] == {'data1': 'input1'}
+
+
+def test_response_model_is_cached():
+    from integrify.schemas import APIResponse, get_response_model
+
+    class Handler(APIPayloadHandler):
+        req_model = RequestSchema
+        resp_model = ResponseSchema
+
+    assert get_response_model(ResponseSchema) is get_response_model(ResponseSchema)
+    assert Handler().response_model is Handler().response_model
+    assert issubclass(Handler().response_model, APIResponse)
+
+
+def test_warmup(api_client: APIClient):
+    class Handler(APIPayloadHandler):
+        req_model = RequestSchema
+        resp_model = ResponseSchema
+
+    api_client.add_url('warm', 'url', 'GET')
+    api_client.add_handler('warm', Handler)
+    api_client.warmup()
+
+    assert 'response_model' in api_client.handlers['warm'].__dict__
+
+
+def test_deferred_models_warmup():
+    from integrify.api import warmup
+    from integrify.schemas import DeferredModel
+
+    class WarmRequest(PayloadBaseModel):
+        data1: str
+
+    class WarmResponse(DeferredModel):
+        data2: int
+
+    class ColdResponse(DeferredModel):
+        data3: int
+
+    class Callback(DeferredModel):
+        data4: int
+
+    class WarmHandler(APIPayloadHandler):
+        req_model = WarmRequest
+        resp_model = WarmResponse
+
+    class ColdHandler(APIPayloadHandler):
+        resp_model = ColdResponse
+
+    client = APIClient(None, 'base_url')
+    client.add_url('warm', 'url', 'GET')
+    client.add_url('cold', 'url', 'GET')
+    client.add_handler('warm', WarmHandler)
+    client.add_handler('cold', ColdHandler)
+
+    models = [WarmRequest, WarmResponse, ColdResponse, Callback]
+    assert not any(model.__pydantic_complete__ for model in models)
+
+    thread = warmup([client], routes=['warm'], models=[Callback])
+    assert thread is not None
+    thread.join()
+
+    response_model = client.handlers['warm'].response_model
+    assert response_model.__pydantic_complete__
+    assert WarmRequest.__pydantic_complete__
+    assert Callback.__pydantic_complete__
+    assert not ColdResponse.__pydantic_complete__
+
+    # Qurulmamış model ilk istifadədə qurulur
+    assert ColdResponse.model_validate({'data3': 1}).data3 == 1
+    assert ColdResponse.__pydantic_complete__
+
+    assert warmup([client], background=False) is None
+
+
+def test_post_body_encoded_with_json_codec(
+    api_client: APIClient,
+    test_ok_response,
+    mocker: MockerFixture,
+):
+    from integrify.schemas import json_loads
+
+    class Handler(APIPayloadHandler):
+        req_model = RequestSchema
+
+    request = mocker.patch('httpx.Client.request', return_value=test_ok_response)
+    api_client.add_url('encoded', 'url', 'POST')
+    api_client.add_handler('encoded', Handler)
+    api_client.encoded(data1='ağ')
+
+    kwds = request.call_args.kwargs
+    assert 'json' not in kwds
+    assert isinstance(kwds['content'], bytes)
+    assert json_loads(kwds['content']) == {'data1': 'ağ'}
+    assert kwds['headers']['Content-Type'] == 'application/json'
+
+
+def test_get_params_keep_url_query(
+    api_client: APIClient,
+    test_ok_response,
+    mocker: MockerFixture,
+):
+    class Handler(APIPayloadHandler):
+        req_model = RequestSchema
+
+    request = mocker.patch('httpx.Client.request', return_value=test_ok_response)
+    api_client.add_url('details', 'order?tranDetailLevel=2', 'GET')
+    api_client.add_url('search', 'search', 'GET')
+    api_client.add_handler('search', Handler)
+
+    # Boş payload URL-in öz query-sini silmir, payload isə query parametrləri kimi göndərilir
+    api_client.details()
+    assert 'params' not in request.call_args.kwargs
+    assert request.call_args.args[1].endswith('order?tranDetailLevel=2')
+
+    api_client.search(data1='ağ')
+    assert request.call_args.kwargs['params'] == {'data1': 'ağ'}
+
+
+@pytest.mark.parametrize('codec_class', ['StdlibJSONCodec', 'OrjsonJSONCodec'])
+def test_json_codecs(codec_class: str):
+    from integrify import schemas
+
+    if codec_class == 'OrjsonJSONCodec' and schemas.orjson is None:
+        pytest.skip('orjson is not installed')
+
+    codec = getattr(schemas, codec_class)()
+    data = {'data1': 'ağ', 'data2': [1, 2.5, None, True]}
+
+    assert codec.dumps(data) == b'{"data1":"a\xc4\x9f","data2":[1,2.5,null,true]}'
+    assert codec.loads(codec.dumps(data)) == data
+    with pytest.raises(ValueError):
+        codec.loads(b'{not json')
+
+
+def test_set_json_codec():
+    from integrify import schemas
+
+    class Codec(schemas.StdlibJSONCodec):
+        calls = 0
+
+        def loads(self, data):
+            Codec.calls += 1
+            return super().loads(data)
+
+    try:
+        schemas.set_json_codec(Codec())
+        assert isinstance(schemas.get_json_codec(), Codec)
+        assert schemas.APIResponse.convert_to_dict(b'{"a":1}') == {'a': 1}
+        assert schemas.APIResponse.convert_to_dict(b'<html>') == {}
+        assert Codec.calls == 2
+    finally:
+        schemas.set_json_codec()
+
+    expected = schemas.OrjsonJSONCodec if schemas.orjson else schemas.StdlibJSONCodec
+    assert isinstance(schemas.get_json_codec(), expected)
+
+
+def test_json_codec_is_abstract():
+    from integrify.schemas import JSONCodec
+
+    class Incomplete(JSONCodec):
+        def dumps(self, obj):
+            return b''
+
+    with pytest.raises(TypeError):
+        JSONCodec()  # type: ignore[abstract]
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore[abstract]
+
+
+def test_batch_sync(api_client: APIClient, test_ok_response, mocker: MockerFixture):
+    import threading
+    import time
+
+    from pydantic import ValidationError
+
+    class Handler(APIPayloadHandler):
+        req_model = RequestSchema
+
+    lock = threading.Lock()
+    running = peak = 0
+
+    def request(*args, **kwds):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return test_ok_response
+
+    mocker.patch('httpx.Client.request', side_effect=request)
+    api_client.add_url('batched', 'url', 'GET')
+    api_client.add_handler('batched', Handler)
+
+    items = [{'data1': str(i)} for i in range(10)] + [{}]
+    results = list(api_client.batch('batched', items, concurrency=3))
+
+    assert [r.index for r in results] == list(range(11))
+    assert all(r.ok and r.result.ok for r in results[:10])
+    assert not results[-1].ok
+    assert isinstance(results[-1].error, ValidationError)
+    assert peak == 3
+
+    unordered = list(api_client.batch('batched', iter(items), concurrency=4, ordered=False))
+    assert sorted(r.index for r in unordered) == list(range(11))
+
+    with pytest.raises(ValueError):
+        api_client.batch('batched', items, concurrency=0)
+
+
+def test_batch_async():
+    import asyncio
+
+    class Handler(APIPayloadHandler):
+        req_model = RequestSchema
+
+    client = APIClient(None, 'base_url', sync=False, dry=True)
+    client.add_url('batched', 'url', 'POST')
+    client.add_handler('batched', Handler)
+
+    async def collect(**kwds):
+        return [r async for r in client.batch('batched', **kwds)]
+
+    items = [{'data1': str(i)} for i in range(5)] + [{}]
+    results = asyncio.run(collect(items=items, concurrency=2))
+
+    assert [r.index for r in results] == list(range(6))
+    assert [r.result['data'] for r in results[:5]] == items[:5]
+    assert results[-1].error is not None
+
+    unordered = asyncio.run(collect(items=items, concurrency=2, ordered=False))
+    assert sorted(r.index for r in unordered) == list(range(6))
+
+
+def test_lazy_response(test_ok_response, mocker: MockerFixture):
+    class Handler(APIPayloadHandler):
+        resp_model = ResponseSchema
+
+    mocker.patch('httpx.Client.request', return_value=test_ok_response)
+    validate = mocker.spy(Handler, 'handle_response')
+    api_client = APIClient('lazy', 'base_url', lazy_responses=True)
+    api_client.add_url('test', 'url', 'GET')
+    api_client.add_handler('test', Handler)
+
+    resp = api_client.test()
+    assert isinstance(resp, LazyAPIResponse)
+    assert resp.ok
+    assert resp.status_code == 200
+    assert resp.raw_json() == {'data1': 'output1', 'data2': 'output2'}
+    assert resp.raw_bytes() == test_ok_response.content
+    assert not resp.is_parsed
+    assert validate.call_count == 0
+
+    assert resp.body.data1 == 'output1'
+    assert resp.body.data2 == 'output2'
+    assert resp.model_dump()['ok']
+    assert validate.call_count == 1
+
+
+def test_lazy_response_per_handler(api_client: APIClient, test_ok_response, mocker: MockerFixture):
+    class LazyHandler(APIPayloadHandler):
+        resp_model = ResponseSchema
+        lazy = True
+
+    class EagerHandler(LazyHandler):
+        lazy_supported = False
+
+    mocker.patch('httpx.Client.request', return_value=test_ok_response)
+    api_client.add_url('lazy', 'url', 'GET')
+    api_client.add_handler('lazy', LazyHandler)
+    api_client.add_url('eager', 'url', 'GET')
+    api_client.add_handler('eager', EagerHandler)
+
+    assert isinstance(api_client.lazy(), LazyAPIResponse)
+    assert isinstance(api_client.eager().body, ResponseSchema)
+
+
+def test_from_args_binder(mocker: MockerFixture):
+    get_input_fields = mocker.spy(RequestWithUnset, 'get_input_fields')
+
+    assert RequestWithUnset.from_args('a', 'b').data2 == 'b'
+    assert RequestWithUnset.from_args('a', data2='b').data2 == 'b'
+    assert RequestWithUnset.from_args(data1='a').data2 is UNSET
+    assert get_input_fields.call_count <= 1  # Field-lər class üzrə bir dəfə oxunur
+
+    with pytest.raises(TypeError, match='multiple values for argument'):
+        RequestWithUnset.from_args('a', data1='b')
+
+    with pytest.raises(TypeError, match='3 positional arguments'):
+        RequestWithUnset.from_args('a', 'b', 'c')
@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from integrify.api import APIClient
+from integrify.bench import (
+    LoadReport,
+    arun_load,
+    classify,
+    load_client_class,
+    render_template,
+    run_load,
+)
+from integrify.cli import build_parser
+from integrify.testing import Simulator, json_response, request_data, route
+
+
+class ItemsSimulator(Simulator):
+    @route('GET', '/items')
+    def get_item(self, request: httpx.Request) -> httpx.Response:
+        item_id = request_data(request)['item_id']
+        if item_id == '0':
+            return json_response({'error': 'not found'}, 404)
+        return json_response({'id': item_id})
+
+
+def make_client(sim: Simulator, sync: bool = True) -> tuple[APIClient, LoadReport]:
+    report = LoadReport('items.get_item')
+    client = APIClient(
+        'Items',
+        'https://provider.az',
+        sync=sync,
+        transport=sim.transport(),
+        hooks=[report.observe],
+    )
+    client.add_url('get_item', '/items', verb='GET')
+    return client, report
+
+
+def test_run_load():
+    client, report = make_client(ItemsSimulator())
+    run_load(lambda i: client.get_item(item_id=i), concurrency=4, requests=50, report=report)  # type: ignore[attr-defined]
+
+    assert report.requests == report.records == 50
+    assert report.errors == {'HTTP 404': 1}
+    assert report.percentile(50) <= report.percentile(99) <= max(report.latencies)
+    assert report.phases['network'] > 0
+
+    data = report.as_dict()
+    assert set(data['latency']) == {'p50', 'p90', 'p99', 'max'}
+    assert 'HTTP 404' in report.render()
+
+
+def test_run_load_rps():
+    calls = []
+    start = time.perf_counter()
+    report = run_load(calls.append, concurrency=2, rps=100, duration=0.2)
+
+    assert time.perf_counter() - start >= 0.19
+    assert 18 <= report.requests <= 20
+    assert sorted(calls) == list(range(report.requests))
+
+
+def test_arun_load():
+    client, report = make_client(ItemsSimulator(latency=0.02), sync=False)
+
+    async def main():
+        async with client:
+            return await arun_load(
+                lambda i: client.get_item(item_id=i + 1),  # type: ignore[attr-defined]
+                concurrency=10,
+                requests=20,
+                report=report,
+            )
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    assert time.perf_counter() - start < 0.2
+    assert report.requests == 20
+    assert not report.errors
+    assert report.percentile(50) >= 0.02
+
+
+def test_errors_are_grouped():
+    def call(i):
+        if i % 2:
+            raise httpx.ReadTimeout('timeout')
+        return 'ok'
+
+    report = run_load(call, concurrency=1, requests=10)
+    assert report.errors == {'ReadTimeout': 5}
+
+
+def test_classify():
+    assert classify(httpx.Response(200)) is None
+    assert classify(httpx.Response(503)) == 'HTTP 503'
+    assert classify(error=ValueError()) == 'ValueError'
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        run_load(lambda i: None, concurrency=0, requests=1)
+
+    with pytest.raises(ValueError):
+        run_load(lambda i: None)
+
+
+def test_render_template():
+    template = {'order_id': 'order-{i}', 'items': [{'id': '{i}'}], 'amount': 10}
+    assert render_template(template, 3) == {
+        'order_id': 'order-3',
+        'items': [{'id': '3'}],
+        'amount': 10,
+    }
+    assert len(render_template('{uuid}', 0)) == 32
+
+
+def test_cli_arguments():
+    args = build_parser().parse_args(['bench', 'epoint', 'pay', '--rps', '50', '--mode', 'sync'])
+    assert args.integration == 'epoint'
+    assert args.rps == 50
+    assert args.concurrency == 10
+    assert args.args == {}
+
+
+@pytest.mark.parametrize(('value', 'message'), [('{amount: 1}', 'invalid JSON'), ('[1]', 'object')])
+def test_cli_invalid_args(capsys: pytest.CaptureFixture, value: str, message: str):
+    with pytest.raises(SystemExit) as exc:
+        build_parser().parse_args(['bench', 'epoint', 'pay', '--args', value])
+
+    assert exc.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+def test_cli_unknown_integration():
+    with pytest.raises(ValueError, match='Unknown integration'):
+        load_client_class('unknown')
@@ -0,0 +1,243 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+from httpx import Response
+from integrify.api import APIClient
+from integrify.breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from integrify.deadline import DeadlineExceededError
+from pytest_mock import MockerFixture
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(mocker: MockerFixture):
+    clock = Clock()
+    mocker.patch('integrify.breaker.monotonic', clock)
+    return clock
+
+
+@pytest.fixture
+def changes():
+    return []
+
+
+@pytest.fixture
+def breaker(changes):
+    return CircuitBreaker(
+        failure_rate=0.5,
+        minimum_calls=4,
+        window=10,
+        recovery_timeout=30,
+        on_state_change=lambda *change: changes.append(change),
+    )
+
+
+def test_breaker_state_machine(breaker: CircuitBreaker, clock: Clock, changes):
+    for failure in (False, False, True):
+        breaker.before_call('host')
+        breaker.record('host', failure)
+    assert breaker.state('host') is CircuitState.CLOSED
+
+    breaker.record('host', True)
+    assert breaker.state('host') is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call('host')
+    assert exc_info.value.key == 'host'
+    assert exc_info.value.retry_in == 30
+
+    clock.now += 30
+    assert breaker.state('host') is CircuitState.HALF_OPEN
+    breaker.before_call('host')
+    with pytest.raises(CircuitOpenError):  # only one trial call at a time
+        breaker.before_call('host')
+
+    breaker.record('host', True)
+    assert breaker.state('host') is CircuitState.OPEN
+
+    clock.now += 30
+    breaker.before_call('host')
+    breaker.record('host', False)
+    assert breaker.state('host') is CircuitState.CLOSED
+
+    assert [new for _, _, new in changes] == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+
+
+def test_breaker_callback_errors(clock: Clock, caplog: pytest.LogCaptureFixture):
+    seen = []
+
+    def on_state_change(key, old_state, new_state):
+        # Callback lock-dan kənarda çağırılır: başqa thread breaker-i bloklanmadan oxuyur
+        reader = threading.Thread(target=lambda: seen.append(breaker.state(key)))
+        reader.start()
+        reader.join(timeout=1)
+        raise RuntimeError('alert failed')
+
+    breaker = CircuitBreaker(minimum_calls=1, recovery_timeout=30, on_state_change=on_state_change)
+
+    # Callback-in xətası sorğunu dayandırmır və keçidi yarımçıq qoymur
+    breaker.record('host', True)
+    assert breaker.state('host') is CircuitState.OPEN
+    clock.now += 30
+    breaker.before_call('host')
+    breaker.record('host', False)
+
+    assert breaker.state('host') is CircuitState.CLOSED
+    assert seen == [CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED]
+    assert [record.exc_info[1].args for record in caplog.records if record.exc_info] == [
+        ('alert failed',)
+    ] * 3
+
+
+def test_breaker_window(breaker: CircuitBreaker, clock: Clock):
+    for _ in range(3):
+        breaker.record('host', True)
+        clock.now += 6
+
+    # Only the last two failures are still inside the 10s window
+    breaker.record('host', False)
+    breaker.record('host', False)
+    assert breaker.state('host') is CircuitState.CLOSED
+
+    breaker.record('host', True)
+    assert breaker.state('host') is CircuitState.OPEN
+
+    breaker.reset()
+    assert breaker.state('host') is CircuitState.CLOSED
+
+
+def test_breaker_keys():
+    assert CircuitBreaker().key_for('https://api.example.com/pay', 'pay') == 'api.example.com'
+    assert CircuitBreaker(per_route=True).key_for('https://api.example.com/pay', 'pay') == 'pay'
+
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_rate=0)
+
+
+def test_breaker_fast_fails_client(breaker: CircuitBreaker, clock: Clock, mocker: MockerFixture):
+    request = mocker.patch('httpx.Client.request', return_value=Response(502))
+    client = APIClient('breaker', 'https://example.com/', retry=None, circuit_breaker=breaker)
+    client.add_url('pay', 'pay', 'POST')
+    client.add_url('status', 'status', 'GET')
+
+    for _ in range(4):
+        assert client.pay().status_code == 502
+
+    with pytest.raises(CircuitOpenError):
+        client.status()  # the whole host is open
+    assert request.call_count == 4
+
+    client.add_url('other', 'https://other.example.com/', 'GET', circuit_breaker=None)
+    client.other()
+    assert request.call_count == 5
+
+
+def test_breaker_ignores_client_errors(breaker: CircuitBreaker, mocker: MockerFixture):
+    mocker.patch('httpx.Client.request', return_value=Response(404))
+    client = APIClient('breaker', 'https://example.com/', circuit_breaker=breaker)
+    client.add_url('status', 'status', 'GET')
+
+    for _ in range(5):
+        client.status()
+
+    assert breaker.state('example.com') is CircuitState.CLOSED
+
+
+def test_breaker_async(breaker: CircuitBreaker, clock: Clock, mocker: MockerFixture):
+    mocker.patch('httpx.AsyncClient.request', side_effect=httpx.ConnectTimeout('slow'))
+    client = APIClient('breaker', 'https://example.com/', sync=False, circuit_breaker=breaker)
+    client.add_url('pay', 'pay', 'POST')
+
+    async def call():
+        for _ in range(4):
+            with pytest.raises(httpx.ConnectTimeout):
+                await client.pay()
+
+        with pytest.raises(CircuitOpenError):
+            await client.pay()
+
+    asyncio.run(call())
+
+
+def open_circuit(breaker: CircuitBreaker, clock: Clock) -> None:
+    """Circuit-i açır və yarıaçıq vəziyyətə keçirir"""
+    for _ in range(4):
+        breaker.record('example.com', True)
+    clock.now += 30
+    assert breaker.state('example.com') is CircuitState.HALF_OPEN
+
+
+def test_breaker_release(breaker: CircuitBreaker, clock: Clock):
+    open_circuit(breaker, clock)
+
+    breaker.before_call('example.com')
+    breaker.release('example.com')
+    assert breaker.state('example.com') is CircuitState.HALF_OPEN
+
+    # Yer boşaldıqdan sonra yeni sınaq sorğusu buraxılır
+    breaker.before_call('example.com')
+    breaker.record('example.com', False)
+    assert breaker.state('example.com') is CircuitState.CLOSED
+
+    breaker.release('unknown')
+
+
+def test_breaker_cancelled_trial(breaker: CircuitBreaker, clock: Clock):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.5 if request.url.path == '/slow' else 0)
+        return httpx.Response(200)
+
+    client = APIClient(
+        'breaker',
+        'https://example.com/',
+        sync=False,
+        circuit_breaker=breaker,
+        transport=httpx.MockTransport(handler),
+    )
+    client.add_url('slow', 'slow', 'GET')
+    client.add_url('fast', 'fast', 'GET')
+    open_circuit(breaker, clock)
+
+    async def call():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.slow(), 0.05)
+
+        # Ləğv olunmuş sınaq circuit-i yarıaçıq vəziyyətdə ilişdirmir
+        assert breaker.state('example.com') is CircuitState.HALF_OPEN
+        assert (await client.fast()).status_code == 200
+
+    asyncio.run(call())
+    assert breaker.state('example.com') is CircuitState.CLOSED
+
+
+def test_breaker_ignores_deadline(breaker: CircuitBreaker, clock: Clock, mocker: MockerFixture):
+    request = mocker.patch('httpx.Client.request', return_value=Response(200))
+    client = APIClient('breaker', 'https://example.com/', retry=None, circuit_breaker=breaker)
+    client.add_url('status', 'status', 'GET')
+    open_circuit(breaker, clock)
+
+    # Deadline ilk yoxlamadan sonra, sorğu göndərilmədən bitir
+    times = iter([0.0, 0.5])
+    mocker.patch('integrify.deadline.monotonic', lambda: next(times, 2.0))
+    with pytest.raises(DeadlineExceededError):
+        client.status(deadline=1)
+
+    assert request.call_count == 0
+    assert breaker.state('example.com') is CircuitState.HALF_OPEN
+
+    client.status()
+    assert breaker.state('example.com') is CircuitState.CLOSED
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+
+import pytest
+from httpx import Response
+from integrify.api import APIClient
+from integrify.cache import CacheBackend, CachedResponse, MemoryCacheBackend, ResponseCache
+from pytest_mock import MockerFixture
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(mocker: MockerFixture):
+    clock = Clock()
+    mocker.patch('integrify.cache.monotonic', clock)
+    return clock
+
+
+def ok(content: bytes = b'{"ok": true}'):
+    return Response(200, content=content, headers={'Content-Type': 'application/json'})
+
+
+def test_memory_backend_ttl_and_lru(clock: Clock):
+    backend = MemoryCacheBackend(maxsize=2)
+    value = CachedResponse(200, [], b'')
+
+    backend.set('a', value, 10)
+    backend.set('b', value, 10)
+    assert backend.get('a') == value  # `a` ən son istifadə olunan olur
+
+    backend.set('c', value, 10)
+    assert backend.get('b') is None
+    assert len(backend) == 2
+
+    clock.now += 11
+    assert backend.get('a') is None
+    assert backend.get('c') is None
+    assert len(backend) == 0
+
+
+def test_cache_hits_and_invalidation(mocker: MockerFixture):
+    request = mocker.patch('httpx.Client.request', side_effect=lambda *_, **__: ok())
+    cache = ResponseCache()
+    client = APIClient('cache', 'https://example.com/', response_cache=cache)
+    client.add_url('catalog', 'catalog', 'GET', cache_ttl=60)
+    client.add_url('other', 'other', 'GET', cache_ttl=60)
+    client.add_url('orders', 'orders', 'GET')
+
+    assert client.catalog().json() == {'ok': True}
+    assert client.catalog().json() == {'ok': True}
+    assert client.catalog(headers={'x-token': 'other-user'}).is_success
+    assert request.call_count == 2
+    assert cache.stats() == {'hits': 1, 'misses': 2}
+
+    client.orders()
+    client.orders()
+    assert request.call_count == 4  # TTL-i olmayan route cache olunmur
+
+    client.other()
+    client.invalidate_cache('catalog')
+    client.catalog()
+    client.other()
+    assert request.call_count == 6
+
+    client.invalidate_cache()
+    client.other()
+    assert request.call_count == 7
+
+
+def test_cache_only_success_and_get(mocker: MockerFixture):
+    request = mocker.patch('httpx.Client.request', return_value=Response(404))
+    cache = ResponseCache(default_ttl=60)
+    client = APIClient('cache', 'https://example.com/', retry=None, response_cache=cache)
+    client.add_url('missing', 'missing', 'GET')
+    client.add_url('create', 'create', 'POST', cache_ttl=60)
+
+    client.missing()
+    client.missing()
+    client.create()
+    client.create()
+
+    assert request.call_count == 4
+    assert len(cache.backend) == 0
+
+
+def test_cache_key_includes_params():
+    make_key = ResponseCache.make_key
+    key = make_key('route', 'GET', 'https://example.com/a', {'page': 1})
+
+    assert key.startswith('route:')
+    assert key == make_key('route', 'GET', 'https://example.com/a?page=1')
+    assert key != make_key('route', 'GET', 'https://example.com/a', {'page': 2})
+    assert key != make_key('route', 'GET', 'https://example.com/a', {'page': 1}, {'x': '1'})
+
+
+def test_cache_async(mocker: MockerFixture):
+    request = mocker.patch('httpx.AsyncClient.request', side_effect=lambda *_, **__: ok())
+    client = APIClient('cache', 'https://example.com/', sync=False, response_cache=ResponseCache())
+    client.add_url('catalog', 'catalog', 'GET', cache_ttl=60)
+
+    async def main():
+        return [await client.catalog(), await client.catalog()]
+
+    assert all(resp.json() == {'ok': True} for resp in asyncio.run(main()))
+    assert request.call_count == 1
+
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()  # type: ignore[abstract]
+
+
+def test_cache_stats_concurrent():
+    cache = ResponseCache()
+    cache.set('key', Response(200, content=b'{}'), 60)
+
+    def worker():
+        for _ in range(1000):
+            cache.get('key')
+            cache.get('missing')
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.stats() == {'hits': 4000, 'misses': 4000}
@@ -0,0 +1,147 @@
+import asyncio
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from integrify.api import APIClient
+from integrify.cassette import (
+    REDACTED,
+    RecordingTransport,
+    Redactor,
+    ReplayTransport,
+    UnmatchedRequestError,
+    iter_cassette,
+)
+from integrify.testing import Simulator, json_response, request_data, route
+
+
+class OrderSimulator(Simulator):
+    @route('POST', '/token')
+    def token(self, request: httpx.Request) -> httpx.Response:
+        return json_response({'token': 'secret-token', 'ttl': 3600})
+
+    @route('POST', '/orders')
+    def create_order(self, request: httpx.Request) -> httpx.Response:
+        return json_response({'id': self.calls['create_order'], **request_data(request)})
+
+    @route('GET', '/orders/{order_id}')
+    def get_order(self, request: httpx.Request, order_id: str) -> httpx.Response:
+        return httpx.Response(200, content=f'order {order_id}'.encode())
+
+
+@pytest.fixture
+def cassette(tmp_path: Path) -> str:
+    return str(tmp_path / 'orders.cassette')
+
+
+def record(cassette: str) -> OrderSimulator:
+    sim = OrderSimulator(latency=0.01)
+    with httpx.Client(
+        transport=RecordingTransport(cassette, transport=sim.transport()),
+        base_url='https://provider.az',
+    ) as client:
+        assert client.post('/token', json={'user': 'a', 'password': 'p'}).json()['ttl'] == 3600
+        client.post('/orders', json={'amount': 1}, headers={'Authorization': 'Bearer x'})
+        client.post('/orders', json={'amount': 1})
+        client.get('/orders/1', params={'key': 'k', 'full': '1'})
+    return sim
+
+
+def test_record_redacts_secrets(cassette: str):
+    record(cassette)
+    entries = list(iter_cassette(cassette))
+    assert len(entries) == 4
+
+    token = entries[0]
+    assert token['request']['body'] == '{"password":"[REDACTED]","user":"a"}'
+    assert '"token":"[REDACTED]"' in token['response']['body']
+    assert token['elapsed'] >= 0.01
+
+    assert ('authorization', REDACTED) in [tuple(h) for h in entries[1]['request']['headers']]
+    assert entries[3]['request']['url'] == 'https://provider.az/orders/1?full=1&key=%5BREDACTED%5D'
+    assert 'secret-token' not in Path(cassette).read_text()
+
+
+def test_replay(cassette: str):
+    record(cassette)
+    transport = ReplayTransport(cassette)
+    assert len(transport) == 4
+
+    with httpx.Client(transport=transport, base_url='https://provider.az') as client:
+        # Gizli dəyərlər fərqli olsa da, sorğu uyğunlaşır
+        assert client.post('/token', json={'password': 'other', 'user': 'a'}).status_code == 200
+
+        # Eyni açarlı qeydlər sıra ilə, bitdikdə yenidən qaytarılır
+        ids = [client.post('/orders', json={'amount': 1}).json()['id'] for _ in range(3)]
+        assert ids == [1, 2, 1]
+
+        assert client.get('/orders/1', params={'full': '1', 'key': 'k2'}).text == 'order 1'
+
+        with pytest.raises(UnmatchedRequestError):
+            client.get('/orders/2')
+
+
+def test_replay_without_repeat(cassette: str):
+    record(cassette)
+    with httpx.Client(transport=ReplayTransport(cassette, repeat=False)) as client:
+        client.get('https://provider.az/orders/1?full=1&key=k')
+        with pytest.raises(UnmatchedRequestError):
+            client.get('https://provider.az/orders/1?full=1&key=k')
+
+
+def test_replay_latency(cassette: str):
+    record(cassette)
+    transport = ReplayTransport(cassette, latency=1)
+
+    async def main():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await asyncio.gather(
+                *(client.get('https://provider.az/orders/1?full=1&key=k') for _ in range(10))
+            )
+
+    start = time.perf_counter()
+    responses = asyncio.run(main())
+    elapsed = time.perf_counter() - start
+    assert 0.01 <= elapsed < 0.1
+    assert all(response.text == 'order 1' for response in responses)
+
+
+def test_replay_with_api_client(cassette: str):
+    record(cassette)
+
+    client = APIClient('Orders', 'https://provider.az', transport=ReplayTransport(cassette))
+    client.add_url('create_order', '/orders', verb='POST')
+
+    response = client.create_order(amount=1)  # type: ignore[attr-defined]
+    assert response.status_code == 200
+    assert response.json() == {'id': 1, 'amount': 1}
+
+
+def test_match_on(cassette: str):
+    sim = OrderSimulator()
+    redactor = Redactor(fields=['password'])
+    with httpx.Client(
+        transport=RecordingTransport(
+            cassette,
+            transport=sim.transport(),
+            redactor=redactor,
+            match_on=['method', 'url'],
+        )
+    ) as client:
+        client.post('https://provider.az/orders', json={'amount': 1, 'nonce': 1})
+
+    transport = ReplayTransport(cassette, redactor=redactor, match_on=['method', 'url'])
+    with httpx.Client(transport=transport) as client:
+        response = client.post('https://provider.az/orders', json={'amount': 1, 'nonce': 2})
+        assert response.json()['nonce'] == 1
+
+    with pytest.raises(ValueError):
+        ReplayTransport(cassette, match_on=['headers'])
+
+
+def test_empty_cassette(cassette: str):
+    Path(cassette).touch()
+    with httpx.Client(transport=ReplayTransport(cassette)) as client:
+        with pytest.raises(UnmatchedRequestError):
+            client.get('https://provider.az/orders/1')
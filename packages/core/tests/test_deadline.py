@@ -0,0 +1,147 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from integrify.api import APIClient
+from integrify.deadline import (
+    Deadline,
+    DeadlineExceededError,
+    bounded_timeout,
+    current_deadline,
+    deadline,
+)
+from integrify.retry import RetryPolicy
+
+
+def make_client(responses: list, sync: bool = True, **kwds) -> tuple[APIClient, list]:
+    """Göndərilən sorğuları (timeout-ları ilə) qeyd edən klient"""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0) if responses else httpx.Response(200)
+
+    client = APIClient(
+        'deadline',
+        'https://example.com/',
+        sync=sync,
+        transport=httpx.MockTransport(handler),
+        timeout=10,
+        **kwds,
+    )
+    client.add_url('status', 'status', 'GET')
+    client.add_url('fast', 'fast', 'GET', timeout=0.5)
+    client.add_url('unlimited', 'unlimited', 'GET', timeout=None)
+    return client, requests
+
+
+def read_timeout(request: httpx.Request) -> float | None:
+    return request.extensions['timeout']['read']
+
+
+def test_route_timeout():
+    client, requests = make_client([])
+
+    client.status()
+    client.fast()
+    client.unlimited()
+
+    assert [read_timeout(request) for request in requests] == [10, 0.5, None]
+    assert client.request_executor.get_timeout('fast') == 0.5
+    assert client.request_executor.get_timeout('status') == httpx.Timeout(10)
+
+
+def test_call_deadline_shrinks_timeout():
+    client, requests = make_client([])
+
+    client.status(deadline=2)
+    client.fast(deadline=Deadline(2))
+    client.unlimited(deadline=2)
+
+    assert 1.9 < read_timeout(requests[0]) <= 2
+    assert read_timeout(requests[1]) == 0.5
+    assert 1.9 < read_timeout(requests[2]) <= 2
+    assert current_deadline() is None
+
+
+def test_context_deadline():
+    client, requests = make_client([])
+
+    with deadline(5) as outer:
+        assert current_deadline() is outer
+        client.status()
+
+        with deadline(1):
+            client.status()
+            # Daha uzun per-call deadline kontekstdəkini uzatmır
+            client.status(deadline=30)
+
+        with deadline(60) as inner:
+            assert inner is outer
+
+    assert current_deadline() is None
+    assert 4.9 < read_timeout(requests[0]) <= 5
+    assert all(0.9 < read_timeout(request) <= 1 for request in requests[1:])
+
+
+def test_exhausted_deadline_fails_fast():
+    client, requests = make_client([])
+    budget = Deadline(0)
+
+    with pytest.raises(DeadlineExceededError, match='https://example.com/status'):
+        client.status(deadline=budget)
+
+    assert not requests
+    assert isinstance(DeadlineExceededError('url', 0), TimeoutError)
+
+
+def test_deadline_stops_retries():
+    client, requests = make_client(
+        [httpx.Response(503), httpx.Response(503), httpx.Response(200)],
+        retry=RetryPolicy(max_attempts=3, backoff_factor=0.2, jitter=False),
+    )
+
+    # 0.2s gözləmə büdcəyə sığmır: təkrar cəhd olmadan son cavab qaytarılır
+    start = time.perf_counter()
+    assert client.status(deadline=0.1).status_code == 503
+    assert time.perf_counter() - start < 0.1
+    assert len(requests) == 1
+
+    assert client.status(deadline=5).status_code == 200
+    assert len(requests) == 3
+
+
+def test_batch_inherits_deadline():
+    client, requests = make_client([])
+
+    with deadline(3):
+        results = list(client.batch('status', [{}, {}, {}], concurrency=3))
+
+    assert all(result.ok for result in results)
+    assert all(2.9 < read_timeout(request) <= 3 for request in requests)
+
+
+def test_async_deadline():
+    client, requests = make_client([], sync=False)
+
+    async def main():
+        await client.fast(deadline=0.2)
+
+        with deadline(2):
+            await asyncio.gather(client.status(), client.status())
+
+        with pytest.raises(DeadlineExceededError):
+            await client.status(deadline=-1)
+
+    asyncio.run(main())
+
+    assert 0.1 < read_timeout(requests[0]) <= 0.2
+    assert all(1.9 < read_timeout(request) <= 2 for request in requests[1:])
+    assert len(requests) == 3
+
+
+def test_bounded_timeout():
+    timeout = bounded_timeout(httpx.Timeout(5, connect=1, pool=None), 2)
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (1, 2, 2, 2)
+    assert bounded_timeout(None, 3) == httpx.Timeout(3)
@@ -0,0 +1,199 @@
+import asyncio
+import math
+import random
+import time
+
+import httpx
+import pytest
+from integrify.api import APIClient
+from integrify.hedging import HedgePolicy
+from integrify.hooks import RequestRecord
+from integrify.metrics import MetricsRegistry
+from integrify.ratelimit import RateLimiter
+
+FAST = HedgePolicy(percentile=None, delay=0.05, max_extra_load=1)
+
+
+def make_client(plan: list[tuple[float, int]], **kwds) -> tuple[APIClient, list[int]]:
+    """Hər sorğuya `plan`-dakı (gecikmə, status) ilə cavab verən async klient.
+    Plan bitdikdə, sorğular dərhal `200` alır."""
+    started: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        attempt = len(started)
+        started.append(attempt)
+        latency, status = plan[attempt] if attempt < len(plan) else (0, 200)
+        await asyncio.sleep(latency)
+        return httpx.Response(status, json={'attempt': attempt})
+
+    client = APIClient(
+        'hedge',
+        'https://example.com/',
+        sync=False,
+        retry=None,
+        transport=httpx.MockTransport(handler),
+        **kwds,
+    )
+    client.add_url('status', 'status', 'GET')
+    client.add_url('pay', 'pay', 'POST')
+    return client, started
+
+
+def test_hedge_wins():
+    records: list[RequestRecord] = []
+    policy = HedgePolicy(percentile=None, delay=0.05, max_extra_load=1)
+    client, started = make_client([(1, 200), (0, 200)], hedge=policy, hooks=[records.append])
+
+    start = time.perf_counter()
+    response = asyncio.run(client.status())
+
+    assert time.perf_counter() - start < 0.5
+    assert response.json() == {'attempt': 1}
+    assert len(started) == 2
+    assert (records[0].hedges, records[0].hedge_won) == (1, True)
+    assert policy.stats() == {'requests': 1, 'hedges': 1, 'wins': 1, 'throttled': 0}
+
+
+def test_no_hedge_for_fast_response():
+    policy = HedgePolicy(percentile=None, delay=0.2)
+    client, started = make_client([], hedge=policy)
+
+    asyncio.run(client.status())
+
+    assert len(started) == 1
+    assert policy.stats()['hedges'] == 0
+
+
+def test_hedge_waits_for_success():
+    policy = HedgePolicy(percentile=None, delay=0.05, max_extra_load=1)
+    client, started = make_client([(0.1, 503), (0.15, 200)], hedge=policy)
+
+    response = asyncio.run(client.status())
+
+    assert response.status_code == 200
+    assert len(started) == 2
+
+    # Heç bir cavab uğurlu deyilsə, sonuncu qaytarılır
+    client, started = make_client([(0.1, 503), (0.1, 503)], hedge=HedgePolicy(delay=0.05))
+    assert asyncio.run(client.status()).status_code == 503
+
+
+def test_hedge_budget():
+    policy = HedgePolicy(percentile=None, delay=0.01, max_hedges=2, max_extra_load=0.1)
+    client, started = make_client([(0.1, 200)] * 20, hedge=policy)
+
+    async def main():
+        for _ in range(5):
+            await client.status()
+
+    asyncio.run(main())
+
+    # Başlanğıc tokeni və 5 sorğunun 0.5 tokeni yalnız bir hedge-ə imkan verir
+    assert policy.stats()['hedges'] == 1
+    assert policy.stats()['throttled'] == 5
+    assert len(started) == 6
+
+
+def test_hedge_rate_limited():
+    policy = HedgePolicy(percentile=None, delay=0.01, max_extra_load=1)
+    limiter = RateLimiter(1, per=60)
+    client, started = make_client([(0.1, 200)], hedge=policy, rate_limiter=limiter)
+
+    asyncio.run(client.status())
+
+    assert len(started) == 1
+    assert policy.stats() == {'requests': 1, 'hedges': 0, 'wins': 0, 'throttled': 1}
+
+
+def test_hedge_scope():
+    client, started = make_client([(0.2, 200)] * 2)
+    client.set_hedge_policy(FAST, 'status')
+    executor = client.request_executor
+
+    assert executor.get_hedge_policy('status', 'GET') is FAST
+    assert executor.get_hedge_policy('pay', 'POST') is None
+    asyncio.run(client.pay())
+    assert len(started) == 1
+
+    client.add_url('report', 'report', 'POST', idempotent=True, hedge=FAST)
+    assert executor.get_hedge_policy('report', 'POST') is FAST
+
+    client.set_hedge_policy(None, 'status')
+    assert executor.get_hedge_policy('status', 'GET') is None
+
+    sync_client = APIClient('hedge', 'https://example.com/', hedge=FAST)
+    sync_client.add_url('status', 'status', 'GET')
+    assert sync_client.request_executor.get_hedge_policy('status', 'GET') is None
+
+
+def test_hedge_delay_percentile():
+    policy = HedgePolicy(percentile=90, delay=0.5, window=10, min_samples=5)
+    assert policy.get_delay('route') == 0.5
+
+    for latency in range(1, 21):
+        policy.observe('route', latency / 100, hedge_won=False)
+
+    # Yalnız son 10 ölçü (0.11 - 0.20) nəzərə alınır
+    assert policy.get_delay('route') == pytest.approx(0.19)
+    assert policy.get_delay('other') == 0.5
+
+    policy.reset()
+    assert policy.get_delay('route') == 0.5
+
+    with pytest.raises(ValueError):
+        HedgePolicy(percentile=0)
+    with pytest.raises(ValueError):
+        HedgePolicy(max_extra_load=2)
+
+
+def test_hedge_delay_window():
+    policy = HedgePolicy(percentile=95, window=50, min_samples=1)
+    rng = random.Random(7)
+    latencies = [rng.choice([rng.random(), 0.5]) for _ in range(500)]
+
+    # Sıralanmış pəncərə təkrar dəyərlərlə və köhnə ölçülər çıxarıldıqdan sonra da
+    # son `window` ölçünün persentilini verir
+    for count, latency in enumerate(latencies, 1):
+        policy.observe('route', latency, hedge_won=False)
+        window = sorted(latencies[max(0, count - 50) : count])
+        assert policy.get_delay('route') == window[math.ceil(0.95 * len(window)) - 1]
+
+    with pytest.raises(ValueError):
+        HedgePolicy(window=0)
+
+
+def test_hedge_metrics():
+    registry = MetricsRegistry()
+    policy = HedgePolicy(percentile=None, delay=0.05, max_extra_load=1)
+    client, _ = make_client([(1, 200)], hedge=policy, hooks=[registry])
+
+    async def main():
+        await client.status()
+        await client.status()
+
+    asyncio.run(main())
+
+    series = registry.snapshot()[('hedge', 'status', '2xx')]
+    assert (series['count'], series['hedges'], series['hedge_wins']) == (2, 1, 1)
+
+    text = registry.render_prometheus()
+    labels = 'client="hedge",route="status",status="2xx"'
+    assert f'integrify_hedged_requests_total{{{labels}}} 1' in text
+    assert f'integrify_hedge_wins_total{{{labels}}} 1' in text
+
+
+def test_hedge_observes_primary_latency():
+    policy = HedgePolicy(percentile=100, delay=0.05, max_extra_load=1, min_samples=1)
+    client, started = make_client([(0.08, 503), (0.2, 200)], hedge=policy)
+
+    assert asyncio.run(client.status()).status_code == 200
+    assert len(started) == 2
+
+    # Ölçü qalib hedge-in deyil (~0.25s), primary sorğunun öz müddətidir (~0.08s)
+    assert 0.08 <= policy.get_delay('hedge:status') < 0.15
+
+    # Hedge qalib gəldikdə, ləğv olunan primary-nin müddəti gecikmədən az ola bilməz
+    policy.reset()
+    client, _ = make_client([(1, 200), (0, 200)], hedge=policy)
+    asyncio.run(client.status())
+    assert policy.get_delay('hedge:status') >= 0.05
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from httpx import Response
+from integrify.api import APIClient
+from integrify.cache import ResponseCache
+from integrify.hooks import PHASES, RequestRecord
+from pytest_mock import MockerFixture
+
+
+def test_sync_hooks(mocker: MockerFixture):
+    mocker.patch('httpx.Client.request', return_value=Response(201, content=b'{"id": 1}'))
+    records: list[RequestRecord] = []
+    client = APIClient('hooks', 'https://example.com/', hooks=[records.append])
+    client.add_url('create', 'create', 'POST')
+
+    client.create(name='test')
+
+    [record] = records
+    assert (record.client_name, record.route_name, record.verb) == ('hooks', 'create', 'POST')
+    assert record.url == 'https://example.com/create'
+    assert record.status_code == 201
+    assert record.bytes_out == len(b'{"name":"test"}')
+    assert record.bytes_in == len(b'{"id": 1}')
+    assert tuple(record.timings) == PHASES
+    assert record.duration >= sum(record.timings.values())
+    assert record.as_dict()['error'] is None
+
+
+def test_hook_errors(mocker: MockerFixture):
+    mocker.patch('httpx.Client.request', side_effect=ValueError('boom'))
+    records: list[RequestRecord] = []
+
+    def broken_hook(_: RequestRecord):
+        raise RuntimeError('hook failed')
+
+    client = APIClient('hooks', 'https://example.com/', retry=None)
+    client.add_url('create', 'create', 'POST')
+    client.add_hook(broken_hook)
+    client.add_hook(records.append)
+
+    # Sorğunun xətası hook-lara ötürülür, hook-un öz xətası isə sorğuya təsir etmir
+    with pytest.raises(ValueError):
+        client.create()
+    assert isinstance(records[0].error, ValueError)
+    assert records[0].status_code is None
+    assert 'network' not in records[0].timings
+
+    client.remove_hook(broken_hook)
+    client.remove_hook(records.append)
+    assert not client.request_executor.hooks
+
+    async def async_hook(_: RequestRecord):
+        pass
+
+    with pytest.raises(TypeError):
+        client.add_hook(async_hook)
+
+
+def test_hooks_cache_and_coalesce(mocker: MockerFixture):
+    mocker.patch('httpx.Client.request', return_value=Response(200, content=b'{}'))
+    records: list[RequestRecord] = []
+    client = APIClient('hooks', 'https://example.com/', response_cache=ResponseCache())
+    client.add_url('catalog', 'catalog', 'GET', cache_ttl=60)
+    client.add_hook(records.append)
+
+    client.catalog()
+    client.catalog()
+
+    assert [record.cache_hit for record in records] == [False, True]
+    assert records[1].status_code == 200
+
+
+def test_async_hooks(mocker: MockerFixture):
+    async def slow_request(*_, **__):
+        await asyncio.sleep(0.01)
+        return Response(200, content=b'{}')
+
+    mocker.patch('httpx.AsyncClient.request', side_effect=slow_request)
+    records: list[RequestRecord] = []
+
+    async def async_hook(record: RequestRecord):
+        await asyncio.sleep(0)
+        records.append(record)
+
+    client = APIClient('hooks', 'https://example.com/', sync=False, hooks=[async_hook])
+    client.add_url('status', 'status', 'GET', coalesce=True)
+    client.add_hook(records.append)
+
+    async def main():
+        await asyncio.gather(*(client.status(order_id=1) for _ in range(3)))
+
+    asyncio.run(main())
+
+    assert len(records) == 6
+    assert all(record.status_code == 200 for record in records)
+    assert sum(record.coalesced for record in records) == 4  # 2 birləşdirilmiş çağırış x 2 hook
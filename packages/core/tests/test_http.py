@@ -0,0 +1,162 @@
+import asyncio
+
+import httpx
+import pytest
+from integrify import api
+from integrify.api import APIClient
+
+
+def echo(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={'path': request.url.path})
+
+
+def test_transport_and_limits():
+    limits = httpx.Limits(max_connections=5, max_keepalive_connections=2, keepalive_expiry=1)
+    timeout = httpx.Timeout(5, connect=1, pool=2)
+    client = APIClient(
+        'http',
+        'https://example.com/',
+        timeout=timeout,
+        limits=limits,
+        transport=httpx.MockTransport(echo),
+    )
+    client.add_url('route', 'route', 'GET')
+
+    assert client.route().json() == {'path': '/route'}
+    assert client.request_executor.client.timeout == timeout
+
+
+def test_async_transport():
+    client = APIClient(
+        'http', 'https://example.com/', sync=False, transport=httpx.MockTransport(echo)
+    )
+    client.add_url('route', 'route', 'GET')
+
+    async def call():
+        async with client:
+            return await client.route()
+
+    assert asyncio.run(call()).json() == {'path': '/route'}
+
+
+def test_injected_client_is_shared():
+    shared = httpx.Client(transport=httpx.MockTransport(echo))
+    first = APIClient('first', 'https://example.com/', http_client=shared)
+    second = APIClient('second', 'https://example.com/', http_client=shared)
+    first.add_url('route', 'route', 'GET')
+
+    assert first.request_executor.client is second.request_executor.client is shared
+
+    first.close()
+    assert not shared.is_closed
+    assert first.route().is_success
+
+    first.configure_http(timeout=1)  # settings of an injected client are left alone
+    assert first.request_executor.client is shared
+
+    first.configure_http(http_client=None)
+    assert first.request_executor.client is not shared
+    first.close()
+    shared.close()
+
+
+def test_configure_http_recreates_client():
+    client = APIClient('http', 'https://example.com/')
+    old = client.request_executor.client
+
+    client.configure_http(transport=httpx.MockTransport(echo), timeout=3)
+    client.add_url('route', 'route', 'GET')
+
+    assert old.is_closed
+    assert client.route().is_success
+    assert client.request_executor.client.timeout == httpx.Timeout(3)
+    client.close()
+
+
+def test_http_settings_validation(monkeypatch):
+    with pytest.raises(TypeError):
+        APIClient('http', http_client=httpx.AsyncClient())
+    with pytest.raises(TypeError):
+        APIClient('http', sync=False, transport=httpx.HTTPTransport())
+
+    monkeypatch.setattr(api, 'h2', None)
+    with pytest.raises(ImportError):
+        APIClient('http', http2=True)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = api.TransportRegistry()
+    monkeypatch.setattr(api, 'TRANSPORT_REGISTRY', registry)
+    return registry
+
+
+def test_shared_pool(registry: api.TransportRegistry, mocker):
+    handle = mocker.patch.object(
+        httpx.HTTPTransport, 'handle_request', return_value=httpx.Response(200)
+    )
+    first = APIClient('first', 'https://example.com/')
+    second = APIClient('second', 'https://example.com/')
+    other = APIClient('other', 'https://other.example.com/')
+    for client in (first, second, other):
+        client.add_url('route', 'route', 'GET')
+        client.route()
+
+    assert handle.call_count == 3
+    assert len(registry) == 2
+
+    first.close()
+    assert len(registry) == 2  # still used by `second`
+    second.close()
+    assert len(registry) == 1
+
+    api.shutdown(registry)
+    assert len(registry) == 0
+
+    assert other.route().is_success  # a new pool is created on demand
+    assert len(registry) == 1
+    other.close()
+    assert len(registry) == 0
+
+
+def test_shared_pool_per_event_loop(registry: api.TransportRegistry, mocker):
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport, 'handle_async_request', return_value=httpx.Response(200)
+    )
+    client = APIClient('async', 'https://example.com/', sync=False)
+    client.add_url('route', 'route', 'GET')
+
+    assert asyncio.run(client.route()).is_success
+    assert len(registry) == 1
+
+    async def in_new_loop():
+        resp = await client.route()
+        assert len(registry) == 1  # the pool of the closed loop is dropped
+        await client.aclose()
+        return resp
+
+    assert asyncio.run(in_new_loop()).is_success
+    assert len(registry) == 0
+
+
+def test_ashutdown(registry: api.TransportRegistry, mocker):
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport, 'handle_async_request', return_value=httpx.Response(200)
+    )
+    aclose = mocker.patch.object(httpx.AsyncHTTPTransport, 'aclose')
+    client = APIClient('async', 'https://example.com/', sync=False)
+    client.add_url('route', 'route', 'GET')
+
+    async def call():
+        await client.route()
+        await api.ashutdown(registry)
+
+    asyncio.run(call())
+    assert len(registry) == 0
+    aclose.assert_awaited_once()
+
+
+def test_shared_pool_disabled(registry: api.TransportRegistry):
+    client = APIClient('private', 'https://example.com/', shared_pool=False)
+    assert isinstance(client.request_executor.client._transport, httpx.HTTPTransport)
+    client.close()
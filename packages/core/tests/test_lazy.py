@@ -0,0 +1,64 @@
+import importlib.util
+import json
+import subprocess
+import sys
+import types
+
+import pytest
+from integrify.lazy import lazy_exports
+
+PACKAGES = ['epoint', 'kapitalbank', 'azericard', 'clopos', 'lsim', 'postaguvercini']
+
+IMPORT_BUDGET_MS = 50
+"""`import integrify.<paket>` üçün maksimum müddət. Lazy export-lar olmadan bu, klient,
+handler və schema-ların importu ilə 300 ms-dən çox çəkir."""
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import integrify.{name}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{'elapsed': elapsed, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def test_lazy_exports():
+    module = types.ModuleType('integrify_lazy_test')
+    sys.modules[module.__name__] = module
+    try:
+        module.__getattr__, module.__dir__ = lazy_exports(  # type: ignore[attr-defined]
+            module.__name__,
+            {'dumps': 'json', 'JSONError': 'json:JSONDecodeError'},
+        )
+
+        assert module.dumps is json.dumps
+        assert 'dumps' in vars(module)
+        assert module.JSONError is json.JSONDecodeError
+        assert {'dumps', 'JSONError'} <= set(dir(module))
+
+        with pytest.raises(AttributeError, match='has no attribute'):
+            module.unknown  # noqa: B018
+    finally:
+        del sys.modules[module.__name__]
+
+
+@pytest.mark.parametrize('name', PACKAGES)
+def test_import_time(name: str):
+    if importlib.util.find_spec(f'integrify.{name}') is None:
+        pytest.skip(f'integrify-{name} is not installed')
+
+    output = subprocess.run(
+        [sys.executable, '-W', 'ignore', '-c', _IMPORT_SCRIPT.format(name=name)],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    result = json.loads(output)
+
+    assert not [module for module in result['modules'] if module.startswith(f'integrify.{name}.')]
+    assert 'pydantic' not in result['modules']
+    assert result['elapsed'] < IMPORT_BUDGET_MS
+
+    package = importlib.import_module(f'integrify.{name}')
+    for export in package.__all__:
+        assert getattr(package, export) is not None
@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+from httpx import Response
+from integrify.api import APIClient
+from integrify.hooks import RequestRecord
+from integrify.metrics import MetricsRegistry, render_prometheus, status_class
+from pytest_mock import MockerFixture
+
+
+def make_record(status_code: int | None, duration: float, route: str = 'pay') -> RequestRecord:
+    record = RequestRecord('epoint', route, 'POST', 'https://example.com/pay')
+    record.status_code = status_code
+    record.duration = duration
+    record.bytes_out = 10
+    record.bytes_in = 20
+    record.timings['network'] = duration
+    return record
+
+
+def test_registry_observe():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry(make_record(200, 0.05))
+    registry(make_record(201, 0.1))
+    registry(make_record(503, 2.0))
+    registry(make_record(None, 0.5))
+
+    snapshot = registry.snapshot()
+    ok = snapshot[('epoint', 'pay', '2xx')]
+    assert ok['count'] == 2
+    assert ok['buckets'] == {0.1: 2, 1.0: 0, float('inf'): 0}
+    assert ok['bytes_in'] == 40
+    assert ok['phases']['network'] == pytest.approx(0.15)
+    assert snapshot[('epoint', 'pay', '5xx')]['buckets'][float('inf')] == 1
+    assert snapshot[('epoint', 'pay', 'error')]['count'] == 1
+    assert status_class(make_record(404, 0)) == '4xx'
+
+    registry.reset()
+    assert registry.snapshot() == {}
+
+
+def test_registry_concurrent_updates():
+    registry = MetricsRegistry()
+
+    def worker():
+        for _ in range(1000):
+            registry.observe(make_record(200, 0.01))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert registry.snapshot()[('epoint', 'pay', '2xx')]['count'] == 4000
+
+
+def test_render_prometheus(mocker: MockerFixture):
+    mocker.patch('httpx.Client.request', return_value=Response(200, content=b'{}'))
+    registry = MetricsRegistry(buckets=(0.5, 1.0))
+    client = APIClient('kapital"bank', 'https://example.com/', hooks=[registry])
+    client.add_url('order', 'order', 'GET')
+
+    client.order()
+    client.order()
+
+    text = render_prometheus(registry)
+    labels = 'client="kapital\\"bank",route="order",status="2xx"'
+    assert '# TYPE integrify_requests_total counter' in text
+    assert f'integrify_requests_total{{{labels}}} 2' in text
+    assert f'integrify_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f'integrify_request_duration_seconds_count{{{labels}}} 2' in text
+    assert f'integrify_response_bytes_total{{{labels}}} 4' in text
+    assert f'integrify_request_phase_seconds_total{{{labels},phase="network"}}' in text
+    assert text.endswith('\n')
@@ -0,0 +1,150 @@
+import asyncio
+
+import httpx
+import pytest
+from integrify.api import APIClient
+from integrify.deadline import DeadlineExceededError
+from integrify.ratelimit import RateLimiter, RateLimitTimeoutError
+from pytest_mock import MockerFixture
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(mocker: MockerFixture):
+    clock = Clock()
+    mocker.patch('integrify.ratelimit.monotonic', clock)
+    mocker.patch('integrify.ratelimit.time.sleep', side_effect=clock.sleep)
+    return clock
+
+
+def test_token_bucket(clock: Clock):
+    limiter = RateLimiter(2, burst=2)
+
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    assert not limiter.try_acquire()
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert limiter.acquire() == pytest.approx(0.5)
+
+    clock.now += 10  # bucket refills up to its burst only
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+    with pytest.raises(ValueError):
+        limiter.acquire(3)
+
+
+def test_from_spec():
+    assert RateLimiter.from_spec(None) is None
+    assert RateLimiter.from_spec(' ') is None
+    assert RateLimiter.from_spec('5').rate == 5
+    assert RateLimiter.from_spec('600/m').rate == 10
+    assert RateLimiter.from_spec('600/m').burst == 10
+    assert RateLimiter.from_spec('36 / hour').rate == 0.01
+    assert RateLimiter.from_spec('36/h').burst == 1
+
+    for spec in ('fast', '10/week', '0/s'):
+        with pytest.raises(ValueError):
+            RateLimiter.from_spec(spec)
+
+
+def test_client_and_route_limiters(clock: Clock, mocker: MockerFixture):
+    mocker.patch('httpx.Client.request')
+    client_limiter = RateLimiter(10, burst=1)
+    route_limiter = RateLimiter(1, burst=1)
+
+    client = APIClient('limited', 'https://example.com/', rate_limiter=client_limiter)
+    client.add_url('slow', 'slow', 'GET', rate_limiter=route_limiter)
+    client.add_url('fast', 'fast', 'GET')
+
+    start = clock.now
+    client.fast()
+    client.fast()
+    assert clock.now - start == pytest.approx(0.1)
+
+    client.slow()
+    client.slow()
+    assert clock.now - start == pytest.approx(1.2)  # both buckets are waited for
+
+
+def test_async_limiter(mocker: MockerFixture):
+    sleep = mocker.patch('integrify.ratelimit.asyncio.sleep')
+    mocker.patch('httpx.AsyncClient.request')
+
+    client = APIClient('limited', 'https://example.com/', sync=False)
+    client.add_url('route', 'url', 'GET', rate_limiter=RateLimiter(1, per=60))
+
+    async def call():
+        await client.route()
+        await client.route()
+
+    asyncio.run(call())
+    sleep.assert_awaited_once()
+    assert sleep.await_args.args[0] == pytest.approx(60, abs=0.1)
+
+
+def test_acquire_timeout(clock: Clock):
+    limiter = RateLimiter(1, burst=1)
+    limiter.acquire()
+
+    with pytest.raises(RateLimitTimeoutError) as exc_info:
+        limiter.acquire(timeout=0.5)
+    assert exc_info.value.wait == pytest.approx(1)
+
+    # Uğursuz çağırış token rezerv etmir
+    assert limiter.acquire(timeout=1) == pytest.approx(1)
+
+
+def test_shared():
+    limiter = RateLimiter.shared('provider', '10/s')
+
+    assert RateLimiter.shared('provider', ' 10/s ') is limiter
+    assert RateLimiter.shared('other', '10/s') is not limiter
+    assert RateLimiter.shared('provider', '') is None
+
+
+def test_limiter_respects_deadline():
+    requests: list[httpx.Request] = []
+    limiter = RateLimiter(1, per=60)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    client = APIClient(
+        'limited',
+        'https://example.com/',
+        rate_limiter=limiter,
+        transport=httpx.MockTransport(handler),
+    )
+    client.add_url('route', 'url', 'GET')
+    client.route()
+
+    # Növbəti token 60s sonra hazır olur: gözləmədən deadline xətası qaldırılır
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        client.route(deadline=1)
+    assert exc_info.value.overrun == pytest.approx(59, abs=0.1)
+    assert len(requests) == 1
+
+    async_client = APIClient(
+        'limited',
+        'https://example.com/',
+        sync=False,
+        rate_limiter=limiter,
+        transport=httpx.MockTransport(handler),
+    )
+    async_client.add_url('route', 'url', 'GET')
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(async_client.route(deadline=1))
+    assert len(requests) == 1
@@ -0,0 +1,169 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from httpx import Response
+from integrify.api import APIClient
+from integrify.retry import RetryPolicy, parse_retry_after
+from pytest_mock import MockerFixture
+
+NO_WAIT = RetryPolicy(max_attempts=3, backoff_factor=0)
+
+
+@pytest.fixture
+def retry_client():
+    return APIClient('retry', 'https://example.com/', retry=NO_WAIT)
+
+
+def unavailable(**headers):
+    return Response(status_code=503, headers=headers)
+
+
+@pytest.mark.parametrize(
+    ('verb', 'idempotent', 'calls'),
+    [
+        ('GET', None, 3),
+        ('POST', None, 1),
+        ('POST', True, 3),
+        ('GET', False, 1),
+    ],
+)
+def test_retry_idempotency(retry_client: APIClient, mocker: MockerFixture, verb, idempotent, calls):
+    request = mocker.patch('httpx.Client.request', return_value=unavailable())
+    retry_client.add_url('route', 'url', verb, idempotent=idempotent)
+
+    resp = retry_client.route()
+
+    assert request.call_count == calls
+    assert resp.status_code == 503
+
+
+def test_retry_until_success(retry_client: APIClient, test_ok_response, mocker: MockerFixture):
+    request = mocker.patch(
+        'httpx.Client.request',
+        side_effect=[httpx.ConnectError('refused'), unavailable(), test_ok_response],
+    )
+    retry_client.add_url('status', 'url', 'GET')
+
+    assert retry_client.status().is_success
+    assert request.call_count == 3
+
+
+def test_retry_exhausted_raises(retry_client: APIClient, mocker: MockerFixture):
+    request = mocker.patch('httpx.Client.request', side_effect=httpx.ReadTimeout('slow'))
+    retry_client.add_url('status', 'url', 'GET')
+
+    with pytest.raises(httpx.ReadTimeout):
+        retry_client.status()
+
+    assert request.call_count == 3
+
+
+def test_retry_not_on_unlisted(retry_client: APIClient, mocker: MockerFixture):
+    request = mocker.patch('httpx.Client.request', side_effect=httpx.UnsupportedProtocol('ftp'))
+    retry_client.add_url('status', 'url', 'GET')
+
+    with pytest.raises(httpx.UnsupportedProtocol):
+        retry_client.status()
+
+    assert request.call_count == 1
+
+
+def test_retry_per_route_policy(retry_client: APIClient, mocker: MockerFixture):
+    request = mocker.patch('httpx.Client.request', return_value=unavailable())
+    retry_client.add_url('once', 'url', 'GET', retry=None)
+    retry_client.add_url('twice', 'url', 'GET', retry=RetryPolicy(2, backoff_factor=0))
+
+    retry_client.once()
+    assert request.call_count == 1
+
+    retry_client.twice()
+    assert request.call_count == 3
+
+    retry_client.set_retry_policy(None)
+    retry_client.add_url('default', 'url', 'GET')
+    retry_client.default()
+    assert request.call_count == 4
+
+    retry_client.set_retry_policy(NO_WAIT, 'once')
+    retry_client.once()
+    assert request.call_count == 7
+
+
+def test_no_retry_by_default(mocker: MockerFixture):
+    request = mocker.patch('httpx.Client.request', return_value=unavailable())
+    client = APIClient('retry', 'https://example.com/')
+    client.add_url('status', 'url', 'GET')
+    client.add_url('update', 'url', 'PUT')
+
+    client.status()
+    client.update()
+    assert request.call_count == 2
+
+    # Təkrar yalnız açıq şəkildə işarələnmiş endpoint üçün aktivdir
+    client.add_url('status', 'url', 'GET', retry=NO_WAIT)
+    client.status()
+    assert request.call_count == 5
+
+
+def test_route_options_merged(mocker: MockerFixture):
+    request = mocker.patch('httpx.Client.request', return_value=unavailable())
+    client = APIClient('retry', 'https://example.com/')
+
+    # `add_url`-dan əvvəl təyin olunmuş siyasət itmir
+    client.set_retry_policy(NO_WAIT, 'status')
+    client.add_url('status', 'url', 'GET', coalesce=True)
+    client.status()
+    assert request.call_count == 3
+
+    client.add_url('status', 'url', 'GET', timeout=5)
+    options = client.request_executor.routes['status']
+    assert (options['retry'], options['coalesce'], options['timeout']) == (NO_WAIT, True, 5)
+
+
+def test_retry_after(retry_client: APIClient, mocker: MockerFixture):
+    sleep = mocker.patch('time.sleep')
+    request = mocker.patch(
+        'httpx.Client.request',
+        side_effect=[unavailable(**{'Retry-After': '2'}), unavailable(**{'Retry-After': '120'})],
+    )
+    retry_client.add_url('status', 'url', 'GET')
+
+    assert retry_client.status().status_code == 503
+    assert request.call_count == 2
+    sleep.assert_called_once_with(2.0)
+
+
+def test_retry_async(test_ok_response, mocker: MockerFixture):
+    request = mocker.patch(
+        'httpx.AsyncClient.request',
+        side_effect=[unavailable(), test_ok_response],
+    )
+    client = APIClient('retry', 'https://example.com/', sync=False, retry=NO_WAIT)
+    client.add_url('status', 'url', 'GET')
+
+    assert asyncio.run(client.status()).is_success
+    assert request.call_count == 2
+
+
+def test_backoff_delay():
+    policy = RetryPolicy(backoff_factor=1, backoff_max=5, jitter=False)
+    assert [policy.get_delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+    policy = RetryPolicy(backoff_factor=1, backoff_max=5)
+    assert all(0 <= policy.get_delay(3) <= 4 for _ in range(20))
+
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after('-3') == 0.0
+    assert parse_retry_after('soon') is None
+
+    date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    assert 55 <= parse_retry_after(date) <= 60
@@ -0,0 +1,219 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from httpx import Response
+from integrify.api import APIClient, _copy_result
+from integrify.deadline import DeadlineExceededError
+from integrify.schemas import APIResponse, LazyAPIResponse
+from integrify.singleflight import AsyncSingleFlight, SingleFlight
+from pytest_mock import MockerFixture
+
+
+def test_sync_coalescing(mocker: MockerFixture):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_request(*_, **__):
+        started.set()
+        release.wait(5)
+        return Response(200, json={'status': 'paid'})
+
+    request = mocker.patch('httpx.Client.request', side_effect=slow_request)
+    client = APIClient('flight', 'https://example.com/')
+    client.add_url('status', 'status', 'GET', coalesce=True)
+    client.add_url('create', 'create', 'POST')
+
+    with ThreadPoolExecutor(4) as pool:
+        leader = pool.submit(client.status, order_id=1)
+        started.wait(5)
+        followers = [pool.submit(client.status, order_id=1) for _ in range(3)]
+        threading.Timer(0.1, release.set).start()
+        results = [leader.result(), *(f.result() for f in followers)]
+
+    assert request.call_count == 1
+    assert all(resp.json() == {'status': 'paid'} for resp in results)
+    # Hər çağırış cavabın öz nüsxəsini alır: dəyişikliklər digərlərinə keçmir
+    assert len({id(resp) for resp in results}) == len(results)
+    results[1].headers['X-Changed'] = '1'
+    assert 'X-Changed' not in results[0].headers
+    assert len(client.request_executor.flights) == 0
+
+    client.create()
+    client.create()
+    assert request.call_count == 3
+
+
+def test_single_flight_shares_result_and_error():
+    flights = SingleFlight()
+    entered, release = threading.Event(), threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        entered.set()
+        release.wait(5)
+        return object()
+
+    with ThreadPoolExecutor(3) as pool:
+        leader = pool.submit(flights.do, 'key', func)
+        entered.wait(5)
+        followers = [pool.submit(flights.do, 'key', func) for _ in range(2)]
+        threading.Timer(0.1, release.set).start()
+        results = {id(leader.result()), *(id(f.result()) for f in followers)}
+
+    assert len(calls) == 1
+    assert len(results) == 1
+
+    def fail():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        flights.do('key', fail)
+    assert len(flights) == 0
+
+
+def test_async_coalescing(mocker: MockerFixture):
+    async def slow_request(*_, **__):
+        await asyncio.sleep(0.01)
+        return Response(200, json={'status': 'paid'})
+
+    request = mocker.patch('httpx.AsyncClient.request', side_effect=slow_request)
+    client = APIClient('flight', 'https://example.com/', sync=False)
+    client.add_url('status', 'status', 'GET', coalesce=True)
+    client.add_url('other', 'status', 'GET')
+
+    async def main():
+        same = await asyncio.gather(*(client.status(order_id=1) for _ in range(5)))
+        different = await asyncio.gather(client.status(order_id=2), client.status(order_id=3))
+        opted_out = await asyncio.gather(client.other(), client.other())
+        return same, different, opted_out
+
+    same, different, opted_out = asyncio.run(main())
+
+    assert request.call_count == 1 + 2 + 2
+    assert all(resp.json() == {'status': 'paid'} for resp in same)
+    assert len({id(resp) for resp in same}) == len(same)
+    assert different[0] is not different[1]
+    assert opted_out[0] is not opted_out[1]
+
+
+def test_async_single_flight_cancel_and_error():
+    flights = AsyncSingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError('boom')
+
+    async def main():
+        leader = asyncio.create_task(flights.do('key', func))
+        follower = asyncio.create_task(flights.do('key', func))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        # İlk çağırış ləğv olunduqda, gözləyən çağırış funksiyanı özü icra edir
+        assert await follower == 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        results = await asyncio.gather(
+            flights.do('error', fail), flights.do('error', fail), return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(flights) == 0
+
+    asyncio.run(main())
+
+
+def test_coalescing_is_opt_in(mocker: MockerFixture):
+    request = mocker.patch('httpx.AsyncClient.request', return_value=Response(200))
+    client = APIClient('flight', 'https://example.com/', sync=False)
+    client.add_url('status', 'status', 'GET')
+    executor = client.request_executor
+
+    async def main():
+        await asyncio.gather(client.status(), client.status())
+
+    asyncio.run(main())
+    assert request.call_count == 2
+    assert not executor.should_coalesce('status', 'GET')
+
+    client.set_coalesce('status')
+    assert executor.should_coalesce('status', 'GET')
+    client.set_coalesce('status', False)
+    assert not executor.should_coalesce('status', 'GET')
+
+    # Qeyri-idempotent sorğular işarələnsə belə birləşdirilmir
+    client.add_url('pay', 'pay', 'POST', coalesce=True)
+    assert not executor.should_coalesce('pay', 'POST')
+    client.add_url('paid', 'paid', 'POST', idempotent=True, coalesce=True)
+    assert executor.should_coalesce('paid', 'POST')
+    executor.coalesce = False
+    assert not executor.should_coalesce('paid', 'POST')
+
+
+def test_coalesced_results_are_copied():
+    def parse(response: Response) -> APIResponse[dict]:
+        return APIResponse[dict].model_validate(response, from_attributes=True)
+
+    response = parse(Response(200, json={'items': [1]}))
+    _copy_result(response).body['items'].append(2)
+    assert response.body == {'items': [1]}
+
+    lazy = LazyAPIResponse(Response(200, json={'items': [1]}), parse)
+    lazy.body['items'].append(2)
+    assert _copy_result(lazy).body == {'items': [1]}
+
+
+def test_follower_deadline():
+    release = threading.Event()
+
+    def sync_handler(request: httpx.Request) -> httpx.Response:
+        release.wait(5)
+        return httpx.Response(200)
+
+    client = APIClient(
+        'flight', 'https://example.com/', transport=httpx.MockTransport(sync_handler)
+    )
+    client.add_url('status', 'status', 'GET', coalesce=True)
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(client.status)
+        while not len(client.request_executor.flights):
+            time.sleep(0.001)
+
+        # Gözləyən çağırış öz deadline-ını gözləyir, davam edən sorğu isə davam edir
+        start = time.perf_counter()
+        with pytest.raises(DeadlineExceededError):
+            client.status(deadline=0.05)
+        assert time.perf_counter() - start < 1
+
+        release.set()
+        assert leader.result().status_code == 200
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.3)
+        return httpx.Response(200)
+
+    async_client = APIClient(
+        'flight', 'https://example.com/', sync=False, transport=httpx.MockTransport(async_handler)
+    )
+    async_client.add_url('status', 'status', 'GET', coalesce=True)
+
+    async def main():
+        leader = asyncio.ensure_future(async_client.status())
+        await asyncio.sleep(0.01)
+        with pytest.raises(DeadlineExceededError):
+            await async_client.status(deadline=0.05)
+        assert not leader.done()
+        assert (await leader).status_code == 200
+
+    asyncio.run(main())
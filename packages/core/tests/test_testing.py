@@ -0,0 +1,178 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from integrify.api import APIClient
+from integrify.testing import (
+    Simulator,
+    json_response,
+    request_data,
+    route,
+    sample_model,
+    simulator,
+)
+from pydantic import BaseModel, Field
+
+
+class EchoSimulator(Simulator):
+    name = 'echo'
+
+    @route('POST', '/api/items')
+    def create_item(self, request: httpx.Request) -> httpx.Response:
+        return json_response(request_data(request), 201)
+
+    @route('GET', '/api/items/{item_id}')
+    def get_item(self, request: httpx.Request, item_id: str) -> httpx.Response:
+        return json_response({'id': item_id, **request_data(request)})
+
+    @route('GET', '/api/items/latest')
+    def get_latest(self, request: httpx.Request) -> httpx.Response:
+        self.send_callback('POST', 'http://merchant/callback', json={'latest': True})
+        return json_response({'id': 'latest'})
+
+
+def test_routing():
+    sim = EchoSimulator()
+    client = httpx.Client(transport=sim.transport(), base_url='https://provider.az/v1')
+
+    assert client.post('/api/items', json={'name': 'a'}).json() == {'name': 'a'}
+    assert client.get('/api/items/5', params={'full': '1'}).json() == {'id': '5', 'full': '1'}
+    assert client.get('/api/items/latest').json() == {'id': 'latest'}
+    assert client.delete('/api/items/5').status_code == 405
+    assert client.get('/api/unknown').status_code == 404
+
+    assert sim.calls == {'create_item': 1, 'get_item': 1, 'get_latest': 1}
+    assert len(sim.callbacks) == 1
+
+    sim.reset()
+    assert not sim.calls
+    assert not sim.callbacks
+
+
+def test_request_data_form():
+    request = httpx.Request('POST', 'https://provider.az', data={'a': '1', 'b': '2'})
+    assert request_data(request) == {'a': '1', 'b': '2'}
+
+
+def test_faults():
+    sim = EchoSimulator(error_rate=1, error_status=502)
+    assert sim.handle(httpx.Request('GET', 'https://provider.az/api/items/1')).status_code == 502
+
+    sim = EchoSimulator(timeout_rate=1)
+    with pytest.raises(httpx.ReadTimeout):
+        sim.handle(httpx.Request('GET', 'https://provider.az/api/items/1'))
+
+    with pytest.raises(ValueError):
+        EchoSimulator(error_rate=2)
+
+    with pytest.raises(ValueError):
+        EchoSimulator(latency=-1)
+
+
+def test_seeded_faults_are_reproducible():
+    def statuses(seed):
+        sim = EchoSimulator(error_rate=0.5, jitter=0.001, seed=seed)
+        request = httpx.Request('GET', 'https://provider.az/api/items/1')
+        return [sim.handle(request).status_code for _ in range(20)]
+
+    assert statuses(1) == statuses(1)
+    assert set(statuses(1)) == {200, 503}
+
+
+def test_latency():
+    sim = EchoSimulator(latency=0.02)
+    start = time.perf_counter()
+    sim.handle(httpx.Request('GET', 'https://provider.az/api/items/1'))
+    assert time.perf_counter() - start >= 0.02
+
+
+def test_async_latency_does_not_block():
+    sim = EchoSimulator(latency=0.05)
+
+    async def run():
+        async with httpx.AsyncClient(transport=sim.transport()) as client:
+            return await asyncio.gather(
+                *(client.get(f'https://provider.az/api/items/{i}') for i in range(10))
+            )
+
+    start = time.perf_counter()
+    responses = asyncio.run(run())
+    assert time.perf_counter() - start < 0.4
+    assert [r.json()['id'] for r in responses] == [str(i) for i in range(10)]
+
+
+def test_asgi():
+    sim = EchoSimulator()
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'{"name": "a"}', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        'type': 'http',
+        'method': 'POST',
+        'scheme': 'http',
+        'server': ('127.0.0.1', 8000),
+        'path': '/api/items',
+        'query_string': b'',
+        'headers': [(b'content-type', b'application/json')],
+    }
+    asyncio.run(sim(scope, receive, send))
+
+    assert messages[0]['status'] == 201
+    assert messages[1]['body'] == b'{"name":"a"}'
+
+
+def test_asgi_timeout():
+    sim = EchoSimulator(timeout_rate=1)
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b''}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {'type': 'http', 'method': 'GET', 'path': '/api/items/1', 'headers': []}
+    asyncio.run(sim(scope, receive, send))
+    assert messages[0]['status'] == 504
+
+
+def test_on_callback():
+    received = []
+    sim = EchoSimulator(on_callback=received.append)
+    sim.handle(httpx.Request('GET', 'https://provider.az/api/items/latest'))
+
+    assert received == sim.callbacks
+    assert received[0].url == 'http://merchant/callback'
+
+
+def test_with_api_client():
+    sim = EchoSimulator()
+    client = APIClient('Echo', 'https://provider.az', transport=sim.transport())
+    client.add_url('create_item', '/api/items', verb='POST')
+
+    response = client.create_item(name='a')  # type: ignore[attr-defined]
+    assert response.status_code == 201
+    assert sim.calls['create_item'] == 1
+
+
+def test_simulator_registry():
+    with pytest.raises(ValueError, match='Unknown simulator'):
+        simulator('unknown')
+
+
+def test_sample_model():
+    class Item(BaseModel):
+        name: str = Field(min_length=3, max_length=5)
+        count: int = Field(gt=10)
+        tags: list[str]
+        note: str | None = None
+
+    data = sample_model(Item)
+    assert Item.model_validate(data)
+    assert set(sample_model(Item, required_only=True)) == {'name', 'count', 'tags'}
@@ -0,0 +1,81 @@
+import pytest
+from httpx import Response
+from integrify import tracing
+from integrify.api import APIClient
+from integrify.hooks import PHASES
+from integrify.tracing import RequestTracer
+from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def exporter():
+    sdk_trace = pytest.importorskip('opentelemetry.sdk.trace')
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    exporter.provider = provider
+    return exporter
+
+
+def test_request_spans(mocker: MockerFixture, exporter):
+    from opentelemetry import trace
+
+    current = []
+
+    def request(*_, **__):
+        current.append(trace.get_current_span())
+        return Response(502, content=b'{"error": true}')
+
+    mocker.patch('httpx.Client.request', side_effect=request)
+    client = APIClient(
+        'epoint',
+        'https://epoint.az/api/1/',
+        retry=None,
+        tracer=RequestTracer(exporter.provider),
+    )
+    client.add_url('pay', 'request', 'POST')
+
+    client.pay(amount=1)
+
+    *children, root = exporter.get_finished_spans()
+    assert root.name == 'epoint pay'
+    assert root.kind == trace.SpanKind.CLIENT
+    assert root.attributes['server.address'] == 'epoint.az'
+    assert root.attributes['http.response.status_code'] == 502
+    assert root.attributes['http.request.body.size'] == len(b'{"amount":1}')
+    assert root.attributes['http.response.body.size'] == len(b'{"error": true}')
+    assert root.status.status_code == trace.StatusCode.ERROR
+    assert current[0].get_span_context() == root.get_span_context()  # sorğu zamanı aktiv span
+
+    assert tuple(span.name for span in children) == PHASES
+    assert all(span.parent.span_id == root.context.span_id for span in children)
+    assert children[0].start_time == root.start_time
+    assert all(a.end_time == b.start_time for a, b in zip(children, children[1:]))
+
+
+def test_request_span_error(mocker: MockerFixture, exporter):
+    mocker.patch('httpx.Client.request', side_effect=ValueError('boom'))
+    client = APIClient('epoint', 'https://epoint.az/', retry=None)
+    client.request_executor.tracer = RequestTracer(exporter.provider)
+    client.add_url('pay', 'request', 'POST')
+
+    with pytest.raises(ValueError):
+        client.pay()
+
+    root = exporter.get_finished_spans()[-1]
+    assert root.events[0].name == 'exception'
+    assert 'http.response.status_code' not in root.attributes
+
+
+def test_tracing_without_opentelemetry(mocker: MockerFixture):
+    mocker.patch.object(tracing, 'trace', None)
+    mocker.patch('httpx.Client.request', return_value=Response(200, content=b'{}'))
+    tracer = RequestTracer()
+    client = APIClient('epoint', 'https://epoint.az/', tracer=tracer)
+    client.add_url('pay', 'request', 'POST')
+
+    assert not tracer.enabled
+    assert client.pay().status_code == 200
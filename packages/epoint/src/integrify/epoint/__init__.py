@@ -6,7 +6,22 @@ EN: https://epointbucket.s3.eu-central-1.amazonaws.com/files/instructions/API%20
 RU: https://epointbucket.s3.eu-central-1.amazonaws.com/files/instructions/API%20Epoint%20ru.pdf
 """
 
-from .client import EPointAsyncRequest, EPointClientClass, EPointRequest
-from .env import VERSION
+from typing import TYPE_CHECKING
+
+from integrify.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import EPointAsyncRequest, EPointClientClass, EPointRequest
+    from .env import VERSION
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'EPointAsyncRequest': '.client',
+        'EPointClientClass': '.client',
+        'EPointRequest': '.client',
+        'VERSION': '.env',
+    },
+)
 
 __all__ = ['EPointAsyncRequest', 'EPointClientClass', 'EPointRequest', 'VERSION']
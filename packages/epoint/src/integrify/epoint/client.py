@@ -24,6 +24,7 @@ from integrify.epoint.schemas.response import (
     SplitPayWithSavedCardResponseSchema,
     TransactionStatusResponseSchema,
 )
+from integrify.retry import DEFAULT_RETRY_POLICY
 from integrify.schemas import APIResponse
 from integrify.utils import UNSET, Unset
 
@@ -40,13 +41,21 @@ class EPointClientClass(APIClient, Generic[_Mode]):
         default_handler=None,
         sync: bool = True,
         dry: bool = False,
+        **kwds: Any,
     ):
-        super().__init__(name, base_url, default_handler, sync, dry)
+        kwds.setdefault('retry', DEFAULT_RETRY_POLICY)
+        super().__init__(name, base_url, default_handler, sync, dry, **kwds)
 
         self.add_url('pay', env.API.PAY, verb='POST')
         self.add_handler('pay', PaymentPayloadHandler)
 
-        self.add_url('get_transaction_status', env.API.GET_STATUS, verb='POST')
+        self.add_url(
+            'get_transaction_status',
+            env.API.GET_STATUS,
+            verb='POST',
+            idempotent=True,
+            coalesce=True,
+        )
         self.add_handler('get_transaction_status', GetTransactionStatusPayloadHandler)
 
         self.add_url('save_card', env.API.SAVE_CARD, verb='POST')
@@ -1,5 +1,4 @@
 import base64
-import json
 
 import httpx
 from integrify.api import APIPayloadHandler
@@ -26,13 +25,16 @@ from integrify.epoint.schemas.response import (
     SplitPayWithSavedCardResponseSchema,
     TransactionStatusResponseSchema,
 )
-from integrify.schemas import APIResponse, _ResponseT
+from integrify.schemas import APIResponse, _ResponseT, json_dumps
 
 
 class BasePayloadHandler(APIPayloadHandler):
     """EPoint üçün baza handler. `req_model`/`resp_model` alt class-larda
     ClassVar kimi təyin olunur."""
 
+    # `ok` və `status_code` cavabın body-sindən təyin olunur
+    lazy_supported = False
+
     def pre_handle_payload(self, *args, **kwds):
         return {
             'public_key': env.EPOINT_PUBLIC_KEY,
@@ -40,7 +42,7 @@ class BasePayloadHandler(APIPayloadHandler):
         }
 
     def post_handle_payload(self, data: dict):
-        b64data = base64.b64encode(json.dumps(data).encode()).decode()
+        b64data = base64.b64encode(json_dumps(data)).decode()
         return {
             'data': b64data,
             'signature': generate_signature(b64data),
@@ -1,10 +1,10 @@
 import base64
-import json
 from functools import partial
 from hashlib import sha1
 
 from integrify.epoint import env
 from integrify.epoint.schemas.callback import CallbackDataSchema, DecodedCallbackDataSchema
+from integrify.schemas import json_loads
 
 __all__ = ['generate_signature', 'decode_callback_data']
 
@@ -30,4 +30,4 @@ def decode_callback_data(data: CallbackDataSchema) -> DecodedCallbackDataSchema:
     if data.signature != generate_signature(data.data):
         return None
 
-    return DecodedCallbackDataSchema.model_validate(json.loads(base64.b64decode(data.data)))
+    return DecodedCallbackDataSchema.model_validate(json_loads(base64.b64decode(data.data)))
@@ -2,10 +2,11 @@ from decimal import Decimal
 from urllib.parse import parse_qsl
 
 from integrify.epoint.schemas.response import BaseWithCodeSchema
-from pydantic import BaseModel, model_validator
+from integrify.schemas import DeferredModel
+from pydantic import model_validator
 
 
-class CallbackDataSchema(BaseModel):
+class CallbackDataSchema(DeferredModel):
     """Raw və encoded callback data schema-sı"""
 
     data: str
@@ -1,10 +1,11 @@
 from decimal import Decimal
 
 from integrify.epoint.schemas.enums import Code, TransactionStatus, TransactionStatusExtended
-from pydantic import BaseModel, field_validator
+from integrify.schemas import DeferredModel
+from pydantic import field_validator
 
 
-class MinimalResponseSchema(BaseModel):
+class MinimalResponseSchema(DeferredModel):
     status: TransactionStatus
     """Success və ya failed əməliyyatının nəticəsi"""
 
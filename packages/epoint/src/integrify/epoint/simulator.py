@@ -0,0 +1,215 @@
+import base64
+import itertools
+from decimal import Decimal
+from hashlib import sha1
+from typing import Any
+
+import httpx
+from integrify.epoint import env
+from integrify.schemas import json_dumps, json_loads
+from integrify.testing import Simulator, json_response, request_data, route
+
+__all__ = ['EPointSimulator']
+
+
+class EPointSimulator(Simulator):
+    """EPoint API-sinin lokal simulyatoru (bax: `integrify.testing.Simulator`).
+
+    Sorğuların `signature`-i və `public_key`-i yoxlanılır, tranzaksiyalar və qeydiyyatdan
+    keçmiş kartlar yaddaşda saxlanılır. Redirect tələb edən ödənişlər `new` statusunda
+    yaradılır və `complete()` ilə (və ya `auto_complete=True` olduqda dərhal) tamamlanır;
+    tamamlanma zamanı `callback_url`-ə EPoint formatında (`data` + `signature`) callback
+    göndərilir. EPoint kimi, xətalar da 200 statusu ilə qaytarılır.
+    """
+
+    name = 'epoint'
+    base_url = env.API.BASE_URL.value
+
+    def __init__(
+        self,
+        public_key: str | None = None,
+        private_key: str | None = None,
+        callback_url: str = 'http://testserver/epoint/callback',
+        auto_complete: bool = False,
+        **kwds: Any,
+    ):
+        """
+        Args:
+            public_key: Merchant-in public key-i. Verilməsə, `EPOINT_PUBLIC_KEY` istifadə olunur.
+            private_key: İmza üçün private key. Verilməsə, `EPOINT_PRIVATE_KEY` istifadə olunur.
+            callback_url: Ödəniş nəticəsinin göndəriləcəyi URL
+            auto_complete: Ödənişləri redirect gözləmədən dərhal uğurla tamamlamaq
+            **kwds: `Simulator` argumentləri (`latency`, `error_rate` və s.)
+        """
+        super().__init__(**kwds)
+        self.public_key = public_key if public_key is not None else env.EPOINT_PUBLIC_KEY
+        self.private_key = private_key if private_key is not None else env.EPOINT_PRIVATE_KEY
+        self.callback_url = callback_url
+        self.auto_complete = auto_complete
+
+        self.transactions: dict[str, dict[str, Any]] = {}
+        self.cards: set[str] = set()
+        self._ids = itertools.count(1)
+
+    def sign(self, data: str) -> str:
+        """EPoint imzası: `base64(sha1(private_key + data + private_key))`"""
+        source = self.private_key + data + self.private_key
+        return base64.b64encode(sha1(source.encode(), usedforsecurity=False).digest()).decode()
+
+    def _decode(self, request: httpx.Request) -> dict[str, Any] | None:
+        payload = request_data(request)
+        data, signature = payload.get('data', ''), payload.get('signature')
+        if not data or signature != self.sign(data):
+            return None
+
+        decoded = json_loads(base64.b64decode(data))
+        return decoded if decoded.get('public_key') == self.public_key else None
+
+    def _new_transaction(self, data: dict[str, Any], **extra: Any) -> dict[str, Any]:
+        transaction_id = f'te{next(self._ids):09d}'
+        transaction = {
+            'transaction': transaction_id,
+            'order_id': data.get('order_id'),
+            'amount': str(data.get('amount', '0')),
+            'status': 'new',
+            **extra,
+        }
+        self.transactions[transaction_id] = transaction
+        return transaction
+
+    def complete(self, transaction_id: str, success: bool = True, code: str = '000') -> None:
+        """Redirect səhifəsində ödənişin bitməsini simulyasiya edir və callback göndərir.
+
+        Args:
+            transaction_id: Tranzaksiya ID-si
+            success: Ödənişin uğurlu olub-olmaması
+            code: Bankın 3 rəqəmli cavab kodu
+        """
+        with self._lock:
+            transaction = self.transactions[transaction_id]
+            transaction.update(
+                status='success' if success else 'error',
+                code=code if success else '100',
+                bank_transaction=f'bt{transaction_id}',
+                rrn=f'{int(transaction_id[2:]):012d}',
+                card_mask='123456******1234',
+                card_name='SIMULATED CARD',
+                operation_code='100',
+            )
+            if transaction.get('card_id'):
+                self.cards.add(transaction['card_id'])
+
+            data = base64.b64encode(json_dumps(transaction)).decode()
+            self.send_callback(
+                'POST',
+                self.callback_url,
+                data={'data': data, 'signature': self.sign(data)},
+            )
+
+    def _redirect(self, request: httpx.Request, save_card: bool = False) -> httpx.Response:
+        data = self._decode(request)
+        if data is None:
+            return json_response({'status': 'error', 'message': 'Signature mismatch'})
+
+        extra = {'card_id': f'ce{next(self._ids):09d}'} if save_card else {}
+        if 'split_amount' in data:
+            extra['split_amount'] = str(data['split_amount'])
+        if 'order_id' not in data:  # yalnız kart qeydiyyatı
+            extra['amount'] = '0'
+
+        transaction = self._new_transaction(data, **extra)
+        if self.auto_complete:
+            self.complete(transaction['transaction'])
+
+        return json_response(
+            {
+                'status': 'success',
+                'transaction': transaction['transaction'],
+                'redirect_url': f'{self.base_url}/pay/{transaction["transaction"]}',
+                **({'card_id': extra['card_id']} if save_card else {}),
+            }
+        )
+
+    def _charge_card(self, request: httpx.Request) -> httpx.Response:
+        data = self._decode(request)
+        if data is None:
+            return json_response({'status': 'error', 'message': 'Signature mismatch'})
+        if data.get('card_id') not in self.cards:
+            return json_response({'status': 'failed', 'message': 'Card not found'})
+
+        extra = {'split_amount': str(data['split_amount'])} if 'split_amount' in data else {}
+        transaction = self._new_transaction(data, card_id=data['card_id'], **extra)
+        self.complete(transaction['transaction'])
+        return json_response(
+            {
+                key: value
+                for key, value in transaction.items()
+                if key not in {'order_id', 'card_id', 'code'}
+            }
+        )
+
+    @route('POST', env.API.PAY)
+    def pay(self, request: httpx.Request) -> httpx.Response:
+        return self._redirect(request)
+
+    @route('POST', env.API.SAVE_CARD)
+    def save_card(self, request: httpx.Request) -> httpx.Response:
+        return self._redirect(request, save_card=True)
+
+    @route('POST', env.API.PAY_AND_SAVE_CARD)
+    def pay_and_save_card(self, request: httpx.Request) -> httpx.Response:
+        return self._redirect(request, save_card=True)
+
+    @route('POST', env.API.SPLIT_PAY)
+    def split_pay(self, request: httpx.Request) -> httpx.Response:
+        return self._redirect(request)
+
+    @route('POST', env.API.SPLIT_PAY_AND_SAVE_CARD)
+    def split_pay_and_save_card(self, request: httpx.Request) -> httpx.Response:
+        return self._redirect(request, save_card=True)
+
+    @route('POST', env.API.PAY_WITH_SAVED_CARD)
+    def pay_with_saved_card(self, request: httpx.Request) -> httpx.Response:
+        return self._charge_card(request)
+
+    @route('POST', env.API.SPLIT_PAY_WITH_SAVED_CARD)
+    def split_pay_with_saved_card(self, request: httpx.Request) -> httpx.Response:
+        return self._charge_card(request)
+
+    @route('POST', env.API.PAYOUT)
+    def payout(self, request: httpx.Request) -> httpx.Response:
+        return self._charge_card(request)
+
+    @route('POST', env.API.GET_STATUS)
+    def get_transaction_status(self, request: httpx.Request) -> httpx.Response:
+        data = self._decode(request)
+        if data is None:
+            return json_response({'status': 'server_error', 'message': 'Signature mismatch'})
+
+        transaction = self.transactions.get(data.get('transaction', ''))
+        if transaction is None:
+            return json_response({'status': 'error', 'message': 'Transaction not found'})
+        return json_response(transaction)
+
+    @route('POST', env.API.REFUND)
+    def refund(self, request: httpx.Request) -> httpx.Response:
+        data = self._decode(request)
+        if data is None:
+            return json_response({'status': 'error', 'message': 'Signature mismatch'})
+
+        transaction = self.transactions.get(data.get('transaction', ''))
+        if transaction is None or transaction['status'] != 'success':
+            return json_response({'status': 'error', 'message': 'Transaction cannot be reversed'})
+
+        amount = data.get('amount')
+        if amount is not None and Decimal(str(amount)) > Decimal(transaction['amount']):
+            return json_response({'status': 'error', 'message': 'Invalid amount'})
+
+        transaction['status'] = 'returned'
+        return json_response({'status': 'success', 'message': 'Reversed'})
+
+    def reset(self) -> None:
+        with self._lock:
+            super().reset()
+            self.transactions.clear()
+            self.cards.clear()
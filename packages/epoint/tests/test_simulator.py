@@ -0,0 +1,82 @@
+import pytest
+from integrify.epoint.client import EPointClientClass
+from integrify.epoint.helpers import decode_callback_data
+from integrify.epoint.schemas.callback import CallbackDataSchema
+from integrify.epoint.schemas.enums import TransactionStatus
+from integrify.epoint.simulator import EPointSimulator
+from integrify.testing import simulator
+from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def epoint_simulator(mocker: MockerFixture):
+    mocker.patch('integrify.epoint.env.EPOINT_PUBLIC_KEY', 'i000000001')
+    mocker.patch('integrify.epoint.env.EPOINT_PRIVATE_KEY', 'private-key')
+    yield simulator('epoint')
+
+
+def test_registry(epoint_simulator: EPointSimulator):
+    assert isinstance(epoint_simulator, EPointSimulator)
+
+
+def test_pay_and_callback(epoint_simulator: EPointSimulator):
+    client = EPointClientClass(transport=epoint_simulator.transport())
+
+    resp = client.pay(amount=1, currency='AZN', order_id='1')
+    assert resp.ok
+    assert resp.body.status == TransactionStatus.SUCCESS
+    assert resp.body.redirect_url
+
+    epoint_simulator.complete(resp.body.transaction)
+    callback = CallbackDataSchema.model_validate(epoint_simulator.callbacks[0].read())
+    decoded = decode_callback_data(callback)
+    assert decoded is not None
+    assert decoded.status == TransactionStatus.SUCCESS
+    assert decoded.order_id == '1'
+
+    status = client.get_transaction_status(transaction_id=resp.body.transaction)
+    assert status.body.status == TransactionStatus.SUCCESS
+
+    refund = client.refund(transaction_id=resp.body.transaction, currency='AZN')
+    assert refund.body.status == TransactionStatus.SUCCESS
+
+
+def test_saved_card(epoint_simulator: EPointSimulator):
+    epoint_simulator.auto_complete = True
+    client = EPointClientClass(transport=epoint_simulator.transport())
+
+    card = client.save_card()
+    assert card.body.card_id
+
+    resp = client.pay_with_saved_card(amount=1, currency='AZN', order_id='2', card_id='unknown')
+    assert resp.body.status != TransactionStatus.SUCCESS
+
+    resp = client.pay_with_saved_card(
+        amount=1,
+        currency='AZN',
+        order_id='2',
+        card_id=card.body.card_id,
+    )
+    assert resp.body.status == TransactionStatus.SUCCESS
+    assert epoint_simulator.calls['pay_with_saved_card'] == 2
+
+
+def test_invalid_signature(epoint_simulator: EPointSimulator, mocker: MockerFixture):
+    mocker.patch('integrify.epoint.env.EPOINT_PRIVATE_KEY', 'wrong-key')
+    client = EPointClientClass(transport=epoint_simulator.transport())
+
+    resp = client.pay(amount=1, currency='AZN', order_id='1')
+    assert resp.body.status == TransactionStatus.ERROR
+    assert not epoint_simulator.transactions
+
+
+def test_bench_cli(epoint_simulator: EPointSimulator, capsys: pytest.CaptureFixture[str]):
+    from integrify.cli import main
+
+    args = '{"amount": 1, "currency": "AZN", "order_id": "{i}"}'
+    assert main(['bench', 'epoint', 'pay', '--args', args, '-n', '20', '-c', '4']) == 0
+
+    output = capsys.readouterr().out
+    assert 'epoint.pay (async)' in output
+    assert 'requests    20' in output
+    assert 'errors      0' in output
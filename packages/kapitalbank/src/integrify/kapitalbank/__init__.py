@@ -8,7 +8,22 @@ PAN: 4169741330151778, ExpDate: 06/25, CVV: 119
 PAN: 5239151747183468, ExpDate: 11/27, CVV2: 602
 """
 
-from .client import KapitalAsyncRequest, KapitalClientClass, KapitalRequest
-from .env import VERSION
+from typing import TYPE_CHECKING
+
+from integrify.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import KapitalAsyncRequest, KapitalClientClass, KapitalRequest
+    from .env import VERSION
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'KapitalAsyncRequest': '.client',
+        'KapitalClientClass': '.client',
+        'KapitalRequest': '.client',
+        'VERSION': '.env',
+    },
+)
 
 __all__ = ['KapitalAsyncRequest', 'KapitalClientClass', 'KapitalRequest', 'VERSION']
@@ -30,6 +30,7 @@ from integrify.kapitalbank.schemas.response import (
     ProcessPaymentWithSavedCardResponseSchema,
     RefundOrderResponseSchema,
 )
+from integrify.retry import DEFAULT_RETRY_POLICY
 from integrify.utils import UNSET as _UNSET
 from integrify.utils import Unset as Unsettable
 
@@ -44,16 +45,20 @@ class KapitalClientClass(APIClient, Generic[_Mode]):
         default_handler=None,
         sync=True,
         dry=False,
+        **kwds: Any,
     ):
-        super().__init__(name, base_url, default_handler, sync, dry)
+        kwds.setdefault('retry', DEFAULT_RETRY_POLICY)
+        super().__init__(name, base_url, default_handler, sync, dry, **kwds)
 
         self.add_url('create_order', env.API.ORDER, verb='POST')
         self.add_handler('create_order', CreateOrderPayloadHandler)
 
-        self.add_url('get_order_information', env.API.GET_ORDER, verb='GET')
+        self.add_url('get_order_information', env.API.GET_ORDER, verb='GET', coalesce=True)
         self.add_handler('get_order_information', OrderInformationPayloadHandler)
 
-        self.add_url('get_detailed_order_info', env.API.GET_DETAILED_ORDER, verb='GET')
+        self.add_url(
+            'get_detailed_order_info', env.API.GET_DETAILED_ORDER, verb='GET', coalesce=True
+        )
         self.add_handler('get_detailed_order_info', DetailedOrderInformationPayloadHandler)
 
         self.add_url('refund_order', env.API.ORDER_EXECUTION, verb='POST')
@@ -1,5 +1,4 @@
 import base64
-import json
 from functools import cached_property
 from typing import ClassVar
 
@@ -32,6 +31,7 @@ from integrify.kapitalbank.schemas.response import (
     ProcessPaymentWithSavedCardResponseSchema,
     RefundOrderResponseSchema,
 )
+from integrify.schemas import get_response_model, json_loads
 from pydantic import BaseModel
 
 
@@ -39,8 +39,8 @@ def _safe_json(resp: httpx.Response) -> dict:
     """Cavabı JSON kimi parse etmək; JSON deyilsə (gateway xətası, boş body)
     exception atmaq əvəzinə boş dict qaytarır."""
     try:
-        data = resp.json()
-    except (json.JSONDecodeError, ValueError):
+        data = json_loads(resp.content)
+    except (ValueError, UnicodeDecodeError):
         return {}
 
     return data if isinstance(data, dict) else {}
@@ -74,7 +74,7 @@ class BasePayloadHandler(APIPayloadHandler):
         200-dən fərqli status kodu gələrsə, gələn cavabı modelə uyğunlaşdırır və error obyektini APIResponse obyektinə əlavə edir.
         """  # noqa: E501
 
-        api_resp = APIResponse[BaseResponseSchema].model_validate(resp, from_attributes=True)
+        api_resp = get_response_model(BaseResponseSchema).model_validate(resp, from_attributes=True)
         body = _safe_json(resp)
 
         if resp.status_code == 200:
@@ -0,0 +1,228 @@
+import base64
+import itertools
+import secrets
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+import httpx
+from integrify.kapitalbank import env
+from integrify.kapitalbank.schemas.response import DetailedOrderInformationResponseSchema
+from integrify.testing import Simulator, json_response, request_data, route, sample_model
+
+__all__ = ['KapitalSimulator']
+
+
+class KapitalSimulator(Simulator):
+    """Kapitalbank e-commerce API-sinin lokal simulyatoru (bax: `integrify.testing.Simulator`).
+
+    `Authorization: Basic` header-i yoxlanılır, sifarişlər yaddaşda saxlanılır və
+    əməliyyatlar (refund, clearing, reverse) sifarişin statusunu və məbləğlərini dəyişir.
+    Ödəniş səhifəsində sifarişin bitməsi `complete()` ilə (və ya `auto_complete=True`
+    olduqda dərhal) simulyasiya olunur; bu zaman sifarişin `hppRedirectUrl`-inə
+    `ID` və `STATUS` parametrləri ilə redirect (callback) göndərilir.
+    """
+
+    name = 'kapitalbank'
+    base_url = env.API.BASE_URL.value
+
+    def __init__(
+        self,
+        username: str | None = None,
+        password: str | None = None,
+        auto_complete: bool = False,
+        **kwds: Any,
+    ):
+        """
+        Args:
+            username: Merchant login-i. Verilməsə, `KAPITAL_USERNAME` istifadə olunur.
+            password: Merchant şifrəsi. Verilməsə, `KAPITAL_PASSWORD` istifadə olunur.
+            auto_complete: Sifarişləri ödəniş səhifəsini gözləmədən dərhal ödənilmiş etmək
+            **kwds: `Simulator` argumentləri (`latency`, `error_rate` və s.)
+        """
+        super().__init__(**kwds)
+        username = username if username is not None else env.KAPITAL_USERNAME
+        password = password if password is not None else env.KAPITAL_PASSWORD
+        credentials = base64.b64encode(f'{username}:{password}'.encode()).decode()
+        self.authorization = f'Basic {credentials}'
+        self.auto_complete = auto_complete
+
+        self.orders: dict[int, dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+
+    @staticmethod
+    def error(status_code: int, code: str, description: str) -> httpx.Response:
+        """Kapitalbank formatında xəta cavabı"""
+        return json_response({'errorCode': code, 'errorDescription': description}, status_code)
+
+    def _authorized(self, request: httpx.Request) -> bool:
+        return request.headers.get('Authorization') == self.authorization
+
+    def complete(self, order_id: int, status: str = 'FullyPaid') -> None:
+        """Ödəniş səhifəsində sifarişin bitməsini simulyasiya edir və redirect göndərir.
+
+        Args:
+            order_id: Sifarişin ID-si
+            status: Sifarişin yeni statusu (`FullyPaid`, `Authorized`, `Declined` və s.)
+        """
+        with self._lock:
+            order = self.orders[order_id]
+            order['status'] = status
+            if status in {'FullyPaid', 'Authorized'}:
+                order['authorizedChargeAmount'] = order['amount']
+            if status == 'FullyPaid':
+                order['clearedChargeAmount'] = order['amount']
+
+            if order.get('hppRedirectUrl'):
+                self.send_callback(
+                    'GET',
+                    order['hppRedirectUrl'],
+                    params={'ID': order_id, 'STATUS': status},
+                )
+
+    @route('POST', env.API.ORDER)
+    def create_order(self, request: httpx.Request) -> httpx.Response:
+        if not self._authorized(request):
+            return self.error(401, 'InvalidLogin', 'Invalid login or password')
+
+        data = request_data(request).get('order', {})
+        if Decimal(str(data.get('amount', 0))) <= 0:
+            return self.error(400, 'InvalidAmt', 'Invalid amount')
+
+        order_id = next(self._ids)
+        order = {
+            'id': order_id,
+            'password': secrets.token_hex(6),
+            'hppUrl': f'{self.base_url}/flex',
+            'hppRedirectUrl': data.get('hppRedirectUrl'),
+            'status': 'Preparing',
+            'typeRid': data.get('typeRid', 'Order_SMS'),
+            'amount': float(data['amount']),
+            'currency': data.get('currency', 'AZN'),
+            'description': data.get('description', ''),
+            'language': data.get('language', 'az'),
+            'createTime': datetime.now().isoformat(),
+            'authorizedChargeAmount': 0.0,
+            'clearedChargeAmount': 0.0,
+            'clearedRefundAmount': 0.0,
+        }
+        self.orders[order_id] = order
+        if self.auto_complete:
+            self.complete(order_id)
+
+        return json_response(
+            {
+                'order': {
+                    'id': order_id,
+                    'password': order['password'],
+                    'hppUrl': order['hppUrl'],
+                    'status': order['status'],
+                    'cvv2AuthStatus': 'Required',
+                    'secret': secrets.token_hex(8),
+                }
+            }
+        )
+
+    @route('GET', env.API.GET_ORDER)
+    def get_order(self, request: httpx.Request, order_id: str) -> httpx.Response:
+        if not self._authorized(request):
+            return self.error(401, 'InvalidLogin', 'Invalid login or password')
+
+        order = self.orders.get(int(order_id))
+        if order is None:
+            return self.error(404, 'InvalidRequest', 'Order not found')
+
+        info = {
+            'id': order['id'],
+            'typeRid': order['typeRid'],
+            'status': order['status'],
+            'lastStatusLogin': 'simulator',
+            'amount': order['amount'],
+            'currency': order['currency'],
+            'createTime': order['createTime'],
+            'type': {'title': order['typeRid']},
+        }
+        if 'tranDetailLevel' in request.url.params:
+            detailed = sample_model(DetailedOrderInformationResponseSchema)
+            info = {**detailed, **info, **order, 'srcAmount': order['amount']}
+            info['type'] = {**detailed['type'], 'title': order['typeRid']}
+        return json_response({'order': info})
+
+    @route('POST', env.API.ORDER_EXECUTION)
+    def execute_transaction(self, request: httpx.Request, order_id: str) -> httpx.Response:
+        if not self._authorized(request):
+            return self.error(401, 'InvalidLogin', 'Invalid login or password')
+
+        order = self.orders.get(int(order_id))
+        if order is None:
+            return self.error(404, 'InvalidRequest', 'Order not found')
+
+        tran = request_data(request).get('tran', {})
+        if 'password' in request.url.params and request.url.params['password'] != order['password']:
+            return self.error(403, 'InvalidTranLink', 'Invalid order password')
+
+        amount = float(tran.get('amount', order['amount']))
+        if amount <= 0 or amount > order['amount']:
+            return self.error(400, 'InvalidAmt', 'Invalid amount')
+
+        if tran.get('type') == 'Refund':
+            if order['status'] not in {'FullyPaid', 'PartiallyPaid'}:
+                return self.error(400, 'TranProhibited', 'Order is not paid')
+            order['clearedRefundAmount'] += amount
+            if order['clearedRefundAmount'] >= order['clearedChargeAmount']:
+                order['status'] = 'Refunded'
+        elif tran.get('voidKind') == 'Full':
+            order['status'] = 'Voided'
+            order['authorizedChargeAmount'] = 0.0
+        elif tran.get('voidKind') == 'Partial':
+            order['authorizedChargeAmount'] = max(0.0, order['authorizedChargeAmount'] - amount)
+        elif tran.get('phase') == 'Clearing':
+            order['clearedChargeAmount'] += amount
+            order['status'] = (
+                'FullyPaid' if order['clearedChargeAmount'] >= order['amount'] else 'PartiallyPaid'
+            )
+        else:  # saxlanılmış kartla ödəniş
+            order['status'] = 'FullyPaid'
+            order['authorizedChargeAmount'] = order['clearedChargeAmount'] = amount
+
+        return json_response(
+            {
+                'tran': {
+                    'approvalCode': f'{order["id"]:06d}'[-6:],
+                    'match': {
+                        'tranActionId': secrets.token_hex(8),
+                        'ridByPmo': secrets.token_hex(6),
+                    },
+                    'pmoResultCode': '1',
+                }
+            }
+        )
+
+    @route('POST', '/api/order/{order_id}/set-src-token')
+    def link_card_token(self, request: httpx.Request, order_id: str) -> httpx.Response:
+        if not self._authorized(request):
+            return self.error(401, 'InvalidLogin', 'Invalid login or password')
+
+        order = self.orders.get(int(order_id))
+        if order is None or request.url.params.get('password') != order['password']:
+            return self.error(404, 'InvalidRequest', 'Order not found')
+
+        stored_id = request_data(request).get('token', {}).get('storedId')
+        src_token = sample_model(DetailedOrderInformationResponseSchema)['srcToken']
+        return json_response(
+            {
+                'order': {
+                    'status': order['status'],
+                    'cvv2AuthStatus': 'NotRequired',
+                    'tdsV1AuthStatus': 'NotRequired',
+                    'tdsV2AuthStatus': 'NotRequired',
+                    'otpAutStatus': 'NotRequired',
+                    'srcToken': {**src_token, 'id': stored_id or src_token['id']},
+                }
+            }
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            super().reset()
+            self.orders.clear()
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import pytest
+from integrify.kapitalbank.client import KapitalClientClass
+from integrify.kapitalbank.simulator import KapitalSimulator
+from integrify.testing import simulator
+
+
+@pytest.fixture
+def kapital_simulator():
+    yield simulator('kapitalbank')
+
+
+def test_registry(kapital_simulator: KapitalSimulator):
+    assert isinstance(kapital_simulator, KapitalSimulator)
+
+
+def test_order_flow(kapital_simulator: KapitalSimulator):
+    client = KapitalClientClass(transport=kapital_simulator.transport())
+
+    order = client.create_order(
+        amount=10,
+        currency='AZN',
+        description='test',
+        hpp_redirect_url='https://merchant.az/kapital/callback',
+    )
+    assert order.status_code == 200
+    order_id = order.body.data.id
+
+    info = client.get_order_information(order_id=order_id)
+    assert info.body.data.status == 'Preparing'
+
+    kapital_simulator.complete(order_id)
+    assert kapital_simulator.callbacks[0].url.params['STATUS'] == 'FullyPaid'
+
+    detailed = client.get_detailed_order_info(order_id=order_id)
+    assert detailed.body.data.status == 'FullyPaid'
+    assert detailed.body.data.password == order.body.data.password
+
+    refund = client.refund_order(order_id=order_id, amount=10)
+    assert refund.body.data.pmo_result_code == 'Approved'
+    assert kapital_simulator.orders[order_id]['status'] == 'Refunded'
+
+
+def test_errors(kapital_simulator: KapitalSimulator):
+    client = KapitalClientClass(transport=kapital_simulator.transport())
+
+    resp = client.get_order_information(order_id=404)
+    assert resp.status_code == 404
+    assert resp.body.error.error_description == 'Order not found'
+
+    kapital_simulator.authorization = 'Basic invalid'
+    resp = client.create_order(amount=10, currency='AZN', description='test')
+    assert resp.status_code == 401
+
+
+def test_cassette_replay(
+    kapital_simulator: KapitalSimulator,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+):
+    from integrify.cassette import RecordingTransport, iter_cassette
+    from integrify.cli import main
+
+    cassette = str(tmp_path / 'kapital.cassette')
+    transport = RecordingTransport(cassette, transport=kapital_simulator.transport())
+    with KapitalClientClass(transport=transport) as client:
+        order_id = client.create_order(amount=10, currency='AZN', description='test').body.data.id
+        assert client.get_order_information(order_id=order_id).ok
+
+    entries = list(iter_cassette(cassette))
+    assert [entry['response']['status_code'] for entry in entries] == [200, 200]
+    assert 'Basic' not in str(entries[0]['request']['headers'])
+
+    args = ['--args', f'{{"order_id": {order_id}}}', '-n', '20', '--cassette', cassette]
+    assert main(['bench', 'kapitalbank', 'get_order_information', *args]) == 0
+    assert 'errors      0' in capsys.readouterr().out
+    assert kapital_simulator.calls['get_order'] == 1  # replay simulyatora müraciət etmir
@@ -4,10 +4,33 @@ Dokumentasiya:
 EN: https://mmzeynalli.notion.site/LSIM-1974f14f727e8029a3f5f9e4e556afe3?pvs=74
 """
 
-from .bulk.client import LSIMBulkSMSAsyncClient, LSIMBulkSMSClient, LSIMBulkSMSClientClass
-from .bulk.env import VERSION as BULKSMS_VERSION
-from .single.client import LSIMSingleSMSAsyncClient, LSIMSingleSMSClient, LSIMSingleSMSClientClass
-from .single.env import VERSION as SINGLESMS_VERSION
+from typing import TYPE_CHECKING
+
+from integrify.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .bulk.client import LSIMBulkSMSAsyncClient, LSIMBulkSMSClient, LSIMBulkSMSClientClass
+    from .bulk.env import VERSION as BULKSMS_VERSION
+    from .single.client import (
+        LSIMSingleSMSAsyncClient,
+        LSIMSingleSMSClient,
+        LSIMSingleSMSClientClass,
+    )
+    from .single.env import VERSION as SINGLESMS_VERSION
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'LSIMBulkSMSAsyncClient': '.bulk.client',
+        'LSIMBulkSMSClient': '.bulk.client',
+        'LSIMBulkSMSClientClass': '.bulk.client',
+        'BULKSMS_VERSION': '.bulk.env:VERSION',
+        'LSIMSingleSMSAsyncClient': '.single.client',
+        'LSIMSingleSMSClient': '.single.client',
+        'LSIMSingleSMSClientClass': '.single.client',
+        'SINGLESMS_VERSION': '.single.env:VERSION',
+    },
+)
 
 __all__ = [
     'LSIMBulkSMSAsyncClient',
@@ -18,6 +18,7 @@ from integrify.lsim.bulk.schemas.response import (
     GetBulkSMSReportResponseSchema,
     SendBulkSMSResponseSchema,
 )
+from integrify.ratelimit import RateLimiter
 from integrify.schemas import APIResponse
 
 
@@ -29,8 +30,10 @@ class LSIMBulkSMSClientClass(APIClient, Generic[_Mode]):
         default_handler=None,
         sync=True,
         dry=False,
+        **kwds: Any,
     ):
-        super().__init__(name, base_url, default_handler, sync, dry)
+        kwds.setdefault('rate_limiter', RateLimiter.shared('lsim', base_env.LSIM_RATE_LIMIT))
+        super().__init__(name, base_url, default_handler, sync, dry, **kwds)
 
         self.add_url('bulk_send_one_message', env.API.ENDPOINT, verb='POST')
         self.add_handler('bulk_send_one_message', SendBulkSMSOneMessagePayloadHandler)
@@ -38,19 +41,24 @@ class LSIMBulkSMSClientClass(APIClient, Generic[_Mode]):
         self.add_url('bulk_send_different_messages', env.API.ENDPOINT, verb='POST')
         self.add_handler('bulk_send_different_messages', SendBulkSMSDifferentMessagesPayloadHandler)
 
-        self.add_url('get_report', env.API.ENDPOINT, verb='POST')
+        self.add_url('get_report', env.API.ENDPOINT, verb='POST', idempotent=True)
         self.add_handler('get_report', GetBulkSMSReportPayloadHandler)
 
-        self.add_url('get_detailed_report', env.API.ENDPOINT, verb='POST')
+        self.add_url('get_detailed_report', env.API.ENDPOINT, verb='POST', idempotent=True)
         self.add_handler('get_detailed_report', GetBulkSMSDeatiledReportPayloadHandler)
 
-        self.add_url('get_detailed_report_with_dates', env.API.ENDPOINT, verb='POST')
+        self.add_url(
+            'get_detailed_report_with_dates',
+            env.API.ENDPOINT,
+            verb='POST',
+            idempotent=True,
+        )
         self.add_handler(
             'get_detailed_report_with_dates',
             GetBulkSMSDeatiledWithDateReportPayloadHandler,
         )
 
-        self.add_url('check_balance', env.API.ENDPOINT, verb='POST')
+        self.add_url('check_balance', env.API.ENDPOINT, verb='POST', idempotent=True)
         self.add_handler('check_balance', GetBalancePayloadHandler)
 
     if TYPE_CHECKING:
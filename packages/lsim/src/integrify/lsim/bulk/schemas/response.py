@@ -1,8 +1,9 @@
 from integrify.lsim.bulk.schemas.enums import Code, SMSStatus
-from pydantic import BaseModel, Field, model_validator
+from integrify.schemas import DeferredModel
+from pydantic import Field, model_validator
 
 
-class SendBulkSMSResponseSchema(BaseModel):
+class SendBulkSMSResponseSchema(DeferredModel):
     response_code: Code | int
     """Sorğunun uğur(suz)luq kodu"""
 
@@ -19,7 +20,7 @@ class SendBulkSMSResponseSchema(BaseModel):
         }
 
 
-class GetBulkSMSReportResponseSchema(BaseModel):
+class GetBulkSMSReportResponseSchema(DeferredModel):
     response_code: Code | int
     """Sorğunun uğur(suz)luq kodu"""
 
@@ -60,14 +61,14 @@ class GetBulkSMSReportResponseSchema(BaseModel):
         }
 
 
-class SMSReportSchema(BaseModel):
+class SMSReportSchema(DeferredModel):
     msisdn: int
     message: str
     status: SMSStatus
     date: str | None = None
 
 
-class GetBulkSMSDetailedReportResponseSchema(BaseModel):
+class GetBulkSMSDetailedReportResponseSchema(DeferredModel):
     response_code: Code | str
     """Sorğunun uğur(suz)luq kodu"""
 
@@ -83,7 +84,7 @@ class GetBulkSMSDetailedReportResponseSchema(BaseModel):
         }
 
 
-class GetBalanceResponseSchema(BaseModel):
+class GetBalanceResponseSchema(DeferredModel):
     response_code: Code | str
     """Sorğunun uğur(suz)luq kodu"""
 
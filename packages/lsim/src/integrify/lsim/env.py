@@ -1,5 +1,28 @@
 import os
+from warnings import warn
+
+from integrify.ratelimit import RateLimiter
 
 LSIM_LOGIN: str | None = os.getenv('LSIM_LOGIN')
 LSIM_PASSWORD: str | None = os.getenv('LSIM_PASSWORD')
 LSIM_SENDER_NAME: str | None = os.getenv('LSIM_SENDER_NAME')
+
+
+def _parse_rate_limit(name: str, value: str | None) -> str | None:
+    """Env-dən oxunan sorğu limitini yoxlayır. Yanlış formatlı dəyərdə paketin importu xəta
+    ilə dayanmasın deyə, xəbərdarlıq edilir və limit tətbiq olunmur (`None`)."""
+    try:
+        RateLimiter.from_spec(value)
+    except ValueError:
+        warn(
+            f"{name}='{value}' yanlış formatdadır (məs., '10/s', '600/m'); "
+            'limit tətbiq olunmayacaq.'
+        )
+        return None
+
+    return value
+
+
+# Client-side sorğu limiti (məs., '10/s', '600/m'). Təyin olunmasa və ya yanlış formatdadırsa,
+# limit tətbiq olunmur.
+LSIM_RATE_LIMIT: str | None = _parse_rate_limit('LSIM_RATE_LIMIT', os.getenv('LSIM_RATE_LIMIT'))
@@ -0,0 +1,262 @@
+import itertools
+from datetime import datetime
+from hashlib import md5
+from typing import Any
+
+import httpx
+from integrify.lsim import env
+from integrify.lsim.bulk import env as bulk_env
+from integrify.lsim.bulk.schemas.enums import Code as BulkCode
+from integrify.lsim.bulk.schemas.enums import SMSStatus
+from integrify.lsim.single import env as single_env
+from integrify.lsim.single.schemas.enums import Code
+from integrify.testing import Simulator, json_response, request_data, route
+
+__all__ = ['LSIMSimulator']
+
+_BULK_STATUS = {
+    Code.IN_QUEUE: SMSStatus.MESSAGE_IN_QUEUE,
+    Code.DELIVERED: SMSStatus.MESSAGE_DELIVERED,
+    Code.UNDELIVERED: SMSStatus.MESSAGE_UNDELIVERED,
+    Code.EXPIRED: SMSStatus.MESSAGE_EXPIRED,
+    Code.SENT: SMSStatus.MESSAGE_SENT,
+    Code.BLACK_LISTED: SMSStatus.BLACK_LIST,
+}
+
+_BULK_REPORT_KEYS = {
+    SMSStatus.MESSAGE_EXPIRED: 'expired',
+    SMSStatus.MESSAGE_DELIVERED: 'delivered',
+    SMSStatus.MESSAGE_UNDELIVERED: 'undelivered',
+    SMSStatus.MESSAGE_SENT: 'send',
+    SMSStatus.SYSTEM_ERROR: 'error',
+    SMSStatus.BLACK_LIST: 'blackList',
+    SMSStatus.MESSAGE_IN_QUEUE: 'queue',
+    SMSStatus.DUPLICATE_MESSAGE: 'duplicate',
+}
+
+
+def _md5(value: str) -> str:
+    return md5(value.encode(), usedforsecurity=False).hexdigest()
+
+
+class LSIMSimulator(Simulator):
+    """LSIM tək (`apps.lsim.az`) və bulk (`sendsms.az`) SMS API-lərinin lokal simulyatoru
+    (bax: `integrify.testing.Simulator`).
+
+    Hər iki API eyni simulyatorda işləyir, yəni eyni transport hər iki klientə verilə bilər.
+    `key` və login/şifrə yoxlanılır, hər SMS balansdan bir vahid çıxır. Mesajlar
+    `IN_QUEUE` statusunda yaradılır və `deliver()` ilə (və ya `auto_deliver=True` olduqda
+    dərhal) çatdırılır.
+    """
+
+    name = 'lsim'
+    base_url = single_env.API.BASE_URL.value
+
+    def __init__(
+        self,
+        login: str | None = None,
+        password: str | None = None,
+        balance: int = 10_000,
+        auto_deliver: bool = False,
+        **kwds: Any,
+    ):
+        """
+        Args:
+            login: LSIM login-i. Verilməsə, `LSIM_LOGIN` istifadə olunur.
+            password: LSIM şifrəsi. Verilməsə, `LSIM_PASSWORD` istifadə olunur.
+            balance: Başlanğıc balans (SMS sayı)
+            auto_deliver: Mesajları dərhal çatdırılmış etmək
+            **kwds: `Simulator` argumentləri (`latency`, `error_rate` və s.)
+        """
+        super().__init__(**kwds)
+        self.login = login if login is not None else env.LSIM_LOGIN or ''
+        self.password = password if password is not None else env.LSIM_PASSWORD or ''
+        self.initial_balance = balance
+        self.balance = balance
+        self.auto_deliver = auto_deliver
+
+        self.messages: dict[int, dict[str, Any]] = {}
+        """Tək SMS-lər (`trans_id` -> mesaj)"""
+
+        self.tasks: dict[int, list[dict[str, Any]]] = {}
+        """Bulk göndərişlər (`taskid` -> mesajlar)"""
+
+        self._ids = itertools.count(1)
+
+    def deliver(self, trans_id: int, status: Code = Code.DELIVERED) -> None:
+        """Tək SMS-in (və ya bulk göndərişin bütün mesajlarının) statusunu dəyişir.
+
+        Args:
+            trans_id: SMS-in `trans_id`-si və ya bulk göndərişin `taskid`-si
+            status: Yeni status
+        """
+        with self._lock:
+            if trans_id in self.messages:
+                self.messages[trans_id]['status'] = status
+            for message in self.tasks.get(trans_id, []):
+                message['status'] = _BULK_STATUS.get(status, SMSStatus.SYSTEM_ERROR)
+                message['date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    def _charge(self, count: int) -> bool:
+        if self.balance < count:
+            return False
+        self.balance -= count
+        return True
+
+    # ------------------------------------------------------------------------------------- #
+    # Tək SMS
+    # ------------------------------------------------------------------------------------- #
+    def _send_sms(self, request: httpx.Request, post: bool) -> httpx.Response:
+        data = request_data(request)
+        login, text = data.get('login', ''), data.get('text', '')
+        msisdn, sender = data.get('msisdn', ''), data.get('sender', '')
+
+        code = None
+        if login != self.login or data.get('key') != _md5(
+            _md5(self.password) + login + text + msisdn + sender
+        ):
+            code = Code.INVALID_KEY
+        elif not (msisdn.isdigit() and len(msisdn) == 12):  # noqa: PLR2004
+            code = Code.WRONG_NUMBER_FORMAT
+        elif not self._charge(1):
+            code = Code.INSUFFICIENT_BALANCE
+
+        if code is not None:
+            body = {'errorMessage': code.name, 'obj': -1, 'errorCode': code.value}
+        else:
+            trans_id = next(self._ids)
+            self.messages[trans_id] = {'msisdn': msisdn, 'text': text, 'status': Code.IN_QUEUE}
+            if self.auto_deliver:
+                self.deliver(trans_id)
+            body = {'successMessage': 'SMS queued', 'obj': trans_id, 'errorCode': Code.IN_QUEUE}
+
+        if post:
+            body['errorCode'] = str(int(body['errorCode']))
+        return json_response(body)
+
+    @route('GET', single_env.API.SEND_SMS_GET)
+    def send_sms_get(self, request: httpx.Request) -> httpx.Response:
+        return self._send_sms(request, post=False)
+
+    @route('POST', single_env.API.SEND_SMS_POST)
+    def send_sms_post(self, request: httpx.Request) -> httpx.Response:
+        return self._send_sms(request, post=True)
+
+    @route('GET', single_env.API.CHECK_BALANCE)
+    def check_balance(self, request: httpx.Request) -> httpx.Response:
+        data = request_data(request)
+        if data.get('login') != self.login or data.get('key') != _md5(
+            _md5(self.password) + self.login
+        ):
+            return json_response({'errorMessage': 'INVALID_KEY', 'obj': -1, 'errorCode': -100})
+        return json_response({'successMessage': 'OK', 'obj': self.balance})
+
+    @route('GET', single_env.API.GET_REPORT_GET)
+    def get_report_get(self, request: httpx.Request) -> httpx.Response:
+        message = self.messages.get(int(request_data(request).get('trans_id', 0)))
+        code = message['status'] if message else Code.INVALID_TRANSACTION_ID
+        return httpx.Response(200, text=str(code.value))
+
+    @route('POST', single_env.API.GET_REPORT_POST)
+    def get_report_post(self, request: httpx.Request) -> httpx.Response:
+        message = self.messages.get(int(request_data(request).get('transid', 0)))
+        if message is None:
+            return json_response({'message': 'Invalid transaction id', 'delivery_status': None})
+        return json_response({'message': 'OK', 'delivery_status': message['status'].name})
+
+    # ------------------------------------------------------------------------------------- #
+    # Bulk SMS
+    # ------------------------------------------------------------------------------------- #
+    @staticmethod
+    def _bulk_response(code: BulkCode, body: Any = None) -> httpx.Response:
+        response: dict[str, Any] = {'head': {'responsecode': code.value}}
+        if body is not None:
+            response['body'] = body
+        return json_response({'response': response})
+
+    def _bulk_submit(self, head: dict[str, Any], body: list[dict[str, Any]]) -> httpx.Response:
+        if not head.get('title'):
+            return self._bulk_response(BulkCode.EMPTY_TITLE)
+        if not head.get('controlid'):
+            return self._bulk_response(BulkCode.EMPTY_CONTROL_ID)
+        if not body:
+            return self._bulk_response(BulkCode.INVALID_BODY)
+        if head.get('isbulk') and not head.get('bulkmessage'):
+            return self._bulk_response(BulkCode.INVALID_BULK_MSG)
+        if not self._charge(len(body)):
+            return self._bulk_response(BulkCode.INSUFFICIENT_BALANCE)
+
+        task_id = next(self._ids)
+        self.tasks[task_id] = [
+            {
+                'msisdn': int(item['msisdn']),
+                'message': head.get('bulkmessage') if head.get('isbulk') else item.get('message'),
+                'status': SMSStatus.MESSAGE_IN_QUEUE,
+                'date': None,
+            }
+            for item in body
+        ]
+        if self.auto_deliver:
+            self.deliver(task_id)
+        return self._bulk_response(BulkCode.SUCCESS, {'taskid': task_id})
+
+    def _bulk_report(self, head: dict[str, Any]) -> httpx.Response:
+        messages = self.tasks.get(int(head.get('taskid') or 0))
+        if messages is None:
+            return self._bulk_response(BulkCode.INVALID_TASK_ID)
+
+        if head['operation'] == 'report':
+            report = dict.fromkeys(_BULK_REPORT_KEYS.values(), 0) | {'removed': 0}
+            for message in messages:
+                report[_BULK_REPORT_KEYS[message['status']]] += 1
+            return self._bulk_response(BulkCode.SUCCESS, report)
+
+        with_date = head['operation'] == 'detailedreportwithdate'
+        return self._bulk_response(
+            BulkCode.SUCCESS,
+            [
+                {
+                    'msisdn': message['msisdn'],
+                    'message': message['message'],
+                    'status': message['status'].value,
+                    **({'date': message['date']} if with_date else {}),
+                }
+                for message in messages
+            ],
+        )
+
+    def _bulk_head_error(self, head: dict[str, Any]) -> BulkCode | None:
+        if not head.get('operation'):
+            return BulkCode.OPERATION_TYPE_EMPTY
+        if not head.get('login'):
+            return BulkCode.EMTPY_LOGIN
+        if not head.get('password'):
+            return BulkCode.EMTPY_PASSWORD
+        if head['login'] != self.login or head['password'] != self.password:
+            return BulkCode.INVALID_AUTH
+        return None
+
+    @route('POST', bulk_env.API.ENDPOINT)
+    def bulk(self, request: httpx.Request) -> httpx.Response:
+        payload = request_data(request).get('request') or {}
+        head, body = payload.get('head') or {}, payload.get('body') or []
+
+        error = self._bulk_head_error(head)
+        if error is not None:
+            return self._bulk_response(error)
+
+        operation = head['operation']
+        if operation == 'submit':
+            return self._bulk_submit(head, body)
+        if operation in {'report', 'detailedreport', 'detailedreportwithdate'}:
+            return self._bulk_report(head)
+        if operation == 'units':
+            return self._bulk_response(BulkCode.SUCCESS, {'units': self.balance})
+        return self._bulk_response(BulkCode.INVALID_OPERATION)
+
+    def reset(self) -> None:
+        with self._lock:
+            super().reset()
+            self.balance = self.initial_balance
+            self.messages.clear()
+            self.tasks.clear()
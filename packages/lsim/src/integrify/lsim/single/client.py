@@ -18,6 +18,7 @@ from integrify.lsim.single.schemas.response import (
     ReportGetResponseSchema,
     ReportPostResponseSchema,
 )
+from integrify.ratelimit import RateLimiter
 from integrify.schemas import APIResponse
 
 
@@ -29,10 +30,12 @@ class LSIMSingleSMSClientClass(APIClient, Generic[_Mode]):
         default_handler=None,
         sync=True,
         dry=False,
+        **kwds: Any,
     ):
-        super().__init__(name, base_url, default_handler, sync, dry)
+        kwds.setdefault('rate_limiter', RateLimiter.shared('lsim', base_env.LSIM_RATE_LIMIT))
+        super().__init__(name, base_url, default_handler, sync, dry, **kwds)
 
-        self.add_url('send_sms_get', env.API.SEND_SMS_GET, verb='GET')
+        self.add_url('send_sms_get', env.API.SEND_SMS_GET, verb='GET', idempotent=False)
         self.add_handler('send_sms_get', SendSMSGetPayloadHandler)
 
         self.add_url('send_sms_post', env.API.SEND_SMS_POST, verb='POST')
@@ -44,7 +47,7 @@ class LSIMSingleSMSClientClass(APIClient, Generic[_Mode]):
         self.add_url('get_report_get', env.API.GET_REPORT_GET, verb='GET')
         self.add_handler('get_report_get', GetReportGetPayloadHandler)
 
-        self.add_url('get_report_post', env.API.GET_REPORT_POST, verb='POST')
+        self.add_url('get_report_post', env.API.GET_REPORT_POST, verb='POST', idempotent=True)
         self.add_handler('get_report_post', GetReportPostPayloadHandler)
 
     if TYPE_CHECKING:
@@ -1,5 +1,3 @@
-import json
-
 from integrify.api import APIPayloadHandler
 from integrify.lsim.single.schemas.request import (
     CheckBalanceRequestSchema,
@@ -14,6 +12,7 @@ from integrify.lsim.single.schemas.response import (
     ReportGetResponseSchema,
     ReportPostResponseSchema,
 )
+from integrify.schemas import json_dumps
 
 
 class SendSMSGetPayloadHandler(APIPayloadHandler):
@@ -46,7 +45,7 @@ class GetReportGetPayloadHandler(APIPayloadHandler):
         except (TypeError, ValueError):
             error_code = None
 
-        resp._content = json.dumps({'error_code': error_code}).encode()  # pylint: disable=protected-access
+        resp._content = json_dumps({'error_code': error_code})  # pylint: disable=protected-access
         return super().handle_response(resp)
 
 
@@ -1,9 +1,10 @@
 from integrify.lsim.single.schemas.enums import Code
-from pydantic import BaseModel, ConfigDict
+from integrify.schemas import DeferredModel
+from pydantic import ConfigDict
 from pydantic.alias_generators import to_camel
 
 
-class BaseGetResponseSchema(BaseModel):
+class BaseGetResponseSchema(DeferredModel):
     model_config = ConfigDict(alias_generator=to_camel)
 
     success_message: str | None = None
@@ -24,12 +25,12 @@ class BasePostResponseSchema(BaseGetResponseSchema):
     """Status mesajı (həm uğurlu, həm xəta)"""
 
 
-class ReportGetResponseSchema(BaseModel):
+class ReportGetResponseSchema(DeferredModel):
     error_code: Code | None = None
     """Status kodu (həm uğurlu, həm xəta)"""
 
 
-class ReportPostResponseSchema(BaseModel):
+class ReportPostResponseSchema(DeferredModel):
     message: str | None = None
     """Xəta/uğur mesajı"""
 
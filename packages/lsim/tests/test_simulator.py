@@ -0,0 +1,62 @@
+import pytest
+from integrify.lsim.bulk.client import LSIMBulkSMSClientClass
+from integrify.lsim.bulk.schemas.enums import Code as BulkCode
+from integrify.lsim.bulk.schemas.enums import SMSStatus
+from integrify.lsim.simulator import LSIMSimulator
+from integrify.lsim.single.client import LSIMSingleSMSClientClass
+from integrify.lsim.single.schemas.enums import Code
+from integrify.testing import simulator
+
+CREDENTIALS = {'login': 'login', 'password': 'password'}
+
+
+@pytest.fixture
+def lsim_simulator():
+    yield simulator('lsim', balance=3, **CREDENTIALS)
+
+
+def test_single_sms(lsim_simulator: LSIMSimulator):
+    client = LSIMSingleSMSClientClass(transport=lsim_simulator.transport())
+
+    resp = client.send_sms_get(msisdn='994501234567', text='test', sender='S', **CREDENTIALS)
+    assert resp.body.error_code == Code.IN_QUEUE
+    trans_id = resp.body.obj
+
+    lsim_simulator.deliver(trans_id)
+    assert client.get_report_get(trans_id=trans_id, login='login').body.error_code == Code.DELIVERED
+    assert client.check_balance(**CREDENTIALS).body.obj == 2
+
+    resp = client.send_sms_get(
+        msisdn='994501234567', text='test', sender='S', login='login', password='x'
+    )
+    assert resp.body.error_code == Code.INVALID_KEY
+
+
+def test_bulk_sms(lsim_simulator: LSIMSimulator):
+    client = LSIMBulkSMSClientClass(transport=lsim_simulator.transport())
+
+    resp = client.bulk_send_one_message(
+        controlid=1,
+        msisdns=['994501234567', '994501234568'],
+        bulkmessage='test',
+        title='S',
+        **CREDENTIALS,
+    )
+    assert resp.body.response_code == BulkCode.SUCCESS
+    task_id = resp.body.task_id
+
+    lsim_simulator.deliver(task_id)
+    assert client.get_report(taskid=task_id, **CREDENTIALS).body.delivered == 2
+
+    report = client.get_detailed_report(taskid=task_id, **CREDENTIALS)
+    assert {sms.status for sms in report.body.body} == {SMSStatus.MESSAGE_DELIVERED}
+
+    resp = client.bulk_send_one_message(
+        controlid=2,
+        msisdns=['994501234567', '994501234568'],
+        bulkmessage='test',
+        title='S',
+        **CREDENTIALS,
+    )
+    assert resp.body.response_code == BulkCode.INSUFFICIENT_BALANCE
+    assert client.check_balance(**CREDENTIALS).body.units == 1
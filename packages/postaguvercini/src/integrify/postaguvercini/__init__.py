@@ -4,12 +4,27 @@ Dokumentasiya:
 EN: https://www.poctgoyercini.com/api_json/swagger/ui/index
 """
 
-from .client import (
-    PostaGuverciniAsyncClient,
-    PostaGuverciniClient,
-    PostaGuverciniClientClass,
+from typing import TYPE_CHECKING
+
+from integrify.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import (
+        PostaGuverciniAsyncClient,
+        PostaGuverciniClient,
+        PostaGuverciniClientClass,
+    )
+    from .env import VERSION
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'PostaGuverciniAsyncClient': '.client',
+        'PostaGuverciniClientClass': '.client',
+        'PostaGuverciniClient': '.client',
+        'VERSION': '.env',
+    },
 )
-from .env import VERSION
 
 __all__ = [
     'PostaGuverciniAsyncClient',
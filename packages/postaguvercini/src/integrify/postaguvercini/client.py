@@ -17,6 +17,8 @@ from integrify.postaguvercini.schemas.response import (
     SendSMSResponseSchema,
     StatusResponseSchema,
 )
+from integrify.ratelimit import RateLimiter
+from integrify.retry import DEFAULT_RETRY_POLICY
 from integrify.schemas import APIResponse
 from integrify.utils import UNSET as _UNSET
 from integrify.utils import Unset as Unsettable
@@ -32,8 +34,13 @@ class PostaGuverciniClientClass(APIClient, Generic[_Mode]):
         default_handler=None,
         sync=True,
         dry=False,
+        **kwds: Any,
     ):
-        super().__init__(name, base_url, default_handler, sync, dry)
+        kwds.setdefault(
+            'rate_limiter', RateLimiter.shared('postaguvercini', env.POSTA_GUVERCINI_RATE_LIMIT)
+        )
+        kwds.setdefault('retry', DEFAULT_RETRY_POLICY)
+        super().__init__(name, base_url, default_handler, sync, dry, **kwds)
 
         self.add_url('send_single_sms', env.API.SEND_SINGLE_SMS, verb='POST')
         self.add_handler('send_single_sms', SendSingleSMSPayloadHandler)
@@ -41,10 +48,10 @@ class PostaGuverciniClientClass(APIClient, Generic[_Mode]):
         self.add_url('send_multiple_sms', env.API.SEND_MULTIPLE_SMS, verb='POST')
         self.add_handler('send_multiple_sms', SendMultipleSMSPayloadHandler)
 
-        self.add_url('get_status', env.API.STATUS, verb='POST')
+        self.add_url('get_status', env.API.STATUS, verb='POST', idempotent=True)
         self.add_handler('get_status', StatusPayloadHandler)
 
-        self.add_url('credit_balance', env.API.CREDIT_BALANCE, verb='POST')
+        self.add_url('credit_balance', env.API.CREDIT_BALANCE, verb='POST', idempotent=True)
         self.add_handler('credit_balance', CreditBalancePayloadHandler)
 
     if TYPE_CHECKING:
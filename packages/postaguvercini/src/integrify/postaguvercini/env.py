@@ -1,5 +1,8 @@
 import os
 from enum import Enum
+from warnings import warn
+
+from integrify.ratelimit import RateLimiter
 
 VERSION = 'v1'
 
@@ -7,6 +10,28 @@ POSTA_GUVERCINI_USERNAME: str | None = os.getenv('POSTA_GUVERCINI_USERNAME', Non
 POSTA_GUVERCINI_PASSWORD: str | None = os.getenv('POSTA_GUVERCINI_PASSWORD', None)
 
 
+def _parse_rate_limit(name: str, value: str | None) -> str | None:
+    """Env-dən oxunan sorğu limitini yoxlayır. Yanlış formatlı dəyərdə paketin importu xəta
+    ilə dayanmasın deyə, xəbərdarlıq edilir və limit tətbiq olunmur (`None`)."""
+    try:
+        RateLimiter.from_spec(value)
+    except ValueError:
+        warn(
+            f"{name}='{value}' yanlış formatdadır (məs., '10/s', '600/m'); "
+            'limit tətbiq olunmayacaq.'
+        )
+        return None
+
+    return value
+
+
+# Client-side sorğu limiti (məs., '10/s', '600/m'). Təyin olunmasa və ya yanlış formatdadırsa,
+# limit tətbiq olunmur.
+POSTA_GUVERCINI_RATE_LIMIT: str | None = _parse_rate_limit(
+    'POSTA_GUVERCINI_RATE_LIMIT', os.getenv('POSTA_GUVERCINI_RATE_LIMIT')
+)
+
+
 class API(str, Enum):
     BASE_URL = 'https://www.poctgoyercini.com'
 
@@ -20,5 +45,6 @@ __all__ = [
     'VERSION',
     'POSTA_GUVERCINI_USERNAME',
     'POSTA_GUVERCINI_PASSWORD',
+    'POSTA_GUVERCINI_RATE_LIMIT',
     'API',
 ]
@@ -18,6 +18,9 @@ class BasePayloadHandler(APIPayloadHandler):
     """PostaGuvercini üçün baza handler. `req_model`/`resp_model` alt class-larda
     ClassVar kimi təyin olunur."""
 
+    # `ok` və `status_code` cavabın body-sindən təyin olunur
+    lazy_supported = False
+
     def handle_response(self, resp):
         api_resp: APIResponse[MinimalResponseSchema] = super().handle_response(resp)
 
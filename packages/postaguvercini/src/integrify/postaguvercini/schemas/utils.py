@@ -1,8 +1,9 @@
-from pydantic import BaseModel, ConfigDict
+from integrify.schemas import DeferredModel
+from pydantic import ConfigDict
 from pydantic.alias_generators import to_pascal
 
 
-class BaseSchema(BaseModel):
+class BaseSchema(DeferredModel):
     model_config = ConfigDict(
         alias_generator=to_pascal,
         populate_by_name=True,
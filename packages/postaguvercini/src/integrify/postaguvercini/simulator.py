@@ -0,0 +1,182 @@
+import itertools
+from datetime import datetime
+from typing import Any
+
+import httpx
+from integrify.postaguvercini import env
+from integrify.postaguvercini.schemas.enums import StatusCode
+from integrify.testing import Simulator, json_response, request_data, route
+
+__all__ = ['PostaGuverciniSimulator']
+
+MAX_RECEIVERS = 800
+"""Bir sorğuda icazə verilən alıcı sayı"""
+
+
+class PostaGuverciniSimulator(Simulator):
+    """PostaGuvercini SMS API-sinin lokal simulyatoru (bax: `integrify.testing.Simulator`).
+
+    Login/şifrə yoxlanılır, hər SMS balansdan bir vahid çıxır və mesajlar yaddaşda
+    saxlanılır. PostaGuvercini kimi, xətalar da 200 statusu ilə, `StatusCode` və real
+    API-nin mesajları body-də qaytarılır. Mesajlar göndərilmiş statusda yaradılır və
+    `deliver()` ilə (və ya `auto_deliver=True` olduqda dərhal) çatdırılır.
+    """
+
+    name = 'postaguvercini'
+    base_url = env.API.BASE_URL.value
+
+    def __init__(
+        self,
+        username: str | None = None,
+        password: str | None = None,
+        balance: int = 10_000,
+        auto_deliver: bool = False,
+        **kwds: Any,
+    ):
+        """
+        Args:
+            username: İstifadəçi adı. Verilməsə, `POSTA_GUVERCINI_USERNAME` istifadə olunur.
+            password: Şifrə. Verilməsə, `POSTA_GUVERCINI_PASSWORD` istifadə olunur.
+            balance: Başlanğıc kredit balansı
+            auto_deliver: Mesajları dərhal çatdırılmış etmək
+            **kwds: `Simulator` argumentləri (`latency`, `error_rate` və s.)
+        """
+        super().__init__(**kwds)
+        self.username = username if username is not None else env.POSTA_GUVERCINI_USERNAME
+        self.password = password if password is not None else env.POSTA_GUVERCINI_PASSWORD
+        self.initial_balance = balance
+        self.balance = balance
+        self.auto_deliver = auto_deliver
+
+        self.messages: dict[str, dict[str, Any]] = {}
+        """`MessageId` üzrə mesajlar"""
+
+        self._ids = itertools.count(1)
+
+    @staticmethod
+    def _response(code: StatusCode, description: str, result: Any = None) -> httpx.Response:
+        return json_response(
+            {'StatusCode': code.value, 'StatusDescription': description, 'Result': result}
+        )
+
+    def _authorized(self, data: dict[str, Any]) -> bool:
+        return data.get('Username') == self.username and data.get('Password') == self.password
+
+    def _unauthorized(self) -> httpx.Response:
+        return self._response(StatusCode.SERVER_ERROR, 'Daxilolma məlumatlarında xəta var!')
+
+    def deliver(self, message_id: str, delivered: bool = True) -> None:
+        """Mesajın operatora çatdırılmasını simulyasiya edir.
+
+        Args:
+            message_id: Mesajın ID-si
+            delivered: Mesajın çatdırılıb-çatdırılmaması
+        """
+        with self._lock:
+            self.messages[message_id].update(
+                SmsStatus='DELIVERED' if delivered else 'UNDELIVERED',
+                SmsStatusDescription='Çatdı' if delivered else 'Çatmadı',
+                IsFinalStatus='true',
+                StatusTime=datetime.now().isoformat(),
+            )
+
+    def _send(self, data: dict[str, Any], messages: list[tuple[str, str]]) -> httpx.Response:
+        if not self._authorized(data):
+            return self._unauthorized()
+        if not messages:
+            return self._response(
+                StatusCode.EMPTY_RECEIVER_LIST,
+                'Receivers cannot be empty. (ERR1060)',
+            )
+        if len(messages) > MAX_RECEIVERS:
+            return self._response(
+                StatusCode.MAX_NUMBER_OF_RECIPIENTS,
+                'Your request could not be recorded. You must add no more than '
+                f'{MAX_RECEIVERS} recipients at once. (ERR1070)',
+            )
+        if any(not message for _, message in messages):
+            return self._response(
+                StatusCode.MESSAGE_EMPTY,
+                'Messages is cannot be empty. (ERR1090)',
+            )
+        if self.balance < len(messages):
+            return self._response(StatusCode.SERVER_ERROR, 'Insufficient credit balance')
+
+        self.balance -= len(messages)
+        result = []
+        for receiver, message in messages:
+            message_id = str(next(self._ids))
+            self.messages[message_id] = {
+                'MessageId': message_id,
+                'Receiver': receiver,
+                'Message': message,
+                'SmsStatus': 'SENT',
+                'SmsStatusDescription': 'Sent to operator',
+                'IsFinalStatus': 'false',
+                'StatusTime': datetime.now().isoformat(),
+                'SmsCharge': '1',
+            }
+            if self.auto_deliver:
+                self.deliver(message_id)
+            result.append({'MessageId': message_id, 'Receiver': receiver, 'Charge': 1})
+
+        return self._response(StatusCode.OK, 'Transaction done successfully', result)
+
+    @route('POST', env.API.SEND_SINGLE_SMS)
+    def send_single_sms(self, request: httpx.Request) -> httpx.Response:
+        data = request_data(request)
+        message = data.get('Message', '')
+        return self._send(data, [(receiver, message) for receiver in data.get('Receivers') or []])
+
+    @route('POST', env.API.SEND_MULTIPLE_SMS)
+    def send_multiple_sms(self, request: httpx.Request) -> httpx.Response:
+        data = request_data(request)
+        messages = [
+            (
+                item.get('receiver', item.get('Receiver', '')),
+                item.get('message', item.get('Message')),
+            )
+            for item in data.get('Messages') or []
+        ]
+        if any(message is None for _, message in messages):
+            return self._response(
+                StatusCode.DIFFERENT_SIZE_RECIPIENT_AND_MESSAGE,
+                'Receiver and message counts differ',
+            )
+        return self._send(data, messages)
+
+    @route('POST', env.API.STATUS)
+    def get_status(self, request: httpx.Request) -> httpx.Response:
+        data = request_data(request)
+        if not self._authorized(data):
+            return self._unauthorized()
+
+        result = []
+        for message_id in data.get('MessageIds') or []:
+            message = self.messages.get(message_id) or {
+                'MessageId': message_id,
+                'Receiver': '',
+                'SmsStatus': 'UNKNOWN',
+                'SmsStatusDescription': 'Bilinmiyor ?',
+                'IsFinalStatus': 'false',
+                'StatusTime': '',
+                'SmsCharge': '0',
+            }
+            result.append({k: v for k, v in message.items() if k != 'Message'})
+        return self._response(StatusCode.OK, 'Transaction done successfully', result)
+
+    @route('POST', env.API.CREDIT_BALANCE)
+    def credit_balance(self, request: httpx.Request) -> httpx.Response:
+        if not self._authorized(request_data(request)):
+            return self._unauthorized()
+        return self._response(
+            StatusCode.OK,
+            'Transaction done successfully',
+            {'Balance': self.balance},
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            super().reset()
+            self.balance = self.initial_balance
+            self.messages.clear()
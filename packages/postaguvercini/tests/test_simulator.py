@@ -0,0 +1,45 @@
+import pytest
+from integrify.postaguvercini.client import PostaGuverciniClientClass
+from integrify.postaguvercini.simulator import PostaGuverciniSimulator
+from integrify.testing import simulator
+
+CREDENTIALS = {'username': 'user', 'password': 'password'}
+
+
+@pytest.fixture
+def postaguvercini_simulator():
+    yield simulator('postaguvercini', **CREDENTIALS)
+
+
+def test_send_and_status(postaguvercini_simulator: PostaGuverciniSimulator):
+    client = PostaGuverciniClientClass(transport=postaguvercini_simulator.transport())
+
+    resp = client.send_single_sms(
+        message='test',
+        receivers=['994501234567', '994501234568'],
+        **CREDENTIALS,
+    )
+    assert resp.ok
+    message_ids = [result.message_id for result in resp.body.result]
+
+    postaguvercini_simulator.deliver(message_ids[0])
+    status = client.get_status(message_ids=message_ids, **CREDENTIALS)
+    assert [result.sms_status for result in status.body.result] == ['DELIVERED', 'SENT']
+
+    unknown = client.get_status(message_ids=['random'], **CREDENTIALS)
+    assert unknown.body.result[0].sms_status_description == 'Bilinmiyor ?'
+
+    balance = client.credit_balance(**CREDENTIALS)
+    assert balance.body.result.balance == postaguvercini_simulator.initial_balance - 2
+
+
+def test_errors(postaguvercini_simulator: PostaGuverciniSimulator):
+    client = PostaGuverciniClientClass(transport=postaguvercini_simulator.transport())
+
+    resp = client.credit_balance(username='user', password='wrong')
+    assert not resp.ok
+    assert resp.body.status_description == 'Daxilolma məlumatlarında xəta var!'
+
+    resp = client.send_multiple_sms(messages=[], **CREDENTIALS)
+    assert not resp.ok
+    assert resp.body.status_code == 1060